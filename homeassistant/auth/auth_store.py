@@ -8,7 +8,7 @@ import hmac
 from logging import getLogger
 from typing import Any
 
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.helpers import device_registry as dr, entity_registry as er
 from homeassistant.helpers.storage import Store
 from homeassistant.util import dt as dt_util
@@ -303,6 +303,22 @@ class AuthStore:
                 return
             await self._async_load_task()
 
+    @callback
+    def _async_listen_registry_updates(self, perm_lookup: PermissionLookup) -> None:
+        """Invalidate cached entity permissions when a registry changes."""
+
+        @callback
+        def _async_registry_updated(event: Event) -> None:
+            perm_lookup.generation += 1
+
+        for event_type in (
+            er.EVENT_ENTITY_REGISTRY_UPDATED,
+            dr.EVENT_DEVICE_REGISTRY_UPDATED,
+        ):
+            self.hass.bus.async_listen(
+                event_type, _async_registry_updated, run_immediately=True
+            )
+
     async def _async_load_task(self) -> None:
         """Load the users."""
         dev_reg = dr.async_get(self.hass)
@@ -315,6 +331,7 @@ class AuthStore:
             return
 
         self._perm_lookup = perm_lookup = PermissionLookup(ent_reg, dev_reg)
+        self._async_listen_registry_updates(perm_lookup)
 
         if data is None or not isinstance(data, dict):
             self._set_defaults()
@@ -54,11 +54,31 @@ class PolicyPermissions(AbstractPermissions):
         """Initialize the permission class."""
         self._policy = policy
         self._perm_lookup = perm_lookup
+        # Results of check_entity by key and entity_id
+        self._entity_results: dict[str, dict[str, bool]] = {}
+        self._entity_results_generation = 0
 
     def access_all_entities(self, key: str) -> bool:
         """Check if we have a certain access to all entities."""
         return test_all(self._policy.get(CAT_ENTITIES), key)
 
+    def check_entity(self, entity_id: str, key: str) -> bool:
+        """Check if we can access entity.
+
+        Results are cached until the registries used to look up the area and
+        device of an entity change. A policy change creates a new instance.
+        """
+        if (
+            perm_lookup := self._perm_lookup
+        ) is not None and perm_lookup.generation != self._entity_results_generation:
+            self._entity_results_generation = perm_lookup.generation
+            self._entity_results.clear()
+        if (results := self._entity_results.get(key)) is None:
+            results = self._entity_results[key] = {}
+        if (result := results.get(entity_id)) is None:
+            result = results[entity_id] = super().check_entity(entity_id, key)
+        return result
+
     def _entity_func(self) -> Callable[[str, str], bool]:
         """Return a function that can test entity access."""
         return compile_entities(self._policy.get(CAT_ENTITIES), self._perm_lookup)
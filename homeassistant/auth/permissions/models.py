@@ -15,3 +15,5 @@ class PermissionLookup:
 
     entity_registry: er.EntityRegistry = attr.ib()
     device_registry: dr.DeviceRegistry = attr.ib()
+    # Incremented when the registries change, to invalidate cached lookups
+    generation: int = attr.ib(default=0)
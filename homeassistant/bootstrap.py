@@ -250,7 +250,7 @@ async def load_registries(hass: core.HomeAssistant) -> None:
         issue_registry.async_load(hass),
         hass.async_add_executor_job(_cache_uname_processor),
         template.async_load_custom_templates(hass),
-        restore_state.async_load(hass),
+        restore_state.async_load(hass, incremental=True),
     )
 
 
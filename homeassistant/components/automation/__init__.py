@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 import asyncio
-from collections.abc import Callable, Mapping
+from collections.abc import Callable, Iterable, Mapping
 from dataclasses import dataclass
 import logging
 from typing import Any, Protocol, cast
@@ -61,6 +61,7 @@ from homeassistant.helpers.integration_platform import (
     async_process_integration_platform_for_component,
 )
 from homeassistant.helpers.issue_registry import IssueSeverity, async_create_issue
+from homeassistant.helpers.reference_index import ReferenceIndex
 from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.helpers.script import (
     ATTR_CUR,
@@ -116,6 +117,8 @@ DEFAULT_STOP_ACTIONS = True
 EVENT_AUTOMATION_RELOADED = "automation_reloaded"
 EVENT_AUTOMATION_TRIGGERED = "automation_triggered"
 
+DATA_REFERENCE_INDEX = "automation_reference_index"
+
 ATTR_LAST_TRIGGERED = "last_triggered"
 ATTR_SOURCE = "source"
 ATTR_VARIABLES = "variables"
@@ -147,21 +150,30 @@ def is_on(hass: HomeAssistant, entity_id: str) -> bool:
     return hass.states.is_state(entity_id, STATE_ON)
 
 
+def _referenced_ids(
+    automation_entity: BaseAutomationEntity, property_name: str
+) -> Iterable[str]:
+    """Return the ids of the x referenced by an automation."""
+    if property_name == "referenced_blueprint":
+        if (blueprint := automation_entity.referenced_blueprint) is None:
+            return ()
+        return (blueprint,)
+    return cast(set[str], getattr(automation_entity, property_name))
+
+
 def _automations_with_x(
     hass: HomeAssistant, referenced_id: str, property_name: str
 ) -> list[str]:
     """Return all automations that reference the x."""
-    if DOMAIN not in hass.data:
+    if DATA_REFERENCE_INDEX not in hass.data:
         return []
 
-    component: EntityComponent[BaseAutomationEntity] = hass.data[DOMAIN]
-
-    return [
-        automation_entity.entity_id
-        for automation_entity in component.entities
-        if referenced_id in getattr(automation_entity, property_name)
+    reference_index: ReferenceIndex[BaseAutomationEntity] = hass.data[
+        DATA_REFERENCE_INDEX
     ]
 
+    return reference_index.async_referencing(property_name, referenced_id)
+
 
 def _x_in_automation(
     hass: HomeAssistant, entity_id: str, property_name: str
@@ -217,16 +229,7 @@ def areas_in_automation(hass: HomeAssistant, entity_id: str) -> list[str]:
 @callback
 def automations_with_blueprint(hass: HomeAssistant, blueprint_path: str) -> list[str]:
     """Return all automations that reference the blueprint."""
-    if DOMAIN not in hass.data:
-        return []
-
-    component: EntityComponent[BaseAutomationEntity] = hass.data[DOMAIN]
-
-    return [
-        automation_entity.entity_id
-        for automation_entity in component.entities
-        if automation_entity.referenced_blueprint == blueprint_path
-    ]
+    return _automations_with_x(hass, blueprint_path, "referenced_blueprint")
 
 
 @callback
@@ -248,6 +251,9 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     hass.data[DOMAIN] = component = EntityComponent[BaseAutomationEntity](
         LOGGER, DOMAIN, hass
     )
+    hass.data[DATA_REFERENCE_INDEX] = ReferenceIndex(
+        lambda: component.entities, _referenced_ids
+    )
 
     # Process integration platforms right away since
     # we will create entities before firing EVENT_COMPONENT_LOADED
@@ -343,6 +349,16 @@ class BaseAutomationEntity(ToggleEntity, ABC):
     def referenced_entities(self) -> set[str]:
         """Return a set of referenced entities."""
 
+    async def async_internal_added_to_hass(self) -> None:
+        """Invalidate the reference index when added to hass."""
+        await super().async_internal_added_to_hass()
+        self.hass.data[DATA_REFERENCE_INDEX].async_invalidate()
+
+    async def async_internal_will_remove_from_hass(self) -> None:
+        """Invalidate the reference index when removed from hass."""
+        self.hass.data[DATA_REFERENCE_INDEX].async_invalidate()
+        await super().async_internal_will_remove_from_hass()
+
     @abstractmethod
     async def async_trigger(
         self,
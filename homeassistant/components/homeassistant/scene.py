@@ -36,6 +36,7 @@ from homeassistant.helpers import (
     entity_platform,
 )
 from homeassistant.helpers.entity_platform import AddEntitiesCallback, EntityPlatform
+from homeassistant.helpers.reference_index import ReferenceIndex
 from homeassistant.helpers.service import async_register_admin_service
 from homeassistant.helpers.state import async_reproduce_state
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
@@ -86,6 +87,7 @@ def _ensure_no_intersection(value: dict[str, Any]) -> dict[str, Any]:
 CONF_SCENE_ID = "scene_id"
 CONF_SNAPSHOT = "snapshot_entities"
 DATA_PLATFORM = "homeassistant_scene"
+DATA_REFERENCE_INDEX = "homeassistant_scene_reference_index"
 EVENT_SCENE_RELOADED = "scene_reloaded"
 STATES_SCHEMA = vol.All(dict, _convert_states)
 
@@ -138,20 +140,30 @@ class SceneConfig(NamedTuple):
     states: dict
 
 
+@callback
+def _async_get_reference_index(
+    hass: HomeAssistant,
+) -> ReferenceIndex[HomeAssistantScene]:
+    """Return the index of the entities referenced by the scenes."""
+    if (reference_index := hass.data.get(DATA_REFERENCE_INDEX)) is None:
+
+        def get_entities() -> ValuesView[HomeAssistantScene]:
+            platform: EntityPlatform = hass.data[DATA_PLATFORM]
+            return cast(ValuesView[HomeAssistantScene], platform.entities.values())
+
+        reference_index = hass.data[DATA_REFERENCE_INDEX] = ReferenceIndex(
+            get_entities, lambda scene_entity, _: scene_entity.scene_config.states
+        )
+    return cast(ReferenceIndex[HomeAssistantScene], reference_index)
+
+
 @callback
 def scenes_with_entity(hass: HomeAssistant, entity_id: str) -> list[str]:
     """Return all scenes that reference the entity."""
     if DATA_PLATFORM not in hass.data:
         return []
 
-    platform: EntityPlatform = hass.data[DATA_PLATFORM]
-
-    scene_entities = cast(ValuesView[HomeAssistantScene], platform.entities.values())
-    return [
-        scene_entity.entity_id
-        for scene_entity in scene_entities
-        if entity_id in scene_entity.scene_config.states
-    ]
+    return _async_get_reference_index(hass).async_referencing("entities", entity_id)
 
 
 @callback
@@ -329,6 +341,16 @@ class HomeAssistantScene(Scene):
             attributes[CONF_ID] = unique_id
         return attributes
 
+    async def async_internal_added_to_hass(self) -> None:
+        """Invalidate the reference index when added to hass."""
+        await super().async_internal_added_to_hass()
+        _async_get_reference_index(self.hass).async_invalidate()
+
+    async def async_internal_will_remove_from_hass(self) -> None:
+        """Invalidate the reference index when removed from hass."""
+        _async_get_reference_index(self.hass).async_invalidate()
+        await super().async_internal_will_remove_from_hass()
+
     async def async_activate(self, **kwargs: Any) -> None:
         """Activate scene. Try to get entities into requested state."""
         await async_reproduce_state(
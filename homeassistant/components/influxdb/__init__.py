@@ -6,7 +6,6 @@ from contextlib import suppress
 from dataclasses import dataclass
 import logging
 import math
-import queue
 import threading
 import time
 from typing import Any
@@ -38,11 +37,12 @@ from homeassistant.helpers.entityfilter import (
     INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA,
     convert_include_exclude_filter,
 )
+from homeassistant.helpers.storage import STORAGE_DIR
 from homeassistant.helpers.typing import ConfigType
 
 from .const import (
     API_VERSION_2,
-    BATCH_BUFFER_SIZE,
+    BATCH_BUFFER_BYTES,
     BATCH_TIMEOUT,
     CATCHING_UP_MESSAGE,
     CLIENT_ERROR_V1,
@@ -88,7 +88,9 @@ from .const import (
     INFLUX_CONF_TIME,
     INFLUX_CONF_VALUE,
     QUERY_ERROR,
-    QUEUE_BACKLOG_SECONDS,
+    QUEUE_MEMORY_LIMIT,
+    QUEUE_SPILL_FILE,
+    QUEUE_SPILL_LIMIT,
     RE_DECIMAL,
     RE_DIGIT_TAIL,
     RESUMED_MESSAGE,
@@ -101,6 +103,8 @@ from .const import (
     WRITE_ERROR,
     WROTE_MESSAGE,
 )
+from .export_queue import ExportQueue
+from .line_protocol import encode_line
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -320,12 +324,26 @@ def _generate_event_to_json(conf: dict) -> Callable[[Event], dict[str, Any] | No
     return event_to_json
 
 
+def _generate_event_to_line(conf: dict) -> Callable[[Event], bytes | None]:
+    """Build event to line protocol converter."""
+    event_to_json = _generate_event_to_json(conf)
+    precision = conf.get(CONF_PRECISION)
+
+    def event_to_line(event: Event) -> bytes | None:
+        """Convert event into a line in the line protocol."""
+        if (json := event_to_json(event)) is None:
+            return None
+        return encode_line(json, precision)
+
+    return event_to_line
+
+
 @dataclass
 class InfluxClient:
     """An InfluxDB client wrapper for V1 or V2."""
 
     data_repositories: list[str]
-    write: Callable[[str], None]
+    write: Callable[[bytes], None]
     query: Callable[[str, str], list[Any]]
     close: Callable[[], None]
 
@@ -353,9 +371,9 @@ def get_influx_connection(  # noqa: C901
         initial_write_mode = SYNCHRONOUS if test_write else ASYNCHRONOUS
         write_api = influx.write_api(write_options=initial_write_mode)
 
-        def write_v2(json):
-            """Write data to V2 influx."""
-            data = {"bucket": bucket, "record": json}
+        def write_v2(lines):
+            """Write lines in the line protocol to V2 influx."""
+            data = {"bucket": bucket, "record": lines}
 
             if precision is not None:
                 data["write_precision"] = precision
@@ -366,7 +384,7 @@ def get_influx_connection(  # noqa: C901
                 raise ConnectionError(CONNECTION_ERROR % exc) from exc
             except ApiException as exc:
                 if exc.status == CODE_INVALID_INPUTS:
-                    raise ValueError(WRITE_ERROR % (json, exc)) from exc
+                    raise ValueError(WRITE_ERROR % (lines, exc)) from exc
                 raise ConnectionError(CLIENT_ERROR_V2 % exc) from exc
 
         def query_v2(query, _=None):
@@ -430,10 +448,12 @@ def get_influx_connection(  # noqa: C901
 
     influx = InfluxDBClient(**kwargs)
 
-    def write_v1(json):
-        """Write data to V1 influx."""
+    def write_v1(lines):
+        """Write lines in the line protocol to V1 influx."""
         try:
-            influx.write_points(json, time_precision=precision)
+            influx.write_points(
+                lines.decode(), time_precision=precision, protocol="line"
+            )
         except (
             requests.exceptions.RequestException,
             exceptions.InfluxDBServerError,
@@ -442,7 +462,7 @@ def get_influx_connection(  # noqa: C901
             raise ConnectionError(CONNECTION_ERROR % exc) from exc
         except exceptions.InfluxDBClientError as exc:
             if exc.code == CODE_INVALID_INPUTS:
-                raise ValueError(WRITE_ERROR % (json, exc)) from exc
+                raise ValueError(WRITE_ERROR % (lines, exc)) from exc
             raise ConnectionError(CLIENT_ERROR_V1 % exc) from exc
 
     def query_v1(query, database=None):
@@ -466,7 +486,7 @@ def get_influx_connection(  # noqa: C901
 
     databases = []
     if test_write:
-        write_v1([])
+        write_v1(b"")
 
     if test_read:
         databases = [db["name"] for db in query_v1(TEST_QUERY_V1)]
@@ -490,14 +510,21 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:
         )
         return True
 
-    event_to_json = _generate_event_to_json(conf)
+    event_to_line = _generate_event_to_line(conf)
     max_tries = conf.get(CONF_RETRY_COUNT)
-    instance = hass.data[DOMAIN] = InfluxThread(hass, influx, event_to_json, max_tries)
+    export_queue = ExportQueue(
+        hass.config.path(STORAGE_DIR, QUEUE_SPILL_FILE),
+        QUEUE_MEMORY_LIMIT,
+        QUEUE_SPILL_LIMIT,
+    )
+    instance = hass.data[DOMAIN] = InfluxThread(
+        hass, influx, export_queue, event_to_line, max_tries
+    )
     instance.start()
 
     def shutdown(event):
         """Shut down the thread."""
-        instance.queue.put(None)
+        instance.queue.close()
         instance.join()
         influx.close()
 
@@ -509,93 +536,76 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:
 class InfluxThread(threading.Thread):
     """A threaded event handler class."""
 
-    def __init__(self, hass, influx, event_to_json, max_tries):
+    def __init__(self, hass, influx, export_queue, event_to_line, max_tries):
         """Initialize the listener."""
         threading.Thread.__init__(self, name=DOMAIN)
-        self.queue = queue.Queue()
+        self.queue = export_queue
         self.influx = influx
-        self.event_to_json = event_to_json
+        self.event_to_line = event_to_line
         self.max_tries = max_tries
         self.write_errors = 0
-        self.shutdown = False
         hass.bus.listen(EVENT_STATE_CHANGED, self._event_listener)
 
     @callback
     def _event_listener(self, event):
-        """Listen for new messages on the bus and queue them for Influx."""
-        item = (time.monotonic(), event)
-        self.queue.put(item)
+        """Listen for new messages on the bus and queue them for Influx.
+
+        Events are encoded right away, so the queue holds compact lines
+        instead of keeping the states alive until they are written.
+        """
+        if (line := self.event_to_line(event)) is not None:
+            self.queue.put(line)
 
     @staticmethod
     def batch_timeout():
         """Return number of seconds to wait for more events."""
         return BATCH_TIMEOUT
 
-    def get_events_json(self):
-        """Return a batch of events formatted for writing."""
-        queue_seconds = QUEUE_BACKLOG_SECONDS + self.max_tries * RETRY_DELAY
-
-        count = 0
-        json = []
-
-        dropped = 0
-
-        with suppress(queue.Empty):
-            while len(json) < BATCH_BUFFER_SIZE and not self.shutdown:
-                timeout = None if count == 0 else self.batch_timeout()
-                item = self.queue.get(timeout=timeout)
-                count += 1
-
-                if item is None:
-                    self.shutdown = True
-                else:
-                    timestamp, event = item
-                    age = time.monotonic() - timestamp
+    def write_to_influxdb(self, lines):
+        """Write a batch of lines to influxdb, with retry.
 
-                    if age < queue_seconds:
-                        event_json = self.event_to_json(event)
-                        if event_json:
-                            json.append(event_json)
-                    else:
-                        dropped += 1
-
-        if dropped:
-            _LOGGER.warning(CATCHING_UP_MESSAGE, dropped)
-
-        return count, json
-
-    def write_to_influxdb(self, json):
-        """Write preprocessed events to influxdb, with retry."""
+        Returns False if the batch could not be written and should be kept.
+        """
         for retry in range(self.max_tries + 1):
             try:
-                self.influx.write(json)
+                self.influx.write(b"".join(lines))
 
                 if self.write_errors:
                     _LOGGER.error(RESUMED_MESSAGE, self.write_errors)
                     self.write_errors = 0
 
-                _LOGGER.debug(WROTE_MESSAGE, len(json))
-                break
+                _LOGGER.debug(WROTE_MESSAGE, len(lines))
+                return True
             except ValueError as err:
                 _LOGGER.error(err)
-                break
+                return True
             except ConnectionError as err:
                 if retry < self.max_tries:
                     time.sleep(RETRY_DELAY)
                 else:
                     if not self.write_errors:
                         _LOGGER.error(err)
-                    self.write_errors += len(json)
+                    self.write_errors += 1
+        return False
 
     def run(self):
         """Process incoming events."""
-        while not self.shutdown:
-            count, json = self.get_events_json()
-            if json:
-                self.write_to_influxdb(json)
-            for _ in range(count):
-                self.queue.task_done()
+        while (
+            lines := self.queue.get_batch(BATCH_BUFFER_BYTES, self.batch_timeout())
+        ) is not None:
+            if self.write_to_influxdb(lines):
+                self.queue.ack()
+            else:
+                # Keep the batch and the backlog, spilling it to disk when it
+                # grows too large, until Influx can be reached again
+                self.queue.suspend(RETRY_INTERVAL)
+                if self.queue.closed:
+                    break
+            if self.queue.dropped:
+                _LOGGER.warning(CATCHING_UP_MESSAGE, self.queue.dropped)
+                self.queue.dropped = 0
+        self.queue.shutdown()
 
     def block_till_done(self):
-        """Block till all events processed."""
+        """Block till all events are written or writing is suspended."""
         self.queue.join()
@@ -74,10 +74,12 @@ DOMAIN = "influxdb"
 API_VERSION_2 = "2"
 TIMEOUT = 10  # seconds
 RETRY_DELAY = 20
-QUEUE_BACKLOG_SECONDS = 30
 RETRY_INTERVAL = 60  # seconds
 BATCH_TIMEOUT = 1
-BATCH_BUFFER_SIZE = 100
+BATCH_BUFFER_BYTES = 256 * 1024
+QUEUE_MEMORY_LIMIT = 4 * 1024**2
+QUEUE_SPILL_LIMIT = 256 * 1024**2
+QUEUE_SPILL_FILE = "influxdb.queue"
 LANGUAGE_INFLUXQL = "influxQL"
 LANGUAGE_FLUX = "flux"
 TEST_QUERY_V1 = "SHOW DATABASES;"
@@ -118,7 +120,7 @@ QUERY_ERROR = (
 )
 RETRY_MESSAGE = f"%s Retrying in {RETRY_INTERVAL} seconds."
 CATCHING_UP_MESSAGE = "Catching up, dropped %d old events."
-RESUMED_MESSAGE = "Resumed, lost %d events."
+RESUMED_MESSAGE = "Resumed after %d failed writes, replaying queued events."
 WROTE_MESSAGE = "Wrote %d events."
 RUNNING_QUERY_MESSAGE = "Running query: %s."
 QUERY_NO_RESULTS_MESSAGE = "Query returned no results, sensor state set to UNKNOWN: %s."
@@ -0,0 +1,277 @@
+"""Queue of encoded lines waiting to be written to Influx."""
+from __future__ import annotations
+
+from collections import deque
+from contextlib import suppress
+import logging
+import os
+import threading
+import time
+from typing import BinaryIO
+
+_LOGGER = logging.getLogger(__name__)
+
+# Bytes read from the end of a segment file to find its last complete line
+TAIL_SIZE = 65536
+
+
+class ExportQueue:
+    """First in first out queue of lines with a bounded memory footprint.
+
+    Lines are added from the event loop and only kept in memory there. When
+    the lines in memory exceed the memory limit the writer thread moves the
+    oldest of them to the end of a segment file, the lines in the segment
+    file are always older than the lines in memory so reading the segment
+    file first keeps the order. Once the segment file reaches its limit the
+    oldest lines in memory are dropped instead.
+
+    Batches are read from the head of the queue and only removed once they
+    are acknowledged, so a batch which failed to be written is read again
+    when writing is retried. Once the queue is closed only the lines in
+    memory are still returned, the segment file is left behind and is
+    replayed from its start the next time the queue is created, writing a
+    point twice to Influx is harmless.
+    """
+
+    def __init__(self, path: str, memory_limit: int, spill_limit: int) -> None:
+        """Initialize the queue and open a segment file left behind."""
+        self._path = path
+        self._memory_limit = memory_limit
+        self._spill_limit = spill_limit
+        self._condition = threading.Condition()
+        self._memory: deque[bytes] = deque()
+        self._memory_bytes = 0
+        self._segment: BinaryIO | None = None
+        self._segment_size = 0
+        self._read_offset = 0
+        self._batch_offset = 0
+        self._batch_lines = 0
+        self._batch_bytes = 0
+        self._in_flight = False
+        self._resume_at = 0.0
+        self._closed = False
+        self.dropped = 0
+        if os.path.exists(path):
+            self._drop_partial_line(self._open_segment())
+
+    @property
+    def closed(self) -> bool:
+        """Return if the queue was closed."""
+        return self._closed
+
+    def _open_segment(self) -> BinaryIO:
+        """Open the segment file for appending and reading."""
+        os.makedirs(os.path.dirname(self._path), exist_ok=True)
+        segment = self._segment = open(  # pylint: disable=consider-using-with
+            self._path, "a+b"
+        )
+        self._segment_size = segment.seek(0, os.SEEK_END)
+        return segment
+
+    def _drop_partial_line(self, segment: BinaryIO) -> None:
+        """Truncate a line left incomplete when spilling was interrupted."""
+        start = segment.seek(max(self._segment_size - TAIL_SIZE, 0))
+        tail = segment.read()
+        if not tail or tail.endswith(b"\n"):
+            return
+        self._segment_size = segment.truncate(start + tail.rfind(b"\n") + 1)
+
+    def _pending(self) -> bool:
+        """Return if there are lines waiting, the lock must be held."""
+        return self._memory_bytes > 0 or self._read_offset < self._segment_size
+
+    def put(self, line: bytes) -> None:
+        """Add a line to the end of the queue."""
+        with self._condition:
+            self._memory.append(line)
+            self._memory_bytes += len(line)
+            self._condition.notify_all()
+
+    def close(self) -> None:
+        """Close the queue, the lines in memory are still returned as batches."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+    def _wait(self, timeout: float | None) -> None:
+        """Spill if needed and wait for the queue to change.
+
+        The lock must be held.
+        """
+        while self._memory_bytes > self._memory_limit:
+            self._spill(self._memory_limit)
+            self._condition.notify_all()
+        self._condition.wait(timeout)
+
+    def get_batch(self, max_bytes: int, timeout: float) -> list[bytes] | None:
+        """Return lines from the head of the queue, without removing them.
+
+        Waits for a first line and while writing is suspended, then waits up
+        to timeout for more lines until the batch reaches max_bytes. Returns
+        None once the queue is closed and there are no lines in memory, the
+        lines in the segment file are kept for the next start.
+        """
+        with self._condition:
+            while not self._closed and (
+                not self._pending() or time.monotonic() < self._resume_at
+            ):
+                self._wait(
+                    max(self._resume_at - time.monotonic(), 0)
+                    if self._pending()
+                    else None
+                )
+            if not self._pending() or (self._closed and not self._memory_bytes):
+                return None
+            deadline = time.monotonic() + timeout
+            while (
+                not self._closed
+                and self._memory_bytes + self._segment_size - self._read_offset
+                < max_bytes
+                and (remaining := deadline - time.monotonic()) > 0
+            ):
+                self._wait(remaining)
+            self._in_flight = True
+            closed = self._closed
+        if closed:
+            # Replaying the segment file would delay stopping
+            self._batch_offset = self._read_offset
+            lines = []
+        else:
+            lines = self._read_segment(max_bytes)
+        size = sum(map(len, lines))
+        with self._condition:
+            # Only this thread removes lines from memory, so the head of
+            # memory stays the same until the batch is acknowledged
+            for line in self._memory:
+                if size >= max_bytes:
+                    break
+                lines.append(line)
+                size += len(line)
+                self._batch_lines += 1
+                self._batch_bytes += len(line)
+        return lines
+
+    def _read_segment(self, max_bytes: int) -> list[bytes]:
+        """Read lines from the head of the segment file."""
+        lines: list[bytes] = []
+        size = 0
+        offset = self._read_offset
+        if (segment := self._segment) is not None and offset < self._segment_size:
+            segment.seek(offset)
+            while (
+                size < max_bytes
+                and offset < self._segment_size
+                and (line := segment.readline())
+            ):
+                lines.append(line)
+                size += len(line)
+                offset += len(line)
+        self._batch_offset = offset
+        return lines
+
+    def ack(self) -> None:
+        """Remove the last batch returned from the queue."""
+        segment: BinaryIO | None = None
+        with self._condition:
+            self._read_offset = self._batch_offset
+            for _ in range(self._batch_lines):
+                self._memory.popleft()
+            self._memory_bytes -= self._batch_bytes
+            self._batch_lines = self._batch_bytes = 0
+            self._in_flight = False
+            if self._segment is not None and self._read_offset >= self._segment_size:
+                segment = self._segment
+                self._segment = None
+                self._segment_size = self._read_offset = 0
+            self._condition.notify_all()
+        if segment is not None:
+            self._remove_segment(segment)
+
+    def suspend(self, seconds: float) -> None:
+        """Keep the last batch and return no batch for a number of seconds."""
+        with self._condition:
+            self._batch_lines = self._batch_bytes = 0
+            self._in_flight = False
+            self._resume_at = time.monotonic() + seconds
+            self._condition.notify_all()
+
+    def _spill(self, limit: int) -> None:
+        """Move the oldest lines in memory to the segment file.
+
+        The lock must be held, it is released while writing to the file. The
+        lines stay in the memory size until they are written, so the queue
+        does not look empty meanwhile.
+        """
+        lines: list[bytes] = []
+        size = 0
+        while self._memory_bytes - size > limit:
+            line = self._memory.popleft()
+            lines.append(line)
+            size += len(line)
+        unread = self._segment_size - self._read_offset
+        if unread + size > self._spill_limit:
+            self._memory_bytes -= size
+            self.dropped += len(lines)
+            return
+        self._condition.release()
+        try:
+            written = self._write_segment(b"".join(lines))
+        finally:
+            self._condition.acquire()
+        self._memory_bytes -= size
+        if written:
+            self._segment_size += size
+        else:
+            self.dropped += len(lines)
+
+    def _write_segment(self, data: bytes) -> bool:
+        """Append to the segment file, return if the data was written."""
+        try:
+            segment = self._segment or self._open_segment()
+            segment.write(data)
+            segment.flush()
+        except OSError as err:
+            _LOGGER.error("Error writing to %s: %s", self._path, err)
+            if self._segment is not None:
+                # Do not leave part of the data behind
+                with suppress(OSError):
+                    self._segment.truncate(self._segment_size)
+            return False
+        return True
+
+    def _remove_segment(self, segment: BinaryIO) -> None:
+        """Close and remove the segment file once all of its lines are read."""
+        segment.close()
+        try:
+            os.unlink(self._path)
+        except OSError as err:
+            _LOGGER.error("Error removing %s: %s", self._path, err)
+
+    def shutdown(self) -> None:
+        """Move the lines in memory to the segment file and close it."""
+        with self._condition:
+            if self._memory_bytes:
+                self._spill(0)
+            segment = self._segment
+            self._segment = None
+            drained = self._read_offset >= self._segment_size
+            self._condition.notify_all()
+        if segment is not None:
+            if drained:
+                self._remove_segment(segment)
+            else:
+                segment.close()
+
+    def join(self) -> None:
+        """Block until the queue is empty or writing is suspended."""
+        with self._condition:
+            while (
+                self._in_flight
+                or self._memory_bytes > self._memory_limit
+                or (
+                    self._pending()
+                    and not self._closed
+                    and time.monotonic() >= self._resume_at
+                )
+            ):
+                self._condition.wait()
@@ -0,0 +1,78 @@
+"""Encode points in the InfluxDB line protocol."""
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any
+
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    INFLUX_CONF_FIELDS,
+    INFLUX_CONF_MEASUREMENT,
+    INFLUX_CONF_TAGS,
+    INFLUX_CONF_TIME,
+)
+
+# Nanoseconds per unit of each write precision
+PRECISION_DIVISORS = {
+    None: 1,
+    "ns": 1,
+    "us": 1_000,
+    "ms": 1_000_000,
+    "s": 1_000_000_000,
+}
+
+_KEY_ESCAPES = str.maketrans(
+    {"\\": "\\\\", " ": "\\ ", ",": "\\,", "=": "\\=", "\n": "\\n"}
+)
+_STRING_ESCAPES = str.maketrans({"\\": "\\\\", '"': '\\"', "\n": "\\n"})
+
+
+def _escape_key(value: Any) -> str:
+    """Escape a measurement, tag key, tag value or field key."""
+    escaped = str(value).translate(_KEY_ESCAPES)
+    # A trailing backslash would escape the separator that follows it
+    if escaped.endswith("\\"):
+        escaped += " "
+    return escaped
+
+
+def _encode_field_value(value: Any) -> str:
+    """Encode a field value with the type Influx infers from its notation."""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, int):
+        return f"{value}i"
+    if isinstance(value, float):
+        return repr(value)
+    return f'"{str(value).translate(_STRING_ESCAPES)}"'
+
+
+def _timestamp(time: datetime, precision: str | None) -> int:
+    """Return the time as an integer in the write precision."""
+    delta = time - dt_util.utc_from_timestamp(0)
+    nanoseconds = (
+        (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds
+    ) * 1000
+    return nanoseconds // PRECISION_DIVISORS[precision]
+
+
+def encode_line(json: dict[str, Any], precision: str | None) -> bytes | None:
+    """Encode a point in the json format as a newline terminated line.
+
+    Matches the encoding of the influxdb client library, tags are sorted by
+    key and tags without a value are left out. Returns None if the point
+    has no fields as Influx rejects such lines.
+    """
+    fields = ",".join(
+        f"{_escape_key(key)}={_encode_field_value(value)}"
+        for key, value in json[INFLUX_CONF_FIELDS].items()
+        if value is not None
+    )
+    if not fields:
+        return None
+    line = _escape_key(json[INFLUX_CONF_MEASUREMENT])
+    for key, value in sorted(json[INFLUX_CONF_TAGS].items()):
+        if value is not None and (tag_value := _escape_key(value)):
+            line += f",{_escape_key(key)}={tag_value}"
+    return f"{line} {fields} {_timestamp(json[INFLUX_CONF_TIME], precision)}\n".encode()
@@ -1,7 +1,7 @@
 """Event parser and human readable log generator."""
 from __future__ import annotations
 
-from collections.abc import Callable, Generator, Sequence
+from collections.abc import Callable, Generator, Iterator, Sequence
 from contextlib import suppress
 from dataclasses import dataclass
 from datetime import datetime as dt
@@ -10,6 +10,7 @@ from typing import Any
 
 from sqlalchemy.engine import Result
 from sqlalchemy.engine.row import Row
+from sqlalchemy.orm import Session
 
 from homeassistant.components.recorder import get_instance
 from homeassistant.components.recorder.filters import Filters
@@ -141,33 +142,79 @@ class EventProcessor:
         end_day: dt,
     ) -> list[dict[str, Any]]:
         """Get events for a period of time."""
+        return list(self.iter_events(start_day, end_day))
+
+    def iter_events(
+        self,
+        start_day: dt,
+        end_day: dt,
+    ) -> Generator[dict[str, Any], None, None]:
+        """Get events for a period of time as the rows are fetched.
+
+        Rows are fetched in batches when the period is longer than a day.
+        The database session is held until the generator is exhausted or
+        closed, so it must be consumed in the executor.
+        """
         with session_scope(hass=self.hass, read_only=True) as session:
-            metadata_ids: list[int] | None = None
-            instance = get_instance(self.hass)
-            if self.entity_ids:
-                metadata_ids = extract_metadata_ids(
-                    instance.states_meta_manager.get_many(
-                        self.entity_ids, session, False
-                    )
-                )
-            event_type_ids = tuple(
-                extract_event_type_ids(
-                    instance.event_type_manager.get_many(self.event_types, session)
-                )
+            yield from _humanify(
+                self._get_rows(session, start_day, end_day),
+                self.ent_reg,
+                self.logbook_run,
+                self.context_augmenter,
             )
-            stmt = statement_for_request(
-                start_day,
-                end_day,
-                event_type_ids,
-                self.entity_ids,
-                metadata_ids,
-                self.device_ids,
-                self.filters,
-                self.context_id,
+
+    def iter_events_after(
+        self,
+        start_day: dt,
+        end_day: dt,
+        after: tuple[float, int, int] | None,
+    ) -> Generator[tuple[tuple[float, int, int], dict[str, Any]], None, None]:
+        """Get events after a row with the time, kind and id of their rows.
+
+        Rows are ordered by their time, then by their kind and then by their
+        event or state id, the rows up to and including after are skipped.
+        """
+        with session_scope(hass=self.hass, read_only=True) as session:
+            rows = _RowsAfter(self._get_rows(session, start_day, end_day), after)
+            for event in _humanify(
+                rows, self.ent_reg, self.logbook_run, self.context_augmenter
+            ):
+                # The entry is yielded while its row is processed
+                assert rows.key is not None
+                yield rows.key, event
+
+    def _get_rows(
+        self, session: Session, start_day: dt, end_day: dt
+    ) -> Sequence[Row] | Result:
+        """Execute the query of the events for a period of time."""
+        metadata_ids: list[int] | None = None
+        instance = get_instance(self.hass)
+        if self.entity_ids:
+            metadata_ids = extract_metadata_ids(
+                instance.states_meta_manager.get_many(self.entity_ids, session, False)
             )
-            return self.humanify(
-                execute_stmt_lambda_element(session, stmt, orm_rows=False)
+        event_type_ids = tuple(
+            extract_event_type_ids(
+                instance.event_type_manager.get_many(self.event_types, session)
             )
+        )
+        stmt = statement_for_request(
+            start_day,
+            end_day,
+            event_type_ids,
+            self.entity_ids,
+            metadata_ids,
+            self.device_ids,
+            self.filters,
+            self.context_id,
+        )
+        return execute_stmt_lambda_element(
+            session,
+            stmt,
+            dt_util.as_utc(start_day),
+            dt_util.as_utc(end_day),
+            orm_rows=False,
+        )
 
     def humanify(
         self, rows: Generator[EventAsRow, None, None] | Sequence[Row] | Result
@@ -183,8 +230,39 @@ class EventProcessor:
         )
 
 
+class _RowsAfter:
+    """Iterate the rows after a row and remember the last one."""
+
+    __slots__ = ("_rows", "_after", "key")
+
+    def __init__(
+        self, rows: Sequence[Row] | Result, after: tuple[float, int, int] | None
+    ) -> None:
+        """Init the rows."""
+        self._rows = iter(rows)
+        self._after = after
+        # The time, kind and id of the last row
+        self.key: tuple[float, int, int] | None = None
+
+    def __iter__(self) -> Iterator[Row]:
+        """Return the iterator."""
+        return self
+
+    def __next__(self) -> Row:
+        """Return the next row after the row to start after."""
+        while True:
+            row = next(self._rows)
+            if (time_fired_ts := row.time_fired_ts) is None:
+                # Context only rows without a matching event or state
+                return row
+            key = (time_fired_ts, row.row_kind, row.row_id)
+            if self._after is None or key > self._after:
+                self.key = key
+                return row
+
+
 def _humanify(
-    rows: Generator[EventAsRow, None, None] | Sequence[Row] | Result,
+    rows: Generator[EventAsRow, None, None] | Sequence[Row] | Result | _RowsAfter,
     ent_reg: er.EntityRegistry,
     logbook_run: LogbookRun,
     context_augmenter: ContextAugmenter,
@@ -12,7 +12,13 @@ from homeassistant.components.recorder.db_schema import (
 )
 from homeassistant.components.recorder.filters import Filters
 
-from .common import apply_states_filters, select_events_without_states, select_states
+from .common import (
+    ROW_ID_ORDER,
+    ROW_KIND_ORDER,
+    apply_states_filters,
+    select_events_without_states,
+    select_states,
+)
 
 
 def all_stmt(
@@ -47,7 +53,7 @@ def all_stmt(
     else:
         stmt += lambda s: s.union_all(_states_query_for_all(start_day, end_day))
 
-    stmt += lambda s: s.order_by(Events.time_fired_ts)
+    stmt += lambda s: s.order_by(Events.time_fired_ts, ROW_KIND_ORDER, ROW_ID_ORDER)
     return stmt
 
 
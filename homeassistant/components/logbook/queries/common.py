@@ -5,8 +5,8 @@ from typing import Final
 
 import sqlalchemy
 from sqlalchemy import select
-from sqlalchemy.sql.elements import BooleanClauseList, ColumnElement
-from sqlalchemy.sql.expression import literal
+from sqlalchemy.sql.elements import BooleanClauseList, ColumnClause, ColumnElement
+from sqlalchemy.sql.expression import literal, literal_column
 from sqlalchemy.sql.selectable import Select
 
 from homeassistant.components.recorder.db_schema import (
@@ -50,8 +50,14 @@ PSEUDO_EVENT_STATE_CHANGED: Final = None
 # since it avoids another column being sent
 # in the payload
 
+# Virtual column to tell event rows from state rows, since their ids come
+# from different tables an event and a state can have the same id
+EVENT_ROW_KIND = literal(value=0, type_=sqlalchemy.Integer).label("row_kind")
+STATE_ROW_KIND = literal(value=1, type_=sqlalchemy.Integer).label("row_kind")
+
 EVENT_COLUMNS = (
     Events.event_id.label("row_id"),
+    EVENT_ROW_KIND,
     EventTypes.event_type.label("event_type"),
     SHARED_DATA_OR_LEGACY_EVENT_DATA,
     Events.time_fired_ts.label("time_fired_ts"),
@@ -74,6 +80,7 @@ STATE_CONTEXT_ONLY_COLUMNS = (
 
 EVENT_COLUMNS_FOR_STATE_SELECT = (
     States.state_id.label("row_id"),
+    STATE_ROW_KIND,
     # We use PSEUDO_EVENT_STATE_CHANGED aka None for
     # state_changed events since it takes up less
     # space in the response and every row has to be
@@ -100,6 +107,11 @@ EVENT_ROWS_NO_STATES = (
     *EMPTY_STATE_COLUMNS,
 )
 
+# Rows which happened at the same time are ordered by their kind and then by
+# their event or state id
+ROW_KIND_ORDER: ColumnClause[int] = literal_column("row_kind")
+ROW_ID_ORDER: ColumnClause[int] = literal_column("row_id")
+
 # Virtual column to tell logbook if it should avoid processing
 # the event as its only used to link contexts
 CONTEXT_ONLY = literal(value="1", type_=sqlalchemy.String).label("context_only")
@@ -19,6 +19,8 @@ from homeassistant.components.recorder.db_schema import (
 )
 
 from .common import (
+    ROW_ID_ORDER,
+    ROW_KIND_ORDER,
     apply_events_context_hints,
     apply_states_context_hints,
     select_events_context_id_subquery,
@@ -90,7 +92,7 @@ def devices_stmt(
             end_day,
             event_type_ids,
             json_quotable_device_ids,
-        ).order_by(Events.time_fired_ts)
+        ).order_by(Events.time_fired_ts, ROW_KIND_ORDER, ROW_ID_ORDER)
     )
     return stmt
 
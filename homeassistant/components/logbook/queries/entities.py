@@ -21,6 +21,8 @@ from homeassistant.components.recorder.db_schema import (
 )
 
 from .common import (
+    ROW_ID_ORDER,
+    ROW_KIND_ORDER,
     apply_events_context_hints,
     apply_states_context_hints,
     apply_states_filters,
@@ -110,7 +112,7 @@ def entities_stmt(
             event_type_ids,
             states_metadata_ids,
             json_quoted_entity_ids,
-        ).order_by(Events.time_fired_ts)
+        ).order_by(Events.time_fired_ts, ROW_KIND_ORDER, ROW_ID_ORDER)
     )
 
 
@@ -17,6 +17,8 @@ from homeassistant.components.recorder.db_schema import (
 )
 
 from .common import (
+    ROW_ID_ORDER,
+    ROW_KIND_ORDER,
     apply_events_context_hints,
     apply_states_context_hints,
     select_events_context_id_subquery,
@@ -122,7 +124,7 @@ def entities_devices_stmt(
             states_metadata_ids,
             json_quoted_entity_ids,
             json_quoted_device_ids,
-        ).order_by(Events.time_fired_ts)
+        ).order_by(Events.time_fired_ts, ROW_KIND_ORDER, ROW_ID_ORDER)
     )
     return stmt
 
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import asyncio
 from collections.abc import Callable
+from contextlib import closing
 from dataclasses import dataclass
 from datetime import datetime as dt, timedelta
 import logging
@@ -34,6 +35,8 @@ EVENT_COALESCE_TIME = 0.35
 BIG_QUERY_HOURS = 25
 # how many hours to deliver in the first chunk when we split the query
 BIG_QUERY_RECENT_HOURS = 24
+# how many historical events to send per message while they are fetched
+STREAM_CHUNK_SIZE = 1000
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -104,6 +107,7 @@ async def _async_send_historical_events(
     if not is_big_query:
         message, last_event_time = await _async_get_ws_stream_events(
             hass,
+            connection,
             msg_id,
             start_time,
             end_time,
@@ -126,6 +130,7 @@ async def _async_send_historical_events(
     recent_query_start = end_time - timedelta(hours=BIG_QUERY_RECENT_HOURS)
     recent_message, recent_query_last_event_time = await _async_get_ws_stream_events(
         hass,
+        connection,
         msg_id,
         recent_query_start,
         end_time,
@@ -138,6 +143,7 @@ async def _async_send_historical_events(
 
     older_message, older_query_last_event_time = await _async_get_ws_stream_events(
         hass,
+        connection,
         msg_id,
         start_time,
         recent_query_start,
@@ -159,6 +165,7 @@ async def _async_send_historical_events(
 
 async def _async_get_ws_stream_events(
     hass: HomeAssistant,
+    connection: ActiveConnection,
     msg_id: int,
     start_time: dt,
     end_time: dt,
@@ -169,6 +176,7 @@ async def _async_get_ws_stream_events(
     """Async wrapper around _ws_formatted_get_events."""
     return await get_instance(hass).async_add_executor_job(
         _ws_stream_get_events,
+        connection,
         msg_id,
         start_time,
         end_time,
@@ -190,6 +198,7 @@ def _generate_stream_message(
 
 
 def _ws_stream_get_events(
+    connection: ActiveConnection,
     msg_id: int,
     start_day: dt,
     end_day: dt,
@@ -197,11 +206,31 @@ def _ws_stream_get_events(
     event_processor: EventProcessor,
     partial: bool,
 ) -> tuple[str, dt | None]:
-    """Fetch events and convert them to json in the executor."""
-    events = event_processor.get_events(start_day, end_day)
-    last_time = None
+    """Fetch events and convert them to json in the executor.
+
+    Every STREAM_CHUNK_SIZE events are sent as a partial message while the
+    rows are still being fetched. The message with the remaining events is
+    returned.
+    """
+    call_soon_threadsafe = event_processor.hass.loop.call_soon_threadsafe
+    events: list[dict[str, Any]] = []
+    last_event: dict[str, Any] | None = None
+    for event in event_processor.iter_events(start_day, end_day):
+        events.append(event)
+        if len(events) < STREAM_CHUNK_SIZE:
+            continue
+        last_event = event
+        chunk_message = _generate_stream_message(events, start_day, end_day)
+        chunk_message["partial"] = True
+        call_soon_threadsafe(
+            connection.send_message, JSON_DUMP(formatter(msg_id, chunk_message))
+        )
+        events = []
     if events:
-        last_time = dt_util.utc_from_timestamp(events[-1]["when"])
+        last_event = events[-1]
+    last_time = None
+    if last_event:
+        last_time = dt_util.utc_from_timestamp(last_event["when"])
     message = _generate_stream_message(events, start_day, end_day)
     if partial:
         # This is a hint to consumers of the api that
@@ -436,11 +465,53 @@ def _ws_formatted_get_events(
     end_time: dt,
     event_processor: EventProcessor,
 ) -> str:
-    """Fetch events and convert them to json in the executor."""
+    """Fetch events and convert them to json in the executor.
+
+    Events are serialized as they are fetched so only their JSON is kept.
+    """
+    joined_events = ",".join(
+        JSON_DUMP(event) for event in event_processor.iter_events(start_time, end_time)
+    )
+    return messages.construct_result_message(msg_id, f"[{joined_events}]")
+
+
+def _parse_cursor(cursor: str) -> tuple[float, int, int] | None:
+    """Parse a logbook page cursor into the time, kind and id of the last row."""
+    try:
+        time_str, row_kind_str, row_id_str = cursor.split(":")
+        return float(time_str), int(row_kind_str), int(row_id_str)
+    except ValueError:
+        return None
+
+
+def _ws_formatted_get_events_page(
+    msg_id: int,
+    start_time: dt,
+    end_time: dt,
+    event_processor: EventProcessor,
+    limit: int | None,
+    cursor: tuple[float, int, int] | None,
+) -> str:
+    """Fetch a page of events and convert it to json in the executor.
+
+    The cursor is the time, the kind and the event or state id of the row
+    of the last event of the page. Fetching stops once the page is full.
+    """
+    events: list[dict[str, Any]] = []
+    next_cursor: str | None = None
+    last_key: tuple[float, int, int] | None = None
+    with closing(
+        event_processor.iter_events_after(start_time, end_time, cursor)
+    ) as events_iter:
+        for key, event in events_iter:
+            if len(events) == limit:
+                assert last_key is not None
+                next_cursor = ":".join(map(str, last_key))
+                break
+            events.append(event)
+            last_key = key
     return JSON_DUMP(
-        messages.result_message(
-            msg_id, event_processor.get_events(start_time, end_time)
-        )
+        messages.result_message(msg_id, {"events": events, "next_cursor": next_cursor})
     )
 
 
@@ -452,6 +523,8 @@ def _ws_formatted_get_events(
         vol.Optional("entity_ids"): [str],
         vol.Optional("device_ids"): [str],
         vol.Optional("context_id"): str,
+        vol.Optional("limit"): vol.All(int, vol.Range(min=1)),
+        vol.Optional("cursor"): str,
     }
 )
 @websocket_api.async_response
@@ -477,8 +550,24 @@ async def ws_get_events(
         connection.send_error(msg["id"], "invalid_end_time", "Invalid end_time")
         return
 
+    limit: int | None = msg.get("limit")
+    cursor: tuple[float, int, int] | None = None
+    if (cursor_str := msg.get("cursor")) is not None:
+        if (cursor := _parse_cursor(cursor_str)) is None:
+            connection.send_error(msg["id"], "invalid_cursor", "Invalid cursor")
+            return
+        # The query excludes the start time, start just before the cursor
+        start_time = max(
+            start_time,
+            dt_util.utc_from_timestamp(cursor[0]) - timedelta(microseconds=1),
+        )
+    paginated = limit is not None or cursor is not None
+
     if start_time > utc_now:
-        connection.send_result(msg["id"], [])
+        if paginated:
+            connection.send_result(msg["id"], {"events": [], "next_cursor": None})
+        else:
+            connection.send_result(msg["id"], [])
         return
 
     device_ids = msg.get("device_ids")
@@ -488,7 +577,10 @@ async def ws_get_events(
         entity_ids = async_filter_entities(hass, entity_ids)
         if not entity_ids and not device_ids:
             # Everything has been filtered away
-            connection.send_result(msg["id"], [])
+            if paginated:
+                connection.send_result(msg["id"], {"events": [], "next_cursor": None})
+            else:
+                connection.send_result(msg["id"], [])
             return
 
     event_types = async_determine_event_types(hass, entity_ids, device_ids)
@@ -503,6 +595,20 @@ async def ws_get_events(
         include_entity_name=False,
     )
 
+    if paginated:
+        connection.send_message(
+            await get_instance(hass).async_add_executor_job(
+                _ws_formatted_get_events_page,
+                msg["id"],
+                start_time,
+                end_time,
+                event_processor,
+                limit,
+                cursor,
+            )
+        )
+        return
+
     connection.send_message(
         await get_instance(hass).async_add_executor_job(
             _ws_formatted_get_events,
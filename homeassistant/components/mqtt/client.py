@@ -2,8 +2,8 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable, Coroutine, Iterable
-from functools import lru_cache
+from collections import Counter, deque
+from collections.abc import Callable, Coroutine, Iterable, Iterator
 from itertools import chain, groupby
 import logging
 from operator import attrgetter
@@ -92,6 +92,7 @@ DISCOVERY_COOLDOWN = 2
 INITIAL_SUBSCRIBE_COOLDOWN = 1.0
 SUBSCRIBE_COOLDOWN = 0.1
 UNSUBSCRIBE_COOLDOWN = 0.1
+MATCHING_SUBSCRIPTIONS_CACHE_SIZE = 8192
 TIMEOUT_ACK = 10
 
 MQTT_ENTRIES_NAMING_BLOG_URL = (
@@ -289,6 +290,220 @@ def _is_simple_match(topic: str) -> bool:
     return not ("+" in topic or "#" in topic)
 
 
+class _TopicNode:
+    """Node of the wildcard subscription trie, one per topic filter level."""
+
+    __slots__ = ("children", "subscriptions")
+
+    def __init__(self) -> None:
+        """Initialize the node."""
+        self.children: dict[str, _TopicNode] = {}
+        self.subscriptions: list[Subscription] = []
+
+
+class _WildcardSubscriptionTrie:
+    """Trie of wildcard subscriptions keyed by topic filter level.
+
+    Matching a topic visits only the branches for its levels, and the
+    "+" and "#" branches, instead of testing every wildcard subscription.
+    """
+
+    __slots__ = ("_root", "_order", "_sequence")
+
+    def __init__(self) -> None:
+        """Initialize the trie."""
+        self._root = _TopicNode()
+        # Subscription -> sequence number, used to return matches
+        # in the order the subscriptions were made
+        self._order: dict[Subscription, int] = {}
+        self._sequence = 0
+
+    def __iter__(self) -> Iterator[Subscription]:
+        """Iterate over the subscriptions in the order they were added."""
+        return iter(self._order)
+
+    def add(self, subscription: Subscription) -> None:
+        """Add a subscription."""
+        node = self._root
+        for level in subscription.topic.split("/"):
+            if (child := node.children.get(level)) is None:
+                child = node.children[level] = _TopicNode()
+            node = child
+        node.subscriptions.append(subscription)
+        self._order[subscription] = self._sequence
+        self._sequence += 1
+
+    def remove(self, subscription: Subscription) -> None:
+        """Remove a subscription.
+
+        Raises KeyError or ValueError if the subscription is not tracked.
+        """
+        path: list[tuple[_TopicNode, str]] = []
+        node = self._root
+        for level in subscription.topic.split("/"):
+            path.append((node, level))
+            node = node.children[level]
+        node.subscriptions.remove(subscription)
+        del self._order[subscription]
+        # Prune the branches that no longer hold subscriptions
+        for parent, level in reversed(path):
+            child = parent.children[level]
+            if child.children or child.subscriptions:
+                break
+            del parent.children[level]
+
+    def has_topic_filter(self, topic_filter: str) -> bool:
+        """Return if there is a subscription for exactly this topic filter."""
+        node = self._root
+        for level in topic_filter.split("/"):
+            if (child := node.children.get(level)) is None:
+                return False
+            node = child
+        return bool(node.subscriptions)
+
+    def match(self, topic: str) -> list[Subscription]:
+        """Return the subscriptions matching a topic."""
+        levels = topic.split("/")
+        # Wildcards at the first level do not match topics starting with $
+        wildcard_first_level = not topic.startswith("$")
+        matches: list[Subscription] = []
+        nodes = [self._root]
+        for index, level in enumerate(levels):
+            wildcards = index > 0 or wildcard_first_level
+            next_nodes: list[_TopicNode] = []
+            for node in nodes:
+                children = node.children
+                if (child := children.get(level)) is not None:
+                    next_nodes.append(child)
+                if not wildcards:
+                    continue
+                if (child := children.get("+")) is not None:
+                    next_nodes.append(child)
+                if (child := children.get("#")) is not None:
+                    matches.extend(child.subscriptions)
+            if not next_nodes:
+                break
+            nodes = next_nodes
+        else:
+            for node in nodes:
+                matches.extend(node.subscriptions)
+                # A filter like "level/#" also matches its parent level
+                if (child := node.children.get("#")) is not None:
+                    matches.extend(child.subscriptions)
+        if len(matches) > 1:
+            matches.sort(key=self._order.__getitem__)
+        return matches
+
+
+class _CachedTopicNode:
+    """Node of the cached topic index, one per topic level."""
+
+    __slots__ = ("children", "topic")
+
+    def __init__(self) -> None:
+        """Initialize the node."""
+        self.children: dict[str, _CachedTopicNode] = {}
+        # The cached topic ending at this node
+        self.topic: str | None = None
+
+
+class _MatchingSubscriptionsCache:
+    """Bounded cache of the subscriptions matching a topic.
+
+    The cached topics are also kept in a trie keyed by topic level, so a
+    wildcard subscription finds the cached topics it matches by walking its
+    filter through the trie instead of testing every cached topic.
+    """
+
+    __slots__ = ("_entries", "_root")
+
+    def __init__(self) -> None:
+        """Initialize the cache."""
+        self._entries: dict[str, list[Subscription]] = {}
+        self._root = _CachedTopicNode()
+
+    def __len__(self) -> int:
+        """Return the number of cached topics."""
+        return len(self._entries)
+
+    def get(self, topic: str) -> list[Subscription] | None:
+        """Return the cached subscriptions matching a topic."""
+        return self._entries.get(topic)
+
+    def set(self, topic: str, subscriptions: list[Subscription]) -> None:
+        """Cache the subscriptions matching a topic."""
+        entries = self._entries
+        if topic not in entries:
+            if len(entries) >= MATCHING_SUBSCRIPTIONS_CACHE_SIZE:
+                # Evict the oldest entry to keep the cache bounded
+                self._remove(next(iter(entries)))
+            node = self._root
+            for level in topic.split("/"):
+                if (child := node.children.get(level)) is None:
+                    child = node.children[level] = _CachedTopicNode()
+                node = child
+            node.topic = topic
+        entries[topic] = subscriptions
+
+    def invalidate(self, topic_filter: str) -> None:
+        """Drop the cached topics matching a topic filter."""
+        if _is_simple_match(topic_filter):
+            if topic_filter in self._entries:
+                self._remove(topic_filter)
+            return
+        topics: list[str] = []
+        nodes = [self._root]
+        for index, level in enumerate(topic_filter.split("/")):
+            next_nodes: list[_CachedTopicNode] = []
+            for node in nodes:
+                # Wildcards at the first level do not match topics starting with $
+                children = (
+                    node.children.items()
+                    if index
+                    else [
+                        (name, child)
+                        for name, child in node.children.items()
+                        if not name.startswith("$")
+                    ]
+                )
+                if level == "#":
+                    # "level/#" also matches its parent level
+                    if node.topic is not None:
+                        topics.append(node.topic)
+                    stack = [child for _, child in children]
+                    while stack:
+                        descendant = stack.pop()
+                        if descendant.topic is not None:
+                            topics.append(descendant.topic)
+                        stack.extend(descendant.children.values())
+                elif level == "+":
+                    next_nodes.extend(child for _, child in children)
+                elif (child := node.children.get(level)) is not None:
+                    next_nodes.append(child)
+            if not next_nodes:
+                break
+            nodes = next_nodes
+        else:
+            topics.extend(node.topic for node in nodes if node.topic is not None)
+        for topic in topics:
+            self._remove(topic)
+
+    def _remove(self, topic: str) -> None:
+        """Remove a cached topic and prune its branch of the trie."""
+        del self._entries[topic]
+        path: list[tuple[_CachedTopicNode, str]] = []
+        node = self._root
+        for level in topic.split("/"):
+            path.append((node, level))
+            node = node.children[level]
+        node.topic = None
+        for parent, level in reversed(path):
+            child = parent.children[level]
+            if child.children or child.topic is not None:
+                break
+            del parent.children[level]
+
+
 class EnsureJobAfterCooldown:
     """Ensure a cool down period before executing a job.
 
@@ -380,7 +595,10 @@ class MQTT:
         self.conf = conf
 
         self._simple_subscriptions: dict[str, list[Subscription]] = {}
-        self._wildcard_subscriptions: list[Subscription] = []
+        self._wildcard_subscriptions = _WildcardSubscriptionTrie()
+        # Entries are invalidated when a subscription
+        # matching the topic is added or removed
+        self._matching_subscriptions_cache = _MatchingSubscriptionsCache()
         # _retained_topics prevents a Subscription from receiving a
         # retained message more than once per topic. This prevents flooding
         # already active subscribers when new subscribers subscribe to a topic
@@ -402,6 +620,12 @@ class MQTT:
             UNSUBSCRIBE_COOLDOWN, self._async_perform_unsubscribes
         )
         self._pending_unsubscribes: set[str] = set()  # topic
+        # Messages received by the paho thread, waiting to be handled
+        # by the event loop in a single drain
+        self._pending_messages: deque[mqtt.MQTTMessage] = deque()
+        self._pending_messages_drain_scheduled = False
+        # number of messages handled per drain -> number of drains
+        self.messages_per_drain: Counter[int] = Counter()
 
         if self.hass.state == CoreState.running:
             self._ha_started.set()
@@ -483,8 +707,9 @@ class MQTT:
 
     def _is_active_subscription(self, topic: str) -> bool:
         """Check if a topic has an active subscription."""
-        return topic in self._simple_subscriptions or any(
-            other.topic == topic for other in self._wildcard_subscriptions
+        return (
+            topic in self._simple_subscriptions
+            or self._wildcard_subscriptions.has_topic_filter(topic)
         )
 
     async def async_publish(
@@ -565,30 +790,26 @@ class MQTT:
         """Restore tracked subscriptions after reload."""
         for subscription in subscriptions:
             self._async_track_subscription(subscription)
-        self._matching_subscriptions.cache_clear()
 
     @callback
     def _async_track_subscription(self, subscription: Subscription) -> None:
         """Track a subscription.
 
         This method does not send a SUBSCRIBE message to the broker.
-
-        The caller is responsible clearing the cache of _matching_subscriptions.
         """
         if _is_simple_match(subscription.topic):
             self._simple_subscriptions.setdefault(subscription.topic, []).append(
                 subscription
             )
         else:
-            self._wildcard_subscriptions.append(subscription)
+            self._wildcard_subscriptions.add(subscription)
+        self._matching_subscriptions_cache.invalidate(subscription.topic)
 
     @callback
     def _async_untrack_subscription(self, subscription: Subscription) -> None:
         """Untrack a subscription.
 
         This method does not send an UNSUBSCRIBE message to the broker.
-
-        The caller is responsible clearing the cache of _matching_subscriptions.
         """
         topic = subscription.topic
         try:
@@ -601,6 +822,7 @@ class MQTT:
                 self._wildcard_subscriptions.remove(subscription)
         except (KeyError, ValueError) as ex:
             raise HomeAssistantError("Can't remove subscription twice") from ex
+        self._matching_subscriptions_cache.invalidate(topic)
 
     @callback
     def _async_queue_subscriptions(
@@ -637,7 +859,6 @@ class MQTT:
             topic, _matcher_for_topic(topic), HassJob(msg_callback), qos, encoding
         )
         self._async_track_subscription(subscription)
-        self._matching_subscriptions.cache_clear()
 
         # Only subscribe if currently connected.
         if self.connected:
@@ -647,7 +868,6 @@ class MQTT:
         def async_remove() -> None:
             """Remove subscription."""
             self._async_untrack_subscription(subscription)
-            self._matching_subscriptions.cache_clear()
             if subscription in self._retained_topics:
                 del self._retained_topics[subscription]
             # Only unsubscribe if currently connected
@@ -805,17 +1025,45 @@ class MQTT:
     def _mqtt_on_message(
         self, _mqttc: mqtt.Client, _userdata: None, msg: mqtt.MQTTMessage
     ) -> None:
-        """Message received callback."""
-        self.hass.add_job(self._mqtt_handle_message, msg)
+        """Message received callback.
+
+        Messages are buffered and handed to the event loop in batches,
+        so a burst of messages only wakes up the loop once.
+        """
+        self._pending_messages.append(msg)
+        if self._pending_messages_drain_scheduled:
+            return
+        self._pending_messages_drain_scheduled = True
+        self.hass.loop.call_soon_threadsafe(self._async_drain_pending_messages)
+
+    @callback
+    def _async_drain_pending_messages(self) -> None:
+        """Handle all messages buffered by the paho thread."""
+        # Reset the flag before draining, a message appended while
+        # draining either gets drained now or schedules a new drain
+        self._pending_messages_drain_scheduled = False
+        pending_messages = self._pending_messages
+        count = 0
+        while pending_messages:
+            msg = pending_messages.popleft()
+            count += 1
+            try:
+                self._mqtt_handle_message(msg)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Error handling MQTT message on %s", msg.topic)
+        if count:
+            self.messages_per_drain[count] += 1
 
-    @lru_cache(None)  # pylint: disable=method-cache-max-size-none
     def _matching_subscriptions(self, topic: str) -> list[Subscription]:
-        subscriptions: list[Subscription] = []
-        if topic in self._simple_subscriptions:
-            subscriptions.extend(self._simple_subscriptions[topic])
-        for subscription in self._wildcard_subscriptions:
-            if subscription.matcher(topic):
-                subscriptions.append(subscription)
+        """Return the subscriptions matching a topic."""
+        cache = self._matching_subscriptions_cache
+        if (subscriptions := cache.get(topic)) is not None:
+            return subscriptions
+        subscriptions = [
+            *self._simple_subscriptions.get(topic, ()),
+            *self._wildcard_subscriptions.match(topic),
+        ]
+        cache.set(topic, subscriptions)
         return subscriptions
 
     @callback
@@ -1,4 +1,7 @@
 """Support for Prometheus metrics export."""
+from __future__ import annotations
+
+import asyncio
 from contextlib import suppress
 import logging
 import string
@@ -92,10 +95,6 @@ CONFIG_SCHEMA = vol.Schema(
 
 def setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Activate Prometheus component."""
-    hass.http.register_view(
-        PrometheusView(prometheus_client, config[DOMAIN][CONF_REQUIRES_AUTH])
-    )
-
     conf = config[DOMAIN]
     entity_filter = conf[CONF_FILTER]
     namespace = conf.get(CONF_PROM_NAMESPACE)
@@ -117,6 +116,9 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:
         override_metric,
         default_metric,
     )
+    hass.http.register_view(
+        PrometheusView(prometheus_client, metrics, conf[CONF_REQUIRES_AUTH])
+    )
 
     hass.bus.listen(EVENT_STATE_CHANGED, metrics.handle_state_changed)
     hass.bus.listen(
@@ -158,6 +160,12 @@ class PrometheusMetrics:
             self.metrics_prefix = ""
         self._metrics = {}
         self._climate_units = climate_units
+        # The entity metrics are kept apart from the collectors of the
+        # process, so their exposition can be cached between changes
+        self.registry = prometheus_cli.CollectorRegistry(auto_describe=True)
+        self.generation = 0
+        self._handlers = {}
+        self._entity_children = {}
 
     def handle_state_changed(self, event):
         """Listen for new messages on the bus, and add them to Prometheus."""
@@ -178,30 +186,37 @@ class PrometheusMetrics:
 
         ignored_states = (STATE_UNAVAILABLE, STATE_UNKNOWN)
 
-        handler = f"_handle_{domain}"
+        try:
+            handler = self._handlers[domain]
+        except KeyError:
+            handler = self._handlers[domain] = getattr(self, f"_handle_{domain}", None)
 
-        if hasattr(self, handler) and state.state not in ignored_states:
-            getattr(self, handler)(state)
+        if handler is not None and state.state not in ignored_states:
+            handler(state)
 
-        labels = self._labels(state)
         state_change = self._metric(
             "state_change", self.prometheus_cli.Counter, "The number of state changes"
         )
-        state_change.labels(**labels).inc()
+        self._labelled(state_change, state).inc()
 
         entity_available = self._metric(
             "entity_available",
             self.prometheus_cli.Gauge,
             "Entity is available (not in the unavailable or unknown state)",
         )
-        entity_available.labels(**labels).set(float(state.state not in ignored_states))
+        self._labelled(entity_available, state).set(
+            float(state.state not in ignored_states)
+        )
 
         last_updated_time_seconds = self._metric(
             "last_updated_time_seconds",
             self.prometheus_cli.Gauge,
             "The last_updated timestamp",
         )
-        last_updated_time_seconds.labels(**labels).set(state.last_updated.timestamp())
+        self._labelled(last_updated_time_seconds, state).set(
+            state.last_updated.timestamp()
+        )
+        self.generation += 1
 
     def handle_entity_registry_updated(self, event):
         """Listen for deleted, disabled or renamed entities and remove them from the Prometheus Registry."""
@@ -225,9 +240,11 @@ class PrometheusMetrics:
 
         if metrics_entity_id:
             self._remove_labelsets(metrics_entity_id)
+            self.generation += 1
 
     def _remove_labelsets(self, entity_id, friendly_name=None):
         """Remove labelsets matching the given entity id from all metrics."""
+        self._entity_children.pop(entity_id, None)
         for _, metric in self._metrics.items():
             for sample in metric.collect()[0].samples:
                 if sample.labels["entity"] == entity_id and (
@@ -251,18 +268,17 @@ class PrometheusMetrics:
 
             try:
                 value = float(value)
-                metric.labels(**self._labels(state)).set(value)
+                self._labelled(metric, state).set(value)
             except (ValueError, TypeError):
                 pass
 
     def _metric(self, metric, factory, documentation, extra_labels=None):
-        labels = ["entity", "friendly_name", "domain"]
-        if extra_labels is not None:
-            labels.extend(extra_labels)
-
         try:
             return self._metrics[metric]
         except KeyError:
+            labels = ["entity", "friendly_name", "domain"]
+            if extra_labels is not None:
+                labels.extend(extra_labels)
             full_metric_name = self._sanitize_metric_name(
                 f"{self.metrics_prefix}{metric}"
             )
@@ -270,7 +286,7 @@ class PrometheusMetrics:
                 full_metric_name,
                 documentation,
                 labels,
-                registry=self.prometheus_cli.REGISTRY,
+                registry=self.registry,
             )
             return self._metrics[metric]
 
@@ -298,13 +314,23 @@ class PrometheusMetrics:
             value = 0
         return value
 
-    @staticmethod
-    def _labels(state):
-        return {
-            "entity": state.entity_id,
-            "domain": state.domain,
-            "friendly_name": state.attributes.get(ATTR_FRIENDLY_NAME),
-        }
+    def _labelled(self, metric, state, *extra_label_values):
+        """Return the child of a metric for an entity.
+
+        The children are cached per entity and dropped when the labelsets of
+        the entity are removed or its friendly name changes.
+        """
+        friendly_name = state.attributes.get(ATTR_FRIENDLY_NAME)
+        cached = self._entity_children.get(state.entity_id)
+        if cached is None or cached[0] != friendly_name:
+            cached = self._entity_children[state.entity_id] = (friendly_name, {})
+        children = cached[1]
+        key = (metric, extra_label_values)
+        if (child := children.get(key)) is None:
+            child = children[key] = metric.labels(
+                state.entity_id, friendly_name, state.domain, *extra_label_values
+            )
+        return child
 
     def _battery(self, state):
         if "battery_level" in state.attributes:
@@ -315,7 +341,7 @@ class PrometheusMetrics:
             )
             try:
                 value = float(state.attributes[ATTR_BATTERY_LEVEL])
-                metric.labels(**self._labels(state)).set(value)
+                self._labelled(metric, state).set(value)
             except ValueError:
                 pass
 
@@ -326,7 +352,7 @@ class PrometheusMetrics:
             "State of the binary sensor (0/1)",
         )
         value = self.state_as_number(state)
-        metric.labels(**self._labels(state)).set(value)
+        self._labelled(metric, state).set(value)
 
     def _handle_input_boolean(self, state):
         metric = self._metric(
@@ -335,7 +361,7 @@ class PrometheusMetrics:
             "State of the input boolean (0/1)",
         )
         value = self.state_as_number(state)
-        metric.labels(**self._labels(state)).set(value)
+        self._labelled(metric, state).set(value)
 
     def _handle_input_number(self, state):
         if unit := self._unit_string(state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)):
@@ -360,7 +386,7 @@ class PrometheusMetrics:
                 value = TemperatureConverter.convert(
                     value, UnitOfTemperature.FAHRENHEIT, UnitOfTemperature.CELSIUS
                 )
-            metric.labels(**self._labels(state)).set(value)
+            self._labelled(metric, state).set(value)
 
     def _handle_device_tracker(self, state):
         metric = self._metric(
@@ -369,14 +395,14 @@ class PrometheusMetrics:
             "State of the device tracker (0/1)",
         )
         value = self.state_as_number(state)
-        metric.labels(**self._labels(state)).set(value)
+        self._labelled(metric, state).set(value)
 
     def _handle_person(self, state):
         metric = self._metric(
             "person_state", self.prometheus_cli.Gauge, "State of the person (0/1)"
         )
         value = self.state_as_number(state)
-        metric.labels(**self._labels(state)).set(value)
+        self._labelled(metric, state).set(value)
 
     def _handle_cover(self, state):
         metric = self._metric(
@@ -388,7 +414,7 @@ class PrometheusMetrics:
 
         cover_states = [STATE_CLOSED, STATE_CLOSING, STATE_OPEN, STATE_OPENING]
         for cover_state in cover_states:
-            metric.labels(**dict(self._labels(state), state=cover_state)).set(
+            self._labelled(metric, state, cover_state).set(
                 float(cover_state == state.state)
             )
 
@@ -399,7 +425,7 @@ class PrometheusMetrics:
                 self.prometheus_cli.Gauge,
                 "Position of the cover (0-100)",
             )
-            position_metric.labels(**self._labels(state)).set(float(position))
+            self._labelled(position_metric, state).set(float(position))
 
         tilt_position = state.attributes.get(ATTR_TILT_POSITION)
         if tilt_position is not None:
@@ -408,7 +434,7 @@ class PrometheusMetrics:
                 self.prometheus_cli.Gauge,
                 "Tilt Position of the cover (0-100)",
             )
-            tilt_position_metric.labels(**self._labels(state)).set(float(tilt_position))
+            self._labelled(tilt_position_metric, state).set(float(tilt_position))
 
     def _handle_light(self, state):
         metric = self._metric(
@@ -423,7 +449,7 @@ class PrometheusMetrics:
             else:
                 value = self.state_as_number(state)
             value = value * 100
-            metric.labels(**self._labels(state)).set(value)
+            self._labelled(metric, state).set(value)
         except ValueError:
             pass
 
@@ -432,7 +458,7 @@ class PrometheusMetrics:
             "lock_state", self.prometheus_cli.Gauge, "State of the lock (0/1)"
         )
         value = self.state_as_number(state)
-        metric.labels(**self._labels(state)).set(value)
+        self._labelled(metric, state).set(value)
 
     def _handle_climate_temp(self, state, attr, metric_name, metric_description):
         if (temp := state.attributes.get(attr)) is not None:
@@ -445,7 +471,7 @@ class PrometheusMetrics:
                 self.prometheus_cli.Gauge,
                 metric_description,
             )
-            metric.labels(**self._labels(state)).set(temp)
+            self._labelled(metric, state).set(temp)
 
     def _handle_climate(self, state):
         self._handle_climate_temp(
@@ -481,7 +507,7 @@ class PrometheusMetrics:
                 ["action"],
             )
             for action in HVACAction:
-                metric.labels(**dict(self._labels(state), action=action.value)).set(
+                self._labelled(metric, state, action.value).set(
                     float(action == current_action)
                 )
 
@@ -495,9 +521,7 @@ class PrometheusMetrics:
                 ["mode"],
             )
             for mode in available_modes:
-                metric.labels(**dict(self._labels(state), mode=mode)).set(
-                    float(mode == current_mode)
-                )
+                self._labelled(metric, state, mode).set(float(mode == current_mode))
 
     def _handle_humidifier(self, state):
         humidifier_target_humidity_percent = state.attributes.get(ATTR_HUMIDITY)
@@ -507,7 +531,7 @@ class PrometheusMetrics:
                 self.prometheus_cli.Gauge,
                 "Target Relative Humidity",
             )
-            metric.labels(**self._labels(state)).set(humidifier_target_humidity_percent)
+            self._labelled(metric, state).set(humidifier_target_humidity_percent)
 
         metric = self._metric(
             "humidifier_state",
@@ -516,7 +540,7 @@ class PrometheusMetrics:
         )
         try:
             value = self.state_as_number(state)
-            metric.labels(**self._labels(state)).set(value)
+            self._labelled(metric, state).set(value)
         except ValueError:
             pass
 
@@ -530,9 +554,7 @@ class PrometheusMetrics:
                 ["mode"],
             )
             for mode in available_modes:
-                metric.labels(**dict(self._labels(state), mode=mode)).set(
-                    float(mode == current_mode)
-                )
+                self._labelled(metric, state, mode).set(float(mode == current_mode))
 
     def _handle_sensor(self, state):
         unit = self._unit_string(state.attributes.get(ATTR_UNIT_OF_MEASUREMENT))
@@ -558,7 +580,7 @@ class PrometheusMetrics:
                     value = TemperatureConverter.convert(
                         value, UnitOfTemperature.FAHRENHEIT, UnitOfTemperature.CELSIUS
                     )
-                _metric.labels(**self._labels(state)).set(value)
+                self._labelled(_metric, state).set(value)
             except ValueError:
                 pass
 
@@ -620,7 +642,7 @@ class PrometheusMetrics:
 
         try:
             value = self.state_as_number(state)
-            metric.labels(**self._labels(state)).set(value)
+            self._labelled(metric, state).set(value)
         except ValueError:
             pass
 
@@ -636,7 +658,7 @@ class PrometheusMetrics:
             "Count of times an automation has been triggered",
         )
 
-        metric.labels(**self._labels(state)).inc()
+        self._labelled(metric, state).inc()
 
     def _handle_counter(self, state):
         metric = self._metric(
@@ -645,7 +667,7 @@ class PrometheusMetrics:
             "Value of counter entities",
         )
 
-        metric.labels(**self._labels(state)).set(self.state_as_number(state))
+        self._labelled(metric, state).set(self.state_as_number(state))
 
 
 class PrometheusView(HomeAssistantView):
@@ -654,16 +676,34 @@ class PrometheusView(HomeAssistantView):
     url = API_ENDPOINT
     name = "api:prometheus"
 
-    def __init__(self, prometheus_cli, requires_auth: bool) -> None:
+    def __init__(
+        self, prometheus_cli, metrics: PrometheusMetrics, requires_auth: bool
+    ) -> None:
         """Initialize Prometheus view."""
         self.requires_auth = requires_auth
         self.prometheus_cli = prometheus_cli
+        self._metrics = metrics
+        self._lock = asyncio.Lock()
+        self._generation: int | None = None
+        self._entity_metrics = b""
 
     async def get(self, request):
         """Handle request for Prometheus metrics."""
         _LOGGER.debug("Received Prometheus metrics request")
 
+        hass = request.app["hass"]
+        async with self._lock:
+            # Entity metrics are only generated again once they changed,
+            # the generation is read first so no change is missed
+            if (generation := self._metrics.generation) != self._generation:
+                self._entity_metrics = await hass.async_add_executor_job(
+                    self.prometheus_cli.generate_latest, self._metrics.registry
+                )
+                self._generation = generation
+            entity_metrics = self._entity_metrics
+
         return web.Response(
-            body=self.prometheus_cli.generate_latest(self.prometheus_cli.REGISTRY),
+            body=self.prometheus_cli.generate_latest(self.prometheus_cli.REGISTRY)
+            + entity_metrics,
             content_type=CONTENT_TYPE_TEXT_PLAIN,
         )
@@ -0,0 +1,380 @@
+"""Bulk insert write path for the recorder.
+
+Instead of adding an ORM object to the event session for every event, the
+bulk writer collects plain States and Events rows for the commit interval
+and emits them with executemany Core inserts when the session is committed.
+
+The ids of the shared rows (states_meta, state_attributes, event_types and
+event_data) are resolved in bulk at commit time through the table managers,
+which keep owning the pending objects and the LRU id maps.
+"""
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, Protocol, cast
+
+from sqlalchemy import Table, bindparam, insert, update
+from sqlalchemy.engine import CursorResult
+from sqlalchemy.orm.session import Session
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Event, State
+import homeassistant.util.dt as dt_util
+
+from .db_schema import (
+    EVENT_ORIGIN_TO_IDX,
+    Base,
+    EventData,
+    Events,
+    EventTypes,
+    StateAttributes,
+    States,
+    StatesMeta,
+)
+from .models import ulid_to_bytes_or_none, uuid_hex_to_bytes_or_none
+
+if TYPE_CHECKING:
+    from .core import Recorder
+
+
+class _PendingRowsManager(Protocol):
+    """Table manager which keeps the rows waiting to be committed."""
+
+    def get_pending(self, shared_data: str, /) -> Any:
+        """Get a pending row which has not been assigned an id yet."""
+
+    def add_pending(self, db_obj: Any, /) -> None:
+        """Add a pending row that will be committed at the next interval."""
+
+
+_STATES_TABLE = cast(Table, States.__table__)
+_EVENTS_TABLE = cast(Table, Events.__table__)
+
+_INSERT_EVENTS = insert(_EVENTS_TABLE)
+_INSERT_STATES = insert(_STATES_TABLE)
+_INSERT_STATES_RETURNING_STATE_ID = insert(_STATES_TABLE).returning(
+    _STATES_TABLE.c.state_id, sort_by_parameter_order=True
+)
+_UPDATE_OLD_STATE_ID = (
+    update(_STATES_TABLE)
+    .where(_STATES_TABLE.c.state_id == bindparam("b_state_id"))
+    .values(old_state_id=bindparam("b_old_state_id"))
+)
+
+_RowT = dict[str, Any]
+
+
+def state_row_from_event(event: Event) -> _RowT:
+    """Create a states table row from a state_changed event."""
+    state: State | None = event.data.get("new_state")
+    context = event.context
+    if state is None:
+        # None state means the state was removed from the state machine
+        state_state = None
+        last_updated_ts = dt_util.utc_to_timestamp(event.time_fired)
+        last_changed_ts = None
+    else:
+        state_state = state.state
+        last_updated_ts = dt_util.utc_to_timestamp(state.last_updated)
+        if state.last_updated == state.last_changed:
+            last_changed_ts = None
+        else:
+            last_changed_ts = dt_util.utc_to_timestamp(state.last_changed)
+    return {
+        "entity_id": None,
+        "state": state_state,
+        "last_updated_ts": last_updated_ts,
+        "last_changed_ts": last_changed_ts,
+        "old_state_id": None,
+        "attributes_id": None,
+        "metadata_id": None,
+        "origin_idx": EVENT_ORIGIN_TO_IDX.get(event.origin),
+        "context_id_bin": ulid_to_bytes_or_none(context.id),
+        "context_user_id_bin": uuid_hex_to_bytes_or_none(context.user_id),
+        "context_parent_id_bin": ulid_to_bytes_or_none(context.parent_id),
+    }
+
+
+def event_row_from_event(event: Event) -> _RowT:
+    """Create an events table row from a native event."""
+    context = event.context
+    return {
+        "event_type_id": None,
+        "data_id": None,
+        "origin_idx": EVENT_ORIGIN_TO_IDX.get(event.origin),
+        "time_fired_ts": dt_util.utc_to_timestamp(event.time_fired),
+        "context_id_bin": ulid_to_bytes_or_none(context.id),
+        "context_user_id_bin": uuid_hex_to_bytes_or_none(context.user_id),
+        "context_parent_id_bin": ulid_to_bytes_or_none(context.parent_id),
+    }
+
+
+class BulkWriter:
+    """Collect States and Events rows and insert them in bulk on commit."""
+
+    def __init__(self, recorder: Recorder) -> None:
+        """Initialize the bulk writer.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self.recorder = recorder
+        self._states: list[_RowT] = []
+        self._events: list[_RowT] = []
+        # (row, old_row) pairs where the old state is part of the same batch
+        self._linked_old_states: list[tuple[_RowT, _RowT]] = []
+        # Rows waiting for the id of a shared row, keyed by the natural key
+        self._missing_metadata_ids: dict[str, list[_RowT]] = {}
+        self._missing_attributes_ids: dict[str, list[_RowT]] = {}
+        self._missing_event_type_ids: dict[str, list[_RowT]] = {}
+        self._missing_data_ids: dict[str, list[_RowT]] = {}
+        self._attributes_hashes: dict[str, int] = {}
+        self._data_hashes: dict[str, int] = {}
+
+    def add_event(self, event: Event) -> None:
+        """Add an event to the current batch.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        if event.event_type == EVENT_STATE_CHANGED:
+            self._add_state_changed_event(event)
+        else:
+            self._add_non_state_changed_event(event)
+
+    def _add_non_state_changed_event(self, event: Event) -> None:
+        """Add any event to the current batch except state changed."""
+        recorder = self.recorder
+        row = event_row_from_event(event)
+
+        if event.data:
+            event_data_manager = recorder.event_data_manager
+            if not (
+                shared_data_bytes := event_data_manager.serialize_from_event(event)
+            ):
+                return
+            shared_data = shared_data_bytes.decode("utf-8")
+            if (data_id := event_data_manager.get_from_cache(shared_data)) is not None:
+                row["data_id"] = data_id
+            elif (rows := self._missing_data_ids.get(shared_data)) is not None:
+                rows.append(row)
+            else:
+                self._missing_data_ids[shared_data] = [row]
+                self._data_hashes[shared_data] = EventData.hash_shared_data_bytes(
+                    shared_data_bytes
+                )
+
+        event_type = event.event_type
+        event_type_manager = recorder.event_type_manager
+        if (event_type_id := event_type_manager.get_from_cache(event_type)) is not None:
+            row["event_type_id"] = event_type_id
+        else:
+            self._missing_event_type_ids.setdefault(event_type, []).append(row)
+
+        self._events.append(row)
+
+    def _add_state_changed_event(self, event: Event) -> None:
+        """Add a state_changed event to the current batch."""
+        recorder = self.recorder
+        state_attributes_manager = recorder.state_attributes_manager
+        entity_id: str | None = event.data["entity_id"]
+        if entity_id is None or not (
+            shared_attrs_bytes := state_attributes_manager.serialize_from_event(event)
+        ):
+            return
+
+        row = state_row_from_event(event)
+
+        states_manager = recorder.states_manager
+        if (old_row := states_manager.pop_pending(entity_id)) is not None:
+            self._linked_old_states.append((row, cast(_RowT, old_row)))
+        elif (old_state_id := states_manager.pop_committed(entity_id)) is not None:
+            row["old_state_id"] = old_state_id
+        if row["state"] is not None:
+            states_manager.add_pending(entity_id, row)
+
+        # Map the entity_id to the StatesMeta table
+        states_meta_manager = recorder.states_meta_manager
+        if not states_meta_manager.active:
+            row["entity_id"] = entity_id
+        if (metadata_id := states_meta_manager.get_from_cache(entity_id)) is not None:
+            row["metadata_id"] = metadata_id
+        else:
+            self._missing_metadata_ids.setdefault(entity_id, []).append(row)
+
+        # Map the attributes to the StateAttributes table
+        shared_attrs = shared_attrs_bytes.decode("utf-8")
+        if (
+            attributes_id := state_attributes_manager.get_from_cache(shared_attrs)
+        ) is not None:
+            row["attributes_id"] = attributes_id
+        elif (rows := self._missing_attributes_ids.get(shared_attrs)) is not None:
+            rows.append(row)
+        else:
+            self._missing_attributes_ids[shared_attrs] = [row]
+            self._attributes_hashes[
+                shared_attrs
+            ] = StateAttributes.hash_shared_attrs_bytes(shared_attrs_bytes)
+
+        self._states.append(row)
+
+    def flush(self, session: Session) -> None:
+        """Insert all rows collected since the last flush into the session.
+
+        The caller is responsible for committing the session.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        recorder = self.recorder
+        states = self._states
+        links: list[tuple[Base, str, list[_RowT]]] = []
+
+        if missing_metadata_ids := self._missing_metadata_ids:
+            states_meta_manager = recorder.states_meta_manager
+            found = states_meta_manager.get_many(missing_metadata_ids, session, True)
+            if states_meta_manager.active and (
+                removed := [
+                    entity_id
+                    for entity_id, rows in missing_metadata_ids.items()
+                    if found[entity_id] is None
+                    and all(row["state"] is None for row in rows)
+                ]
+            ):
+                # If the entity was removed, we don't need to add it to the
+                # StatesMeta table if it does not have a metadata_id allocated
+                # to it as it either never existed or was just renamed.
+                dropped = {
+                    id(row)
+                    for entity_id in removed
+                    for row in missing_metadata_ids.pop(entity_id)
+                }
+                states = [row for row in states if id(row) not in dropped]
+            self._link_ids(
+                session,
+                missing_metadata_ids,
+                found,
+                states_meta_manager,
+                "metadata_id",
+                lambda entity_id: StatesMeta(entity_id=entity_id),
+                links,
+            )
+
+        if missing_attributes_ids := self._missing_attributes_ids:
+            attributes_hashes = self._attributes_hashes
+            self._link_ids(
+                session,
+                missing_attributes_ids,
+                recorder.state_attributes_manager.get_many(
+                    attributes_hashes.items(), session
+                ),
+                recorder.state_attributes_manager,
+                "attributes_id",
+                lambda shared_attrs: StateAttributes(
+                    shared_attrs=shared_attrs, hash=attributes_hashes[shared_attrs]
+                ),
+                links,
+            )
+
+        if missing_event_type_ids := self._missing_event_type_ids:
+            self._link_ids(
+                session,
+                missing_event_type_ids,
+                recorder.event_type_manager.get_many(
+                    missing_event_type_ids, session, True
+                ),
+                recorder.event_type_manager,
+                "event_type_id",
+                lambda event_type: EventTypes(event_type=event_type),
+                links,
+            )
+
+        if missing_data_ids := self._missing_data_ids:
+            data_hashes = self._data_hashes
+            self._link_ids(
+                session,
+                missing_data_ids,
+                recorder.event_data_manager.get_many(data_hashes.items(), session),
+                recorder.event_data_manager,
+                "data_id",
+                lambda shared_data: EventData(
+                    shared_data=shared_data, hash=data_hashes[shared_data]
+                ),
+                links,
+            )
+
+        if links:
+            # Only the new shared rows go through the unit of work
+            session.flush()
+            for db_obj, column, rows in links:
+                db_id = getattr(db_obj, column)
+                for row in rows:
+                    row[column] = db_id
+
+        if self._events:
+            session.execute(_INSERT_EVENTS, self._events)
+
+        if states:
+            self._insert_states(session, states)
+
+        if linked_old_states := [
+            {"b_state_id": row["state_id"], "b_old_state_id": old_row["state_id"]}
+            for row, old_row in self._linked_old_states
+            if "state_id" in row
+        ]:
+            session.execute(_UPDATE_OLD_STATE_ID, linked_old_states)
+
+        self.reset()
+
+    def _link_ids(
+        self,
+        session: Session,
+        missing: dict[str, list[_RowT]],
+        found: dict[str, int | None],
+        manager: _PendingRowsManager,
+        column: str,
+        create: Callable[[str], Base],
+        links: list[tuple[Base, str, list[_RowT]]],
+    ) -> None:
+        """Fill in ids found in the database and create pending rows for the rest."""
+        for key, rows in missing.items():
+            if (db_id := found.get(key)) is not None:
+                for row in rows:
+                    row[column] = db_id
+                continue
+            if (db_obj := manager.get_pending(key)) is None:
+                db_obj = create(key)
+                manager.add_pending(db_obj)
+                session.add(db_obj)
+            links.append((db_obj, column, rows))
+
+    def _insert_states(self, session: Session, states: list[_RowT]) -> None:
+        """Insert states and record the state_id assigned to each row."""
+        if (
+            session.get_bind().dialect.insert_executemany_returning_sort_by_parameter_order
+        ):
+            result = session.execute(_INSERT_STATES_RETURNING_STATE_ID, states)
+            for row, state_id in zip(states, result.scalars(), strict=True):
+                row["state_id"] = state_id
+            return
+        # The dialect cannot return the ids of an executemany insert
+        # in order so we fall back to one insert per row.
+        for row in states:
+            result = cast(CursorResult, session.execute(_INSERT_STATES, row))
+            row["state_id"] = result.inserted_primary_key[0]
+
+    def reset(self) -> None:
+        """Drop all rows that have not been flushed.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._states = []
+        self._events = []
+        self._linked_old_states = []
+        self._missing_metadata_ids = {}
+        self._missing_attributes_ids = {}
+        self._missing_event_type_ids = {}
+        self._missing_data_ids = {}
+        self._attributes_hashes = {}
+        self._data_hashes = {}
@@ -57,11 +57,13 @@ INTEGRATION_PLATFORM_EXCLUDE_ATTRIBUTES = "exclude_attributes"
 INTEGRATION_PLATFORM_COMPILE_STATISTICS = "compile_statistics"
 INTEGRATION_PLATFORM_VALIDATE_STATISTICS = "validate_statistics"
 INTEGRATION_PLATFORM_LIST_STATISTIC_IDS = "list_statistic_ids"
+INTEGRATION_PLATFORM_RECORD_STATE_CHANGED = "record_state_changed"
 
 INTEGRATION_PLATFORMS_LOAD_IN_RECORDER_THREAD = {
     INTEGRATION_PLATFORM_COMPILE_STATISTICS,
     INTEGRATION_PLATFORM_VALIDATE_STATISTICS,
     INTEGRATION_PLATFORM_LIST_STATISTIC_IDS,
+    INTEGRATION_PLATFORM_RECORD_STATE_CHANGED,
 }
 
 
@@ -41,6 +41,7 @@ import homeassistant.util.dt as dt_util
 from homeassistant.util.enum import try_parse_enum
 
 from . import migration, statistics
+from .bulk_writer import BulkWriter
 from .const import (
     CONTEXT_ID_AS_BINARY_SCHEMA_VERSION,
     DB_WORKER_PREFIX,
@@ -111,6 +112,7 @@ from .tasks import (
     PurgeTask,
     RecorderTask,
     StatesContextIDMigrationTask,
+    StatisticsRollupBackfillTask,
     StatisticsTask,
     StopTask,
     SynchronizeTask,
@@ -178,6 +180,7 @@ class Recorder(threading.Thread):
         entity_filter: Callable[[str], bool],
         exclude_event_types: set[str],
         exclude_attributes_by_domain: dict[str, set[str]],
+        bulk_writes: bool = False,
     ) -> None:
         """Initialize the recorder."""
         threading.Thread.__init__(self, name="Recorder")
@@ -225,6 +228,14 @@ class Recorder(threading.Thread):
             self, exclude_attributes_by_domain
         )
         self.statistics_meta_manager = StatisticsMetaManager(self)
+        # The time zone the statistics rollups are compiled for, None
+        # until the rollups have been backfilled
+        self.statistics_rollup_time_zone: str | None = None
+        self._bulk_writer = BulkWriter(self) if bulk_writes else None
+        # Recorder platforms which follow the recorded state changes
+        self.record_state_changed_platforms: list[
+            Callable[[HomeAssistant, Event], None]
+        ] = []
 
         self.event_session: Session | None = None
         self._get_session: Callable[[], Session] | None = None
@@ -545,6 +556,13 @@ class Recorder(threading.Thread):
         """Run tasks every five minutes."""
         self.queue_task(ADJUST_LRU_SIZE_TASK)
         self.async_periodic_statistics()
+        if self.statistics_rollup_time_zone not in (
+            None,
+            str(dt_util.DEFAULT_TIME_ZONE),
+        ):
+            # The time zone changed, compile the rollups for the new one
+            self.statistics_rollup_time_zone = None
+            self.queue_task(StatisticsRollupBackfillTask())
 
     def _adjust_lru_size(self) -> None:
         """Trigger the LRU adjustment.
@@ -1008,6 +1026,15 @@ class Recorder(threading.Thread):
         if not self.enabled:
             return
         if event.event_type == EVENT_STATE_CHANGED:
+            for record_state_changed in self.record_state_changed_platforms:
+                try:
+                    record_state_changed(self.hass, event)
+                except Exception:  # pylint: disable=broad-except
+                    _LOGGER.exception("Error in recorder platform state change hook")
+        if self._bulk_writer is not None:
+            self._event_session_has_pending_writes = True
+            self._bulk_writer.add_event(event)
+        elif event.event_type == EVENT_STATE_CHANGED:
             self._process_state_changed_event_into_session(event)
         else:
             self._process_non_state_changed_event_into_session(event)
@@ -1072,7 +1099,7 @@ class Recorder(threading.Thread):
 
         states_manager = self.states_manager
         if old_state := states_manager.pop_pending(entity_id):
-            dbstate.old_state = old_state
+            dbstate.old_state = cast(States, old_state)
         elif old_state_id := states_manager.pop_committed(entity_id):
             dbstate.old_state_id = old_state_id
         if entity_removed:
@@ -1171,6 +1198,8 @@ class Recorder(threading.Thread):
         session = self.event_session
         self._commits_without_expire += 1
 
+        if self._bulk_writer is not None:
+            self._bulk_writer.flush(session)
         session.commit()
         self._event_session_has_pending_writes = False
         # We just committed the state attributes to the database
@@ -1203,6 +1232,8 @@ class Recorder(threading.Thread):
 
     def _close_event_session(self) -> None:
         """Close the event session."""
+        if self._bulk_writer is not None:
+            self._bulk_writer.reset()
         self.states_manager.reset()
         self.state_attributes_manager.reset()
         self.event_data_manager.reset()
@@ -1413,8 +1444,9 @@ class Recorder(threading.Thread):
         self._open_event_session()
 
     def _schedule_compile_missing_statistics(self) -> None:
-        """Add tasks for missing statistics runs."""
+        """Add tasks for missing statistics runs and statistics rollups."""
         self.queue_task(CompileMissingStatisticsTask())
+        self.queue_task(StatisticsRollupBackfillTask())
 
     def _end_session(self) -> None:
         """End the recorder session."""
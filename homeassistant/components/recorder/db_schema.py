@@ -67,7 +67,7 @@ class Base(DeclarativeBase):
     """Base class for tables."""
 
 
-SCHEMA_VERSION = 41
+SCHEMA_VERSION = 42
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -83,6 +83,8 @@ TABLE_STATISTICS = "statistics"
 TABLE_STATISTICS_META = "statistics_meta"
 TABLE_STATISTICS_RUNS = "statistics_runs"
 TABLE_STATISTICS_SHORT_TERM = "statistics_short_term"
+TABLE_STATISTICS_ROLLUP = "statistics_rollup"
+TABLE_STATISTICS_ROLLUP_RUNS = "statistics_rollup_runs"
 
 STATISTICS_TABLES = ("statistics", "statistics_short_term")
 
@@ -104,6 +106,8 @@ ALL_TABLES = [
     TABLE_STATISTICS_META,
     TABLE_STATISTICS_RUNS,
     TABLE_STATISTICS_SHORT_TERM,
+    TABLE_STATISTICS_ROLLUP,
+    TABLE_STATISTICS_ROLLUP_RUNS,
 ]
 
 TABLES_TO_CHECK = [
@@ -720,6 +724,58 @@ class StatisticsShortTerm(Base, StatisticsBase):
     __tablename__ = TABLE_STATISTICS_SHORT_TERM
 
 
+class StatisticsRollup(Base):
+    """Long term statistics aggregated per day, week or month.
+
+    The periods start at local midnight in the time zone recorded by the
+    latest statistics rollup run.
+    """
+
+    __table_args__ = (
+        # Used for fetching the rollups of an entity during a period
+        Index(
+            "ix_statistics_rollup_statistic_id_period_start_ts",
+            "metadata_id",
+            "period",
+            "start_ts",
+            unique=True,
+        ),
+        _DEFAULT_TABLE_ARGS,
+    )
+    __tablename__ = TABLE_STATISTICS_ROLLUP
+    id: Mapped[int] = mapped_column(Integer, Identity(), primary_key=True)
+    metadata_id: Mapped[int | None] = mapped_column(
+        Integer,
+        ForeignKey(f"{TABLE_STATISTICS_META}.id", ondelete="CASCADE"),
+    )
+    period: Mapped[str] = mapped_column(String(8))
+    start_ts: Mapped[float | None] = mapped_column(TIMESTAMP_TYPE)
+    mean: Mapped[float | None] = mapped_column(DOUBLE_TYPE)
+    # Number of hourly means in the mean, to fold in the next hour
+    mean_count: Mapped[int | None] = mapped_column(Integer)
+    min: Mapped[float | None] = mapped_column(DOUBLE_TYPE)
+    max: Mapped[float | None] = mapped_column(DOUBLE_TYPE)
+    last_reset_ts: Mapped[float | None] = mapped_column(TIMESTAMP_TYPE)
+    state: Mapped[float | None] = mapped_column(DOUBLE_TYPE)
+    sum: Mapped[float | None] = mapped_column(DOUBLE_TYPE)
+
+
+class StatisticsRollupRuns(Base):
+    """Representation of a statistics rollup backfill run.
+
+    Rollups of the periods before end_ts are compiled by the backfill,
+    which has completed up to backfilled_ts. Later periods are compiled
+    when their hourly statistics are compiled or imported.
+    """
+
+    __table_args__ = (_DEFAULT_TABLE_ARGS,)
+    __tablename__ = TABLE_STATISTICS_ROLLUP_RUNS
+    run_id: Mapped[int] = mapped_column(Integer, Identity(), primary_key=True)
+    time_zone: Mapped[str] = mapped_column(String(64))
+    end_ts: Mapped[float] = mapped_column(TIMESTAMP_TYPE)
+    backfilled_ts: Mapped[float] = mapped_column(TIMESTAMP_TYPE)
+
+
 class StatisticsMeta(Base):
     """Statistics meta data."""
 
@@ -11,10 +11,12 @@ from homeassistant.core import HomeAssistant, State
 
 from ... import recorder
 from ..filters import Filters
+from ..models import StateColumns
 from .const import NEED_ATTRIBUTE_DOMAINS, SIGNIFICANT_DOMAINS
 from .modern import (
     get_full_significant_states_with_session as _modern_get_full_significant_states_with_session,
     get_last_state_changes as _modern_get_last_state_changes,
+    get_significant_state_columns_with_session as _modern_get_significant_state_columns_with_session,
     get_significant_states as _modern_get_significant_states,
     get_significant_states_with_session as _modern_get_significant_states_with_session,
     state_changes_during_period as _modern_state_changes_during_period,
@@ -26,6 +28,7 @@ __all__ = [
     "SIGNIFICANT_DOMAINS",
     "get_full_significant_states_with_session",
     "get_last_state_changes",
+    "get_significant_state_columns_with_session",
     "get_significant_states",
     "get_significant_states_with_session",
     "state_changes_during_period",
@@ -152,6 +155,53 @@ def get_significant_states_with_session(
     )
 
 
+def get_significant_state_columns_with_session(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None = None,
+    entity_ids: list[str] | None = None,
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+) -> dict[str, StateColumns]:
+    """Return the significant states during a time period as columns."""
+    if recorder.get_instance(hass).states_meta_manager.active:
+        return _modern_get_significant_state_columns_with_session(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+        )
+    from .legacy import (  # pylint: disable=import-outside-toplevel
+        get_full_significant_states_with_session as _legacy_get_full_significant_states_with_session,
+    )
+
+    if not entity_ids:
+        raise ValueError("entity_ids must be provided")
+    # The legacy schema is only used until the migration is done,
+    # so the columns are built from the states
+    result = {entity_id: StateColumns() for entity_id in entity_ids}
+    for entity_id, states in _legacy_get_full_significant_states_with_session(
+        hass,
+        session,
+        start_time,
+        end_time,
+        entity_ids,
+        None,
+        include_start_time_state,
+        significant_changes_only,
+        True,
+    ).items():
+        columns = result[entity_id]
+        for state in states:
+            columns.timestamps.append(state.last_updated.timestamp())
+            columns.states.append(state.state)
+    return result
+
+
 def state_changes_during_period(
     hass: HomeAssistant,
     start_time: datetime,
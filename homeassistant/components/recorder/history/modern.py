@@ -20,6 +20,7 @@ from sqlalchemy import (
 )
 from sqlalchemy.engine.row import Row
 from sqlalchemy.orm.session import Session
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 
 from homeassistant.const import COMPRESSED_STATE_LAST_UPDATED, COMPRESSED_STATE_STATE
 from homeassistant.core import HomeAssistant, State, split_entity_id
@@ -30,6 +31,7 @@ from ..db_schema import SHARED_ATTR_OR_LEGACY_ATTRIBUTES, StateAttributes, State
 from ..filters import Filters
 from ..models import (
     LazyState,
+    StateColumns,
     datetime_to_timestamp_or_none,
     extract_metadata_ids,
     process_timestamp,
@@ -183,34 +185,22 @@ def _significant_states_stmt(
     ).order_by(unioned_subquery.c.metadata_id, unioned_subquery.c.last_updated_ts)
 
 
-def get_significant_states_with_session(
+def _significant_states_stmt_for_entities(
     hass: HomeAssistant,
     session: Session,
     start_time: datetime,
-    end_time: datetime | None = None,
-    entity_ids: list[str] | None = None,
-    filters: Filters | None = None,
-    include_start_time_state: bool = True,
-    significant_changes_only: bool = True,
-    minimal_response: bool = False,
-    no_attributes: bool = False,
-    compressed_state_format: bool = False,
-) -> MutableMapping[str, list[State | dict[str, Any]]]:
-    """Return states changes during UTC period start_time - end_time.
-
-    entity_ids is an optional iterable of entities to include in the results.
-
-    filters is an optional SQLAlchemy filter which will be applied to the database
-    queries unless entity_ids is given, in which case its ignored.
+    end_time: datetime | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    no_attributes: bool,
+) -> tuple[StatementLambdaElement, dict[str, int | None], float | None] | None:
+    """Return the significant states statement for entity_ids.
 
-    Significant states are all states where there is a state change,
-    as well as all states from certain domains (for instance
-    thermostat so that we get current temperature in our graphs).
+    Also returns the metadata ids of the entities and the start time
+    timestamp when the start time states are included, or None if
+    none of the entities have been recorded.
     """
-    if filters is not None:
-        raise NotImplementedError("Filters are no longer supported")
-    if not entity_ids:
-        raise ValueError("entity_ids must be provided")
     entity_id_to_metadata_id: dict[str, int | None] | None = None
     metadata_ids_in_significant_domains: list[int] = []
     instance = recorder.get_instance(hass)
@@ -219,7 +209,7 @@ def get_significant_states_with_session(
             entity_ids, session, False
         )
     ) or not (possible_metadata_ids := extract_metadata_ids(entity_id_to_metadata_id)):
-        return {}
+        return None
     metadata_ids = possible_metadata_ids
     if significant_changes_only:
         metadata_ids_in_significant_domains = [
@@ -257,9 +247,58 @@ def get_significant_states_with_session(
             include_start_time_state,
         ],
     )
+    return (
+        stmt,
+        entity_id_to_metadata_id,
+        start_time_ts if include_start_time_state else None,
+    )
+
+
+def get_significant_states_with_session(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None = None,
+    entity_ids: list[str] | None = None,
+    filters: Filters | None = None,
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    minimal_response: bool = False,
+    no_attributes: bool = False,
+    compressed_state_format: bool = False,
+) -> MutableMapping[str, list[State | dict[str, Any]]]:
+    """Return states changes during UTC period start_time - end_time.
+
+    entity_ids is an optional iterable of entities to include in the results.
+
+    filters is an optional SQLAlchemy filter which will be applied to the database
+    queries unless entity_ids is given, in which case its ignored.
+
+    Significant states are all states where there is a state change,
+    as well as all states from certain domains (for instance
+    thermostat so that we get current temperature in our graphs).
+    """
+    if filters is not None:
+        raise NotImplementedError("Filters are no longer supported")
+    if not entity_ids:
+        raise ValueError("entity_ids must be provided")
+    if not (
+        query := _significant_states_stmt_for_entities(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            no_attributes,
+        )
+    ):
+        return {}
+    stmt, entity_id_to_metadata_id, start_time_ts = query
     return _sorted_states_to_dict(
         execute_stmt_lambda_element(session, stmt, None, end_time, orm_rows=False),
-        start_time_ts if include_start_time_state else None,
+        start_time_ts,
         entity_ids,
         entity_id_to_metadata_id,
         minimal_response,
@@ -268,6 +307,65 @@ def get_significant_states_with_session(
     )
 
 
+def get_significant_state_columns_with_session(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None = None,
+    entity_ids: list[str] | None = None,
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+) -> dict[str, StateColumns]:
+    """Return the significant states during start_time - end_time as columns.
+
+    The columns are filled directly from the database rows without creating
+    an object per state, which makes long periods much cheaper to load for
+    callers which only need the state and last_updated timestamp.
+    """
+    if not entity_ids:
+        raise ValueError("entity_ids must be provided")
+    result = {entity_id: StateColumns() for entity_id in entity_ids}
+    if not (
+        query := _significant_states_stmt_for_entities(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            True,
+        )
+    ):
+        return result
+    stmt, entity_id_to_metadata_id, _ = query
+    start_time_ts = dt_util.utc_to_timestamp(start_time)
+    metadata_id_to_columns = {
+        metadata_id: result[entity_id]
+        for entity_id, metadata_id in entity_id_to_metadata_id.items()
+        if metadata_id is not None
+    }
+    metadata_id_idx = _FIELD_MAP["metadata_id"]
+    state_idx = _FIELD_MAP["state"]
+    last_updated_ts_idx = _FIELD_MAP["last_updated_ts"]
+    current_metadata_id: int | None = None
+    append_timestamp: Callable[[float], None]
+    append_state: Callable[[str | None], None]
+    # Rows are sorted by metadata_id and last_updated_ts
+    for row in execute_stmt_lambda_element(
+        session, stmt, None, end_time, orm_rows=False
+    ):
+        if (metadata_id := row[metadata_id_idx]) != current_metadata_id:
+            current_metadata_id = metadata_id
+            columns = metadata_id_to_columns[metadata_id]
+            append_timestamp = columns.timestamps.append
+            append_state = columns.states.append
+        # The start time states are selected with a last_updated_ts of 0
+        append_timestamp(row[last_updated_ts_idx] or start_time_ts)
+        append_state(row[state_idx])
+    return result
+
+
 def get_full_significant_states_with_session(
     hass: HomeAssistant,
     session: Session,
@@ -64,6 +64,8 @@ from .db_schema import (
     StatesMeta,
     Statistics,
     StatisticsMeta,
+    StatisticsRollup,
+    StatisticsRollupRuns,
     StatisticsRuns,
     StatisticsShortTerm,
 )
@@ -1060,6 +1062,11 @@ def _apply_update(  # noqa: C901
     elif new_version == 41:
         _create_index(session_maker, "event_types", "ix_event_types_event_type")
         _create_index(session_maker, "states_meta", "ix_states_meta_entity_id")
+    elif new_version == 42:
+        # Add the statistics rollup tables, they are filled by
+        # the StatisticsRollupBackfillTask once the migration is done
+        cast(Table, StatisticsRollup.__table__).create(engine, checkfirst=True)
+        cast(Table, StatisticsRollupRuns.__table__).create(engine, checkfirst=True)
     else:
         raise ValueError(f"No schema migration defined for version {new_version}")
 
@@ -9,7 +9,12 @@ from .context import (
 )
 from .database import DatabaseEngine, DatabaseOptimizer, UnsupportedDialect
 from .event import extract_event_type_ids
-from .state import LazyState, extract_metadata_ids, row_to_compressed_state
+from .state import (
+    LazyState,
+    StateColumns,
+    extract_metadata_ids,
+    row_to_compressed_state,
+)
 from .statistics import (
     CalendarStatisticPeriod,
     FixedStatisticPeriod,
@@ -35,6 +40,7 @@ __all__ = [
     "FixedStatisticPeriod",
     "LazyState",
     "RollingWindowStatisticPeriod",
+    "StateColumns",
     "StatisticData",
     "StatisticDataTimestamp",
     "StatisticMetaData",
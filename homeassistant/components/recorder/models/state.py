@@ -1,6 +1,8 @@
 """Models states in for Recorder."""
 from __future__ import annotations
 
+from array import array
+from dataclasses import dataclass, field
 from datetime import datetime
 import logging
 from typing import Any
@@ -33,6 +35,19 @@ def extract_metadata_ids(
     ]
 
 
+@dataclass(slots=True)
+class StateColumns:
+    """The states of an entity as columns instead of one object per state.
+
+    timestamps holds the last_updated timestamps as a float64 array, which
+    supports the buffer protocol so it can be wrapped with numpy.frombuffer
+    without copying.
+    """
+
+    timestamps: array[float] = field(default_factory=lambda: array("d"))
+    states: list[str | None] = field(default_factory=list)
+
+
 class LazyState(State):
     """A lazy version of core State after schema 31."""
 
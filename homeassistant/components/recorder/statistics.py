@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 from collections import defaultdict
-from collections.abc import Callable, Iterable, Sequence
+from collections.abc import Callable, Iterable, Iterator, Sequence
 import contextlib
 import dataclasses
 from datetime import datetime, timedelta
@@ -12,7 +12,7 @@ import logging
 from operator import itemgetter
 import re
 from statistics import mean
-from typing import TYPE_CHECKING, Any, Literal, TypedDict, cast
+from typing import TYPE_CHECKING, Any, Literal, TypedDict, TypeVar, cast
 
 from sqlalchemy import Select, and_, bindparam, func, lambda_stmt, select, text
 from sqlalchemy.engine.row import Row
@@ -56,6 +56,8 @@ from .db_schema import (
     STATISTICS_TABLES,
     Statistics,
     StatisticsBase,
+    StatisticsRollup,
+    StatisticsRollupRuns,
     StatisticsRuns,
     StatisticsShortTerm,
 )
@@ -121,6 +123,29 @@ QUERY_STATISTICS_SUMMARY_SUM = (
     .label("rownum"),
 )
 
+QUERY_STATISTICS_ROLLUP_MEAN = (
+    Statistics.metadata_id,
+    func.avg(Statistics.mean),
+    func.count(Statistics.mean),
+    func.min(Statistics.min),
+    func.max(Statistics.max),
+)
+
+QUERY_STATISTICS_ROLLUP_SUM = (
+    Statistics.metadata_id,
+    Statistics.last_reset_ts,
+    Statistics.state,
+    Statistics.sum,
+    func.row_number()
+    .over(  # type: ignore[no-untyped-call]
+        partition_by=Statistics.metadata_id,
+        order_by=Statistics.start_ts.desc(),
+    )
+    .label("rownum"),
+)
+
+# Days of hourly statistics compiled into rollups per backfill batch
+STATISTICS_ROLLUP_BACKFILL_DAYS = 31
 
 STATISTIC_UNIT_TO_UNIT_CONVERTER: dict[str | None, type[BaseUnitConverter]] = {
     **{unit: DataRateConverter for unit in DataRateConverter.VALID_UNITS},
@@ -144,6 +169,9 @@ STATISTIC_UNIT_TO_UNIT_CONVERTER: dict[str | None, type[BaseUnitConverter]] = {
 
 _LOGGER = logging.getLogger(__name__)
 
+# The tables of hourly and short term statistics and of their rollups
+_StatisticsTableT = TypeVar("_StatisticsTableT", StatisticsBase, StatisticsRollup)
+
 
 class BaseStatisticsRow(TypedDict, total=False):
     """A processed row of statistic data."""
@@ -395,6 +423,175 @@ def _compile_hourly_statistics(session: Session, start: datetime) -> None:
         for metadata_id, summary_item in summary.items()
     )
 
+    # Fold the new hour into the day, week and month it belongs to
+    if summary:
+        _fold_statistics_rollups(session, start_time_ts, end_time_ts, summary)
+
+
+def _fold_statistics_rollups(
+    session: Session,
+    start_time_ts: float,
+    end_time_ts: float,
+    summary: dict[int, StatisticDataTimestamp],
+) -> None:
+    """Fold a compiled hour into the rollups of the periods it is in.
+
+    The compiled hour is the last hour of its periods so far, the existing
+    rollups are updated with it instead of being compiled from all the
+    hourly statistics of the period again.
+    """
+    ids = list(summary)
+    for period, period_start_ts, _ in _statistics_rollup_periods(
+        start_time_ts, end_time_ts
+    ):
+        rollups: dict[int | None, StatisticsRollup] = {
+            rollup.metadata_id: rollup
+            for rollup in session.query(StatisticsRollup).filter(
+                StatisticsRollup.period == period,
+                StatisticsRollup.start_ts == period_start_ts,
+                StatisticsRollup.metadata_id.in_(ids),
+            )
+        }
+        for metadata_id, hour in summary.items():
+            _mean = hour.get("mean")
+            if (rollup := rollups.get(metadata_id)) is None:
+                rollup = StatisticsRollup(
+                    metadata_id=metadata_id,
+                    period=period,
+                    start_ts=period_start_ts,
+                    mean=_mean,
+                    mean_count=0 if _mean is None else 1,
+                    min=hour.get("min"),
+                    max=hour.get("max"),
+                )
+                session.add(rollup)
+            else:
+                if _mean is not None:
+                    count = rollup.mean_count or 0
+                    rollup.mean = (
+                        _mean
+                        if rollup.mean is None or not count
+                        else (rollup.mean * count + _mean) / (count + 1)
+                    )
+                    rollup.mean_count = count + 1
+                if (_min := hour.get("min")) is not None:
+                    rollup.min = _min if rollup.min is None else min(rollup.min, _min)
+                if (_max := hour.get("max")) is not None:
+                    rollup.max = _max if rollup.max is None else max(rollup.max, _max)
+            rollup.last_reset_ts = hour.get("last_reset_ts")
+            rollup.state = hour.get("state")
+            rollup.sum = hour.get("sum")
+
+
+def _compile_statistics_rollup_mean_stmt(
+    start_time_ts: float, end_time_ts: float, metadata_ids: list[int] | None
+) -> StatementLambdaElement:
+    """Generate the summary mean statement for a statistics rollup."""
+    stmt = lambda_stmt(
+        lambda: select(*QUERY_STATISTICS_ROLLUP_MEAN)
+        .filter(Statistics.start_ts >= start_time_ts)
+        .filter(Statistics.start_ts < end_time_ts)
+    )
+    if metadata_ids is not None:
+        stmt += lambda q: q.filter(
+            # https://github.com/python/mypy/issues/2608
+            Statistics.metadata_id.in_(metadata_ids)  # type:ignore[arg-type]
+        )
+    stmt += lambda q: q.group_by(Statistics.metadata_id)
+    return stmt
+
+
+def _compile_statistics_rollup_last_sum_stmt(
+    start_time_ts: float, end_time_ts: float, metadata_ids: list[int] | None
+) -> StatementLambdaElement:
+    """Generate the last sum statement for a statistics rollup."""
+    if metadata_ids is None:
+        return lambda_stmt(
+            lambda: select(
+                subquery := (
+                    select(*QUERY_STATISTICS_ROLLUP_SUM)
+                    .filter(Statistics.start_ts >= start_time_ts)
+                    .filter(Statistics.start_ts < end_time_ts)
+                    .subquery()
+                )
+            ).filter(subquery.c.rownum == 1)
+        )
+    return lambda_stmt(
+        lambda: select(
+            subquery := (
+                select(*QUERY_STATISTICS_ROLLUP_SUM)
+                .filter(Statistics.start_ts >= start_time_ts)
+                .filter(Statistics.start_ts < end_time_ts)
+                .filter(
+                    # https://github.com/python/mypy/issues/2608
+                    Statistics.metadata_id.in_(metadata_ids)  # type:ignore[arg-type]
+                )
+                .subquery()
+            )
+        ).filter(subquery.c.rownum == 1)
+    )
+
+
+def _statistics_rollup_periods(
+    start_time_ts: float, end_time_ts: float
+) -> Iterator[tuple[str, float, float]]:
+    """Yield the rollup periods overlapping start_time_ts - end_time_ts."""
+    for period, factory in STATISTICS_ROLLUP_FACTORIES.items():
+        _, period_start_end = factory()
+        time_ts = start_time_ts
+        while time_ts < end_time_ts:
+            period_start_ts, time_ts = period_start_end(time_ts)
+            yield period, period_start_ts, time_ts
+
+
+def _compile_statistics_rollups(
+    session: Session,
+    periods: Iterable[tuple[str, float, float]],
+    metadata_ids: set[int] | None,
+) -> None:
+    """Compile the rollups of (period, start_ts, end_ts) periods.
+
+    The rollups are compiled from the hourly statistics the same way
+    _reduce_statistics does: the mean of the means, the extremes of the
+    minima and maxima and the last state, sum and last reset of the period.
+    """
+    ids = list(metadata_ids) if metadata_ids is not None else None
+    for period, period_start_ts, period_end_ts in periods:
+        query = session.query(StatisticsRollup).filter(
+            StatisticsRollup.period == period,
+            StatisticsRollup.start_ts == period_start_ts,
+        )
+        if ids is not None:
+            query = query.filter(StatisticsRollup.metadata_id.in_(ids))
+        query.delete(synchronize_session=False)
+
+        rollups: dict[int, StatisticsRollup] = {}
+        stmt = _compile_statistics_rollup_mean_stmt(period_start_ts, period_end_ts, ids)
+        for metadata_id, _mean, mean_count, _min, _max in execute_stmt_lambda_element(
+            session, stmt
+        ):
+            rollups[metadata_id] = StatisticsRollup(
+                metadata_id=metadata_id,
+                period=period,
+                start_ts=period_start_ts,
+                mean=_mean,
+                mean_count=mean_count,
+                min=_min,
+                max=_max,
+            )
+        stmt = _compile_statistics_rollup_last_sum_stmt(
+            period_start_ts, period_end_ts, ids
+        )
+        for metadata_id, last_reset_ts, state, _sum, _ in execute_stmt_lambda_element(
+            session, stmt
+        ):
+            if (rollup := rollups.get(metadata_id)) is None:
+                continue
+            rollup.last_reset_ts = last_reset_ts
+            rollup.state = state
+            rollup.sum = _sum
+        session.add_all(rollups.values())
+
 
 @retryable_database_job("compile missing statistics")
 def compile_missing_statistics(instance: Recorder) -> bool:
@@ -459,6 +656,59 @@ def compile_statistics(instance: Recorder, start: datetime, fire_events: bool) -
     return True
 
 
+@retryable_database_job("backfill statistics rollups")
+def backfill_statistics_rollups(instance: Recorder) -> bool:
+    """Compile the rollups of the periods compiled before the latest rollup run.
+
+    The rollups are compiled from scratch if they were compiled for another
+    time zone. Returns False if there are more periods to compile.
+    """
+    time_zone = str(dt_util.DEFAULT_TIME_ZONE)
+    with session_scope(session=instance.get_session()) as session:
+        run = (
+            session.query(StatisticsRollupRuns)
+            .order_by(StatisticsRollupRuns.run_id.desc())
+            .first()
+        )
+        if run is None or run.time_zone != time_zone:
+            _LOGGER.debug("Compiling statistics rollups for %s", time_zone)
+            instance.statistics_rollup_time_zone = None
+            session.query(StatisticsRollup).delete(synchronize_session=False)
+            session.query(StatisticsRollupRuns).delete(synchronize_session=False)
+            now_ts = dt_util.utcnow().timestamp()
+            first_ts, last_ts = session.query(
+                func.min(Statistics.start_ts), func.max(Statistics.start_ts)
+            ).one()
+            run = StatisticsRollupRuns(time_zone=time_zone, end_ts=now_ts)
+            if first_ts is None:
+                run.backfilled_ts = now_ts
+            else:
+                run.backfilled_ts = first_ts
+                run.end_ts = max(now_ts, last_ts + Statistics.duration.total_seconds())
+            session.add(run)
+
+        if run.backfilled_ts < run.end_ts:
+            end_ts = min(
+                run.backfilled_ts
+                + timedelta(days=STATISTICS_ROLLUP_BACKFILL_DAYS).total_seconds(),
+                run.end_ts,
+            )
+            _LOGGER.debug(
+                "Compiling statistics rollups for %s-%s",
+                dt_util.utc_from_timestamp(run.backfilled_ts),
+                dt_util.utc_from_timestamp(end_ts),
+            )
+            _compile_statistics_rollups(
+                session, _statistics_rollup_periods(run.backfilled_ts, end_ts), None
+            )
+            run.backfilled_ts = end_ts
+            if end_ts < run.end_ts:
+                return False
+
+    instance.statistics_rollup_time_zone = time_zone
+    return True
+
+
 def _get_first_id_stmt(start: datetime) -> StatementLambdaElement:
     """Return a statement that returns the first run_id at start."""
     return lambda_stmt(lambda: select(StatisticsRuns.run_id).filter_by(start=start))
@@ -538,7 +788,7 @@ def _compile_statistics(
 
 def _adjust_sum_statistics(
     session: Session,
-    table: type[StatisticsBase],
+    table: type[_StatisticsTableT],
     metadata_id: int,
     start_time: datetime,
     adj: float,
@@ -1016,6 +1266,34 @@ def _reduce_statistics_per_month(
     )
 
 
+STATISTICS_ROLLUP_FACTORIES = {
+    "day": reduce_day_ts_factory,
+    "week": reduce_week_ts_factory,
+    "month": reduce_month_ts_factory,
+}
+
+
+def _set_statistics_rollup_end(
+    stats: dict[str, list[StatisticsRow]], period: str
+) -> None:
+    """Set the end of statistics rollups, the periods differ in length."""
+    _, period_start_end = STATISTICS_ROLLUP_FACTORIES[period]()
+    for stat_list in stats.values():
+        for statistic in stat_list:
+            statistic["end"] = period_start_end(statistic["start"])[1]
+
+
+def _is_statistics_rollup_boundary(period: str, time: datetime) -> bool:
+    """Return if time is the start of a rollup period.
+
+    Rollups only hold whole periods, a bound within a period must be read
+    from the hourly statistics to include the partial period.
+    """
+    _, period_start_end = STATISTICS_ROLLUP_FACTORIES[period]()
+    time_ts = time.timestamp()
+    return period_start_end(time_ts)[0] == time_ts
+
+
 def _generate_statistics_during_period_stmt(
     start_time: datetime,
     end_time: datetime | None,
@@ -1042,6 +1320,33 @@ def _generate_statistics_during_period_stmt(
     return stmt
 
 
+def _generate_statistics_rollup_during_period_stmt(
+    start_time: datetime,
+    end_time: datetime | None,
+    metadata_ids: list[int] | None,
+    period: str,
+    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+) -> StatementLambdaElement:
+    """Prepare a database query for statistics rollups during a given period."""
+    start_time_ts = start_time.timestamp()
+    stmt = _generate_select_columns_for_types_stmt(StatisticsRollup, types)
+    stmt += lambda q: q.filter(StatisticsRollup.period == period).filter(
+        StatisticsRollup.start_ts >= start_time_ts
+    )
+    if end_time is not None:
+        end_time_ts = end_time.timestamp()
+        stmt += lambda q: q.filter(StatisticsRollup.start_ts < end_time_ts)
+    if metadata_ids:
+        stmt += lambda q: q.filter(
+            # https://github.com/python/mypy/issues/2608
+            StatisticsRollup.metadata_id.in_(metadata_ids)  # type:ignore[arg-type]
+        )
+    stmt += lambda q: q.order_by(
+        StatisticsRollup.metadata_id, StatisticsRollup.start_ts
+    )
+    return stmt
+
+
 def _generate_max_mean_min_statistic_in_sub_period_stmt(
     columns: Select,
     start_time: datetime | None,
@@ -1482,7 +1787,7 @@ _type_column_mapping = {
 
 
 def _generate_select_columns_for_types_stmt(
-    table: type[StatisticsBase],
+    table: type[_StatisticsTableT],
     types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
 ) -> StatementLambdaElement:
     columns = select(table.metadata_id, table.start_ts)
@@ -1641,9 +1946,22 @@ def _statistics_during_period_with_session(
     table: type[Statistics | StatisticsShortTerm] = (
         Statistics if period != "5minute" else StatisticsShortTerm
     )
-    stmt = _generate_statistics_during_period_stmt(
-        start_time, end_time, metadata_ids, table, types
+    # The rollups are complete once backfilled for the current time zone
+    use_rollups = (
+        period in STATISTICS_ROLLUP_FACTORIES
+        and get_instance(hass).statistics_rollup_time_zone
+        == str(dt_util.DEFAULT_TIME_ZONE)
+        and _is_statistics_rollup_boundary(period, start_time)
+        and (end_time is None or _is_statistics_rollup_boundary(period, end_time))
     )
+    if use_rollups:
+        stmt = _generate_statistics_rollup_during_period_stmt(
+            start_time, end_time, metadata_ids, period, types
+        )
+    else:
+        stmt = _generate_statistics_during_period_stmt(
+            start_time, end_time, metadata_ids, table, types
+        )
     stats = cast(
         Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
     )
@@ -1664,13 +1982,16 @@ def _statistics_during_period_with_session(
         types,
     )
 
-    if period == "day":
+    if use_rollups:
+        _set_statistics_rollup_end(result, period)
+
+    elif period == "day":
         result = _reduce_statistics_per_day(result, types)
 
-    if period == "week":
+    elif period == "week":
         result = _reduce_statistics_per_week(result, types)
 
-    if period == "month":
+    elif period == "month":
         result = _reduce_statistics_per_month(result, types)
 
     if "change" in _types:
@@ -2215,11 +2536,25 @@ def _import_statistics_with_session(
     _, metadata_id = statistics_meta_manager.update_or_add(
         session, metadata, old_metadata_dict
     )
+    start_times: set[float] = set()
     for stat in statistics:
         if stat_id := _statistics_exists(session, table, metadata_id, stat["start"]):
             _update_statistics(session, table, stat_id, stat)
         else:
             _insert_statistics(session, table, metadata_id, stat)
+        start_times.add(stat["start"].timestamp())
+
+    if table == Statistics and start_times:
+        # Recompile the rollups of the periods the imported hours are in
+        hour_seconds = Statistics.duration.total_seconds()
+        periods = {
+            period
+            for start_time_ts in start_times
+            for period in _statistics_rollup_periods(
+                start_time_ts, start_time_ts + hour_seconds
+            )
+        }
+        _compile_statistics_rollups(session, sorted(periods), {metadata_id})
 
     return True
 
@@ -2237,9 +2572,12 @@ def import_statistics(
         session=instance.get_session(),
         exception_filter=_filter_unique_constraint_integrity_error(instance),
     ) as session:
-        return _import_statistics_with_session(
-            instance, session, metadata, statistics, table
-        )
+        _import_statistics_with_session(instance, session, metadata, statistics, table)
+
+    # Compiling the rollups flushes the session, a duplicated row blocked by the
+    # exception filter is then raised inside the session scope and must not
+    # cause the job to be rescheduled
+    return True
 
 
 @retryable_database_job("adjust_statistics")
@@ -2281,12 +2619,30 @@ def adjust_statistics(
             sum_adjustment,
         )
 
+        # Rollups of periods starting after the adjustment are adjusted as is,
+        # the rollups of the periods the adjusted hour is in are recompiled
+        _adjust_sum_statistics(
+            session,
+            StatisticsRollup,
+            metadata[statistic_id][0],
+            start_time.replace(minute=0),
+            sum_adjustment,
+        )
+        hour_start_ts = start_time.replace(minute=0).timestamp()
+        _compile_statistics_rollups(
+            session,
+            _statistics_rollup_periods(
+                hour_start_ts, hour_start_ts + Statistics.duration.total_seconds()
+            ),
+            {metadata[statistic_id][0]},
+        )
+
     return True
 
 
 def _change_statistics_unit_for_table(
     session: Session,
-    table: type[StatisticsBase],
+    table: type[_StatisticsTableT],
     metadata_id: int,
     convert: Callable[[float | None], float | None],
 ) -> None:
@@ -2344,6 +2700,9 @@ def change_statistics_unit(
         )
         for table in tables:
             _change_statistics_unit_for_table(session, table, metadata_id, convert)
+        _change_statistics_unit_for_table(
+            session, StatisticsRollup, metadata_id, convert
+        )
 
         statistics_meta_manager.update_unit_of_measurement(
             session, statistic_id, new_unit
@@ -1,6 +1,8 @@
 """Support managing States."""
 from __future__ import annotations
 
+from typing import Any
+
 from ..db_schema import States
 
 
@@ -9,10 +11,12 @@ class StatesManager:
 
     def __init__(self) -> None:
         """Initialize the states manager for linking old_state_id."""
-        self._pending: dict[str, States] = {}
+        # Pending states are either States objects in the session
+        # or rows waiting to be inserted by the bulk writer
+        self._pending: dict[str, States | dict[str, Any]] = {}
         self._last_committed_id: dict[str, int] = {}
 
-    def pop_pending(self, entity_id: str) -> States | None:
+    def pop_pending(self, entity_id: str) -> States | dict[str, Any] | None:
         """Pop a pending state.
 
         Pending states are states that are in the session but not yet committed.
@@ -33,7 +37,7 @@ class StatesManager:
         """
         return self._last_committed_id.pop(entity_id, None)
 
-    def add_pending(self, entity_id: str, state: States) -> None:
+    def add_pending(self, entity_id: str, state: States | dict[str, Any]) -> None:
         """Add a pending state.
 
         Pending states are states that are in the session but not yet committed.
@@ -50,7 +54,10 @@ class StatesManager:
         recorder thread.
         """
         for entity_id, db_states in self._pending.items():
-            self._last_committed_id[entity_id] = db_states.state_id
+            if isinstance(db_states, dict):
+                self._last_committed_id[entity_id] = db_states["state_id"]
+            else:
+                self._last_committed_id[entity_id] = db_states.state_id
         self._pending.clear()
 
     def reset(self) -> None:
@@ -14,7 +14,7 @@ from homeassistant.core import Event
 from homeassistant.helpers.typing import UndefinedType
 
 from . import entity_registry, purge, statistics
-from .const import DOMAIN
+from .const import DOMAIN, INTEGRATION_PLATFORM_RECORD_STATE_CHANGED
 from .db_schema import Statistics, StatisticsShortTerm
 from .models import StatisticData, StatisticMetaData
 from .util import periodic_db_cleanups, session_scope
@@ -180,6 +180,18 @@ class CompileMissingStatisticsTask(RecorderTask):
         instance.queue_task(CompileMissingStatisticsTask())
 
 
+@dataclass(slots=True)
+class StatisticsRollupBackfillTask(RecorderTask):
+    """An object to insert into the recorder queue to backfill the statistics rollups."""
+
+    def run(self, instance: Recorder) -> None:
+        """Run statistics task to compile missing statistics rollups."""
+        if statistics.backfill_statistics_rollups(instance):
+            return
+        # Schedule a new backfill task if this one didn't finish
+        instance.queue_task(StatisticsRollupBackfillTask())
+
+
 @dataclass(slots=True)
 class ImportStatisticsTask(RecorderTask):
     """An object to insert into the recorder queue to run an import statistics task."""
@@ -320,6 +332,15 @@ class AddRecorderPlatformTask(RecorderTask):
         platform = self.platform
         platforms: dict[str, Any] = hass.data[DOMAIN].recorder_platforms
         platforms[domain] = platform
+        instance.record_state_changed_platforms = [
+            record_state_changed
+            for recorder_platform in platforms.values()
+            if (
+                record_state_changed := getattr(
+                    recorder_platform, INTEGRATION_PLATFORM_RECORD_STATE_CHANGED, None
+                )
+            )
+        ]
 
 
 @dataclass(slots=True)
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 import asyncio
+from collections.abc import Iterable
 from dataclasses import dataclass
 import logging
 from typing import Any, cast
@@ -45,6 +46,7 @@ from homeassistant.helpers.entity_component import EntityComponent
 from homeassistant.helpers.integration_platform import (
     async_process_integration_platform_for_component,
 )
+from homeassistant.helpers.reference_index import ReferenceIndex
 from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.helpers.script import (
     ATTR_CUR,
@@ -81,6 +83,8 @@ SCRIPT_TURN_ONOFF_SCHEMA = make_entity_service_schema(
 )
 RELOAD_SERVICE_SCHEMA = vol.Schema({})
 
+DATA_REFERENCE_INDEX = "script_reference_index"
+
 
 @bind_hass
 def is_on(hass, entity_id):
@@ -88,20 +92,27 @@ def is_on(hass, entity_id):
     return hass.states.is_state(entity_id, STATE_ON)
 
 
+def _referenced_ids(
+    script_entity: BaseScriptEntity, property_name: str
+) -> Iterable[str]:
+    """Return the ids of the x referenced by a script."""
+    if property_name == "referenced_blueprint":
+        if (blueprint := script_entity.referenced_blueprint) is None:
+            return ()
+        return (blueprint,)
+    return cast(set[str], getattr(script_entity, property_name))
+
+
 def _scripts_with_x(
     hass: HomeAssistant, referenced_id: str, property_name: str
 ) -> list[str]:
     """Return all scripts that reference the x."""
-    if DOMAIN not in hass.data:
+    if DATA_REFERENCE_INDEX not in hass.data:
         return []
 
-    component: EntityComponent[BaseScriptEntity] = hass.data[DOMAIN]
+    reference_index: ReferenceIndex[BaseScriptEntity] = hass.data[DATA_REFERENCE_INDEX]
 
-    return [
-        script_entity.entity_id
-        for script_entity in component.entities
-        if referenced_id in getattr(script_entity, property_name)
-    ]
+    return reference_index.async_referencing(property_name, referenced_id)
 
 
 def _x_in_script(hass: HomeAssistant, entity_id: str, property_name: str) -> list[str]:
@@ -156,16 +167,7 @@ def areas_in_script(hass: HomeAssistant, entity_id: str) -> list[str]:
 @callback
 def scripts_with_blueprint(hass: HomeAssistant, blueprint_path: str) -> list[str]:
     """Return all scripts that reference the blueprint."""
-    if DOMAIN not in hass.data:
-        return []
-
-    component: EntityComponent[BaseScriptEntity] = hass.data[DOMAIN]
-
-    return [
-        script_entity.entity_id
-        for script_entity in component.entities
-        if script_entity.referenced_blueprint == blueprint_path
-    ]
+    return _scripts_with_x(hass, blueprint_path, "referenced_blueprint")
 
 
 @callback
@@ -187,6 +189,9 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     hass.data[DOMAIN] = component = EntityComponent[BaseScriptEntity](
         LOGGER, DOMAIN, hass
     )
+    hass.data[DATA_REFERENCE_INDEX] = ReferenceIndex(
+        lambda: component.entities, _referenced_ids
+    )
 
     # Process integration platforms right away since
     # we will create entities before firing EVENT_COMPONENT_LOADED
@@ -404,6 +409,16 @@ class BaseScriptEntity(ToggleEntity, ABC):
     def referenced_entities(self) -> set[str]:
         """Return a set of referenced entities."""
 
+    async def async_internal_added_to_hass(self) -> None:
+        """Invalidate the reference index when added to hass."""
+        await super().async_internal_added_to_hass()
+        self.hass.data[DATA_REFERENCE_INDEX].async_invalidate()
+
+    async def async_internal_will_remove_from_hass(self) -> None:
+        """Invalidate the reference index when removed from hass."""
+        self.hass.data[DATA_REFERENCE_INDEX].async_invalidate()
+        await super().async_internal_will_remove_from_hass()
+
 
 class UnavailableScriptEntity(BaseScriptEntity):
     """A non-functional script entity with its state set to unavailable.
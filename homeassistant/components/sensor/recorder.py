@@ -30,7 +30,7 @@ from homeassistant.const import (
     UnitOfSoundPressure,
     UnitOfVolume,
 )
-from homeassistant.core import HomeAssistant, State, callback, split_entity_id
+from homeassistant.core import Event, HomeAssistant, State, callback, split_entity_id
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity import entity_sources
 from homeassistant.util import dt as dt_util
@@ -71,6 +71,108 @@ WARN_UNSTABLE_UNIT = "sensor_warn_unstable_unit"
 # Link to dev statistics where issues around LTS can be fixed
 LINK_DEV_STATISTICS = "https://my.home-assistant.io/redirect/developer_statistics"
 
+RECENT_STATES = "sensor_recorder_recent_states"
+
+
+class RecentStates:
+    """Sensor states recorded since the recorder started feeding them.
+
+    The recorder feeds every recorded state change of sensors with a state
+    class from its thread, which allows compiling the 5-minute statistics
+    without querying the states history.
+    """
+
+    __slots__ = ("start", "states")
+
+    def __init__(self, start: datetime.datetime) -> None:
+        """Initialize the recent states."""
+        # All state changes from this point in time on are known
+        self.start = start
+        # entity_id -> states ordered by last_updated, the first state
+        # is the state the sensor had before it was first fed
+        self.states: dict[str, list[State]] = {}
+
+    def add(self, entity_id: str, old_state: State | None, new_state: State) -> None:
+        """Add a recorded state change."""
+        if (entity_states := self.states.get(entity_id)) is None:
+            if ATTR_STATE_CLASS not in new_state.attributes:
+                return
+            entity_states = self.states[entity_id] = []
+            if old_state is not None:
+                entity_states.append(old_state)
+        entity_states.append(new_state)
+
+    def remove(self, entity_id: str) -> None:
+        """Forget the states of a removed sensor."""
+        self.states.pop(entity_id, None)
+
+    def covers(self, start: datetime.datetime) -> bool:
+        """Return if all state changes from start on are known."""
+        return self.start < start - datetime.timedelta.resolution
+
+    def history(
+        self,
+        current_state: State,
+        start: datetime.datetime,
+        end: datetime.datetime,
+        significant_changes_only: bool,
+    ) -> list[State] | None:
+        """Return the states of a sensor during start-end.
+
+        Like the states history, the first state is the state the sensor
+        had at the start time. Returns None if the states are not known.
+        """
+        if (entity_states := self.states.get(current_state.entity_id)) is None:
+            if current_state.last_updated <= self.start:
+                # The sensor did not change since the recorder started feeding
+                return [current_state]
+            # The state changed, but the recorder did not feed it yet
+            return None
+        start_time = start - datetime.timedelta.resolution
+        start_state: State | None = None
+        period_states: list[State] = []
+        for state in entity_states:
+            last_updated = state.last_updated
+            if last_updated <= start_time:
+                start_state = state
+            elif last_updated >= end:
+                break
+            elif not significant_changes_only or state.last_changed == last_updated:
+                period_states.append(state)
+        if start_state is None:
+            return period_states
+        return [start_state, *period_states]
+
+    def purge(self, before: datetime.datetime) -> None:
+        """Forget states not needed for periods starting at or after before."""
+        purge_before = before - datetime.timedelta.resolution
+        for entity_states in self.states.values():
+            # Keep the last state before the cut off, it is the start state
+            keep_from = 0
+            for index, state in enumerate(entity_states):
+                if state.last_updated > purge_before:
+                    break
+                keep_from = index
+            del entity_states[:keep_from]
+
+
+def record_state_changed(hass: HomeAssistant, event: Event) -> None:
+    """Feed a recorded sensor state change to the recent states.
+
+    Note: This is called from the recorder thread
+    """
+    entity_id: str = event.data["entity_id"]
+    if not entity_id.startswith("sensor."):
+        return
+    recent_states: RecentStates | None = hass.data.get(RECENT_STATES)
+    if (new_state := event.data.get("new_state")) is None:
+        if recent_states is not None:
+            recent_states.remove(entity_id)
+        return
+    if recent_states is None:
+        recent_states = hass.data[RECENT_STATES] = RecentStates(event.time_fired)
+    recent_states.add(entity_id, event.data.get("old_state"), new_state)
+
 
 def _get_sensor_states(hass: HomeAssistant) -> list[State]:
     """Get the current state of all sensors for which to compile statistics."""
@@ -386,6 +488,45 @@ def _timestamp_to_isoformat_or_none(timestamp: float | None) -> str | None:
     return dt_util.utc_from_timestamp(timestamp).isoformat()
 
 
+def _get_history(
+    hass: HomeAssistant,
+    session: Session,
+    start: datetime.datetime,
+    end: datetime.datetime,
+    sensor_states: list[State],
+    wanted_statistics: dict[str, set[str]],
+) -> MutableMapping[str, list[State]]:
+    """Query the states history of the sensors during start-end."""
+    entities_full_history = [
+        i.entity_id for i in sensor_states if "sum" in wanted_statistics[i.entity_id]
+    ]
+    history_list: MutableMapping[str, list[State]] = {}
+    if entities_full_history:
+        history_list = history.get_full_significant_states_with_session(
+            hass,
+            session,
+            start - datetime.timedelta.resolution,
+            end,
+            entity_ids=entities_full_history,
+            significant_changes_only=False,
+        )
+    entities_significant_history = [
+        i.entity_id
+        for i in sensor_states
+        if "sum" not in wanted_statistics[i.entity_id]
+    ]
+    if entities_significant_history:
+        _history_list = history.get_full_significant_states_with_session(
+            hass,
+            session,
+            start - datetime.timedelta.resolution,
+            end,
+            entity_ids=entities_significant_history,
+        )
+        history_list = {**history_list, **_history_list}
+    return history_list
+
+
 def compile_statistics(
     hass: HomeAssistant, start: datetime.datetime, end: datetime.datetime
 ) -> statistics.PlatformCompiledStatistics:
@@ -417,34 +558,32 @@ def _compile_statistics(  # noqa: C901
 
     sensor_states = _get_sensor_states(hass)
     wanted_statistics = _wanted_statistics(sensor_states)
-    # Get history between start and end
-    entities_full_history = [
-        i.entity_id for i in sensor_states if "sum" in wanted_statistics[i.entity_id]
-    ]
-    history_list: MutableMapping[str, list[State]] = {}
-    if entities_full_history:
-        history_list = history.get_full_significant_states_with_session(
-            hass,
-            session,
-            start - datetime.timedelta.resolution,
-            end,
-            entity_ids=entities_full_history,
-            significant_changes_only=False,
-        )
-    entities_significant_history = [
-        i.entity_id
-        for i in sensor_states
-        if "sum" not in wanted_statistics[i.entity_id]
-    ]
-    if entities_significant_history:
-        _history_list = history.get_full_significant_states_with_session(
-            hass,
-            session,
-            start - datetime.timedelta.resolution,
-            end,
-            entity_ids=entities_significant_history,
+    history_list: MutableMapping[str, list[State]]
+    recent_states: RecentStates | None = hass.data.get(RECENT_STATES)
+    if recent_states is not None and recent_states.covers(start):
+        # All state changes during the period were fed by the recorder
+        history_list = {}
+        unknown_history: list[State] = []
+        for _state in sensor_states:
+            if (
+                entity_history := recent_states.history(
+                    _state, start, end, "sum" not in wanted_statistics[_state.entity_id]
+                )
+            ) is None:
+                unknown_history.append(_state)
+            else:
+                history_list[_state.entity_id] = entity_history
+        recent_states.purge(start)
+        if unknown_history:
+            history_list.update(
+                _get_history(
+                    hass, session, start, end, unknown_history, wanted_statistics
+                )
+            )
+    else:
+        history_list = _get_history(
+            hass, session, start, end, sensor_states, wanted_statistics
         )
-        history_list = {**history_list, **_history_list}
 
     entities_with_float_states: dict[str, list[tuple[float, State]]] = {}
     for _state in sensor_states:
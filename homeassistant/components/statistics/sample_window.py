@@ -0,0 +1,319 @@
+"""Rolling window of samples for the statistics sensor."""
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right, insort
+from collections import deque
+from datetime import datetime
+from fractions import Fraction
+import math
+
+# Target length of the blocks of _SortedValues
+_BLOCK_SIZE = 256
+
+
+class _SortedValues:
+    """Sorted multiset of values kept as a list of sorted blocks.
+
+    Inserting into or deleting from a single sorted list moves O(n) items,
+    splitting the values in blocks of about _BLOCK_SIZE bounds the move to
+    one block while finding the block and indexing are a bisect and a walk
+    over the blocks, so both are O(sqrt n) for the window sizes in use.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the empty multiset."""
+        self._blocks: list[list[float | bool]] = []
+        # Largest value of each block
+        self._maxes: list[float | bool] = []
+        self._len = 0
+
+    def __len__(self) -> int:
+        """Return the number of values."""
+        return self._len
+
+    def __getitem__(self, index: int) -> float | bool:
+        """Return the value at a position in sorted order."""
+        if not 0 <= index < self._len:
+            raise IndexError(index)
+        for block in self._blocks:
+            if index < len(block):
+                return block[index]
+            index -= len(block)
+        raise IndexError(index)
+
+    def add(self, value: float | bool) -> None:
+        """Add a value."""
+        self._len += 1
+        blocks = self._blocks
+        maxes = self._maxes
+        if not blocks:
+            blocks.append([value])
+            maxes.append(value)
+            return
+        position = min(bisect_right(maxes, value), len(maxes) - 1)
+        block = blocks[position]
+        insort(block, value)
+        maxes[position] = block[-1]
+        if len(block) > 2 * _BLOCK_SIZE:
+            blocks.insert(position + 1, block[_BLOCK_SIZE:])
+            del block[_BLOCK_SIZE:]
+            maxes.insert(position, block[-1])
+
+    def remove(self, value: float | bool) -> None:
+        """Remove one occurrence of a value which must be present."""
+        self._len -= 1
+        blocks = self._blocks
+        maxes = self._maxes
+        position = bisect_left(maxes, value)
+        block = blocks[position]
+        del block[bisect_left(block, value)]
+        if len(block) >= _BLOCK_SIZE // 2 or len(blocks) == 1:
+            if block:
+                maxes[position] = block[-1]
+            else:
+                del blocks[position]
+                del maxes[position]
+            return
+        # Merge a small block into its neighbour to keep indexing O(sqrt n)
+        if position == len(blocks) - 1:
+            position -= 1
+        block = blocks[position]
+        block.extend(blocks.pop(position + 1))
+        del maxes[position]
+        maxes[position] = block[-1]
+        if len(block) > 2 * _BLOCK_SIZE:
+            blocks.insert(position + 1, block[_BLOCK_SIZE:])
+            del block[_BLOCK_SIZE:]
+            maxes.insert(position, block[-1])
+
+
+class SampleWindow:
+    """Samples of the source sensor with statistics maintained on add and remove.
+
+    Sums, areas and differences are kept as running totals. The sum and the
+    sum of squares are exact, so the mean and variance are rounded the same
+    way as the statistics module does. The minimum and
+    maximum are kept in monotonic queues and the sorted values, needed for
+    the median and percentiles, are only maintained when requested, in
+    blocks so that adding and removing a sample is O(sqrt n).
+    """
+
+    def __init__(
+        self,
+        max_size: int | None,
+        *,
+        track_extrema: bool = False,
+        track_order: bool = False,
+    ) -> None:
+        """Initialize the window."""
+        self._max_size = max_size
+        self._track_extrema = track_extrema
+        self._track_order = track_order
+        self.states: deque[float | bool] = deque()
+        self.ages: deque[datetime] = deque()
+        # Sequence number of states[0], used to expire the extrema queues
+        self._first_sequence = 0
+        # (sequence, value, age) with decreasing and increasing values
+        self._max_queue: deque[tuple[int, float | bool, datetime]] = deque()
+        self._min_queue: deque[tuple[int, float | bool, datetime]] = deque()
+        self._sorted = _SortedValues()
+        self._removals_since_resync = 0
+        self._count_true = 0
+        self._sum = Fraction(0)
+        self._sum_squares = Fraction(0)
+        self._area_linear = 0.0
+        self._area_step = 0.0
+        self._sum_differences: float = 0
+        self._sum_differences_nonnegative: float = 0
+
+    def __len__(self) -> int:
+        """Return the number of samples."""
+        return len(self.states)
+
+    def append(self, value: float | bool, age: datetime) -> None:
+        """Add a sample, evicting the oldest one when the window is full.
+
+        Raises ValueError or OverflowError for non-finite values, before the
+        window is changed.
+        """
+        exact = Fraction(value)
+        if self._max_size is not None and len(self.states) >= self._max_size:
+            self.popleft()
+        if self.states:
+            self._add_pair(self.states[-1], self.ages[-1], value, age)
+        sequence = self._first_sequence + len(self.states)
+        self.states.append(value)
+        self.ages.append(age)
+        self._add_value(value, exact)
+        if self._track_extrema:
+            max_queue = self._max_queue
+            while max_queue and max_queue[-1][1] < value:
+                max_queue.pop()
+            max_queue.append((sequence, value, age))
+            min_queue = self._min_queue
+            while min_queue and min_queue[-1][1] > value:
+                min_queue.pop()
+            min_queue.append((sequence, value, age))
+        if self._track_order:
+            self._sorted.add(value)
+
+    def popleft(self) -> None:
+        """Remove the oldest sample."""
+        value = self.states.popleft()
+        age = self.ages.popleft()
+        if self.states:
+            self._remove_pair(value, age, self.states[0], self.ages[0])
+        sequence = self._first_sequence
+        self._first_sequence += 1
+        if self._track_extrema:
+            if self._max_queue[0][0] == sequence:
+                self._max_queue.popleft()
+            if self._min_queue[0][0] == sequence:
+                self._min_queue.popleft()
+        if self._track_order:
+            self._sorted.remove(value)
+        self._remove_value(value)
+        # Recomputing the floating point totals once per window worth of
+        # removals keeps their drift bounded at amortized O(1) cost
+        self._removals_since_resync += 1
+        if self._removals_since_resync > len(self.states):
+            self._resync()
+
+    def _add_value(self, value: float | bool, exact: Fraction) -> None:
+        """Add the contribution of a sample to the exact sums."""
+        self._sum += exact
+        self._sum_squares += exact * exact
+        if value is True:
+            self._count_true += 1
+
+    def _remove_value(self, value: float | bool) -> None:
+        """Remove the contribution of a sample from the exact sums."""
+        exact = Fraction(value)
+        self._sum -= exact
+        self._sum_squares -= exact * exact
+        if value is True:
+            self._count_true -= 1
+
+    def _add_pair(
+        self,
+        value: float | bool,
+        age: datetime,
+        next_value: float | bool,
+        next_age: datetime,
+    ) -> None:
+        """Add the contribution of two consecutive samples."""
+        seconds = (next_age - age).total_seconds()
+        self._area_linear += 0.5 * (next_value + value) * seconds
+        self._area_step += value * seconds
+        self._sum_differences += abs(next_value - value)
+        self._sum_differences_nonnegative += (
+            next_value - value if next_value >= value else next_value
+        )
+
+    def _remove_pair(
+        self,
+        value: float | bool,
+        age: datetime,
+        next_value: float | bool,
+        next_age: datetime,
+    ) -> None:
+        """Remove the contribution of two consecutive samples."""
+        seconds = (next_age - age).total_seconds()
+        self._area_linear -= 0.5 * (next_value + value) * seconds
+        self._area_step -= value * seconds
+        self._sum_differences -= abs(next_value - value)
+        self._sum_differences_nonnegative -= (
+            next_value - value if next_value >= value else next_value
+        )
+
+    def _resync(self) -> None:
+        """Recompute the floating point totals from the samples."""
+        self._removals_since_resync = 0
+        self._area_linear = 0.0
+        self._area_step = 0.0
+        self._sum_differences = 0
+        self._sum_differences_nonnegative = 0
+        previous: tuple[float | bool, datetime] | None = None
+        for value, age in zip(self.states, self.ages):
+            if previous is not None:
+                self._add_pair(*previous, value, age)
+            previous = (value, age)
+
+    @property
+    def count_true(self) -> int:
+        """Return the number of samples which are True."""
+        return self._count_true
+
+    @property
+    def sum(self) -> float:
+        """Return the sum of the samples."""
+        return float(self._sum)
+
+    @property
+    def mean(self) -> float:
+        """Return the mean of the samples, the window must not be empty."""
+        return float(self._sum / len(self.states))
+
+    @property
+    def variance(self) -> float:
+        """Return the sample variance, the window needs two samples."""
+        count = len(self.states)
+        return float((self._sum_squares - self._sum * self._sum / count) / (count - 1))
+
+    @property
+    def standard_deviation(self) -> float:
+        """Return the sample standard deviation, the window needs two samples."""
+        return math.sqrt(self.variance)
+
+    @property
+    def area_linear(self) -> float:
+        """Return the area under the samples, interpolated linearly."""
+        return self._area_linear
+
+    @property
+    def area_step(self) -> float:
+        """Return the area under the samples, each held until the next one."""
+        return self._area_step
+
+    @property
+    def sum_differences(self) -> float:
+        """Return the sum of the absolute differences of consecutive samples."""
+        return self._sum_differences
+
+    @property
+    def sum_differences_nonnegative(self) -> float:
+        """Return the sum of the differences, counting resets from zero."""
+        return self._sum_differences_nonnegative
+
+    @property
+    def max(self) -> tuple[float | bool, datetime]:
+        """Return the first maximum value and its age, requires track_extrema."""
+        _, value, age = self._max_queue[0]
+        return value, age
+
+    @property
+    def min(self) -> tuple[float | bool, datetime]:
+        """Return the first minimum value and its age, requires track_extrema."""
+        _, value, age = self._min_queue[0]
+        return value, age
+
+    @property
+    def median(self) -> float | bool:
+        """Return the median, requires track_order."""
+        values = self._sorted
+        middle = len(values) // 2
+        if len(values) % 2:
+            return values[middle]
+        return (values[middle - 1] + values[middle]) / 2
+
+    def percentile(self, percentile: int) -> float:
+        """Return a percentile, requires track_order and two samples.
+
+        Matches statistics.quantiles(n=100, method="exclusive").
+        """
+        values = self._sorted
+        count = len(values)
+        position = percentile * (count + 1)
+        index = min(max(position // 100, 1), count - 1)
+        delta = position - index * 100
+        return (values[index - 1] * (100 - delta) + values[index] * delta) / 100
@@ -5,7 +5,8 @@ from collections.abc import Callable
 import datetime as dt
 from functools import lru_cache, partial
 import json
-from typing import Any, cast
+import logging
+from typing import TYPE_CHECKING, Any, NamedTuple, cast
 
 import voluptuous as vol
 
@@ -16,14 +17,26 @@ from homeassistant.const import (
     MATCH_ALL,
     SIGNAL_BOOTSTRAP_INTEGRATIONS,
 )
-from homeassistant.core import Context, Event, HomeAssistant, State, callback
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Context,
+    Event,
+    HomeAssistant,
+    State,
+    callback,
+)
 from homeassistant.exceptions import (
     HomeAssistantError,
     ServiceNotFound,
     TemplateError,
     Unauthorized,
 )
-from homeassistant.helpers import config_validation as cv, entity, template
+from homeassistant.helpers import (
+    config_validation as cv,
+    entity,
+    entity_platform,
+    template,
+)
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.event import (
     EventStateChangedData,
@@ -55,6 +68,12 @@ from .const import ERR_NOT_FOUND
 from .messages import construct_event_message, construct_result_message
 
 ALL_SERVICE_DESCRIPTIONS_JSON_CACHE = "websocket_api_all_service_descriptions_json"
+SUBSCRIBE_ENTITIES_DISPATCHER = "websocket_api_subscribe_entities_dispatcher"
+
+_LOGGER = logging.getLogger(__name__)
+
+if TYPE_CHECKING:
+    from .http import WebSocketAdapter
 
 
 @callback
@@ -71,6 +90,7 @@ def async_register_commands(
     async_reg(hass, handle_get_services)
     async_reg(hass, handle_get_states)
     async_reg(hass, handle_manifest_get)
+    async_reg(hass, handle_integration_poll_info)
     async_reg(hass, handle_integration_setup_info)
     async_reg(hass, handle_manifest_list)
     async_reg(hass, handle_ping)
@@ -267,6 +287,14 @@ def handle_get_states(
     hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
 ) -> None:
     """Handle get states command."""
+    if connection.user.permissions.access_all_entities(POLICY_READ) and (
+        payload := _async_get_entity_changes_dispatcher(hass).async_get_states_payload(
+            _GET_STATES_FORMAT, connection.logger
+        )
+    ):
+        connection.send_message(construct_result_message(msg["id"], payload))
+        return
+
     states = _async_get_allowed_states(hass, connection)
 
     try:
@@ -303,15 +331,11 @@ def _send_handle_get_states_response(
 
 def _forward_entity_changes(
     send_message: Callable[[str | dict[str, Any] | Callable[[], str]], None],
-    entity_ids: set[str],
     user: User,
     msg_id: int,
     event: Event,
 ) -> None:
     """Forward entity state changed events to websocket."""
-    entity_id = event.data["entity_id"]
-    if entity_ids and entity_id not in entity_ids:
-        return
     # We have to lookup the permissions again because the user might have
     # changed since the subscription was created.
     permissions = user.permissions
@@ -322,6 +346,189 @@ def _forward_entity_changes(
     send_message(messages.cached_state_diff_message(msg_id, event))
 
 
+class _StatesFormat(NamedTuple):
+    """How the states of all entities are serialized into a payload."""
+
+    serialize: Callable[[State], str]
+    prefix: str
+    suffix: str
+
+
+_GET_STATES_FORMAT = _StatesFormat(State.as_dict_json, "[", "]")
+_SUBSCRIBE_ENTITIES_FORMAT = _StatesFormat(
+    State.as_compressed_state_json, '{"a":{', "}}"
+)
+
+
+class _StatesSnapshot:
+    """Serialized states of all entities, shared by all connections.
+
+    The serialized state of each entity is kept and only the entities which
+    changed since the last request are serialized again. The joined payload
+    is reused until the next state change, so clients reconnecting at the
+    same time share one buffer.
+    """
+
+    __slots__ = ("_hass", "_format", "_serialized", "_dirty", "_payload")
+
+    def __init__(self, hass: HomeAssistant, states_format: _StatesFormat) -> None:
+        """Initialize the snapshot."""
+        self._hass = hass
+        self._format = states_format
+        self._serialized: dict[str, str] | None = None
+        self._dirty: set[str] = set()
+        self._payload: str | None = None
+
+    @callback
+    def async_invalidate(self, entity_id: str) -> None:
+        """Mark the state of an entity as changed."""
+        self._payload = None
+        if self._serialized is not None:
+            self._dirty.add(entity_id)
+
+    @callback
+    def async_get_payload(self, logger: WebSocketAdapter) -> str:
+        """Return the payload with the serialized states of all entities."""
+        if self._payload is not None:
+            return self._payload
+        if (serialized := self._serialized) is None:
+            serialized = self._serialized = {}
+            states: list[State] = self._hass.states.async_all()
+        else:
+            get_state = self._hass.states.get
+            states = []
+            for entity_id in self._dirty:
+                if (state := get_state(entity_id)) is None:
+                    serialized.pop(entity_id, None)
+                else:
+                    states.append(state)
+            self._dirty.clear()
+        states_format = self._format
+        serialize = states_format.serialize
+        for state in states:
+            try:
+                serialized[state.entity_id] = serialize(state)
+            except (ValueError, TypeError):
+                serialized.pop(state.entity_id, None)
+                logger.error(
+                    "Unable to serialize to JSON. Bad data found at %s",
+                    format_unserializable_data(
+                        find_paths_unserializable_data(state, dump=JSON_DUMP)
+                    ),
+                )
+        joined_states = ",".join(serialized.values())
+        self._payload = f"{states_format.prefix}{joined_states}{states_format.suffix}"
+        return self._payload
+
+
+class _EntityChangesDispatcher:
+    """Dispatch state_changed events to subscribe_entities subscriptions.
+
+    A single state_changed listener is shared by all connections. Each event
+    is only forwarded to the subscriptions for its entity_id and to the
+    subscriptions for all entities, and the state diff message is serialized
+    once per event by cached_state_diff_message.
+
+    While the listener is active it also keeps the snapshots of the
+    serialized states of all entities up to date.
+    """
+
+    __slots__ = ("_hass", "_all", "_entity_ids", "_unsub", "_snapshots")
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the dispatcher."""
+        self._hass = hass
+        self._all: list[Callable[[Event], None]] = []
+        self._entity_ids: dict[str, list[Callable[[Event], None]]] = {}
+        self._unsub: CALLBACK_TYPE | None = None
+        self._snapshots: dict[_StatesFormat, _StatesSnapshot] = {}
+
+    @callback
+    def async_get_states_payload(
+        self,
+        states_format: _StatesFormat,
+        logger: WebSocketAdapter,
+    ) -> str | None:
+        """Return the serialized states of all entities.
+
+        Returns None if there are no subscriptions, since the snapshot can
+        only be kept up to date while the state_changed listener is active.
+        """
+        if self._unsub is None:
+            return None
+        if (snapshot := self._snapshots.get(states_format)) is None:
+            snapshot = self._snapshots[states_format] = _StatesSnapshot(
+                self._hass, states_format
+            )
+        return snapshot.async_get_payload(logger)
+
+    @callback
+    def async_subscribe(
+        self, entity_ids: set[str], forward: Callable[[Event], None]
+    ) -> CALLBACK_TYPE:
+        """Subscribe to changes of entity_ids or all entities if empty."""
+        if self._unsub is None:
+            self._unsub = self._hass.bus.async_listen(
+                EVENT_STATE_CHANGED, self._async_dispatch, run_immediately=True
+            )
+        if not entity_ids:
+            self._all.append(forward)
+        else:
+            for entity_id in entity_ids:
+                self._entity_ids.setdefault(entity_id, []).append(forward)
+        return partial(self._async_unsubscribe, entity_ids, forward)
+
+    @callback
+    def _async_unsubscribe(
+        self, entity_ids: set[str], forward: Callable[[Event], None]
+    ) -> None:
+        """Remove a subscription and the listener once no subscriptions are left."""
+        if not entity_ids:
+            self._all.remove(forward)
+        else:
+            for entity_id in entity_ids:
+                forwards = self._entity_ids[entity_id]
+                forwards.remove(forward)
+                if not forwards:
+                    del self._entity_ids[entity_id]
+        if not self._all and not self._entity_ids and self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+            self._snapshots.clear()
+
+    @callback
+    def _async_dispatch(self, event: Event) -> None:
+        """Forward the event to the interested subscriptions."""
+        entity_id: str = event.data["entity_id"]
+        for snapshot in self._snapshots.values():
+            snapshot.async_invalidate(entity_id)
+        if (entity_forwards := self._entity_ids.get(entity_id)) is not None:
+            forwards = [*self._all, *entity_forwards]
+        elif self._all:
+            forwards = self._all[:]
+        else:
+            return
+        for forward in forwards:
+            try:
+                forward(event)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception(
+                    "Error while forwarding state change for %s", entity_id
+                )
+
+
+@callback
+def _async_get_entity_changes_dispatcher(
+    hass: HomeAssistant,
+) -> _EntityChangesDispatcher:
+    """Return the shared subscribe_entities dispatcher."""
+    if (dispatcher := hass.data.get(SUBSCRIBE_ENTITIES_DISPATCHER)) is None:
+        dispatcher = hass.data[
+            SUBSCRIBE_ENTITIES_DISPATCHER
+        ] = _EntityChangesDispatcher(hass)
+    return cast(_EntityChangesDispatcher, dispatcher)
+
+
 @callback
 @decorators.websocket_command(
     {
@@ -337,22 +544,31 @@ def handle_subscribe_entities(
     # We must never await between sending the states and listening for
     # state changed events or we will introduce a race condition
     # where some states are missed
-    states = _async_get_allowed_states(hass, connection)
-    connection.subscriptions[msg["id"]] = hass.bus.async_listen(
-        EVENT_STATE_CHANGED,
-        callback(
-            partial(
-                _forward_entity_changes,
-                connection.send_message,
-                entity_ids,
-                connection.user,
-                msg["id"],
-            )
+    dispatcher = _async_get_entity_changes_dispatcher(hass)
+    connection.subscriptions[msg["id"]] = dispatcher.async_subscribe(
+        entity_ids,
+        partial(
+            _forward_entity_changes,
+            connection.send_message,
+            connection.user,
+            msg["id"],
         ),
-        run_immediately=True,
     )
     connection.send_result(msg["id"])
 
+    if (
+        not entity_ids
+        and connection.user.permissions.access_all_entities(POLICY_READ)
+        and (
+            payload := dispatcher.async_get_states_payload(
+                _SUBSCRIBE_ENTITIES_FORMAT, connection.logger
+            )
+        )
+    ):
+        connection.send_message(construct_event_message(msg["id"], payload))
+        return
+
+    states = _async_get_allowed_states(hass, connection)
     # JSON serialize here so we can recover if it blows up due to the
     # state machine containing unserializable data. This command is required
     # to succeed for the UI to show.
@@ -465,6 +681,31 @@ async def handle_manifest_get(
         connection.send_error(msg["id"], const.ERR_NOT_FOUND, "Integration not found")
 
 
+@callback
+@decorators.websocket_command({vol.Required("type"): "integration/poll_info"})
+def handle_integration_poll_info(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle poll info command."""
+    connection.send_result(
+        msg["id"],
+        [
+            {
+                "platform": platform,
+                "polls": statistics.polls,
+                "overruns": statistics.overruns,
+                "skipped_polls": statistics.skipped_polls,
+                "last_seconds": statistics.last_duration,
+                "max_seconds": statistics.max_duration,
+                "mean_seconds": statistics.mean_duration,
+            }
+            for platform, statistics in entity_platform.async_get_poll_statistics(
+                hass
+            ).items()
+        ],
+    )
+
+
 @callback
 @decorators.websocket_command({vol.Required("type"): "integration/setup_info"})
 def handle_integration_setup_info(
@@ -4,6 +4,7 @@ from __future__ import annotations
 import asyncio
 from collections.abc import Callable, Hashable
 from contextvars import ContextVar
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
 from aiohttp import web
@@ -30,6 +31,26 @@ MessageHandler = Callable[[HomeAssistant, "ActiveConnection", dict[str, Any]], N
 BinaryHandler = Callable[[HomeAssistant, "ActiveConnection", bytes], None]
 
 
+@dataclass(slots=True)
+class TransferStatistics:
+    """Statistics of the messages sent on a websocket connection."""
+
+    messages: int = 0
+    compressed_messages: int = 0
+    # Size of the JSON messages before compression
+    payload_bytes: int = 0
+    # Size of the frame payloads sent, messages deflated by aiohttp are
+    # counted before compression
+    bytes_sent: int = 0
+
+    @property
+    def compression_ratio(self) -> float:
+        """Return the ratio of payload bytes to bytes sent."""
+        if not self.bytes_sent:
+            return 1.0
+        return self.payload_bytes / self.bytes_sent
+
+
 class ActiveConnection:
     """Handle an active websocket client connection."""
 
@@ -42,9 +63,11 @@ class ActiveConnection:
         "subscriptions",
         "last_id",
         "can_coalesce",
+        "can_send_binary",
         "supported_features",
         "handlers",
         "binary_handlers",
+        "transfer_statistics",
     )
 
     def __init__(
@@ -64,11 +87,13 @@ class ActiveConnection:
         self.subscriptions: dict[Hashable, Callable[[], Any]] = {}
         self.last_id = 0
         self.can_coalesce = False
+        self.can_send_binary = False
         self.supported_features: dict[str, float] = {}
         self.handlers: dict[str, tuple[MessageHandler, vol.Schema]] = self.hass.data[
             const.DOMAIN
         ]
         self.binary_handlers: list[BinaryHandler | None] = []
+        self.transfer_statistics = TransferStatistics()
         current_connection.set(self)
 
     def __repr__(self) -> str:
@@ -79,6 +104,7 @@ class ActiveConnection:
         """Set supported features."""
         self.supported_features = features
         self.can_coalesce = const.FEATURE_COALESCE_MESSAGES in features
+        self.can_send_binary = const.FEATURE_BINARY_MESSAGES in features
 
     def get_description(self, request: web.Request | None) -> str:
         """Return a description of the connection."""
@@ -25,6 +25,9 @@ PENDING_MSG_PEAK_TIME: Final = 5
 # This is effectively the upper limit of the number of entities
 # that can fire state changes within ~1 second.
 MAX_PENDING_MSG: Final = 4096
+# Messages smaller than this are sent uncompressed, deflating them costs
+# more CPU time than the few bytes it saves are worth.
+COMPRESSION_THRESHOLD: Final = 512
 
 ERR_ID_REUSE: Final = "id_reuse"
 ERR_INVALID_FORMAT: Final = "invalid_format"
@@ -49,3 +52,6 @@ SIGNAL_WEBSOCKET_DISCONNECTED: Final = "websocket_disconnected"
 DATA_CONNECTIONS: Final = f"{DOMAIN}.connections"
 
 FEATURE_COALESCE_MESSAGES = "coalesce_messages"
+# Messages at or above the compression threshold are sent as binary frames
+# with the zlib compressed JSON when permessage-deflate was not negotiated
+FEATURE_BINARY_MESSAGES = "binary_messages"
@@ -7,8 +7,10 @@ from collections.abc import Callable
 import datetime as dt
 import logging
 from typing import TYPE_CHECKING, Any, Final
+import zlib
 
 from aiohttp import WSMsgType, web
+from aiohttp.http_websocket import WebSocketWriter
 
 from homeassistant.components.http import HomeAssistantView
 from homeassistant.const import EVENT_HOMEASSISTANT_STOP
@@ -18,7 +20,9 @@ from homeassistant.helpers.event import async_call_later
 from homeassistant.util.json import json_loads
 
 from .auth import AuthPhase, auth_required_message
+from .connection import TransferStatistics
 from .const import (
+    COMPRESSION_THRESHOLD,
     DATA_CONNECTIONS,
     MAX_PENDING_MSG,
     PENDING_MSG_PEAK,
@@ -38,6 +42,20 @@ if TYPE_CHECKING:
 _WS_LOGGER: Final = logging.getLogger(f"{__name__}.connection")
 
 
+def _async_get_frame_writer(wsock: web.WebSocketResponse) -> WebSocketWriter | None:
+    """Return the aiohttp frame writer if it has the internals we rely on.
+
+    aiohttp has no public way to send a frame uncompressed once
+    permessage-deflate is negotiated.
+    """
+    ws_writer = wsock._writer  # pylint: disable=protected-access
+    if isinstance(ws_writer, WebSocketWriter) and isinstance(
+        getattr(ws_writer, "compress", None), int
+    ):
+        return ws_writer
+    return None
+
+
 class WebsocketAPIView(HomeAssistantView):
     """View to serve a websockets endpoint."""
 
@@ -75,6 +93,7 @@ class WebSocketHandler:
         "_connection",
         "_message_queue",
         "_ready_future",
+        "_statistics",
     )
 
     def __init__(self, hass: HomeAssistant, request: web.Request) -> None:
@@ -96,6 +115,7 @@ class WebSocketHandler:
         # an asyncio.Queue.
         self._message_queue: deque[str | None] = deque()
         self._ready_future: asyncio.Future[None] | None = None
+        self._statistics = TransferStatistics()
 
     def __repr__(self) -> str:
         """Return the representation."""
@@ -121,11 +141,50 @@ class WebSocketHandler:
         message_queue = self._message_queue
         logger = self._logger
         wsock = self._wsock
-        send_str = wsock.send_str
         loop = self._hass.loop
         debug = logger.debug
         is_enabled_for = logger.isEnabledFor
         logging_debug = logging.DEBUG
+        statistics = self._statistics
+        # The negotiated permessage-deflate window bits, 0 when not negotiated
+        deflate_bits = wsock.compress
+        # Passed per message, so each large message gets a fresh compressor
+        message_compress: bool | None = deflate_bits
+        if ws_writer := _async_get_frame_writer(wsock):
+            # aiohttp deflates every frame once permessage-deflate is negotiated,
+            # so it is turned off for the writer and only requested per message
+            # for the large ones.
+            ws_writer.compress = 0
+        else:
+            # Fresh compressors must not be mixed with the shared window of
+            # the writer, which keeps compressing every frame.
+            message_compress = None
+            debug(
+                "%s: aiohttp frame writer not supported, sending with its defaults",
+                self.description,
+            )
+
+        async def send_str(message: str) -> None:
+            """Send a message, compressed if it is large enough."""
+            size = len(message) if message.isascii() else len(message.encode())
+            statistics.messages += 1
+            statistics.payload_bytes += size
+            if size >= COMPRESSION_THRESHOLD:
+                if deflate_bits:
+                    statistics.compressed_messages += 1
+                    # aiohttp deflates the frame, so the size is not known here
+                    statistics.bytes_sent += size
+                    await wsock.send_str(message, compress=message_compress)
+                    return
+                if (connection := self._connection) and connection.can_send_binary:
+                    statistics.compressed_messages += 1
+                    compressed = zlib.compress(message.encode(), zlib.Z_BEST_SPEED)
+                    statistics.bytes_sent += len(compressed)
+                    await wsock.send_bytes(compressed)
+                    return
+            statistics.bytes_sent += size
+            await wsock.send_str(message)
+
         # Exceptions if Socket disconnected or cancelled by connection handler
         try:
             while not wsock.closed:
@@ -323,6 +382,7 @@ class WebSocketHandler:
             if is_enabled_for(logging_debug):
                 debug("%s: Received %s", self.description, auth_msg_data)
             connection = await auth.async_handle(auth_msg_data)
+            connection.transfer_statistics = self._statistics
             self._connection = connection
             hass.data[DATA_CONNECTIONS] = hass.data.get(DATA_CONNECTIONS, 0) + 1
             async_dispatcher_send(hass, SIGNAL_WEBSOCKET_CONNECTED)
@@ -439,6 +499,19 @@ class WebSocketHandler:
                     # Make sure all error messages are written before closing
                     await wsock.close()
                 finally:
+                    statistics = self._statistics
+                    debug(
+                        (
+                            "%s: Sent %s messages, %s compressed, %s bytes of"
+                            " %s bytes payload, compression ratio %.2f"
+                        ),
+                        self.description,
+                        statistics.messages,
+                        statistics.compressed_messages,
+                        statistics.bytes_sent,
+                        statistics.payload_bytes,
+                        statistics.compression_ratio,
+                    )
                     if disconnect_warn is None:
                         debug("%s: Disconnected", self.description)
                     else:
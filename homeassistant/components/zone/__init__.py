@@ -21,6 +21,7 @@ from homeassistant.const import (
     CONF_NAME,
     CONF_RADIUS,
     EVENT_CORE_CONFIG_UPDATE,
+    EVENT_STATE_CHANGED,
     SERVICE_RELOAD,
     STATE_HOME,
     STATE_NOT_HOME,
@@ -41,6 +42,7 @@ from homeassistant.loader import bind_hass
 from homeassistant.util.location import distance
 
 from .const import ATTR_PASSIVE, ATTR_RADIUS, CONF_PASSIVE, DOMAIN, HOME_ZONE
+from .index import ZoneIndex
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -97,7 +99,7 @@ STORAGE_VERSION = 1
 
 ENTITY_ID_SORTER = attrgetter("entity_id")
 
-ZONE_ENTITY_IDS = "zone_entity_ids"
+ZONE_INDEX = "zone_index"
 
 
 @bind_hass
@@ -108,12 +110,15 @@ def async_active_zone(
 
     This method must be run in the event loop.
     """
+    # This can be called before async_setup by device tracker
+    zone_index: ZoneIndex | None = hass.data.get(ZONE_INDEX)
+    if zone_index is None or latitude is None or longitude is None:
+        return None
     # Sort entity IDs so that we are deterministic if equal distance to 2 zones
     min_dist = None
     closest = None
-    # This can be called before async_setup by device tracker
-    zone_entity_ids: list[str] = hass.data.get(ZONE_ENTITY_IDS, [])
-    for entity_id in zone_entity_ids:
+    # Exact distances are only calculated for the zones near the location
+    for entity_id in zone_index.candidates(latitude, longitude, radius):
         zone = hass.states.get(entity_id)
         if (
             not zone
@@ -148,28 +153,29 @@ def async_active_zone(
 
 
 @callback
-def async_setup_track_zone_entity_ids(hass: HomeAssistant) -> None:
-    """Set up track of entity IDs for zones."""
-    zone_entity_ids: list[str] = hass.states.async_entity_ids(DOMAIN)
-    hass.data[ZONE_ENTITY_IDS] = zone_entity_ids
+def async_setup_track_zone_index(hass: HomeAssistant) -> None:
+    """Set up the spatial index of the zones."""
+    zone_index = hass.data[ZONE_INDEX] = ZoneIndex()
+    for state in hass.states.async_all(DOMAIN):
+        zone_index.async_update(state.entity_id, state)
 
     @callback
-    def _async_add_zone_entity_id(
-        event_: EventType[event.EventStateChangedData],
-    ) -> None:
-        """Add zone entity ID."""
-        zone_entity_ids.append(event_.data["entity_id"])
-        zone_entity_ids.sort()
+    def _async_zone_filter(event_: Event) -> bool:
+        """Filter state changes of zones."""
+        return bool(event_.data["entity_id"].startswith(f"{DOMAIN}."))
 
     @callback
-    def _async_remove_zone_entity_id(
-        event_: EventType[event.EventStateChangedData],
-    ) -> None:
-        """Remove zone entity ID."""
-        zone_entity_ids.remove(event_.data["entity_id"])
-
-    event.async_track_state_added_domain(hass, DOMAIN, _async_add_zone_entity_id)
-    event.async_track_state_removed_domain(hass, DOMAIN, _async_remove_zone_entity_id)
+    def _async_update_zone_index(event_: Event) -> None:
+        """Update the index with the new state of a zone."""
+        zone_index.async_update(event_.data["entity_id"], event_.data["new_state"])
+
+    # Run immediately so lookups never see a zone in its old location
+    hass.bus.async_listen(
+        EVENT_STATE_CHANGED,
+        _async_update_zone_index,
+        event_filter=_async_zone_filter,
+        run_immediately=True,
+    )
 
 
 def in_zone(zone: State, latitude: float, longitude: float, radius: float = 0) -> bool:
@@ -215,7 +221,7 @@ class ZoneStorageCollection(collection.DictStorageCollection):
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up configured zones as well as Home Assistant zone if necessary."""
-    async_setup_track_zone_entity_ids(hass)
+    async_setup_track_zone_index(hass)
 
     component = entity_component.EntityComponent[Zone](_LOGGER, DOMAIN, hass)
     id_manager = collection.IDManager()
@@ -0,0 +1,122 @@
+"""Spatial index of the active zones."""
+from __future__ import annotations
+
+from collections.abc import Iterator
+import contextlib
+import math
+
+from homeassistant.const import ATTR_LATITUDE, ATTR_LONGITUDE, STATE_UNAVAILABLE
+from homeassistant.core import State
+
+from .const import ATTR_PASSIVE, ATTR_RADIUS
+
+# Size of a grid cell in degrees
+CELL_SIZE = 0.1
+COLUMNS = round(360 / CELL_SIZE)
+# Bounding boxes covering more cells are not put in the grid
+MAX_CELLS = 1024
+# Less than the length of a degree of latitude anywhere on the WGS 84
+# ellipsoid and of a degree of longitude at the equator, so bounding boxes
+# are never too small
+METERS_PER_DEGREE = 110_000
+
+_Cell = tuple[int, int]
+
+
+def _bounding_cells(
+    latitude: float, longitude: float, radius: float
+) -> list[_Cell] | None:
+    """Return the grid cells covered by a circle.
+
+    Returns None if the circle is not bounded by a small enough box, which
+    is the case for large circles and circles close to the poles.
+    """
+    lat_delta = radius / METERS_PER_DEGREE
+    if (max_latitude := abs(latitude) + lat_delta) >= 89:
+        return None
+    lon_delta = lat_delta / math.cos(math.radians(max_latitude))
+    rows = range(
+        math.floor((latitude - lat_delta) / CELL_SIZE),
+        math.floor((latitude + lat_delta) / CELL_SIZE) + 1,
+    )
+    columns = range(
+        math.floor((longitude - lon_delta) / CELL_SIZE),
+        math.floor((longitude + lon_delta) / CELL_SIZE) + 1,
+    )
+    if len(rows) * len(columns) > MAX_CELLS:
+        return None
+    # Columns wrap around at the antimeridian
+    return [(row, column % COLUMNS) for row in rows for column in columns]
+
+
+class ZoneIndex:
+    """Grid of the bounding boxes of the zones an entity can be in.
+
+    Passive and unavailable zones are left out. Zones with a bounding box
+    which does not fit the grid, or without a valid location or radius, are
+    candidates for every lookup so they are still handled by the exact
+    check of the caller.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the index."""
+        self._cells: dict[_Cell, set[str]] = {}
+        self._unbounded: set[str] = set()
+        self._zones: dict[str, tuple[list[_Cell] | None, tuple]] = {}
+
+    def async_update(self, entity_id: str, state: State | None) -> None:
+        """Add, move or remove a zone after its state changed."""
+        if state is None or state.state == STATE_UNAVAILABLE:
+            geometry: tuple | None = None
+        elif state.attributes.get(ATTR_PASSIVE):
+            geometry = None
+        else:
+            geometry = (
+                state.attributes.get(ATTR_LATITUDE),
+                state.attributes.get(ATTR_LONGITUDE),
+                state.attributes.get(ATTR_RADIUS),
+            )
+        if (indexed := self._zones.get(entity_id)) is not None:
+            if indexed[1] == geometry:
+                return
+            self._remove(entity_id, indexed[0])
+        if geometry is None:
+            return
+        cells: list[_Cell] | None = None
+        latitude, longitude, radius = geometry
+        with contextlib.suppress(TypeError, ValueError, OverflowError):
+            cells = _bounding_cells(latitude, longitude, radius)
+        self._zones[entity_id] = (cells, geometry)
+        if cells is None:
+            self._unbounded.add(entity_id)
+            return
+        for cell in cells:
+            self._cells.setdefault(cell, set()).add(entity_id)
+
+    def _remove(self, entity_id: str, cells: list[_Cell] | None) -> None:
+        """Remove a zone from the grid."""
+        del self._zones[entity_id]
+        if cells is None:
+            self._unbounded.discard(entity_id)
+            return
+        for cell in cells:
+            zones = self._cells[cell]
+            zones.discard(entity_id)
+            if not zones:
+                del self._cells[cell]
+
+    def _candidates(
+        self, latitude: float, longitude: float, radius: float
+    ) -> Iterator[str]:
+        """Yield the zones with a bounding box near a circle."""
+        if (cells := _bounding_cells(latitude, longitude, max(radius, 0))) is None:
+            yield from self._zones
+            return
+        yield from self._unbounded
+        for cell in cells:
+            if zones := self._cells.get(cell):
+                yield from zones
+
+    def candidates(self, latitude: float, longitude: float, radius: float) -> list[str]:
+        """Return the sorted entity ids of the zones a circle may overlap."""
+        return sorted(set(self._candidates(latitude, longitude, radius)))
@@ -19,6 +19,7 @@ from contextlib import suppress
 import datetime
 import enum
 import functools
+import heapq
 import logging
 import os
 import pathlib
@@ -78,6 +79,7 @@ from .util.async_ import (
 from .util.json import JsonObjectType
 from .util.read_only_dict import ReadOnlyDict
 from .util.timeout import TimeoutManager
+from .util.timer_wheel import TimerWheel
 from .util.ulid import ulid, ulid_at_time
 from .util.unit_system import (
     _CONF_UNIT_SYSTEM_IMPERIAL,
@@ -92,6 +94,7 @@ if TYPE_CHECKING:
     from .auth import AuthManager
     from .components.http import ApiConfig, HomeAssistantHTTP
     from .config_entries import ConfigEntries
+    from .helpers.storage import StoreSnapshot
 
 
 STAGE_1_SHUTDOWN_TIMEOUT = 100
@@ -313,6 +316,8 @@ class HomeAssistant:
         self._stopped: asyncio.Event | None = None
         # Timeout handler for Core/Helper namespace
         self.timeout: TimeoutManager = TimeoutManager()
+        # Coarse timers for helpers which schedule a large number of them
+        self.timer_wheel: TimerWheel = TimerWheel(self.loop)
         self._stop_future: concurrent.futures.Future[None] | None = None
 
     @property
@@ -1408,11 +1413,26 @@ class State:
 class StateMachine:
     """Helper class that tracks the state of different entities."""
 
-    __slots__ = ("_states", "_reservations", "_bus", "_loop")
+    __slots__ = (
+        "_states",
+        "_domain_index",
+        "_insert_order",
+        "_next_insert",
+        "_reservations",
+        "_bus",
+        "_loop",
+    )
 
     def __init__(self, bus: EventBus, loop: asyncio.events.AbstractEventLoop) -> None:
         """Initialize state machine."""
         self._states: dict[str, State] = {}
+        # domain -> entity_id -> State, kept in the same insertion order as
+        # _states so domain filtered lookups do not have to scan every state.
+        self._domain_index: dict[str, dict[str, State]] = {}
+        # entity_id -> increasing number of when it was added to _states, used
+        # to merge several domains back into insertion order
+        self._insert_order: dict[str, int] = {}
+        self._next_insert = 0
         self._reservations: set[str] = set()
         self._bus = bus
         self._loop = loop
@@ -1436,13 +1456,25 @@ class StateMachine:
             return list(self._states)
 
         if isinstance(domain_filter, str):
-            domain_filter = (domain_filter.lower(),)
+            return list(self._domain_index.get(domain_filter.lower(), ()))
 
-        return [
-            state.entity_id
-            for state in self._states.values()
-            if state.domain in domain_filter
+        return list(self._async_domains_entity_ids(domain_filter))
+
+    @callback
+    def _async_domains_entity_ids(self, domains: Iterable[str]) -> Iterable[str]:
+        """Return the entity ids of the domains in the order they were added."""
+        domain_index = self._domain_index
+        buckets = [
+            domain_states
+            for domain in set(domains)
+            if (domain_states := domain_index.get(domain))
         ]
+        if not buckets:
+            return ()
+        if len(buckets) == 1:
+            return buckets[0]
+        # Each bucket is in insertion order already
+        return heapq.merge(*buckets, key=self._insert_order.__getitem__)
 
     @callback
     def async_entity_ids_count(
@@ -1456,10 +1488,12 @@ class StateMachine:
             return len(self._states)
 
         if isinstance(domain_filter, str):
-            domain_filter = (domain_filter.lower(),)
+            return len(self._domain_index.get(domain_filter.lower(), ()))
 
-        return len(
-            [None for state in self._states.values() if state.domain in domain_filter]
+        return sum(
+            len(domain_states)
+            for domain in set(domain_filter)
+            if (domain_states := self._domain_index.get(domain)) is not None
         )
 
     def all(self, domain_filter: str | Iterable[str] | None = None) -> list[State]:
@@ -1480,10 +1514,14 @@ class StateMachine:
             return list(self._states.values())
 
         if isinstance(domain_filter, str):
-            domain_filter = (domain_filter.lower(),)
+            if (domain_states := self._domain_index.get(domain_filter.lower())) is None:
+                return []
+            return list(domain_states.values())
 
+        states = self._states
         return [
-            state for state in self._states.values() if state.domain in domain_filter
+            states[entity_id]
+            for entity_id in self._async_domains_entity_ids(domain_filter)
         ]
 
     def get(self, entity_id: str) -> State | None:
@@ -1527,6 +1565,12 @@ class StateMachine:
         if old_state is None:
             return False
 
+        del self._insert_order[entity_id]
+        domain_states = self._domain_index[old_state.domain]
+        del domain_states[entity_id]
+        if not domain_states:
+            del self._domain_index[old_state.domain]
+
         old_state.expire()
         self._bus.async_fire(
             EVENT_STATE_CHANGED,
@@ -1647,6 +1691,11 @@ class StateMachine:
         )
         if old_state is not None:
             old_state.expire()
+            self._domain_index[state.domain][entity_id] = state
+        else:
+            self._domain_index.setdefault(state.domain, {})[entity_id] = state
+            self._insert_order[entity_id] = self._next_insert
+            self._next_insert += 1
         self._states[entity_id] = state
         self._bus.async_fire(
             EVENT_STATE_CHANGED,
@@ -2335,7 +2384,11 @@ class Config:
                 raise NotImplementedError
             return data
 
-        async def async_save(self, data: dict[str, Any]) -> None:
+        async def async_save(
+            self, data: dict[str, Any] | StoreSnapshot[dict[str, Any]]
+        ) -> None:
+            if not isinstance(data, dict):
+                data = data.build()
             if self._original_unit_system:
                 data["unit_system"] = self._original_unit_system
             return await super().async_save(data)
@@ -432,10 +432,83 @@ class DeviceRegistryItems(UserDict[str, _EntryTypeT]):
         return None
 
 
+class ActiveDeviceRegistryItems(DeviceRegistryItems[DeviceEntry]):
+    """Container for active (non-deleted) device registry entries.
+
+    Maintains additional indexes:
+    - area_id -> device ids
+    - config_entry_id -> device ids
+    """
+
+    def __init__(self) -> None:
+        """Initialize the container."""
+        super().__init__()
+        self._area_id_index: dict[str, dict[str, Literal[True]]] = {}
+        self._config_entry_id_index: dict[str, dict[str, Literal[True]]] = {}
+
+    def __setitem__(self, key: str, entry: DeviceEntry) -> None:
+        """Add an item."""
+        old_entry = self.data.get(key)
+        super().__setitem__(key, entry)
+        self._update_secondary_indexes(key, old_entry, entry)
+
+    def __delitem__(self, key: str) -> None:
+        """Remove an item."""
+        self._update_secondary_indexes(key, self[key], None)
+        super().__delitem__(key)
+
+    def _update_secondary_indexes(
+        self, key: str, old_entry: DeviceEntry | None, entry: DeviceEntry | None
+    ) -> None:
+        """Update the area and config entry indexes.
+
+        A device is only moved when the indexed value changes, so each index
+        keeps the order of the underlying dict.
+        """
+        old_area_id = old_entry.area_id if old_entry else None
+        new_area_id = entry.area_id if entry else None
+        if old_area_id != new_area_id:
+            if old_area_id is not None:
+                _remove_from_index(self._area_id_index, old_area_id, key)
+            if new_area_id is not None:
+                self._area_id_index.setdefault(new_area_id, {})[key] = True
+
+        old_config_entries = old_entry.config_entries if old_entry else set()
+        new_config_entries = entry.config_entries if entry else set()
+        for config_entry_id in old_config_entries - new_config_entries:
+            _remove_from_index(self._config_entry_id_index, config_entry_id, key)
+        for config_entry_id in new_config_entries - old_config_entries:
+            self._config_entry_id_index.setdefault(config_entry_id, {})[key] = True
+
+    def get_devices_for_area_id(self, area_id: str) -> list[DeviceEntry]:
+        """Get devices for area."""
+        data = self.data
+        return [data[key] for key in self._area_id_index.get(area_id, ())]
+
+    def get_devices_for_config_entry_id(
+        self, config_entry_id: str
+    ) -> list[DeviceEntry]:
+        """Get devices for config entry."""
+        data = self.data
+        return [
+            data[key] for key in self._config_entry_id_index.get(config_entry_id, ())
+        ]
+
+
+def _remove_from_index(
+    index: dict[str, dict[str, Literal[True]]], value: str, key: str
+) -> None:
+    """Remove a key from an index, dropping the value once it is unused."""
+    keys = index[value]
+    del keys[key]
+    if not keys:
+        del index[value]
+
+
 class DeviceRegistry:
     """Class to hold a registry of devices."""
 
-    devices: DeviceRegistryItems[DeviceEntry]
+    devices: ActiveDeviceRegistryItems
     deleted_devices: DeviceRegistryItems[DeletedDeviceEntry]
     _device_data: dict[str, DeviceEntry]
 
@@ -776,7 +849,7 @@ class DeviceRegistry:
 
         data = await self._store.async_load()
 
-        devices: DeviceRegistryItems[DeviceEntry] = DeviceRegistryItems()
+        devices = ActiveDeviceRegistryItems()
         deleted_devices: DeviceRegistryItems[DeletedDeviceEntry] = DeviceRegistryItems()
 
         if data is not None:
@@ -836,42 +909,52 @@ class DeviceRegistry:
         self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
 
     @callback
-    def _data_to_save(self) -> dict[str, list[dict[str, Any]]]:
-        """Return data of device registry to store in a file."""
-        data: dict[str, list[dict[str, Any]]] = {}
-
-        data["devices"] = [
-            {
-                "area_id": entry.area_id,
-                "config_entries": list(entry.config_entries),
-                "configuration_url": entry.configuration_url,
-                "connections": list(entry.connections),
-                "disabled_by": entry.disabled_by,
-                "entry_type": entry.entry_type,
-                "hw_version": entry.hw_version,
-                "id": entry.id,
-                "identifiers": list(entry.identifiers),
-                "manufacturer": entry.manufacturer,
-                "model": entry.model,
-                "name_by_user": entry.name_by_user,
-                "name": entry.name,
-                "sw_version": entry.sw_version,
-                "via_device_id": entry.via_device_id,
-            }
-            for entry in self.devices.values()
-        ]
-        data["deleted_devices"] = [
-            {
-                "config_entries": list(entry.config_entries),
-                "connections": list(entry.connections),
-                "identifiers": list(entry.identifiers),
-                "id": entry.id,
-                "orphaned_timestamp": entry.orphaned_timestamp,
-            }
-            for entry in self.deleted_devices.values()
-        ]
-
-        return data
+    def _data_to_save(
+        self,
+    ) -> storage.StoreSnapshot[dict[str, list[dict[str, Any]]]]:
+        """Return a snapshot of the device registry to store in a file."""
+        # The entries are frozen and replaced when they change
+        devices = list(self.devices.values())
+        deleted_devices = list(self.deleted_devices.values())
+
+        def _build() -> dict[str, list[dict[str, Any]]]:
+            """Return data of device registry to store in a file."""
+            data: dict[str, list[dict[str, Any]]] = {}
+
+            data["devices"] = [
+                {
+                    "area_id": entry.area_id,
+                    "config_entries": list(entry.config_entries),
+                    "configuration_url": entry.configuration_url,
+                    "connections": list(entry.connections),
+                    "disabled_by": entry.disabled_by,
+                    "entry_type": entry.entry_type,
+                    "hw_version": entry.hw_version,
+                    "id": entry.id,
+                    "identifiers": list(entry.identifiers),
+                    "manufacturer": entry.manufacturer,
+                    "model": entry.model,
+                    "name_by_user": entry.name_by_user,
+                    "name": entry.name,
+                    "sw_version": entry.sw_version,
+                    "via_device_id": entry.via_device_id,
+                }
+                for entry in devices
+            ]
+            data["deleted_devices"] = [
+                {
+                    "config_entries": list(entry.config_entries),
+                    "connections": list(entry.connections),
+                    "identifiers": list(entry.identifiers),
+                    "id": entry.id,
+                    "orphaned_timestamp": entry.orphaned_timestamp,
+                }
+                for entry in deleted_devices
+            ]
+
+            return data
+
+        return storage.StoreSnapshot(_build)
 
     @callback
     def async_clear_config_entry(self, config_entry_id: str) -> None:
@@ -939,7 +1022,7 @@ async def async_load(hass: HomeAssistant) -> None:
 @callback
 def async_entries_for_area(registry: DeviceRegistry, area_id: str) -> list[DeviceEntry]:
     """Return entries that match an area."""
-    return [device for device in registry.devices.values() if device.area_id == area_id]
+    return registry.devices.get_devices_for_area_id(area_id)
 
 
 @callback
@@ -947,11 +1030,7 @@ def async_entries_for_config_entry(
     registry: DeviceRegistry, config_entry_id: str
 ) -> list[DeviceEntry]:
     """Return entries that match a config entry."""
-    return [
-        device
-        for device in registry.devices.values()
-        if config_entry_id in device.config_entries
-    ]
+    return registry.devices.get_devices_for_config_entry_id(config_entry_id)
 
 
 @callback
@@ -4,6 +4,7 @@ from __future__ import annotations
 from abc import ABC
 import asyncio
 from collections.abc import Coroutine, Iterable, Mapping, MutableMapping
+from contextvars import ContextVar
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from enum import Enum, auto
@@ -59,6 +60,11 @@ DATA_ENTITY_SOURCE = "entity_info"
 SOURCE_CONFIG_ENTRY = "config_entry"
 SOURCE_PLATFORM_CONFIG = "platform_config"
 
+# Limits the executor jobs of sync updates, set by entity platforms while polling
+executor_update_limit: ContextVar[asyncio.Semaphore | None] = ContextVar(
+    "executor_update_limit", default=None
+)
+
 # Used when converting float states to string: limit precision according to machine
 # epsilon to make the string representation readable
 FLOAT_PRECISION = abs(int(math.floor(math.log10(abs(sys.float_info.epsilon))))) - 1
@@ -255,6 +261,9 @@ class Entity(ABC):
     # Process updates in parallel
     parallel_updates: asyncio.Semaphore | None = None
 
+    # Seconds the last update took, without waiting for update slots
+    update_duration: float | None = None
+
     # Entry in the entity registry
     registry_entry: er.RegistryEntry | None = None
 
@@ -919,14 +928,25 @@ class Entity(ABC):
                 hass.loop.time() + SLOW_UPDATE_WARNING, self._async_slow_update_warning
             )
 
+        self.update_duration = None
+        update_start: float | None = None
         try:
             if hasattr(self, "async_update"):
+                update_start = hass.loop.time()
                 await self.async_update()
             elif hasattr(self, "update"):
-                await hass.async_add_executor_job(self.update)
+                if (limit := executor_update_limit.get()) is None:
+                    update_start = hass.loop.time()
+                    await hass.async_add_executor_job(self.update)
+                else:
+                    async with limit:
+                        update_start = hass.loop.time()
+                        await hass.async_add_executor_job(self.update)
             else:
                 return
         finally:
+            if update_start is not None:
+                self.update_duration = hass.loop.time() - update_start
             self._update_staged = False
             if warning:
                 update_warn.cancel()
@@ -2,11 +2,15 @@
 from __future__ import annotations
 
 import asyncio
+from bisect import bisect_left, insort
 from collections.abc import Awaitable, Callable, Coroutine, Iterable
 from contextvars import ContextVar
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from logging import Logger, getLogger
+import time
 from typing import TYPE_CHECKING, Any, Protocol
+import zlib
 
 import voluptuous as vol
 
@@ -20,6 +24,7 @@ from homeassistant.core import (
     CALLBACK_TYPE,
     DOMAIN as HOMEASSISTANT_DOMAIN,
     CoreState,
+    HassJob,
     HomeAssistant,
     ServiceCall,
     callback,
@@ -38,8 +43,9 @@ from . import (
     service,
     translation,
 )
+from .entity import executor_update_limit
 from .entity_registry import EntityRegistry, RegistryEntryDisabler, RegistryEntryHider
-from .event import async_call_later, async_track_time_interval
+from .event import async_call_later
 from .issue_registry import IssueSeverity, async_create_issue
 from .typing import UNDEFINED, ConfigType, DiscoveryInfoType
 
@@ -54,8 +60,16 @@ SLOW_ADD_MIN_TIMEOUT = 500
 
 PLATFORM_NOT_READY_RETRIES = 10
 DATA_ENTITY_PLATFORM = "entity_platform"
+DATA_POLLING_SCHEDULER = "entity_platform_polling_scheduler"
 PLATFORM_NOT_READY_BASE_WAIT_TIME = 30  # seconds
 
+# Polling entities with a sync update of all platforms share this many
+# executor jobs, so polls scheduled at the same time do not flood the executor
+MAX_PARALLEL_EXECUTOR_POLLS = 16
+# Entities whose update takes longer than the scan interval skip 1, 2, 4, ..
+# up to this many polls until an update completes within the scan interval
+MAX_POLL_BACKOFF = 8
+
 _LOGGER = getLogger(__name__)
 
 
@@ -98,6 +112,221 @@ class EntityPlatformModule(Protocol):
         """Set up an integration platform from a config entry."""
 
 
+@dataclass(slots=True)
+class PollStatistics:
+    """Statistics of the polling of the entities of a platform.
+
+    A poll is a batch of entities of the platform that were due at once.
+    """
+
+    polls: int = 0
+    overruns: int = 0
+    skipped_polls: int = 0
+    last_duration: float = 0
+    max_duration: float = 0
+    total_duration: float = 0
+
+    @property
+    def mean_duration(self) -> float:
+        """Return the mean duration of a poll."""
+        return self.total_duration / self.polls if self.polls else 0
+
+    def record(self, duration: float) -> None:
+        """Record the duration of a poll."""
+        self.polls += 1
+        self.last_duration = duration
+        self.total_duration += duration
+        if duration > self.max_duration:
+            self.max_duration = duration
+
+
+class _PollingScheduler:
+    """Polling state shared by all entity platforms."""
+
+    __slots__ = ("executor_polls",)
+
+    def __init__(self) -> None:
+        """Initialize the polling scheduler."""
+        self.executor_polls = asyncio.Semaphore(MAX_PARALLEL_EXECUTOR_POLLS)
+
+
+@callback
+def _async_get_polling_scheduler(hass: HomeAssistant) -> _PollingScheduler:
+    """Return the polling scheduler."""
+    scheduler: _PollingScheduler | None = hass.data.get(DATA_POLLING_SCHEDULER)
+    if scheduler is None:
+        scheduler = hass.data[DATA_POLLING_SCHEDULER] = _PollingScheduler()
+    return scheduler
+
+
+def _poll_slot(entity_id: str | None, slots: int) -> int:
+    """Return the slot of an entity within the scan interval.
+
+    The slot is taken from a stable hash of the entity id, so an entity is
+    polled at the same offset within the interval on every start.
+    """
+    return zlib.crc32((entity_id or "").encode()) * slots >> 32
+
+
+class _PollSlots:
+    """Entities of a platform bucketed by their slot within the scan interval.
+
+    The scan interval is split in slots of about a second and one coarse
+    timer runs at the next occupied slot, so the entities of a platform are
+    spread over the interval without a timer per entity.
+    """
+
+    __slots__ = (
+        "_hass",
+        "_action",
+        "_job",
+        "_slots",
+        "_slot_length",
+        "_buckets",
+        "_occupied",
+        "_entity_slots",
+        "_timer",
+        "_start",
+        "_last_slot",
+        "_next_slot",
+    )
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        interval: timedelta,
+        action: Callable[[list[Entity], datetime], None],
+        name: str,
+    ) -> None:
+        """Initialize the slots."""
+        self._hass = hass
+        self._action = action
+        self._job = HassJob(self._async_run, name)
+        self._slots = max(1, round(interval.total_seconds()))
+        self._slot_length = interval.total_seconds() / self._slots
+        self._buckets: dict[int, list[Entity]] = {}
+        # Slots with a bucket in ascending order
+        self._occupied: list[int] = []
+        self._entity_slots: dict[Entity, int] = {}
+        self._timer: CALLBACK_TYPE | None = None
+        # Timestamp the slots are counted from, slot n is due at
+        # _start + (n + 1) * _slot_length
+        self._start = 0.0
+        # Number of the last slot run and of the slot the timer is set for,
+        # counted across intervals
+        self._last_slot = -1
+        self._next_slot = -1
+
+    def __contains__(self, entity: Entity) -> bool:
+        """Return if an entity is in a slot."""
+        return entity in self._entity_slots
+
+    def __len__(self) -> int:
+        """Return the number of entities in the slots."""
+        return len(self._entity_slots)
+
+    @property
+    def running(self) -> bool:
+        """Return if the slots are being run."""
+        return self._timer is not None
+
+    @callback
+    def add(self, entity: Entity) -> None:
+        """Add an entity to its slot."""
+        slot = _poll_slot(entity.entity_id, self._slots)
+        self._entity_slots[entity] = slot
+        if (bucket := self._buckets.get(slot)) is None:
+            bucket = self._buckets[slot] = []
+            insort(self._occupied, slot)
+        bucket.append(entity)
+        if self._timer is not None:
+            self._async_schedule()
+
+    @callback
+    def remove(self, entity: Entity) -> None:
+        """Remove an entity from its slot."""
+        if (slot := self._entity_slots.pop(entity, None)) is None:
+            return
+        bucket = self._buckets[slot]
+        bucket.remove(entity)
+        if not bucket:
+            del self._buckets[slot]
+            del self._occupied[bisect_left(self._occupied, slot)]
+        if not self._entity_slots:
+            self._async_cancel()
+
+    @callback
+    def async_start(self) -> None:
+        """Start running the slots, the first interval starts now."""
+        if self._timer is not None:
+            return
+        self._start = time.time()
+        self._last_slot = -1
+        self._async_schedule()
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop running the slots and remove all entities."""
+        self._async_cancel()
+        self._buckets.clear()
+        self._occupied.clear()
+        self._entity_slots.clear()
+
+    @callback
+    def _async_cancel(self) -> None:
+        """Cancel the timer."""
+        if self._timer is not None:
+            self._timer()
+            self._timer = None
+
+    @callback
+    def _async_schedule(self) -> None:
+        """Set the timer for the next occupied slot after the last one run."""
+        if not (occupied := self._occupied):
+            self._async_cancel()
+            return
+        interval, position = divmod(self._last_slot + 1, self._slots)
+        if (index := bisect_left(occupied, position)) < len(occupied):
+            next_slot = interval * self._slots + occupied[index]
+        else:
+            next_slot = (interval + 1) * self._slots + occupied[0]
+        if self._timer is not None:
+            if next_slot == self._next_slot:
+                return
+            self._timer()
+        self._next_slot = next_slot
+        due = self._start + (next_slot + 1) * self._slot_length
+        self._timer = async_call_later(
+            self._hass, due - time.time(), self._job, coarse=True
+        )
+
+    @callback
+    def _async_run(self, now: datetime) -> None:
+        """Run the action for the entities of the slots which are due.
+
+        Slots missed while the event loop was busy are caught up, but
+        at most one interval so each entity is polled once.
+        """
+        self._timer = None
+        slots = self._slots
+        occupied = self._occupied
+        due_slot = max(
+            int((now.timestamp() - self._start) / self._slot_length) - 1,
+            self._next_slot,
+        )
+        first_slot = max(self._last_slot + 1, due_slot - slots + 1)
+        self._last_slot = due_slot
+        start = first_slot % slots
+        end = start + due_slot - first_slot + 1
+        due = occupied[bisect_left(occupied, start) : bisect_left(occupied, end)]
+        if end > slots:
+            due.extend(occupied[: bisect_left(occupied, end - slots)])
+        entities = [entity for slot in due for entity in self._buckets[slot]]
+        if entities:
+            self._action(entities, now)
+        self._async_schedule()
+
+
 class EntityPlatform:
     """Manage the entities for a single platform."""
 
@@ -129,11 +358,22 @@ class EntityPlatform:
         self._tasks: list[asyncio.Task[None]] = []
         # Stop tracking tasks after setup is completed
         self._setup_complete = False
-        # Method to cancel the state change listener
-        self._async_unsub_polling: CALLBACK_TYPE | None = None
         # Method to cancel the retry of setup
         self._async_cancel_retry_setup: CALLBACK_TYPE | None = None
-        self._process_updates: asyncio.Lock | None = None
+        self.poll_statistics = PollStatistics()
+        # Entities of the platform spread over the scan interval
+        self._poll_slots = _PollSlots(
+            hass,
+            scan_interval,
+            self._async_poll_slot,
+            f"EntityPlatform poll {domain}.{platform_name}",
+        )
+        # Entities due to be polled by the next batch
+        self._due_polls: list[Entity] = []
+        # Entities which are due or being polled
+        self._polling: set[Entity] = set()
+        # Polls to skip and the current back-off of slow polling entities
+        self._poll_backoff: dict[Entity, tuple[int, int]] = {}
 
         self.parallel_updates: asyncio.Semaphore | None = None
         self._update_in_sequence: bool = False
@@ -520,19 +760,18 @@ class EntityPlatform:
             )
             raise
 
-        if (
-            (self.config_entry and self.config_entry.pref_disable_polling)
-            or self._async_unsub_polling is not None
-            or not any(entity.should_poll for entity in self.entities.values())
-        ):
+        if self.config_entry and self.config_entry.pref_disable_polling:
             return
 
-        self._async_unsub_polling = async_track_time_interval(
-            self.hass,
-            self._update_entity_states,
-            self.scan_interval,
-            name=f"EntityPlatform poll {self.domain}.{self.platform_name}",
-        )
+        # All entities are kept in the slots as should_poll is read on every
+        # poll, the timer is started once an entity of the platform polls
+        should_poll = False
+        for entity in self.entities.values():
+            if entity not in self._poll_slots:
+                self._poll_slots.add(entity)
+            should_poll = should_poll or entity.should_poll
+        if should_poll:
+            self._poll_slots.async_start()
 
     def _entity_id_already_exists(self, entity_id: str) -> tuple[bool, bool]:
         """Check if an entity_id already exists.
@@ -746,6 +985,8 @@ class EntityPlatform:
         def remove_entity_cb() -> None:
             """Remove entity from entities dict."""
             self.entities.pop(entity_id)
+            self._poll_backoff.pop(entity, None)
+            self._poll_slots.remove(entity)
 
         entity.async_on_remove(remove_entity_cb)
 
@@ -771,9 +1012,7 @@ class EntityPlatform:
     @callback
     def async_unsub_polling(self) -> None:
         """Stop polling."""
-        if self._async_unsub_polling is not None:
-            self._async_unsub_polling()
-            self._async_unsub_polling = None
+        self._poll_slots.async_stop()
 
     async def async_destroy(self) -> None:
         """Destroy an entity platform.
@@ -787,13 +1026,6 @@ class EntityPlatform:
         """Remove entity id from platform."""
         await self.entities[entity_id].async_remove()
 
-        # Clean up polling job if no longer needed
-        if self._async_unsub_polling is not None and not any(
-            entity.should_poll for entity in self.entities.values()
-        ):
-            self._async_unsub_polling()
-            self._async_unsub_polling = None
-
     async def async_extract_from_service(
         self, service_call: ServiceCall, expand_group: bool = True
     ) -> list[Entity]:
@@ -843,43 +1075,112 @@ class EntityPlatform:
             self.platform_name, name, handle_service, schema
         )
 
-    async def _update_entity_states(self, now: datetime) -> None:
-        """Update the states of all the polling entities.
+    @callback
+    def _async_poll_slot(self, entities: list[Entity], now: datetime) -> None:
+        """Queue the entities of a slot which currently poll."""
+        for entity in entities:
+            if entity.should_poll:
+                self._async_poll_due(entity, now)
 
-        To protect from flooding the executor, we will update async entities
-        in parallel and other entities sequential.
+    @callback
+    def _async_poll_due(self, entity: Entity, now: datetime) -> None:
+        """Queue an entity for polling.
 
-        This method must be run in the event loop.
+        Entities which are due at the same time are polled as one batch.
         """
-        if self._process_updates is None:
-            self._process_updates = asyncio.Lock()
-        if self._process_updates.locked():
+        if entity in self._polling:
+            self.poll_statistics.overruns += 1
             self.logger.warning(
-                "Updating %s %s took longer than the scheduled update interval %s",
-                self.platform_name,
-                self.domain,
+                "Updating %s took longer than the scheduled update interval %s",
+                entity.entity_id,
                 self.scan_interval,
             )
             return
 
-        async with self._process_updates:
-            if self._update_in_sequence or len(self.entities) <= 1:
-                # If we know we will update sequentially, we want to avoid scheduling
-                # the coroutines as tasks that will wait on the semaphore lock.
-                for entity in list(self.entities.values()):
-                    # If the entity is removed from hass during the previous
-                    # entity being updated, we need to skip updating the
-                    # entity.
-                    if entity.should_poll and entity.hass:
-                        await entity.async_update_ha_state(True)
-                return
+        self._polling.add(entity)
+        self._due_polls.append(entity)
+        if len(self._due_polls) == 1:
+            self.hass.async_create_task(
+                self._update_entity_states(),
+                f"EntityPlatform poll {self.domain}.{self.platform_name}",
+            )
 
-            if tasks := [
-                entity.async_update_ha_state(True)
-                for entity in self.entities.values()
-                if entity.should_poll
-            ]:
-                await asyncio.gather(*tasks)
+    async def _update_entity_states(self) -> None:
+        """Update the states of the polling entities which are due.
+
+        To protect from flooding the executor, we will update async entities
+        in parallel and other entities sequential. Entities with a sync update
+        also share a limited number of executor jobs with all platforms.
+
+        This method must be run in the event loop.
+        """
+        entities = self._due_polls
+        self._due_polls = []
+        start = self.hass.loop.time()
+        try:
+            await self._async_poll_entities(entities)
+        finally:
+            self._polling.difference_update(entities)
+            self.poll_statistics.record(self.hass.loop.time() - start)
+
+    async def _async_poll_entities(self, entities: list[Entity]) -> None:
+        """Poll the entities which are not backed off."""
+        if self._update_in_sequence or len(entities) <= 1:
+            # If we know we will update sequentially, we want to avoid scheduling
+            # the coroutines as tasks that will wait on the semaphore lock.
+            for entity in entities:
+                # If the entity is removed from hass during the previous
+                # entity being updated, we need to skip updating the
+                # entity.
+                if entity.should_poll and entity.hass:
+                    await self._async_poll_entity(entity)
+            return
+
+        if tasks := [
+            self._async_poll_entity(entity)
+            for entity in entities
+            if entity.should_poll and entity.hass
+        ]:
+            await asyncio.gather(*tasks)
+
+    async def _async_poll_entity(self, entity: Entity) -> None:
+        """Poll an entity, backing off when its update is slower than the interval."""
+        skip, backoff = self._poll_backoff.get(entity, (0, 0))
+        if skip:
+            self._poll_backoff[entity] = (skip - 1, backoff)
+            self.poll_statistics.skipped_polls += 1
+            return
+
+        try:
+            if hasattr(entity, "update"):
+                # Only the executor job holds a slot, not waiting for PARALLEL_UPDATES
+                scheduler = _async_get_polling_scheduler(self.hass)
+                token = executor_update_limit.set(scheduler.executor_polls)
+                try:
+                    await entity.async_update_ha_state(True)
+                finally:
+                    executor_update_limit.reset(token)
+            else:
+                await entity.async_update_ha_state(True)
+        finally:
+            # The entity can be polled again, even if others of its batch are not done
+            self._polling.discard(entity)
+
+        duration = entity.update_duration
+        if duration is None or duration <= self.scan_interval.total_seconds():
+            if backoff:
+                self._poll_backoff.pop(entity, None)
+            return
+        if self.entities.get(entity.entity_id) is not entity:
+            return
+        backoff = min(backoff * 2 or 1, MAX_POLL_BACKOFF)
+        self._poll_backoff[entity] = (backoff, backoff)
+        self.logger.debug(
+            "Updating %s took longer than the scan interval %s, skipping %s polls",
+            entity.entity_id,
+            self.scan_interval,
+            backoff,
+        )
 
 
 current_platform: ContextVar[EntityPlatform | None] = ContextVar(
@@ -909,3 +1210,23 @@ def async_get_platforms(
     platforms: list[EntityPlatform] = hass.data[DATA_ENTITY_PLATFORM][integration_name]
 
     return platforms
+
+
+@callback
+def async_get_poll_statistics(hass: HomeAssistant) -> dict[str, PollStatistics]:
+    """Return the polling statistics of the platforms with polling entities.
+
+    Platforms are keyed by domain and platform name, followed by the
+    config entry id for platforms set up from a config entry.
+    """
+    statistics: dict[str, PollStatistics] = {}
+    for platforms in hass.data.get(DATA_ENTITY_PLATFORM, {}).values():
+        for platform in platforms:
+            poll_statistics = platform.poll_statistics
+            if not poll_statistics.polls and not poll_statistics.overruns:
+                continue
+            key = f"{platform.domain}.{platform.platform_name}"
+            if platform.config_entry:
+                key = f"{key} {platform.config_entry.entry_id}"
+            statistics[key] = poll_statistics
+    return statistics
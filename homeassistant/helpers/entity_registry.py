@@ -433,9 +433,12 @@ class EntityRegistryStore(storage.Store[dict[str, list[dict[str, Any]]]]):
 class EntityRegistryItems(UserDict[str, "RegistryEntry"]):
     """Container for entity registry items, maps entity_id -> entry.
 
-    Maintains two additional indexes:
+    Maintains additional indexes:
     - id -> entry
     - (domain, platform, unique_id) -> entity_id
+    - device_id -> entity_ids
+    - area_id -> entity_ids
+    - config_entry_id -> entity_ids
     """
 
     def __init__(self) -> None:
@@ -443,6 +446,9 @@ class EntityRegistryItems(UserDict[str, "RegistryEntry"]):
         super().__init__()
         self._entry_ids: dict[str, RegistryEntry] = {}
         self._index: dict[tuple[str, str, str], str] = {}
+        self._device_id_index: dict[str, dict[str, Literal[True]]] = {}
+        self._area_id_index: dict[str, dict[str, Literal[True]]] = {}
+        self._config_entry_id_index: dict[str, dict[str, Literal[True]]] = {}
 
     def values(self) -> ValuesView[RegistryEntry]:
         """Return the underlying values to avoid __iter__ overhead."""
@@ -450,21 +456,48 @@ class EntityRegistryItems(UserDict[str, "RegistryEntry"]):
 
     def __setitem__(self, key: str, entry: RegistryEntry) -> None:
         """Add an item."""
-        if key in self:
-            old_entry = self[key]
+        old_entry = self.data.get(key)
+        if old_entry is not None:
             del self._entry_ids[old_entry.id]
             del self._index[(old_entry.domain, old_entry.platform, old_entry.unique_id)]
         super().__setitem__(key, entry)
         self._entry_ids[entry.id] = entry
         self._index[(entry.domain, entry.platform, entry.unique_id)] = entry.entity_id
+        self._update_secondary_indexes(key, old_entry, entry)
 
     def __delitem__(self, key: str) -> None:
         """Remove an item."""
         entry = self[key]
         del self._entry_ids[entry.id]
         del self._index[(entry.domain, entry.platform, entry.unique_id)]
+        self._update_secondary_indexes(key, entry, None)
         super().__delitem__(key)
 
+    def _update_secondary_indexes(
+        self, key: str, old_entry: RegistryEntry | None, entry: RegistryEntry | None
+    ) -> None:
+        """Update the device, area and config entry indexes.
+
+        An entry is only moved when the indexed value changes, so each index
+        keeps the order of the underlying dict.
+        """
+        for index, attribute in (
+            (self._device_id_index, "device_id"),
+            (self._area_id_index, "area_id"),
+            (self._config_entry_id_index, "config_entry_id"),
+        ):
+            old_value = getattr(old_entry, attribute, None)
+            new_value = getattr(entry, attribute, None)
+            if old_value == new_value:
+                continue
+            if old_value is not None:
+                keys = index[old_value]
+                del keys[key]
+                if not keys:
+                    del index[old_value]
+            if new_value is not None:
+                index.setdefault(new_value, {})[key] = True
+
     def get_entity_id(self, key: tuple[str, str, str]) -> str | None:
         """Get entity_id from (domain, platform, unique_id)."""
         return self._index.get(key)
@@ -473,6 +506,32 @@ class EntityRegistryItems(UserDict[str, "RegistryEntry"]):
         """Get entry from id."""
         return self._entry_ids.get(key)
 
+    def get_entries_for_device_id(
+        self, device_id: str, include_disabled_entities: bool = False
+    ) -> list[RegistryEntry]:
+        """Get entries for device."""
+        data = self.data
+        return [
+            entry
+            for entity_id in self._device_id_index.get(device_id, ())
+            if not (entry := data[entity_id]).disabled_by or include_disabled_entities
+        ]
+
+    def get_entries_for_area_id(self, area_id: str) -> list[RegistryEntry]:
+        """Get entries for area."""
+        data = self.data
+        return [data[entity_id] for entity_id in self._area_id_index.get(area_id, ())]
+
+    def get_entries_for_config_entry_id(
+        self, config_entry_id: str
+    ) -> list[RegistryEntry]:
+        """Get entries for config entry."""
+        data = self.data
+        return [
+            data[entity_id]
+            for entity_id in self._config_entry_id_index.get(config_entry_id, ())
+        ]
+
 
 class EntityRegistry:
     """Class to hold a registry of entities."""
@@ -1101,51 +1160,59 @@ class EntityRegistry:
         self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
 
     @callback
-    def _data_to_save(self) -> dict[str, Any]:
-        """Return data of entity registry to store in a file."""
-        data: dict[str, Any] = {}
-
-        data["entities"] = [
-            {
-                "aliases": list(entry.aliases),
-                "area_id": entry.area_id,
-                "capabilities": entry.capabilities,
-                "config_entry_id": entry.config_entry_id,
-                "device_class": entry.device_class,
-                "device_id": entry.device_id,
-                "disabled_by": entry.disabled_by,
-                "entity_category": entry.entity_category,
-                "entity_id": entry.entity_id,
-                "hidden_by": entry.hidden_by,
-                "icon": entry.icon,
-                "id": entry.id,
-                "has_entity_name": entry.has_entity_name,
-                "name": entry.name,
-                "options": entry.options,
-                "original_device_class": entry.original_device_class,
-                "original_icon": entry.original_icon,
-                "original_name": entry.original_name,
-                "platform": entry.platform,
-                "supported_features": entry.supported_features,
-                "translation_key": entry.translation_key,
-                "unique_id": entry.unique_id,
-                "unit_of_measurement": entry.unit_of_measurement,
-            }
-            for entry in self.entities.values()
-        ]
-        data["deleted_entities"] = [
-            {
-                "config_entry_id": entry.config_entry_id,
-                "entity_id": entry.entity_id,
-                "id": entry.id,
-                "orphaned_timestamp": entry.orphaned_timestamp,
-                "platform": entry.platform,
-                "unique_id": entry.unique_id,
-            }
-            for entry in self.deleted_entities.values()
-        ]
-
-        return data
+    def _data_to_save(self) -> storage.StoreSnapshot[dict[str, Any]]:
+        """Return a snapshot of the entity registry to store in a file."""
+        # The entries are frozen and replaced when they change
+        entities = list(self.entities.values())
+        deleted_entities = list(self.deleted_entities.values())
+
+        def _build() -> dict[str, Any]:
+            """Return data of entity registry to store in a file."""
+            data: dict[str, Any] = {}
+
+            data["entities"] = [
+                {
+                    "aliases": list(entry.aliases),
+                    "area_id": entry.area_id,
+                    "capabilities": entry.capabilities,
+                    "config_entry_id": entry.config_entry_id,
+                    "device_class": entry.device_class,
+                    "device_id": entry.device_id,
+                    "disabled_by": entry.disabled_by,
+                    "entity_category": entry.entity_category,
+                    "entity_id": entry.entity_id,
+                    "hidden_by": entry.hidden_by,
+                    "icon": entry.icon,
+                    "id": entry.id,
+                    "has_entity_name": entry.has_entity_name,
+                    "name": entry.name,
+                    "options": entry.options,
+                    "original_device_class": entry.original_device_class,
+                    "original_icon": entry.original_icon,
+                    "original_name": entry.original_name,
+                    "platform": entry.platform,
+                    "supported_features": entry.supported_features,
+                    "translation_key": entry.translation_key,
+                    "unique_id": entry.unique_id,
+                    "unit_of_measurement": entry.unit_of_measurement,
+                }
+                for entry in entities
+            ]
+            data["deleted_entities"] = [
+                {
+                    "config_entry_id": entry.config_entry_id,
+                    "entity_id": entry.entity_id,
+                    "id": entry.id,
+                    "orphaned_timestamp": entry.orphaned_timestamp,
+                    "platform": entry.platform,
+                    "unique_id": entry.unique_id,
+                }
+                for entry in deleted_entities
+            ]
+
+            return data
+
+        return storage.StoreSnapshot(_build)
 
     @callback
     def async_clear_config_entry(self, config_entry_id: str) -> None:
@@ -1208,12 +1275,9 @@ def async_entries_for_device(
     registry: EntityRegistry, device_id: str, include_disabled_entities: bool = False
 ) -> list[RegistryEntry]:
     """Return entries that match a device."""
-    return [
-        entry
-        for entry in registry.entities.values()
-        if entry.device_id == device_id
-        and (not entry.disabled_by or include_disabled_entities)
-    ]
+    return registry.entities.get_entries_for_device_id(
+        device_id, include_disabled_entities
+    )
 
 
 @callback
@@ -1221,7 +1285,7 @@ def async_entries_for_area(
     registry: EntityRegistry, area_id: str
 ) -> list[RegistryEntry]:
     """Return entries that match an area."""
-    return [entry for entry in registry.entities.values() if entry.area_id == area_id]
+    return registry.entities.get_entries_for_area_id(area_id)
 
 
 @callback
@@ -1229,11 +1293,7 @@ def async_entries_for_config_entry(
     registry: EntityRegistry, config_entry_id: str
 ) -> list[RegistryEntry]:
     """Return entries that match a config entry."""
-    return [
-        entry
-        for entry in registry.entities.values()
-        if entry.config_entry_id == config_entry_id
-    ]
+    return registry.entities.get_entries_for_config_entry_id(config_entry_id)
 
 
 @callback
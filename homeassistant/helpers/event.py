@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable, Coroutine, Iterable, Mapping, Sequence
+from collections.abc import Callable, Collection, Coroutine, Iterable, Mapping, Sequence
 import copy
 from dataclasses import dataclass
 from datetime import datetime, timedelta
@@ -33,6 +33,7 @@ from homeassistant.exceptions import TemplateError
 from homeassistant.loader import bind_hass
 from homeassistant.util import dt as dt_util
 from homeassistant.util.async_ import run_callback_threadsafe
+from homeassistant.util.timer_wheel import TimerWheelHandle
 
 from .device_registry import (
     EVENT_DEVICE_REGISTRY_UPDATED,
@@ -56,6 +57,8 @@ TRACK_STATE_ADDED_DOMAIN_LISTENER = "track_state_added_domain_listener"
 TRACK_STATE_REMOVED_DOMAIN_CALLBACKS = "track_state_removed_domain_callbacks"
 TRACK_STATE_REMOVED_DOMAIN_LISTENER = "track_state_removed_domain_listener"
 
+TRACK_STATE_CHANGE_FILTERED_DISPATCHER = "track_state_change_filtered_dispatcher"
+
 TRACK_ENTITY_REGISTRY_UPDATED_CALLBACKS = "track_entity_registry_updated_callbacks"
 TRACK_ENTITY_REGISTRY_UPDATED_LISTENER = "track_entity_registry_updated_listener"
 
@@ -630,6 +633,171 @@ def _async_string_to_lower_list(instr: str | Iterable[str]) -> list[str]:
     return [mstr.lower() for mstr in instr]
 
 
+class _TrackStateChangeFilteredDispatcher:
+    """Route state changes to filtered trackers from a single listener.
+
+    Trackers are indexed by the entity_ids and domains they track, trackers
+    for all states are kept apart, so a state change only reaches the
+    trackers it is relevant for and each of them at most once.
+
+    The trackers interested in a state change are taken when it is fired
+    and called in the next iteration. Trackers with a coalesced action get
+    all state changes of an iteration in one call.
+    """
+
+    __slots__ = ("hass", "_entities", "_domains", "_all", "_unsub", "_coalesced")
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the dispatcher."""
+        self.hass = hass
+        self._entities: dict[str, dict[_TrackStateChangeFiltered, None]] = {}
+        self._domains: dict[str, dict[_TrackStateChangeFiltered, None]] = {}
+        self._all: dict[_TrackStateChangeFiltered, None] = {}
+        self._unsub: CALLBACK_TYPE | None = None
+        self._coalesced: dict[
+            _TrackStateChangeFiltered, list[EventType[EventStateChangedData]]
+        ] = {}
+
+    @callback
+    def async_update(
+        self,
+        tracker: _TrackStateChangeFiltered,
+        old_track_states: TrackStates | None,
+        new_track_states: TrackStates | None,
+    ) -> None:
+        """Move a tracker from the old to the new TrackStates in the indexes."""
+        old_all, old_domains, old_entities = _track_states_keys(old_track_states)
+        new_all, new_domains, new_entities = _track_states_keys(new_track_states)
+        if old_all and not new_all:
+            del self._all[tracker]
+        elif new_all and not old_all:
+            self._all[tracker] = None
+        _update_tracker_index(self._domains, tracker, old_domains, new_domains)
+        _update_tracker_index(self._entities, tracker, old_entities, new_entities)
+
+        if self._all or self._domains or self._entities:
+            if self._unsub is None:
+                self._unsub = self.hass.bus.async_listen(
+                    EVENT_STATE_CHANGED,
+                    self._async_queue,  # type: ignore[arg-type]
+                    event_filter=self._async_filter,  # type: ignore[arg-type]
+                    run_immediately=True,
+                )
+        elif self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+
+    @callback
+    def _async_filter(self, event: EventType[EventStateChangedData]) -> bool:
+        """Filter out state changes no tracker is interested in."""
+        entity_id = event.data["entity_id"]
+        return bool(
+            self._all
+            or entity_id in self._entities
+            or split_entity_id(entity_id)[0] in self._domains
+        )
+
+    @callback
+    def _async_queue(self, event: EventType[EventStateChangedData]) -> None:
+        """Queue a state change for the trackers interested in it when fired."""
+        entity_id = event.data["entity_id"]
+        trackers = self._all.copy()
+        if domain_trackers := self._domains.get(split_entity_id(entity_id)[0]):
+            trackers.update(domain_trackers)
+        if entity_trackers := self._entities.get(entity_id):
+            trackers.update(entity_trackers)
+        plain_trackers: list[_TrackStateChangeFiltered] = []
+        coalesced = self._coalesced
+        for tracker in trackers:
+            if not tracker.coalesced:
+                plain_trackers.append(tracker)
+                continue
+            if not coalesced:
+                self.hass.loop.call_soon(self._async_dispatch_coalesced)
+            coalesced.setdefault(tracker, []).append(event)
+        if plain_trackers:
+            self.hass.loop.call_soon(self._async_dispatch, event, plain_trackers)
+
+    @callback
+    def _async_dispatch(
+        self,
+        event: EventType[EventStateChangedData],
+        trackers: list[_TrackStateChangeFiltered],
+    ) -> None:
+        """Dispatch a state change to the trackers interested in it."""
+        for tracker in trackers:
+            if not tracker.active:
+                continue
+            try:
+                tracker.async_run_action(event)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception(
+                    "Error while dispatching event for %s to %s",
+                    event.data["entity_id"],
+                    tracker,
+                )
+
+    @callback
+    def _async_dispatch_coalesced(self) -> None:
+        """Dispatch the state changes of an iteration to the coalesced trackers."""
+        coalesced = self._coalesced
+        self._coalesced = {}
+        for tracker, events in coalesced.items():
+            # A tracker may be removed by the action of another tracker
+            if not tracker.active:
+                continue
+            try:
+                tracker.async_run_coalesced_action(events)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception(
+                    "Error while dispatching %s events to %s", len(events), tracker
+                )
+
+
+def _track_states_keys(
+    track_states: TrackStates | None,
+) -> tuple[bool, Collection[str], Collection[str]]:
+    """Return what a TrackStates is indexed by."""
+    if track_states is None:
+        return False, (), ()
+    if track_states.all_states:
+        return True, (), ()
+    return False, track_states.domains or (), track_states.entities or ()
+
+
+def _update_tracker_index(
+    index: dict[str, dict[_TrackStateChangeFiltered, None]],
+    tracker: _TrackStateChangeFiltered,
+    old_keys: Collection[str],
+    new_keys: Collection[str],
+) -> None:
+    """Move a tracker from the old keys to the new keys of an index."""
+    for key in old_keys:
+        if key in new_keys:
+            continue
+        trackers = index[key]
+        del trackers[tracker]
+        if not trackers:
+            del index[key]
+    for key in new_keys:
+        if key not in old_keys:
+            index.setdefault(key, {})[tracker] = None
+
+
+@callback
+def _async_get_track_state_change_filtered_dispatcher(
+    hass: HomeAssistant,
+) -> _TrackStateChangeFilteredDispatcher:
+    """Return the dispatcher shared by all filtered state change trackers."""
+    dispatcher: _TrackStateChangeFilteredDispatcher | None = hass.data.get(
+        TRACK_STATE_CHANGE_FILTERED_DISPATCHER
+    )
+    if dispatcher is None:
+        dispatcher = _TrackStateChangeFilteredDispatcher(hass)
+        hass.data[TRACK_STATE_CHANGE_FILTERED_DISPATCHER] = dispatcher
+    return dispatcher
+
+
 class _TrackStateChangeFiltered:
     """Handle removal / refresh of tracker."""
 
@@ -638,34 +806,39 @@ class _TrackStateChangeFiltered:
         hass: HomeAssistant,
         track_states: TrackStates,
         action: Callable[[EventType[EventStateChangedData]], Any],
+        coalesced_action: Callable[[list[EventType[EventStateChangedData]]], None]
+        | None = None,
     ) -> None:
-        """Handle removal / refresh of tracker init."""
+        """Handle removal / refresh of tracker init.
+
+        The coalesced_action, if given, is called instead of the action with
+        all the state changes of an event loop iteration.
+        """
         self.hass = hass
         self._action = action
         self._action_as_hassjob = HassJob(
             action, f"track state change filtered {track_states}"
         )
-        self._listeners: dict[str, Callable[[], None]] = {}
+        self._coalesced_action = coalesced_action
+        self.coalesced = coalesced_action is not None
         self._last_track_states: TrackStates = track_states
+        self._dispatcher = _async_get_track_state_change_filtered_dispatcher(hass)
+        self._active = False
+
+    def __repr__(self) -> str:
+        """Return the representation."""
+        return f"<_TrackStateChangeFiltered {self._action_as_hassjob}>"
 
     @callback
     def async_setup(self) -> None:
         """Create listeners to track states."""
-        track_states = self._last_track_states
-
-        if (
-            not track_states.all_states
-            and not track_states.domains
-            and not track_states.entities
-        ):
-            return
-
-        if track_states.all_states:
-            self._setup_all_listener()
-            return
+        self._active = True
+        self._dispatcher.async_update(self, None, self._last_track_states)
 
-        self._setup_domains_listener(track_states.domains)
-        self._setup_entities_listener(track_states.domains, track_states.entities)
+    @property
+    def active(self) -> bool:
+        """Return if the tracker is set up and not removed."""
+        return self._active
 
     @property
     def listeners(self) -> dict[str, bool | set[str]]:
@@ -682,86 +855,29 @@ class _TrackStateChangeFiltered:
         """Update the listeners based on the new TrackStates."""
         last_track_states = self._last_track_states
         self._last_track_states = new_track_states
-
-        had_all_listener = last_track_states.all_states
-
-        if new_track_states.all_states:
-            if had_all_listener:
-                return
-            self._cancel_listener(_DOMAINS_LISTENER)
-            self._cancel_listener(_ENTITIES_LISTENER)
-            self._setup_all_listener()
-            return
-
-        if had_all_listener:
-            self._cancel_listener(_ALL_LISTENER)
-
-        domains_changed = new_track_states.domains != last_track_states.domains
-
-        if had_all_listener or domains_changed:
-            domains_changed = True
-            self._cancel_listener(_DOMAINS_LISTENER)
-            self._setup_domains_listener(new_track_states.domains)
-
-        if (
-            had_all_listener
-            or domains_changed
-            or new_track_states.entities != last_track_states.entities
-        ):
-            self._cancel_listener(_ENTITIES_LISTENER)
-            self._setup_entities_listener(
-                new_track_states.domains, new_track_states.entities
-            )
+        if self._active:
+            self._dispatcher.async_update(self, last_track_states, new_track_states)
 
     @callback
     def async_remove(self) -> None:
         """Cancel the listeners."""
-        for key in list(self._listeners):
-            self._listeners.pop(key)()
-
-    @callback
-    def _cancel_listener(self, listener_name: str) -> None:
-        if listener_name not in self._listeners:
+        if not self._active:
             return
-
-        self._listeners.pop(listener_name)()
+        self._active = False
+        self._dispatcher.async_update(self, self._last_track_states, None)
 
     @callback
-    def _setup_entities_listener(self, domains: set[str], entities: set[str]) -> None:
-        if domains:
-            entities = entities.copy()
-            entities.update(self.hass.states.async_entity_ids(domains))
-
-        # Entities has changed to none
-        if not entities:
-            return
-
-        self._listeners[_ENTITIES_LISTENER] = _async_track_state_change_event(
-            self.hass, entities, self._action
-        )
-
-    @callback
-    def _state_added(self, event: EventType[EventStateChangedData]) -> None:
-        self._cancel_listener(_ENTITIES_LISTENER)
-        self._setup_entities_listener(
-            self._last_track_states.domains, self._last_track_states.entities
-        )
+    def async_run_action(self, event: EventType[EventStateChangedData]) -> None:
+        """Run the action for a state change that matched the tracked states."""
         self.hass.async_run_hass_job(self._action_as_hassjob, event)
 
     @callback
-    def _setup_domains_listener(self, domains: set[str]) -> None:
-        if not domains:
-            return
-
-        self._listeners[_DOMAINS_LISTENER] = _async_track_state_added_domain(
-            self.hass, domains, self._state_added
-        )
-
-    @callback
-    def _setup_all_listener(self) -> None:
-        self._listeners[_ALL_LISTENER] = self.hass.bus.async_listen(
-            EVENT_STATE_CHANGED, self._action  # type: ignore[arg-type]
-        )
+    def async_run_coalesced_action(
+        self, events: list[EventType[EventStateChangedData]]
+    ) -> None:
+        """Run the coalesced action for the state changes of an iteration."""
+        assert self._coalesced_action is not None
+        self._coalesced_action(events)
 
 
 @callback
@@ -958,9 +1074,13 @@ class TrackTemplateResultInfo:
                     exc_info=info.exception,
                 )
 
-        self._track_state_changes = async_track_state_change_filtered(
-            self.hass, _render_infos_to_track_states(self._info.values()), self._refresh
+        self._track_state_changes = _TrackStateChangeFiltered(
+            self.hass,
+            _render_infos_to_track_states(self._info.values()),
+            self._refresh,
+            self._refresh_coalesced,
         )
+        self._track_state_changes.async_setup()
         self._update_time_listeners()
         _LOGGER.debug(
             (
@@ -1025,12 +1145,23 @@ class TrackTemplateResultInfo:
         """Force recalculate the template."""
         self._refresh(None)
 
+    @callback
+    def _refresh_coalesced(
+        self, events: list[EventType[EventStateChangedData]]
+    ) -> None:
+        """Refresh the templates once for the state changes of an iteration."""
+        if len(events) == 1:
+            self._refresh(events[0])
+        else:
+            self._refresh(events[-1], events=events)
+
     def _render_template_if_ready(
         self,
         track_template_: TrackTemplate,
         now: datetime,
         event: EventType[EventStateChangedData] | None,
-    ) -> bool | TrackTemplateResult:
+        events: Sequence[EventType[EventStateChangedData]] | None = None,
+    ) -> tuple[bool | TrackTemplateResult, EventType[EventStateChangedData] | None]:
         """Re-render the template if conditions match.
 
         Returns False if the template was not re-rendered.
@@ -1040,14 +1171,23 @@ class TrackTemplateResultInfo:
 
         Returns TrackTemplateResult if the template re-render
         generates a new result.
+
+        The event the template was considered for is returned with
+        the result, for coalesced events it is the one that triggers
+        the re-render.
         """
         template = track_template_.template
 
         if event:
             info = self._info[template]
 
-            if not _event_triggers_rerender(event, info):
-                return False
+            if events is not None:
+                if (
+                    event := _event_triggering_rerender(events, info, track_template_)
+                ) is None:
+                    return False, None
+            elif not _event_triggers_rerender(event, info):
+                return False, event
 
             had_timer = self._rate_limit.async_has_timer(template)
 
@@ -1060,7 +1200,7 @@ class TrackTemplateResultInfo:
                 (track_template_,),
                 True,
             ):
-                return not had_timer
+                return not had_timer, event
 
             _LOGGER.debug(
                 "Template update %s triggered by event: %s",
@@ -1082,12 +1222,12 @@ class TrackTemplateResultInfo:
 
         # Check to see if the result has changed or is new
         if result == last_result and template in self._last_result:
-            return True
+            return True, event
 
         if isinstance(result, TemplateError) and isinstance(last_result, TemplateError):
-            return True
+            return True, event
 
-        return TrackTemplateResult(template, last_result, result)
+        return TrackTemplateResult(template, last_result, result), event
 
     @staticmethod
     def _super_template_as_boolean(result: bool | str | TemplateError) -> bool:
@@ -1103,12 +1243,18 @@ class TrackTemplateResultInfo:
         event: EventType[EventStateChangedData] | None,
         track_templates: Iterable[TrackTemplate] | None = None,
         replayed: bool | None = False,
+        events: Sequence[EventType[EventStateChangedData]] | None = None,
     ) -> None:
         """Refresh the template.
 
         The event is the state_changed event that caused the refresh
         to be considered.
 
+        events are the state_changed events of an event loop iteration
+        when they are coalesced, each template is then considered once
+        for the event that triggers it and the results are passed on
+        with that event.
+
         track_templates is an optional list of TrackTemplate objects
         to refresh.  If not provided, all tracked templates will be
         considered.
@@ -1136,13 +1282,18 @@ class TrackTemplateResultInfo:
 
         block_updates = False
         super_template = self._track_templates[0] if self._has_super_template else None
+        update_events: list[EventType[EventStateChangedData] | None] = []
 
         track_templates = track_templates or self._track_templates
 
         # Update the super template first
         if super_template is not None:
-            update = self._render_template_if_ready(super_template, now, event)
+            update, update_event = self._render_template_if_ready(
+                super_template, now, event, events
+            )
             info_changed |= _apply_update(update, super_template.template)
+            if isinstance(update, TrackTemplateResult):
+                update_events.append(update_event)
 
             if isinstance(update, TrackTemplateResult):
                 super_result = update.result
@@ -1172,8 +1323,12 @@ class TrackTemplateResultInfo:
                 if track_template_ == super_template:
                     continue
 
-                update = self._render_template_if_ready(track_template_, now, event)
+                update, update_event = self._render_template_if_ready(
+                    track_template_, now, event, events
+                )
                 info_changed |= _apply_update(update, track_template_.template)
+                if isinstance(update, TrackTemplateResult):
+                    update_events.append(update_event)
 
         if info_changed:
             assert self._track_state_changes
@@ -1203,7 +1358,19 @@ class TrackTemplateResultInfo:
         for track_result in updates:
             self._last_result[track_result.template] = track_result.result
 
-        self.hass.async_run_hass_job(self._job, event, updates)
+        if events is None or event is None:
+            self.hass.async_run_hass_job(self._job, event, updates)
+            return
+
+        # Coalesced updates are passed on with the event that triggered them,
+        # in the order the events were fired
+        for coalesced_event in events:
+            if event_updates := [
+                update
+                for update, update_event in zip(updates, update_events)
+                if update_event is coalesced_event
+            ]:
+                self.hass.async_run_hass_job(self._job, coalesced_event, event_updates)
 
 
 TrackTemplateResultListener = Callable[
@@ -1379,6 +1546,16 @@ def async_track_point_in_time(
 track_point_in_time = threaded_listener_factory(async_track_point_in_time)
 
 
+@callback
+def _async_get_call_at(
+    hass: HomeAssistant, coarse: bool
+) -> Callable[..., asyncio.TimerHandle | TimerWheelHandle]:
+    """Return the call_at of the timer wheel for coarse timers, else of the loop."""
+    if coarse:
+        return hass.timer_wheel.call_at
+    return hass.loop.call_at
+
+
 @callback
 @bind_hass
 def async_track_point_in_utc_time(
@@ -1386,16 +1563,23 @@ def async_track_point_in_utc_time(
     action: HassJob[[datetime], Coroutine[Any, Any, None] | None]
     | Callable[[datetime], Coroutine[Any, Any, None] | None],
     point_in_time: datetime,
+    *,
+    coarse: bool = False,
 ) -> CALLBACK_TYPE:
-    """Add a listener that fires once after a specific point in UTC time."""
+    """Add a listener that fires once after a specific point in UTC time.
+
+    Coarse listeners are scheduled in the timer wheel of hass, they fire up
+    to a second late but are cheap to add and cancel in large numbers.
+    """
     # Ensure point_in_time is UTC
     utc_point_in_time = dt_util.as_utc(point_in_time)
     expected_fire_timestamp = dt_util.utc_to_timestamp(utc_point_in_time)
 
     # Since this is called once, we accept a HassJob so we can avoid
     # having to figure out how to call the action every time its called.
-    cancel_callback: asyncio.TimerHandle | None = None
+    cancel_callback: asyncio.TimerHandle | TimerWheelHandle | None = None
     loop = hass.loop
+    call_at = _async_get_call_at(hass, coarse)
 
     @callback
     def run_action(job: HassJob[[datetime], Coroutine[Any, Any, None] | None]) -> None:
@@ -1409,7 +1593,7 @@ def async_track_point_in_utc_time(
         if (delta := (expected_fire_timestamp - time_tracker_timestamp())) > 0:
             _LOGGER.debug("Called %f seconds too early, rearming", delta)
 
-            cancel_callback = loop.call_at(loop.time() + delta, run_action, job)
+            cancel_callback = call_at(loop.time() + delta, run_action, job)
             return
 
         hass.async_run_hass_job(job, utc_point_in_time)
@@ -1420,7 +1604,7 @@ def async_track_point_in_utc_time(
         else HassJob(action, f"track point in utc time {utc_point_in_time}")
     )
     delta = expected_fire_timestamp - time.time()
-    cancel_callback = loop.call_at(loop.time() + delta, run_action, job)
+    cancel_callback = call_at(loop.time() + delta, run_action, job)
 
     @callback
     def unsub_point_in_time_listener() -> None:
@@ -1441,8 +1625,13 @@ def async_call_later(
     delay: float | timedelta,
     action: HassJob[[datetime], Coroutine[Any, Any, None] | None]
     | Callable[[datetime], Coroutine[Any, Any, None] | None],
+    *,
+    coarse: bool = False,
 ) -> CALLBACK_TYPE:
-    """Add a listener that is called in <delay>."""
+    """Add a listener that is called in <delay>.
+
+    Coarse listeners are scheduled in the timer wheel of hass.
+    """
     if isinstance(delay, timedelta):
         delay = delay.total_seconds()
 
@@ -1456,7 +1645,8 @@ def async_call_later(
         if isinstance(action, HassJob)
         else HassJob(action, f"call_later {delay}")
     )
-    cancel_callback = hass.loop.call_at(hass.loop.time() + delay, run_action, job)
+    call_at = _async_get_call_at(hass, coarse)
+    cancel_callback = call_at(hass.loop.time() + delay, run_action, job)
 
     @callback
     def unsub_call_later_listener() -> None:
@@ -1479,8 +1669,12 @@ def async_track_time_interval(
     *,
     name: str | None = None,
     cancel_on_shutdown: bool | None = None,
+    coarse: bool = False,
 ) -> CALLBACK_TYPE:
-    """Add a listener that fires repetitively at every timedelta interval."""
+    """Add a listener that fires repetitively at every timedelta interval.
+
+    Coarse listeners are scheduled in the timer wheel of hass.
+    """
     remove: CALLBACK_TYPE
     interval_listener_job: HassJob[[datetime], None]
 
@@ -1499,7 +1693,7 @@ def async_track_time_interval(
         nonlocal interval_listener_job
 
         remove = async_track_point_in_utc_time(
-            hass, interval_listener_job, next_interval()
+            hass, interval_listener_job, next_interval(), coarse=coarse
         )
         hass.async_run_hass_job(job, now)
 
@@ -1511,7 +1705,9 @@ def async_track_time_interval(
     interval_listener_job = HassJob(
         interval_listener, job_name, cancel_on_shutdown=cancel_on_shutdown
     )
-    remove = async_track_point_in_utc_time(hass, interval_listener_job, next_interval())
+    remove = async_track_point_in_utc_time(
+        hass, interval_listener_job, next_interval(), coarse=coarse
+    )
 
     def remove_listener() -> None:
         """Remove interval listener."""
@@ -1798,6 +1994,27 @@ def _rate_limit_for_event(
     return rate_limit
 
 
+def _event_triggering_rerender(
+    events: Sequence[EventType[EventStateChangedData]],
+    info: RenderInfo,
+    track_template_: TrackTemplate,
+) -> EventType[EventStateChangedData] | None:
+    """Return the event of coalesced state changes that re-renders a template.
+
+    The last event that is not rate limited is preferred, otherwise the last
+    event that triggers a re-render is returned.
+    """
+    rate_limited_event: EventType[EventStateChangedData] | None = None
+    for event in reversed(events):
+        if not _event_triggers_rerender(event, info):
+            continue
+        if _rate_limit_for_event(event, info, track_template_) is None:
+            return event
+        if rate_limited_event is None:
+            rate_limited_event = event
+    return rate_limited_event
+
+
 def _suppress_domain_all_in_render_info(render_info: RenderInfo) -> RenderInfo:
     """Remove the domains and all_states from render info during a ratelimit."""
     rate_limited_render_info = copy.copy(render_info)
@@ -160,6 +160,20 @@ def save_json(
     atomic_writes: bool = False,
 ) -> None:
     """Save JSON data to a file."""
+    json_data = json_dumps_for_file(filename, data, encoder=encoder)
+    if atomic_writes:
+        write_utf8_file_atomic(filename, json_data, private)
+    else:
+        write_utf8_file(filename, json_data, private)
+
+
+def json_dumps_for_file(
+    filename: str,
+    data: list | dict,
+    *,
+    encoder: type[json.JSONEncoder] | None = None,
+) -> str:
+    """Serialize JSON data to be saved to a file."""
     dump: Callable[[Any], Any]
     try:
         # For backwards compatibility, if they pass in the
@@ -169,10 +183,9 @@ def save_json(
             # If they pass a custom encoder that is not the
             # default JSONEncoder, we use the slow path of json.dumps
             dump = json.dumps
-            json_data = json.dumps(data, indent=2, cls=encoder)
-        else:
-            dump = _orjson_default_encoder
-            json_data = _orjson_default_encoder(data)
+            return json.dumps(data, indent=2, cls=encoder)
+        dump = _orjson_default_encoder
+        return _orjson_default_encoder(data)
     except TypeError as error:
         formatted_data = format_unserializable_data(
             find_paths_unserializable_data(data, dump=dump)
@@ -181,11 +194,6 @@ def save_json(
         _LOGGER.error(msg)
         raise SerializationError(msg) from error
 
-    if atomic_writes:
-        write_utf8_file_atomic(filename, json_data, private)
-    else:
-        write_utf8_file(filename, json_data, private)
-
 
 def find_paths_unserializable_data(
     bad_data: Any, *, dump: Callable[[Any], str] = json.dumps
@@ -0,0 +1,45 @@
+"""Reverse index of the ids referenced by entities."""
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from typing import Generic, TypeVar
+
+from homeassistant.core import callback
+
+from .entity import Entity
+
+_EntityT = TypeVar("_EntityT", bound=Entity)
+
+
+class ReferenceIndex(Generic[_EntityT]):
+    """Map referenced ids to the entity ids of the entities referencing them.
+
+    The index of a kind of reference is built on its first lookup, and is
+    dropped when it is invalidated because entities were added or removed.
+    Lookups between reloads do not scan all the entities.
+    """
+
+    def __init__(
+        self,
+        get_entities: Callable[[], Iterable[_EntityT]],
+        get_references: Callable[[_EntityT, str], Iterable[str]],
+    ) -> None:
+        """Initialize the index."""
+        self._get_entities = get_entities
+        self._get_references = get_references
+        self._indexes: dict[str, dict[str, list[str]]] = {}
+
+    @callback
+    def async_invalidate(self) -> None:
+        """Drop the index after entities were added or removed."""
+        self._indexes.clear()
+
+    @callback
+    def async_referencing(self, kind: str, referenced_id: str) -> list[str]:
+        """Return the entity ids of the entities referencing an id."""
+        if (index := self._indexes.get(kind)) is None:
+            index = self._indexes[kind] = {}
+            for entity in self._get_entities():
+                for reference in self._get_references(entity, kind):
+                    index.setdefault(reference, []).append(entity.entity_id)
+        return list(index.get(referenced_id, ()))
@@ -16,18 +16,23 @@ from .entity import Entity
 from .event import async_track_time_interval
 from .frame import report
 from .json import JSONEncoder
-from .storage import Store
+from .storage import Store, StoreSnapshot
 
 DATA_RESTORE_STATE = "restore_state"
 
 _LOGGER = logging.getLogger(__name__)
 
 STORAGE_KEY = "core.restore_state"
+STORAGE_JOURNAL_KEY = "core.restore_state_journal"
 STORAGE_VERSION = 1
 
 # How long between periodically saving the current states to disk
 STATE_DUMP_INTERVAL = timedelta(minutes=15)
 
+# How long between compacting the journal into the saved states
+# when saving incrementally
+STATE_COMPACT_INTERVAL = timedelta(hours=4)
+
 # How long should a saved state be preserved if the entity no longer exists
 STATE_EXPIRATION = timedelta(days=7)
 
@@ -93,9 +98,9 @@ class StoredState:
         )
 
 
-async def async_load(hass: HomeAssistant) -> None:
+async def async_load(hass: HomeAssistant, *, incremental: bool = False) -> None:
     """Load the restore state task."""
-    restore_state = RestoreStateData(hass)
+    restore_state = RestoreStateData(hass, incremental=incremental)
     await restore_state.async_setup()
     hass.data[DATA_RESTORE_STATE] = restore_state
 
@@ -107,7 +112,13 @@ def async_get(hass: HomeAssistant) -> RestoreStateData:
 
 
 class RestoreStateData:
-    """Helper class for managing the helper saved data."""
+    """Helper class for managing the helper saved data.
+
+    When saving incrementally, the periodic dumps only write the states
+    which restore entities wrote since the last dump to a new journal
+    segment. The segments are compacted into the saved states periodically,
+    when hass stops and when saving the persistent states.
+    """
 
     @classmethod
     async def async_save_persistent_states(cls, hass: HomeAssistant) -> None:
@@ -129,14 +140,29 @@ class RestoreStateData:
         )
         return async_get(hass)
 
-    def __init__(self, hass: HomeAssistant) -> None:
+    def __init__(self, hass: HomeAssistant, incremental: bool = False) -> None:
         """Initialize the restore state data class."""
         self.hass: HomeAssistant = hass
+        self.incremental = incremental
         self.store = Store[list[dict[str, Any]]](
             hass, STORAGE_VERSION, STORAGE_KEY, encoder=JSONEncoder
         )
         self.last_states: dict[str, StoredState] = {}
         self.entities: dict[str, RestoreEntity] = {}
+        # Entities which wrote their state since the last dump
+        self._dirty_entity_ids: set[str] = set()
+        # Number of journal segments written since the last compaction
+        self._journal_segments = 0
+        self._last_compaction = dt_util.utcnow()
+
+    def _journal_store(self, segment: int) -> Store[list[dict[str, Any]]]:
+        """Return the store of a journal segment."""
+        return Store[list[dict[str, Any]]](
+            self.hass,
+            STORAGE_VERSION,
+            f"{STORAGE_JOURNAL_KEY}.{segment}",
+            encoder=JSONEncoder,
+        )
 
     async def async_setup(self) -> None:
         """Set up up the instance of this data helper."""
@@ -167,6 +193,32 @@ class RestoreStateData:
             }
             _LOGGER.debug("Created cache with %s", list(self.last_states))
 
+        # Apply the journal segments in the order they were written
+        while True:
+            try:
+                journal = await self._journal_store(self._journal_segments).async_load()
+            except HomeAssistantError as exc:
+                _LOGGER.error("Error loading last states journal", exc_info=exc)
+                journal = None
+            if journal is None:
+                return
+            self._journal_segments += 1
+            for item in journal:
+                if not valid_entity_id(entity_id := item["state"]["entity_id"]):
+                    continue
+                stored_state = StoredState.from_dict(item)
+                # The journal is outdated if the compaction was interrupted
+                # before the journal was removed
+                if (
+                    last_state := self.last_states.get(entity_id)
+                ) is None or last_state.last_seen <= stored_state.last_seen:
+                    self.last_states[entity_id] = stored_state
+            _LOGGER.debug(
+                "Applied journal segment %s with %s",
+                self._journal_segments,
+                [item["state"]["entity_id"] for item in journal],
+            )
+
     @callback
     def async_get_stored_states(self) -> list[StoredState]:
         """Get the set of states which should be stored.
@@ -211,18 +263,70 @@ class RestoreStateData:
 
         return stored_states
 
+    @callback
+    def _async_get_stored_state(
+        self, entity_id: str, now: datetime
+    ) -> StoredState | None:
+        """Get the state of an entity which should be stored."""
+        if (
+            (entity := self.entities.get(entity_id))
+            and (state := self.hass.states.get(entity_id))
+            and not state.attributes.get(ATTR_RESTORED)
+        ):
+            return StoredState(state, entity.extra_restore_state_data, now)
+        return self.last_states.get(entity_id)
+
     async def async_dump_states(self) -> None:
         """Save the current state machine to storage."""
         _LOGGER.debug("Dumping states")
+        dirty_entity_ids = self._dirty_entity_ids
+        self._dirty_entity_ids = set()
+        self._last_compaction = dt_util.utcnow()
+        stored_states = _async_snapshot(self.async_get_stored_states())
         try:
-            await self.store.async_save(
-                [
-                    stored_state.as_dict()
-                    for stored_state in self.async_get_stored_states()
-                ]
-            )
+            await self.store.async_save(stored_states)
         except HomeAssistantError as exc:
             _LOGGER.error("Error saving current states", exc_info=exc)
+            self._dirty_entity_ids |= dirty_entity_ids
+            return
+
+        journal_segments = self._journal_segments
+        self._journal_segments = 0
+        for segment in range(journal_segments):
+            await self._journal_store(segment).async_remove()
+
+    async def async_dump_journal(self) -> None:
+        """Save the states which changed since the last dump to the journal.
+
+        Each dump writes a new journal segment which only holds the changed
+        states. Compacts the journal into the saved states instead once the
+        compaction interval has passed.
+        """
+        now = dt_util.utcnow()
+        if now - self._last_compaction >= STATE_COMPACT_INTERVAL:
+            await self.async_dump_states()
+            return
+
+        if not self._dirty_entity_ids:
+            return
+
+        _LOGGER.debug("Dumping %s changed states", len(self._dirty_entity_ids))
+        dirty_entity_ids = self._dirty_entity_ids
+        self._dirty_entity_ids = set()
+        journal = _async_snapshot(
+            [
+                stored_state
+                for entity_id in dirty_entity_ids
+                if (stored_state := self._async_get_stored_state(entity_id, now))
+            ]
+        )
+        try:
+            await self._journal_store(self._journal_segments).async_save(journal)
+        except HomeAssistantError as exc:
+            _LOGGER.error("Error saving changed states", exc_info=exc)
+            self._dirty_entity_ids |= dirty_entity_ids
+            return
+        self._journal_segments += 1
 
     @callback
     def async_setup_dump(self, *args: Any) -> None:
@@ -231,6 +335,9 @@ class RestoreStateData:
         async def _async_dump_states(*_: Any) -> None:
             await self.async_dump_states()
 
+        async def _async_dump_journal(*_: Any) -> None:
+            await self.async_dump_journal()
+
         # Dump the initial states now. This helps minimize the risk of having
         # old states loaded by overwriting the last states once Home Assistant
         # has started and the old states have been read.
@@ -239,7 +346,7 @@ class RestoreStateData:
         # Dump states periodically
         cancel_interval = async_track_time_interval(
             self.hass,
-            _async_dump_states,
+            _async_dump_journal if self.incremental else _async_dump_states,
             STATE_DUMP_INTERVAL,
             name="RestoreStateData dump states",
         )
@@ -258,6 +365,11 @@ class RestoreStateData:
         """Store this entity's state when hass is shutdown."""
         self.entities[entity.entity_id] = entity
 
+    @callback
+    def async_restore_entity_written(self, entity_id: str) -> None:
+        """Mark the state and extra data of an entity as changed."""
+        self._dirty_entity_ids.add(entity_id)
+
     @callback
     def async_restore_entity_removed(
         self, entity_id: str, extra_data: ExtraStoredData | None
@@ -275,10 +387,27 @@ class RestoreStateData:
             self.last_states[entity_id] = StoredState(
                 state, extra_data, dt_util.utcnow()
             )
+            self._dirty_entity_ids.add(entity_id)
 
         self.entities.pop(entity_id)
 
 
+@callback
+def _async_snapshot(
+    stored_states: list[StoredState],
+) -> StoreSnapshot[list[dict[str, Any]]]:
+    """Return a snapshot of stored states, built into dicts in the executor.
+
+    The states are immutable and the extra data is either taken for this dump
+    or loaded from storage, neither is changed once taken.
+    """
+
+    def _build() -> list[dict[str, Any]]:
+        return [stored_state.as_dict() for stored_state in stored_states]
+
+    return StoreSnapshot(_build)
+
+
 def _encode(value: Any) -> Any:
     """Little helper to JSON encode a value."""
     try:
@@ -320,6 +449,13 @@ class RestoreEntity(Entity):
         )
         await super().async_internal_will_remove_from_hass()
 
+    @callback
+    def _async_write_ha_state(self) -> None:
+        """Write the state and mark it to be saved by the next dump."""
+        super()._async_write_ha_state()
+        # The extra data usually changes along with the state
+        async_get(self.hass).async_restore_entity_written(self.entity_id)
+
     @callback
     def _async_get_restored_data(self) -> StoredState | None:
         """Get data stored for an entity, if any."""
@@ -5,6 +5,8 @@ import asyncio
 from collections.abc import Callable, Mapping, Sequence
 from contextlib import suppress
 from copy import deepcopy
+from dataclasses import dataclass
+from functools import partial
 import inspect
 from json import JSONDecodeError, JSONEncoder
 import logging
@@ -24,7 +26,12 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.loader import MAX_LOAD_CONCURRENTLY, bind_hass
 from homeassistant.util import json as json_util
 import homeassistant.util.dt as dt_util
-from homeassistant.util.file import WriteError
+from homeassistant.util.file import (
+    WriteError,
+    write_utf8_file,
+    write_utf8_file_atomic,
+    write_utf8_files_atomic,
+)
 
 from . import json as json_helper
 
@@ -35,6 +42,7 @@ STORAGE_DIR = ".storage"
 _LOGGER = logging.getLogger(__name__)
 
 STORAGE_SEMAPHORE = "storage_semaphore"
+STORAGE_WRITER = "storage_writer"
 
 _T = TypeVar("_T", bound=Mapping[str, Any] | Sequence[Any])
 
@@ -79,6 +87,215 @@ async def async_migrator(
     return config
 
 
+class StoreSnapshot(Generic[_T]):
+    """Data of a store taken cheaply on the event loop and built when written.
+
+    The build function runs in the executor. It must only read the objects it
+    was given, and the event loop must replace them rather than change them.
+    """
+
+    __slots__ = ("_build",)
+
+    def __init__(self, build: Callable[[], _T]) -> None:
+        """Initialize the snapshot."""
+        self._build = build
+
+    def build(self) -> _T:
+        """Build the data of the store."""
+        return self._build()
+
+
+def _build_data(data: dict[str, Any]) -> dict[str, Any]:
+    """Return the data to write with its snapshot built."""
+    if isinstance(snapshot := data["data"], StoreSnapshot):
+        return {**data, "data": snapshot.build()}
+    return data
+
+
+@dataclass(slots=True)
+class WriteStatistics:
+    """Statistics of the writes of a store."""
+
+    writes: int = 0
+    bytes_written: int = 0
+    last_latency: float = 0
+    max_latency: float = 0
+    total_latency: float = 0
+
+    @property
+    def mean_latency(self) -> float:
+        """Return the mean time from requesting a write until it completed."""
+        return self.total_latency / self.writes if self.writes else 0
+
+
+@dataclass(slots=True)
+class _QueuedWrite:
+    """Data of a store waiting to be written."""
+
+    key: str
+    path: str
+    data: dict[str, Any]
+    private: bool
+    encoder: type[JSONEncoder] | None
+    atomic_writes: bool
+    future: asyncio.Future[None]
+
+
+class _StoreWriter:
+    """Write the data of all stores queued in the same loop iteration at once.
+
+    The data is serialized and written in a single executor job and the
+    stores with atomic writes share the sync of their directory.
+    """
+
+    __slots__ = ("hass", "statistics", "_queue")
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the store writer."""
+        self.hass = hass
+        self.statistics: dict[str, WriteStatistics] = {}
+        self._queue: list[_QueuedWrite] = []
+
+    async def async_write(self, store: Store, path: str, data: dict[str, Any]) -> None:
+        """Queue the data of a store and wait until it is written."""
+        future: asyncio.Future[None] = self.hass.loop.create_future()
+        if not self._queue:
+            self.hass.loop.call_soon(self._async_write_queue)
+        self._queue.append(
+            _QueuedWrite(
+                store.key,
+                path,
+                data,
+                store._private,  # pylint: disable=protected-access
+                store._encoder,  # pylint: disable=protected-access
+                store._atomic_writes,  # pylint: disable=protected-access
+                future,
+            )
+        )
+        await future
+
+    @callback
+    def _async_write_queue(self) -> None:
+        """Write the queued data in the executor."""
+        queue = self._queue
+        self._queue = []
+        self.hass.async_add_executor_job(_write_queue, queue).add_done_callback(
+            partial(self._async_queue_written, queue, self.hass.loop.time())
+        )
+
+    @callback
+    def _async_queue_written(
+        self,
+        queue: list[_QueuedWrite],
+        start: float,
+        job: asyncio.Future[list[tuple[int, BaseException | None]]],
+    ) -> None:
+        """Record the statistics and wake up the stores waiting for a write."""
+        latency = self.hass.loop.time() - start
+        if job.cancelled():
+            for write in queue:
+                write.future.cancel()
+            return
+        if (job_exception := job.exception()) is not None:
+            # Raised as a WriteError so each store handles it as a failed write
+            results: list[tuple[int, BaseException | None]] = [
+                (0, WriteError(job_exception))
+            ] * len(queue)
+        else:
+            results = job.result()
+        for write, (bytes_written, exception) in zip(queue, results):
+            if (statistics := self.statistics.get(write.key)) is None:
+                statistics = self.statistics[write.key] = WriteStatistics()
+            if exception is None:
+                statistics.writes += 1
+                statistics.bytes_written += bytes_written
+                statistics.last_latency = latency
+                statistics.total_latency += latency
+                statistics.max_latency = max(statistics.max_latency, latency)
+            if write.future.done():
+                continue
+            if exception is None:
+                write.future.set_result(None)
+            else:
+                write.future.set_exception(exception)
+
+
+def _write_queue(queue: list[_QueuedWrite]) -> list[tuple[int, Exception | None]]:
+    """Write the queued data, returning the bytes written or the error per store.
+
+    Only the last write to a path is written, the earlier writes to the
+    same path share its result.
+    """
+    last_writes = {write.path: index for index, write in enumerate(queue)}
+    results: dict[int, tuple[int, Exception | None]] = {}
+    atomic_files: dict[str, tuple[int, str, bool]] = {}
+    for path, index in last_writes.items():
+        write = queue[index]
+        _LOGGER.debug("Writing data for %s to %s", write.key, path)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            data = json_helper.json_dumps_for_file(
+                path, _build_data(write.data), encoder=write.encoder
+            )
+            if not write.atomic_writes:
+                write_utf8_file(path, data, write.private)
+            else:
+                atomic_files[path] = (index, data, write.private)
+                continue
+        except (json_util.SerializationError, WriteError) as err:
+            results[index] = (0, err)
+        except OSError as err:
+            _LOGGER.exception("Creating the directory failed: %s", path)
+            results[index] = (0, WriteError(err))
+        except Exception as err:  # pylint: disable=broad-except
+            # A snapshot failing to build only fails its own store
+            _LOGGER.exception("Unexpected error preparing the data of %s", write.key)
+            results[index] = (0, json_util.SerializationError(err))
+        else:
+            results[index] = (len(data.encode("utf-8")), None)
+
+    errors: Mapping[str, Exception] = {}
+    if len(atomic_files) == 1:
+        path, (_, data, private) = next(iter(atomic_files.items()))
+        try:
+            write_utf8_file_atomic(path, data, private)
+        except WriteError as err:
+            errors = {path: err}
+    elif atomic_files:
+        try:
+            errors = write_utf8_files_atomic(
+                [
+                    (path, data, private)
+                    for path, (_, data, private) in atomic_files.items()
+                ]
+            )
+        except Exception as err:  # pylint: disable=broad-except
+            _LOGGER.exception("Unexpected error writing %s", list(atomic_files))
+            errors = dict.fromkeys(atomic_files, WriteError(err))
+    for path, (index, data, _) in atomic_files.items():
+        if (error := errors.get(path)) is not None:
+            results[index] = (0, error)
+        else:
+            results[index] = (len(data.encode("utf-8")), None)
+
+    return [results[last_writes[write.path]] for write in queue]
+
+
+@callback
+def _async_get_store_writer(hass: HomeAssistant) -> _StoreWriter:
+    """Return the store writer."""
+    writer: _StoreWriter | None = hass.data.get(STORAGE_WRITER)
+    if writer is None:
+        writer = hass.data[STORAGE_WRITER] = _StoreWriter(hass)
+    return writer
+
+
+@callback
+def async_get_write_statistics(hass: HomeAssistant) -> dict[str, WriteStatistics]:
+    """Return the write statistics by storage key."""
+    return _async_get_store_writer(hass).statistics
+
+
 @bind_hass
 class Store(Generic[_T]):
     """Class to help storing data."""
@@ -152,6 +369,7 @@ class Store(Generic[_T]):
             # If we didn't generate data yet, do it now.
             if "data_func" in data:
                 data["data"] = data.pop("data_func")()
+            data = _build_data(data)
 
             # We make a copy because code might assume it's safe to mutate loaded data
             # and we don't want that to mess with what we're trying to store.
@@ -251,8 +469,11 @@ class Store(Generic[_T]):
 
         return stored
 
-    async def async_save(self, data: _T) -> None:
-        """Save data."""
+    async def async_save(self, data: _T | StoreSnapshot[_T]) -> None:
+        """Save data.
+
+        A snapshot is built in the executor when the data is written.
+        """
         self._data = {
             "version": self.version,
             "minor_version": self.minor_version,
@@ -269,10 +490,14 @@ class Store(Generic[_T]):
     @callback
     def async_delay_save(
         self,
-        data_func: Callable[[], _T],
+        data_func: Callable[[], _T | StoreSnapshot[_T]],
         delay: float = 0,
     ) -> None:
-        """Save data with an optional delay."""
+        """Save data with an optional delay.
+
+        The data_func runs on the event loop when the data is written, large
+        stores can return a snapshot which is built in the executor.
+        """
         # pylint: disable-next=import-outside-toplevel
         from .event import async_call_later
 
@@ -341,6 +566,8 @@ class Store(Generic[_T]):
             data = self._data
 
             if "data_func" in data:
+                # The data_func reads objects owned by the loop, a snapshot
+                # it returns is built in the executor with the serialization
                 data["data"] = data.pop("data_func")()
 
             self._data = None
@@ -354,20 +581,7 @@ class Store(Generic[_T]):
                 _LOGGER.error("Error writing config for %s: %s", self.key, err)
 
     async def _async_write_data(self, path: str, data: dict) -> None:
-        await self.hass.async_add_executor_job(self._write_data, self.path, data)
-
-    def _write_data(self, path: str, data: dict) -> None:
-        """Write the data."""
-        os.makedirs(os.path.dirname(path), exist_ok=True)
-
-        _LOGGER.debug("Writing data for %s to %s", self.key, path)
-        json_helper.save_json(
-            path,
-            data,
-            self._private,
-            encoder=self._encoder,
-            atomic_writes=self._atomic_writes,
-        )
+        await _async_get_store_writer(self.hass).async_write(self, path, data)
 
     async def _async_migrate_func(self, old_major_version, old_minor_version, old_data):
         """Migrate to the new version."""
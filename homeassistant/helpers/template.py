@@ -5,15 +5,23 @@ from ast import literal_eval
 import asyncio
 import base64
 import collections.abc
-from collections.abc import Callable, Collection, Generator, Iterable, MutableMapping
+from collections.abc import (
+    Callable,
+    Collection,
+    Generator,
+    Hashable,
+    Iterable,
+    MutableMapping,
+)
 from contextlib import contextmanager, suppress
 from contextvars import ContextVar
+from copy import deepcopy
 from datetime import datetime, timedelta
 from functools import cache, lru_cache, partial, wraps
 import json
 import logging
 import math
-from operator import contains
+from operator import contains, is_
 import pathlib
 import random
 import re
@@ -37,6 +45,7 @@ import weakref
 from awesomeversion import AwesomeVersion
 import jinja2
 from jinja2 import pass_context, pass_environment, pass_eval_context
+from jinja2.meta import find_undeclared_variables
 from jinja2.runtime import AsyncLoopContext, LoopContext
 from jinja2.sandbox import ImmutableSandboxedEnvironment
 from jinja2.utils import Namespace
@@ -50,6 +59,7 @@ from homeassistant.const import (
     ATTR_LONGITUDE,
     ATTR_PERSONS,
     ATTR_UNIT_OF_MEASUREMENT,
+    EVENT_CORE_CONFIG_UPDATE,
     EVENT_HOMEASSISTANT_START,
     EVENT_HOMEASSISTANT_STOP,
     STATE_UNAVAILABLE,
@@ -92,6 +102,7 @@ _ENVIRONMENT = "template.environment"
 _ENVIRONMENT_LIMITED = "template.environment_limited"
 _ENVIRONMENT_STRICT = "template.environment_strict"
 _HASS_LOADER = "template.hass_loader"
+_RENDER_CACHE = "template.render_cache"
 
 _RE_JINJA_DELIMITERS = re.compile(r"\{%|\{\{|\{#")
 # Match "simple" ints and floats. -1.0, 1, +5, 5.0
@@ -144,6 +155,7 @@ template_cv: ContextVar[tuple[str, str] | None] = ContextVar(
 #
 CACHED_TEMPLATE_STATES = 512
 EVAL_CACHE_SIZE = 512
+RENDER_CACHE_SIZE = 1024
 
 MAX_CUSTOM_TEMPLATE_SIZE = 5 * 1024 * 1024
 
@@ -342,6 +354,7 @@ class RenderInfo:
         "entities",
         "rate_limit",
         "has_time",
+        "is_cacheable",
     )
 
     def __init__(self, template: Template) -> None:
@@ -360,6 +373,8 @@ class RenderInfo:
         self.entities: collections.abc.Set[str] = set()
         self.rate_limit: timedelta | None = None
         self.has_time = False
+        # Cleared when the result is not determined by the tracked states
+        self.is_cacheable = True
 
     def __repr__(self) -> str:
         """Representation of RenderInfo."""
@@ -416,6 +431,23 @@ class RenderInfo:
         self.domains = frozenset(self.domains)
         self.domains_lifecycle = frozenset(self.domains_lifecycle)
 
+    def _copy_for(self, template: Template) -> RenderInfo:
+        """Return a frozen copy of a cached render for another template."""
+        # pylint: disable=protected-access
+        render_info = RenderInfo(template)
+        render_info._result = _copy_render_result(self._result)
+        render_info.entities = self.entities
+        render_info.domains = self.domains
+        render_info.domains_lifecycle = self.domains_lifecycle
+        render_info.rate_limit = self.rate_limit
+        render_info.exception = self.exception
+        render_info.all_states = self.all_states
+        render_info.all_states_lifecycle = self.all_states_lifecycle
+        render_info.has_time = self.has_time
+        render_info.is_cacheable = self.is_cacheable
+        render_info._freeze()
+        return render_info
+
     def _freeze(self) -> None:
         self._freeze_sets()
 
@@ -445,6 +477,145 @@ class RenderInfo:
             self.filter = _false
 
 
+class RenderCache:
+    """Cache of template renders shared by all templates with the same source.
+
+    A render is reused while every state it depended on is still the same
+    State object, so identical templates render once per change of their
+    dependencies. Renders which depend on all states, on time, on randomness
+    or on the registries, and renders which failed, are not cached. Core
+    configuration updates clear the cache, since filters such as as_local
+    depend on it.
+    """
+
+    __slots__ = ("_hass", "_entries", "hits", "misses")
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the cache."""
+        self._hass = hass
+        self._entries: MutableMapping[
+            Hashable,
+            tuple[
+                RenderInfo,
+                tuple[State | None, ...],
+                tuple[str, ...],
+                tuple[list[State], ...],
+            ],
+        ] = LRU(RENDER_CACHE_SIZE)
+        self.hits = 0
+        self.misses = 0
+
+    @callback
+    def async_get(self, key: Hashable) -> RenderInfo | None:
+        """Return a cached render if its dependencies did not change."""
+        if (entry := self._entries.get(key)) is None:
+            self.misses += 1
+            return None
+        render_info, entity_states, domains, domain_states = entry
+        states = self._hass.states
+        if any(
+            states.get(entity_id) is not state
+            for entity_id, state in zip(render_info.entities, entity_states)
+        ) or any(
+            not _same_states(states.async_all(domain), current)
+            for domain, current in zip(domains, domain_states)
+        ):
+            del self._entries[key]
+            self.misses += 1
+            return None
+        self.hits += 1
+        return render_info
+
+    @callback
+    def async_set(self, key: Hashable, render_info: RenderInfo) -> None:
+        """Cache a copy of a frozen render, unless it can not be reused."""
+        if (
+            render_info.exception is not None
+            or render_info.all_states
+            or render_info.all_states_lifecycle
+            or render_info.has_time
+            or not render_info.is_cacheable
+        ):
+            return
+        states = self._hass.states
+        domains = tuple(render_info.domains | render_info.domains_lifecycle)
+        self._entries[key] = (
+            # Cache a copy so the caller can not mutate the shared result
+            render_info._copy_for(  # pylint: disable=protected-access
+                render_info.template
+            ),
+            tuple(states.get(entity_id) for entity_id in render_info.entities),
+            domains,
+            tuple(states.async_all(domain) for domain in domains),
+        )
+
+    @callback
+    def async_clear(self, _: Any = None) -> None:
+        """Drop all cached renders."""
+        self._entries.clear()
+
+
+def _copy_render_result(result: Any) -> Any:
+    """Return a copy of a render result which may be mutated by the caller."""
+    if isinstance(result, (list, dict, set)):
+        return deepcopy(result)
+    return result
+
+
+def _same_states(states: list[State], other: list[State]) -> bool:
+    """Return if two lists hold the same State objects."""
+    return len(states) == len(other) and all(map(is_, states, other))
+
+
+def _set_not_cacheable() -> None:
+    """Keep the current render out of the render cache.
+
+    Used by functions whose result is not determined by the states they
+    collect, such as the ones reading the registries.
+    """
+    if (render_info := _render_info.get()) is not None:
+        render_info.is_cacheable = False
+
+
+@singleton(_RENDER_CACHE)
+@callback
+def _async_get_render_cache(hass: HomeAssistant) -> RenderCache:
+    """Return the render cache, cleared on core configuration updates."""
+    render_cache = RenderCache(hass)
+    hass.bus.async_listen(
+        EVENT_CORE_CONFIG_UPDATE, render_cache.async_clear, run_immediately=True
+    )
+    return render_cache
+
+
+@callback
+def async_get_render_cache_stats(hass: HomeAssistant) -> dict[str, int]:
+    """Return the hits and misses of the template render cache."""
+    render_cache = _async_get_render_cache(hass)
+    return {"hits": render_cache.hits, "misses": render_cache.misses}
+
+
+@lru_cache(maxsize=EVAL_CACHE_SIZE)
+def _template_variable_names(source: str) -> tuple[str, ...] | None:
+    """Return the variables a template refers to, None if it can not be cached.
+
+    Included templates and templates imported with the context can refer to
+    any variable, so the variables of the template do not determine the render.
+    """
+    try:
+        ast = _NO_HASS_ENV.parse(source)
+        names = find_undeclared_variables(ast)
+    except jinja2.TemplateError:
+        return None
+    if (
+        any(True for _ in ast.find_all(jinja2.nodes.Include))
+        or any(node.with_context for node in ast.find_all(jinja2.nodes.Import))
+        or any(node.with_context for node in ast.find_all(jinja2.nodes.FromImport))
+    ):
+        return None
+    return tuple(sorted(names))
+
+
 class Template:
     """Class to hold a template and manage caching and rendering."""
 
@@ -678,6 +849,14 @@ class Template:
             render_info._freeze_static()
             return render_info
 
+        render_cache = _async_get_render_cache(self.hass)
+        cache_key = self._render_cache_key(self.hass, variables, strict, kwargs)
+        if (
+            cache_key is not None
+            and (cached := render_cache.async_get(cache_key)) is not None
+        ):
+            return cached._copy_for(self)
+
         token = _render_info.set(render_info)
         try:
             render_info._result = self.async_render(variables, strict=strict, **kwargs)
@@ -687,8 +866,50 @@ class Template:
             _render_info.reset(token)
 
         render_info._freeze()
+        if cache_key is not None:
+            render_cache.async_set(cache_key, render_info)
         return render_info
 
+    def _render_cache_key(
+        self,
+        hass: HomeAssistant,
+        variables: TemplateVarsType,
+        strict: bool,
+        kwargs: dict[str, Any],
+    ) -> Hashable | None:
+        """Return the render cache key, None if the render can not be cached.
+
+        Only the variables the template refers to are part of the key, so
+        templates which are passed a variable they do not use can share renders.
+        The render options are always part of the key, since they change the
+        environment the template is rendered with and the type of the result.
+        """
+        if (names := _template_variable_names(self.template)) is None:
+            return None
+        kwargs = dict(kwargs)
+        parse_result = kwargs.pop("parse_result", True)
+        limited = kwargs.pop("limited", False)
+        if variables is not None:
+            kwargs.update(variables)
+        key = (
+            self.template,
+            strict,
+            parse_result,
+            limited,
+            # Imported custom templates may have been reloaded
+            _get_hass_loader(hass)._reload,  # pylint: disable=protected-access
+            tuple(
+                (name, type(value), value)
+                for name in names
+                if (value := kwargs.get(name, _SENTINEL)) is not _SENTINEL
+            ),
+        )
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
     def render_with_possible_json_value(self, value, error_value=_SENTINEL):
         """Render template with value exposed.
 
@@ -1016,6 +1237,8 @@ class TemplateStateBase(State):
 
         self._collect_state()
         if rounded and self._state.domain == SENSOR_DOMAIN:
+            # The display precision is read from the entity registry
+            _set_not_cacheable()
             state = async_rounded_state(self._hass, self._entity_id, self._state)
         else:
             state = self._state.state
@@ -1167,11 +1390,20 @@ def result_as_boolean(template_result: Any | None) -> bool:
     return forgiving_boolean(template_result, default=False)
 
 
-def expand(hass: HomeAssistant, *args: Any) -> Iterable[State]:
-    """Expand out any groups and zones into entity states."""
+def _get_entity_source(hass: HomeAssistant, entity_id: str) -> dict[str, str] | None:
+    """Return the entity source of an entity, keeping the render out of the cache.
+
+    The render cache key does not cover the entity sources.
+    """
     # circular import.
     from . import entity as entity_helper  # pylint: disable=import-outside-toplevel
 
+    _set_not_cacheable()
+    return entity_helper.entity_sources(hass).get(entity_id)
+
+
+def expand(hass: HomeAssistant, *args: Any) -> Iterable[State]:
+    """Expand out any groups and zones into entity states."""
     search = list(args)
     found = {}
     while search:
@@ -1190,7 +1422,7 @@ def expand(hass: HomeAssistant, *args: Any) -> Iterable[State]:
             continue
 
         if entity_id.startswith(_GROUP_DOMAIN_PREFIX) or (
-            (source := entity_helper.entity_sources(hass).get(entity_id))
+            (source := _get_entity_source(hass, entity_id))
             and source["domain"] == "group"
         ):
             # Collect state will be called in here since it's wrapped
@@ -1208,6 +1440,7 @@ def expand(hass: HomeAssistant, *args: Any) -> Iterable[State]:
 
 def device_entities(hass: HomeAssistant, _device_id: str) -> Iterable[str]:
     """Get entity ids for entities tied to a device."""
+    _set_not_cacheable()
     entity_reg = entity_registry.async_get(hass)
     entries = entity_registry.async_entries_for_device(entity_reg, _device_id)
     return [entry.entity_id for entry in entries]
@@ -1220,6 +1453,7 @@ def integration_entities(hass: HomeAssistant, entry_name: str) -> Iterable[str]:
     or provide a config entry title for filtering between instances of the same
     integration.
     """
+    _set_not_cacheable()
     # first try if this is a config entry match
     conf_entry = next(
         (
@@ -1247,6 +1481,7 @@ def integration_entities(hass: HomeAssistant, entry_name: str) -> Iterable[str]:
 
 def config_entry_id(hass: HomeAssistant, entity_id: str) -> str | None:
     """Get an config entry ID from an entity ID."""
+    _set_not_cacheable()
     entity_reg = entity_registry.async_get(hass)
     if entity := entity_reg.async_get(entity_id):
         return entity.config_entry_id
@@ -1255,6 +1490,7 @@ def config_entry_id(hass: HomeAssistant, entity_id: str) -> str | None:
 
 def device_id(hass: HomeAssistant, entity_id_or_device_name: str) -> str | None:
     """Get a device ID from an entity ID or device name."""
+    _set_not_cacheable()
     entity_reg = entity_registry.async_get(hass)
     entity = entity_reg.async_get(entity_id_or_device_name)
     if entity is not None:
@@ -1274,6 +1510,7 @@ def device_id(hass: HomeAssistant, entity_id_or_device_name: str) -> str | None:
 
 def device_attr(hass: HomeAssistant, device_or_entity_id: str, attr_name: str) -> Any:
     """Get the device specific attribute."""
+    _set_not_cacheable()
     device_reg = device_registry.async_get(hass)
     if not isinstance(device_or_entity_id, str):
         raise TemplateError("Must provide a device or entity ID")
@@ -1299,12 +1536,14 @@ def is_device_attr(
 
 def areas(hass: HomeAssistant) -> Iterable[str | None]:
     """Return all areas."""
+    _set_not_cacheable()
     area_reg = area_registry.async_get(hass)
     return [area.id for area in area_reg.async_list_areas()]
 
 
 def area_id(hass: HomeAssistant, lookup_value: str) -> str | None:
     """Get the area ID from an area name, device id, or entity id."""
+    _set_not_cacheable()
     area_reg = area_registry.async_get(hass)
     if area := area_reg.async_get_area_by_name(str(lookup_value)):
         return area.id
@@ -1343,6 +1582,7 @@ def _get_area_name(area_reg: area_registry.AreaRegistry, valid_area_id: str) ->
 
 def area_name(hass: HomeAssistant, lookup_value: str) -> str | None:
     """Get the area name from an area id, device id, or entity id."""
+    _set_not_cacheable()
     area_reg = area_registry.async_get(hass)
     if area := area_reg.async_get_area(lookup_value):
         return area.name
@@ -1378,6 +1618,7 @@ def area_name(hass: HomeAssistant, lookup_value: str) -> str | None:
 
 def area_entities(hass: HomeAssistant, area_id_or_name: str) -> Iterable[str]:
     """Return entities for a given area ID or name."""
+    _set_not_cacheable()
     _area_id: str | None
     # if area_name returns a value, we know the input was an ID, otherwise we
     # assume it's a name, and if it's neither, we return early
@@ -1408,6 +1649,7 @@ def area_entities(hass: HomeAssistant, area_id_or_name: str) -> Iterable[str]:
 
 def area_devices(hass: HomeAssistant, area_id_or_name: str) -> Iterable[str]:
     """Return device IDs for a given area ID or name."""
+    _set_not_cacheable()
     _area_id: str | None
     # if area_name returns a value, we know the input was an ID, otherwise we
     # assume it's a name, and if it's neither, we return early
@@ -1551,6 +1793,7 @@ def distance(hass, *args):
 
 def is_hidden_entity(hass: HomeAssistant, entity_id: str) -> bool:
     """Test if an entity is hidden."""
+    _set_not_cacheable()
     entity_reg = entity_registry.async_get(hass)
     entry = entity_reg.async_get(entity_id)
     return entry is not None and entry.hidden
@@ -2089,6 +2332,7 @@ def random_every_time(context, values):
     Unlike Jinja's random filter,
     this is context-dependent to avoid caching the chosen value.
     """
+    _set_not_cacheable()
     return random.choice(values)
 
 
@@ -8,6 +8,7 @@ from collections.abc import Callable
 from contextlib import suppress
 import json
 import logging
+from time import process_time
 from timeit import default_timer as timer
 from typing import TypeVar
 
@@ -15,11 +16,15 @@ from homeassistant import core
 from homeassistant.const import EVENT_STATE_CHANGED
 from homeassistant.helpers.entityfilter import convert_include_exclude_filter
 from homeassistant.helpers.event import (
+    async_call_later,
     async_track_state_change,
     async_track_state_change_event,
 )
 from homeassistant.helpers.json import JSON_DUMP, JSONEncoder
 
+from . import recorder
+from .recorder import RECORDER_BENCHMARKS
+
 # mypy: allow-untyped-calls, allow-untyped-defs, no-check-untyped-defs
 # mypy: no-warn-return-any
 
@@ -34,11 +39,16 @@ def run(args):
     logging.getLogger("homeassistant.core").setLevel(logging.CRITICAL)
 
     parser = argparse.ArgumentParser(description="Run a Home Assistant benchmark.")
-    parser.add_argument("name", choices=BENCHMARKS)
+    parser.add_argument("name", choices=[*BENCHMARKS, *RECORDER_BENCHMARKS])
     parser.add_argument("--script", choices=["benchmark"])
+    recorder.add_arguments(parser)
 
     args = parser.parse_args()
 
+    if args.name in RECORDER_BENCHMARKS:
+        recorder.run(args)
+        return
+
     bench = BENCHMARKS[args.name]
     print("Using event loop:", asyncio.get_event_loop_policy().loop_name)
 
@@ -314,6 +324,40 @@ async def json_serialize_states(hass):
     return timer() - start
 
 
+def _populate_state_machine(hass):
+    """Fill the state machine with 6000 entities spread over 30 domains."""
+    for idx in range(6000):
+        hass.states.async_set(f"domain{idx % 30}.entity_{idx}", "on")
+
+
+@benchmark
+async def state_machine_domain_filter(hass):
+    """Run 10k domain filtered state lookups with 6000 entities."""
+    _populate_state_machine(hass)
+    states = hass.states
+
+    start = timer()
+    for idx in range(10**4):
+        states.async_all(f"domain{idx % 30}")
+    return timer() - start
+
+
+@benchmark
+async def state_machine_domain_scan(hass):
+    """Run 10k state lookups with 6000 entities filtering by scanning all states.
+
+    Baseline for state_machine_domain_filter.
+    """
+    _populate_state_machine(hass)
+    states = hass.states
+
+    start = timer()
+    for idx in range(10**4):
+        domain = f"domain{idx % 30}"
+        [state for state in states.async_all() if state.domain == domain]
+    return timer() - start
+
+
 def _create_state_changed_event_from_old_new(
     entity_id, event_time_fired, old_state, new_state
 ):
@@ -357,3 +401,48 @@ def _create_state_changed_event_from_old_new(
     from homeassistant.components import logbook
 
     return logbook.LazyEventPartialState(row, {})
+
+
+async def _reschedule_timers(hass, coarse):
+    """Schedule 50k timers, reschedule each of them 10 times and run them.
+
+    Returns the CPU time spent, the time the loop is idle waiting for the
+    timers to be due is not included.
+    """
+    count = 0
+    timers = 5 * 10**4
+    done = asyncio.Event()
+
+    @core.callback
+    def listener(_):
+        """Handle timer."""
+        nonlocal count
+        count += 1
+        if count == timers:
+            done.set()
+
+    job = core.HassJob(listener)
+    start = process_time()
+    for _ in range(10):
+        removes = [
+            async_call_later(hass, 1 + idx / timers, job, coarse=coarse)
+            for idx in range(timers)
+        ]
+        for remove in removes:
+            remove()
+    for idx in range(timers):
+        async_call_later(hass, 1 + idx / timers, job, coarse=coarse)
+    await done.wait()
+    return process_time() - start
+
+
+@benchmark
+async def call_later_timers(hass):
+    """Reschedule 50k timers in the event loop."""
+    return await _reschedule_timers(hass, False)
+
+
+@benchmark
+async def call_later_timer_wheel(hass):
+    """Reschedule 50k timers in the timer wheel."""
+    return await _reschedule_timers(hass, True)
@@ -0,0 +1,298 @@
+"""Recorder benchmarks driven by a synthetic state changed event generator."""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from datetime import timedelta
+import os
+import random
+import tempfile
+from timeit import default_timer as timer
+from typing import TYPE_CHECKING, Any
+
+from homeassistant import config_entries, core, loader
+from homeassistant.const import ATTR_FRIENDLY_NAME, ATTR_UNIT_OF_MEASUREMENT
+from homeassistant.helpers import entity, recorder as recorder_helper
+from homeassistant.setup import async_setup_component
+import homeassistant.util.dt as dt_util
+
+if TYPE_CHECKING:
+    from homeassistant.components.recorder import Recorder
+
+RECORDER_BENCHMARKS = (
+    "recorder_write",
+    "recorder_purge",
+    "recorder_compile_statistics",
+)
+
+# How often the backlog and the commit latency are sampled
+SAMPLE_INTERVAL = 1.0
+# Events are fired in slices of this length when the rate is limited
+RATE_SLICE = 0.01
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the options of the recorder benchmarks."""
+    group = parser.add_argument_group("recorder benchmarks")
+    group.add_argument(
+        "--entities", type=int, default=1000, help="Number of entities changing state"
+    )
+    group.add_argument(
+        "--attribute-sets",
+        type=int,
+        default=10,
+        help="Number of distinct attribute sets per entity",
+    )
+    group.add_argument(
+        "--events", type=int, default=100000, help="Number of state changes to fire"
+    )
+    group.add_argument(
+        "--rate",
+        type=float,
+        default=0,
+        help="State changes per second, 0 fires them as fast as possible",
+    )
+    group.add_argument(
+        "--commit-interval", type=int, default=1, help="Recorder commit interval"
+    )
+    group.add_argument(
+        "--bulk-writes", action="store_true", help="Enable recorder bulk writes"
+    )
+    group.add_argument(
+        "--db-file",
+        help="SQLite database to use, a temporary database is used by default",
+    )
+    group.add_argument("--seed", type=int, default=0, help="Random seed")
+
+
+class SyntheticStateGenerator:
+    """Generate state changes for a fixed set of entities.
+
+    Sensors get numeric states, the other domains toggle between on and off.
+    Each entity cycles through a fixed number of attribute sets, so the
+    attribute cardinality of the generated data is known up front.
+    """
+
+    def __init__(self, entities: int, attribute_sets: int, seed: int = 0) -> None:
+        """Initialize the generator."""
+        self._random = random.Random(seed)
+        self.entity_ids = [
+            f"{('sensor', 'binary_sensor', 'light')[idx % 3]}.benchmark_{idx}"
+            for idx in range(entities)
+        ]
+        self._attributes = [
+            [
+                _attributes_for(entity_id, attribute_set)
+                for attribute_set in range(max(attribute_sets, 1))
+            ]
+            for entity_id in self.entity_ids
+        ]
+
+    def __iter__(self) -> Iterator[tuple[str, str, dict[str, Any]]]:
+        """Return an endless iterator of (entity_id, state, attributes)."""
+        rnd = self._random
+        entity_ids = self.entity_ids
+        attributes = self._attributes
+        while True:
+            idx = rnd.randrange(len(entity_ids))
+            entity_id = entity_ids[idx]
+            if idx % 3 == 0:
+                state = str(round(rnd.uniform(0, 100), 1))
+            else:
+                state = rnd.choice(("on", "off"))
+            yield entity_id, state, rnd.choice(attributes[idx])
+
+
+def _attributes_for(entity_id: str, attribute_set: int) -> dict[str, Any]:
+    """Return an attribute set of an entity."""
+    attributes: dict[str, Any] = {
+        ATTR_FRIENDLY_NAME: f"{entity_id} {attribute_set}",
+        "attribute_set": attribute_set,
+    }
+    if entity_id.startswith("sensor."):
+        attributes[ATTR_UNIT_OF_MEASUREMENT] = "W"
+        attributes["state_class"] = "measurement"
+    return attributes
+
+
+@dataclass(slots=True)
+class RecorderBenchmarkReport:
+    """Measurements of a recorder benchmark run."""
+
+    events: int = 0
+    write_seconds: float = 0
+    commit_latencies: list[float] = field(default_factory=list)
+    backlogs: list[int] = field(default_factory=list)
+    db_size_start: int = 0
+    db_size_end: int = 0
+    operation: str | None = None
+    operation_seconds: float = 0
+
+    def summary(self) -> list[str]:
+        """Return the report as lines of text."""
+        lines = [
+            f"Events written: {self.events} in {self.write_seconds:.2f}s "
+            f"({self.events / self.write_seconds:.0f} events/s)"
+        ]
+        if latencies := sorted(self.commit_latencies):
+            lines.append(
+                "Commit latency: "
+                + ", ".join(
+                    f"p{percentile}={_percentile(latencies, percentile) * 1000:.1f}ms"
+                    for percentile in (50, 90, 99)
+                )
+                + f", max={latencies[-1] * 1000:.1f}ms"
+            )
+        if backlogs := self.backlogs:
+            lines.append(
+                f"Queue backlog: max={max(backlogs)}, "
+                f"mean={sum(backlogs) / len(backlogs):.0f}"
+            )
+        growth = self.db_size_end - self.db_size_start
+        lines.append(
+            f"Database size: {self.db_size_start / 1024**2:.1f}MiB -> "
+            f"{self.db_size_end / 1024**2:.1f}MiB "
+            f"({growth / max(self.events, 1):.0f} bytes/event)"
+        )
+        if self.operation:
+            lines.append(f"{self.operation}: {self.operation_seconds:.2f}s")
+        return lines
+
+
+def _percentile(values: list[float], percentile: int) -> float:
+    """Return the nearest rank percentile of sorted values."""
+    return values[min(len(values) - 1, len(values) * percentile // 100)]
+
+
+def _db_size(db_file: str) -> int:
+    """Return the size of the database including the write ahead log."""
+    return sum(
+        os.path.getsize(path)
+        for path in (db_file, f"{db_file}-wal")
+        if os.path.exists(path)
+    )
+
+
+def run(args: argparse.Namespace) -> None:
+    """Run a recorder benchmark and print its report."""
+    with tempfile.TemporaryDirectory() as config_dir:
+        db_file = args.db_file or os.path.join(config_dir, "home-assistant_v2.db")
+        report = asyncio.run(_async_run(args, config_dir, db_file))
+    for line in report.summary():
+        print(line)
+
+
+async def _async_run(
+    args: argparse.Namespace, config_dir: str, db_file: str
+) -> RecorderBenchmarkReport:
+    """Set up the recorder and run the benchmark."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.components import recorder
+    from homeassistant.components.recorder import statistics
+    from homeassistant.components.recorder.tasks import PurgeTask, StatisticsTask
+
+    hass = core.HomeAssistant(config_dir)
+    hass.config.set_time_zone("UTC")
+    hass.config.skip_pip = True
+    loader.async_setup(hass)
+    entity.async_setup(hass)
+    hass.data[loader.DATA_CUSTOM_COMPONENTS] = {}
+    hass.config_entries = config_entries.ConfigEntries(hass, {})
+    recorder_helper.async_initialize_recorder(hass)
+    await async_setup_component(
+        hass,
+        recorder.DOMAIN,
+        {
+            recorder.DOMAIN: {
+                recorder.CONF_DB_URL: f"sqlite:///{db_file}",
+                recorder.CONF_COMMIT_INTERVAL: args.commit_interval,
+                recorder.CONF_BULK_WRITES: args.bulk_writes,
+            }
+        },
+    )
+    if args.name == "recorder_compile_statistics":
+        await async_setup_component(hass, "sensor", {})
+    await hass.async_start()
+    instance = recorder.get_instance(hass)
+    await instance.async_recorder_ready.wait()
+    await instance.async_block_till_done()
+
+    report = RecorderBenchmarkReport(db_size_start=_db_size(db_file))
+    # The 5-minute period the generated states are recorded in
+    period_start = statistics.get_start_time() + timedelta(minutes=5)
+    await _async_write_events(hass, instance, args, report)
+    report.db_size_end = _db_size(db_file)
+
+    if args.name == "recorder_purge":
+        report.operation = "Purge"
+        purge_before = dt_util.utcnow()
+        start = timer()
+        # The table managers can only be used from the recorder thread
+        instance.queue_task(PurgeTask(purge_before, False, False))
+        await instance.async_block_till_done()
+        # A purge which did not finish queues another PurgeTask
+        while instance.backlog:
+            await instance.async_block_till_done()
+        report.operation_seconds = timer() - start
+    elif args.name == "recorder_compile_statistics":
+        report.operation = "Compile statistics"
+        start = timer()
+        # Statistics metadata can only be written from the recorder thread
+        instance.queue_task(StatisticsTask(period_start, False))
+        await instance.async_block_till_done()
+        report.operation_seconds = timer() - start
+
+    await hass.async_stop()
+    return report
+
+
+async def _async_write_events(
+    hass: core.HomeAssistant,
+    instance: Recorder,
+    args: argparse.Namespace,
+    report: RecorderBenchmarkReport,
+) -> None:
+    """Fire state changes and wait for the recorder to commit them.
+
+    The commit latency is the time from requesting a commit until all
+    events fired before the request are committed.
+    """
+    done = asyncio.Event()
+
+    async def _async_sample() -> None:
+        while not done.is_set():
+            report.backlogs.append(instance.backlog)
+            requested = timer()
+            await instance.async_block_till_done()
+            report.commit_latencies.append(timer() - requested)
+            if not done.is_set():
+                await asyncio.sleep(SAMPLE_INTERVAL)
+
+    states = hass.states
+    events = iter(
+        SyntheticStateGenerator(args.entities, args.attribute_sets, args.seed)
+    )
+    per_slice = max(int(args.rate * RATE_SLICE), 1) if args.rate else 1000
+    sampler = hass.async_create_background_task(
+        _async_sample(), "recorder benchmark sampler"
+    )
+    start = timer()
+    fired = 0
+    while fired < args.events:
+        for entity_id, state, attributes in events:
+            states.async_set(entity_id, state, attributes)
+            fired += 1
+            if fired == args.events or not fired % per_slice:
+                break
+        if args.rate:
+            await asyncio.sleep(max(start + fired / args.rate - timer(), 0))
+        else:
+            await asyncio.sleep(0)
+    await hass.async_block_till_done()
+    await instance.async_block_till_done()
+    report.write_seconds = timer() - start
+    done.set()
+    await sampler
+    report.events = fired
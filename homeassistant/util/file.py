@@ -80,3 +80,65 @@ def write_utf8_file(
                     filename,
                     err,
                 )
+
+
+def write_utf8_files_atomic(
+    files: list[tuple[str, str, bool]],
+) -> dict[str, WriteError]:
+    """Write files of (filename, utf8_data, private) and rename them into place.
+
+    Writes all or nothing per file, like write_utf8_file_atomic. Each file
+    is still fsynced before it replaces the old one, but the renames are
+    made durable with one fsync per directory instead of one per file.
+    The filenames must be unique. Returns the errors by filename.
+    """
+    errors: dict[str, WriteError] = {}
+    tmp_filenames: dict[str, str] = {}
+    for filename, utf8_data, private in files:
+        try:
+            with tempfile.NamedTemporaryFile(
+                mode="w", encoding="utf-8", dir=os.path.dirname(filename), delete=False
+            ) as fdesc:
+                tmp_filenames[filename] = fdesc.name
+                fdesc.write(utf8_data)
+                if not private:
+                    os.fchmod(fdesc.fileno(), 0o644)
+                # The data must be on disk before the file replaces the old one
+                fdesc.flush()
+                os.fsync(fdesc.fileno())
+        except OSError as error:
+            _LOGGER.exception("Saving file failed: %s", filename)
+            errors[filename] = WriteError(error)
+
+    directories: set[str] = set()
+    for filename, tmp_filename in tmp_filenames.items():
+        try:
+            if filename not in errors:
+                os.replace(tmp_filename, filename)
+                directories.add(os.path.dirname(filename))
+        except OSError as error:
+            _LOGGER.exception("Saving file failed: %s", filename)
+            errors[filename] = WriteError(error)
+        finally:
+            if os.path.exists(tmp_filename):
+                try:
+                    os.remove(tmp_filename)
+                except OSError as err:
+                    _LOGGER.error(
+                        "File replacement cleanup failed for %s while saving %s: %s",
+                        tmp_filename,
+                        filename,
+                        err,
+                    )
+
+    # Persist the renames
+    for directory in directories:
+        try:
+            fd = os.open(directory or ".", os.O_RDONLY)
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+        except OSError as err:
+            _LOGGER.error("Syncing directory %s failed: %s", directory, err)
+    return errors
@@ -0,0 +1,167 @@
+"""Timer wheel for large numbers of coarse timers.
+
+Timers are kept in buckets per tick of the wheel and only the earliest
+occupied tick is scheduled in the event loop, so adding and cancelling a
+timer does not touch the heap of the event loop and all timers due in the
+same tick are run from a single event loop callback.
+"""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+import heapq
+import logging
+import math
+from typing import Any
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_RESOLUTION = 1.0
+
+
+class TimerWheelHandle:
+    """Handle of a timer in the timer wheel."""
+
+    __slots__ = ("_wheel", "_bucket", "_when", "_cancelled", "callback", "args")
+
+    def __init__(
+        self,
+        wheel: TimerWheel,
+        bucket: dict[TimerWheelHandle, None],
+        when: float,
+        callback: Callable[..., Any],
+        args: tuple[Any, ...],
+    ) -> None:
+        """Initialize the handle."""
+        self._wheel = wheel
+        self._bucket: dict[TimerWheelHandle, None] | None = bucket
+        self._when = when
+        self._cancelled = False
+        self.callback = callback
+        self.args = args
+
+    def __repr__(self) -> str:
+        """Return the representation."""
+        return f"<TimerWheelHandle when={self._when} {self.callback}>"
+
+    def when(self) -> float:
+        """Return the event loop time the timer was requested for."""
+        return self._when
+
+    def cancelled(self) -> bool:
+        """Return if the timer was cancelled."""
+        return self._cancelled
+
+    def cancel(self) -> None:
+        """Cancel the timer."""
+        if self._cancelled:
+            return
+        self._cancelled = True
+        if (bucket := self._bucket) is not None:
+            self._bucket = None
+            del bucket[self]
+            self._wheel._async_timer_removed()  # pylint: disable=protected-access
+
+
+class TimerWheel:
+    """Run timers at the end of the tick they are due in.
+
+    Timers never run early, they run up to one resolution late. Buckets
+    are dicts so adding and cancelling a timer is O(1), the ticks that
+    have a bucket are kept in a heap to find the next one that is due.
+    """
+
+    __slots__ = (
+        "_loop",
+        "_resolution",
+        "_buckets",
+        "_ticks",
+        "_count",
+        "_handle",
+        "_handle_tick",
+    )
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        resolution: float = DEFAULT_RESOLUTION,
+    ) -> None:
+        """Initialize the timer wheel."""
+        self._loop = loop
+        self._resolution = resolution
+        self._buckets: dict[int, dict[TimerWheelHandle, None]] = {}
+        self._ticks: list[int] = []
+        self._count = 0
+        self._handle: asyncio.TimerHandle | None = None
+        self._handle_tick = 0
+
+    def __len__(self) -> int:
+        """Return the number of pending timers."""
+        return self._count
+
+    def call_later(
+        self, delay: float, callback: Callable[..., Any], *args: Any
+    ) -> TimerWheelHandle:
+        """Run a callback after a delay in seconds."""
+        return self.call_at(self._loop.time() + delay, callback, *args)
+
+    def call_at(
+        self, when: float, callback: Callable[..., Any], *args: Any
+    ) -> TimerWheelHandle:
+        """Run a callback at or shortly after an event loop time."""
+        tick = math.ceil(when / self._resolution)
+        if (bucket := self._buckets.get(tick)) is None:
+            bucket = self._buckets[tick] = {}
+            heapq.heappush(self._ticks, tick)
+        handle = TimerWheelHandle(self, bucket, when, callback, args)
+        bucket[handle] = None
+        self._count += 1
+        if self._handle is None or tick < self._handle_tick:
+            self._async_schedule()
+        return handle
+
+    def _async_timer_removed(self) -> None:
+        """Drop the buckets and stop the wheel once the last timer is gone."""
+        self._count -= 1
+        if self._count:
+            return
+        self._buckets.clear()
+        self._ticks.clear()
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+    def _async_schedule(self) -> None:
+        """Schedule the wheel to run at the earliest tick with a bucket."""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        if not self._ticks:
+            return
+        self._handle_tick = tick = self._ticks[0]
+        self._handle = self._loop.call_at(tick * self._resolution, self._run, tick)
+
+    def _run(self, tick: int) -> None:
+        """Run the timers of all ticks up to now."""
+        self._handle = None
+        now = max(tick, math.floor(self._loop.time() / self._resolution))
+        due: list[TimerWheelHandle] = []
+        ticks = self._ticks
+        while ticks and ticks[0] <= now:
+            if bucket := self._buckets.pop(heapq.heappop(ticks), None):
+                due.extend(bucket)
+        self._count -= len(due)
+        for handle in due:
+            handle._bucket = None  # pylint: disable=protected-access
+        for handle in due:
+            if handle.cancelled():
+                continue
+            try:
+                handle.callback(*handle.args)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Error running timer %s", handle)
+        if not self._count:
+            self._buckets.clear()
+            self._ticks.clear()
+        elif self._handle is None:
+            self._async_schedule()
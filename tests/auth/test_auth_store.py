@@ -5,6 +5,9 @@ from unittest.mock import patch
 
 from homeassistant.auth import auth_store
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import device_registry as dr, entity_registry as er
+
+from tests.common import MockConfigEntry
 
 
 async def test_loading_no_group_data_format(
@@ -258,3 +261,56 @@ async def test_loading_race_condition(hass: HomeAssistant) -> None:
         mock_dev_registry.assert_called_once_with(hass)
         mock_load.assert_called_once_with()
         assert results[0] == results[1]
+
+
+async def test_entity_permissions_invalidated_by_registry_updates(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    device_registry: dr.DeviceRegistry,
+    entity_registry: er.EntityRegistry,
+) -> None:
+    """Test cached entity permissions are invalidated when the registries change."""
+    config_entry = MockConfigEntry()
+    config_entry.add_to_hass(hass)
+    device = device_registry.async_get_or_create(
+        config_entry_id=config_entry.entry_id, identifiers={("test", "device")}
+    )
+    entity_registry.async_get_or_create("light", "test", "1234")
+    hass_storage[auth_store.STORAGE_KEY] = {
+        "version": 1,
+        "data": {
+            "credentials": [],
+            "users": [
+                {
+                    "id": "user-id",
+                    "is_active": True,
+                    "is_owner": False,
+                    "name": "Paulus",
+                    "system_generated": False,
+                    "group_ids": ["area-group"],
+                },
+            ],
+            "groups": [
+                {
+                    "id": "area-group",
+                    "name": "Kitchen",
+                    "policy": {"entities": {"area_ids": {"kitchen": {"read": True}}}},
+                }
+            ],
+            "refresh_tokens": [],
+        },
+    }
+    store = auth_store.AuthStore(hass)
+    user = await store.async_get_user("user-id")
+    assert user is not None
+    permissions = user.permissions
+
+    assert not permissions.check_entity("light.test_1234", "read")
+
+    entity_registry.async_update_entity("light.test_1234", device_id=device.id)
+    assert not permissions.check_entity("light.test_1234", "read")
+
+    device_registry.async_update_device(device.id, area_id="kitchen")
+    assert permissions.check_entity("light.test_1234", "read")
+    assert not permissions.check_entity("light.test_1234", "control")
+    assert user.permissions is permissions
@@ -580,7 +580,7 @@ def mock_device_registry(
     fixture instead.
     """
     registry = dr.DeviceRegistry(hass)
-    registry.devices = dr.DeviceRegistryItems()
+    registry.devices = dr.ActiveDeviceRegistryItems()
     registry._device_data = registry.devices.data
     if mock_entries is None:
         mock_entries = {}
@@ -1250,6 +1250,8 @@ def mock_storage(
         store: storage.Store, path: str, data_to_write: dict[str, Any]
     ) -> None:
         """Mock version of write data."""
+        if isinstance(snapshot := data_to_write["data"], storage.StoreSnapshot):
+            data_to_write = {**data_to_write, "data": snapshot.build()}
         # To ensure that the data can be serialized
         _LOGGER.debug("Writing data to %s: %s", store.key, data_to_write)
         raise_contains_mocks(data_to_write)
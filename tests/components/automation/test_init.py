@@ -2,6 +2,7 @@
 import asyncio
 from datetime import timedelta
 import logging
+from typing import Any
 from unittest.mock import Mock, patch
 
 import pytest
@@ -1824,6 +1825,60 @@ async def test_extraction_functions(hass: HomeAssistant) -> None:
     assert automation.blueprint_in_automation(hass, "automation.test3") is None
 
 
+async def test_extraction_functions_after_reload(
+    hass: HomeAssistant, hass_admin_user: MockUser
+) -> None:
+    """Test extraction functions follow automations added and removed."""
+
+    def _config(alias: str, entity_id: str) -> dict[str, Any]:
+        return {
+            "alias": alias,
+            "trigger": {"platform": "state", "entity_id": "sensor.trigger"},
+            "action": {
+                "service": "test.script",
+                "data": {"entity_id": entity_id},
+            },
+        }
+
+    assert await async_setup_component(
+        hass, DOMAIN, {DOMAIN: [_config("first", "light.first")]}
+    )
+    assert automation.automations_with_entity(hass, "light.first") == [
+        "automation.first"
+    ]
+    assert automation.automations_with_entity(hass, "sensor.trigger") == [
+        "automation.first"
+    ]
+
+    with patch(
+        "homeassistant.config.load_yaml_config_file",
+        autospec=True,
+        return_value={
+            DOMAIN: [
+                _config("second", "light.second"),
+                _config("third", "light.second"),
+            ]
+        },
+    ):
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_RELOAD,
+            context=Context(user_id=hass_admin_user.id),
+            blocking=True,
+        )
+        await hass.async_block_till_done()
+
+    assert automation.automations_with_entity(hass, "light.first") == []
+    assert automation.automations_with_entity(hass, "light.second") == [
+        "automation.second",
+        "automation.third",
+    ]
+    assert automation.automations_with_entity(hass, "sensor.trigger") == [
+        "automation.second",
+        "automation.third",
+    ]
+
+
 async def test_logbook_humanify_automation_triggered_event(hass: HomeAssistant) -> None:
     """Test humanifying Automation Trigger event."""
     hass.config.components.add("recorder")
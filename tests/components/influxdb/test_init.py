@@ -2,14 +2,28 @@
 from dataclasses import dataclass
 import datetime
 from http import HTTPStatus
+import re
 from unittest.mock import ANY, MagicMock, Mock, call, patch
 
 import pytest
 
 import homeassistant.components.influxdb as influxdb
-from homeassistant.components.influxdb.const import DEFAULT_BUCKET
-from homeassistant.const import PERCENTAGE, STATE_OFF, STATE_ON, STATE_STANDBY
+from homeassistant.components.influxdb.const import (
+    BATCH_BUFFER_BYTES,
+    DEFAULT_BUCKET,
+    QUEUE_SPILL_FILE,
+    QUEUE_SPILL_LIMIT,
+)
+from homeassistant.components.influxdb.export_queue import ExportQueue
+from homeassistant.const import (
+    EVENT_HOMEASSISTANT_STOP,
+    PERCENTAGE,
+    STATE_OFF,
+    STATE_ON,
+    STATE_STANDBY,
+)
 from homeassistant.core import HomeAssistant, split_entity_id
+from homeassistant.helpers.storage import STORAGE_DIR
 from homeassistant.setup import async_setup_component
 
 INFLUX_PATH = "homeassistant.components.influxdb"
@@ -30,6 +44,85 @@ class FilterTest:
     should_pass: bool
 
 
+def _split(text, separator):
+    """Split line protocol on separators which are not escaped or quoted."""
+    parts = [""]
+    quoted = escaped = False
+    for char in text:
+        if escaped:
+            escaped = False
+        elif char == "\\":
+            escaped = True
+        elif char == '"':
+            quoted = not quoted
+        elif char == separator and not quoted:
+            parts.append("")
+            continue
+        parts[-1] += char
+    return parts
+
+
+def _unescape(text):
+    """Remove the escapes of line protocol."""
+    return re.sub(r"\\(.)", lambda match: "\n" if match[1] == "n" else match[1], text)
+
+
+def _parse_field_value(value):
+    """Parse a field value of line protocol."""
+    if value.startswith('"'):
+        return _unescape(value[1:-1])
+    if value.endswith("i"):
+        return int(value[:-1])
+    if value in ("true", "false"):
+        return value == "true"
+    return float(value)
+
+
+def _parse_lines(lines):
+    """Parse lines of line protocol into points in the json format."""
+    if isinstance(lines, bytes):
+        lines = lines.decode()
+    points = []
+    for line in lines.splitlines():
+        if not line:
+            continue
+        series, fields, timestamp = _split(line, " ")
+        measurement, *tags = _split(series, ",")
+        points.append(
+            {
+                "measurement": _unescape(measurement),
+                "tags": {
+                    _unescape(key): _unescape(value)
+                    for key, value in (_split(tag, "=") for tag in tags)
+                },
+                "time": int(timestamp),
+                "fields": {
+                    _unescape(key): _parse_field_value(value)
+                    for key, value in (
+                        _split(field, "=") for field in _split(fields, ",")
+                    )
+                },
+            }
+        )
+    return points
+
+
+class LineProtocol:
+    """Compare lines of line protocol to points in the json format."""
+
+    def __init__(self, points):
+        """Initialize with the expected points."""
+        self.points = points
+
+    def __eq__(self, other):
+        """Return if the lines encode the expected points."""
+        return isinstance(other, (str, bytes)) and _parse_lines(other) == self.points
+
+    def __repr__(self):
+        """Return the expected points."""
+        return f"<LineProtocol {self.points!r}>"
+
+
 @pytest.fixture(autouse=True)
 def mock_batch_timeout(hass, monkeypatch):
     """Mock the event bus listener and the batch timeout for tests."""
@@ -56,7 +149,7 @@ def get_mock_call_fixture(request):
     """Get version specific lambda to make write API call mock."""
 
     def v2_call(body, precision):
-        data = {"bucket": DEFAULT_BUCKET, "record": body}
+        data = {"bucket": DEFAULT_BUCKET, "record": LineProtocol(body)}
 
         if precision is not None:
             data["write_precision"] = precision
@@ -65,8 +158,9 @@ def get_mock_call_fixture(request):
 
     if request.param == influxdb.API_VERSION_2:
         return lambda body, precision=None: v2_call(body, precision)
-    # pylint: disable-next=unnecessary-lambda
-    return lambda body, precision=None: call(body, time_precision=precision)
+    return lambda body, precision=None: call(
+        LineProtocol(body), time_precision=precision, protocol="line"
+    )
 
 
 def _get_write_api_mock_v1(mock_influx_client):
@@ -1346,7 +1440,7 @@ async def test_event_listener_ignore_attributes_overlapping_entities(
 async def test_event_listener_scheduled_write(
     hass: HomeAssistant, mock_client, config_ext, get_write_api, get_mock_call
 ) -> None:
-    """Test the event listener retries after a write failure."""
+    """Test the event listener keeps events after a write failure."""
     config = {"max_retries": 1}
     config.update(config_ext)
     await _setup(hass, mock_client, config, get_write_api)
@@ -1361,14 +1455,28 @@ async def test_event_listener_scheduled_write(
         assert mock_sleep.called
     assert write_api.call_count == 2
 
-    # Write works again
+    # Writing is suspended until the retry interval has passed
     write_api.side_effect = None
-    with patch.object(influxdb.time, "sleep") as mock_sleep:
-        hass.states.async_set("entity.entity_id", "2")
-        await hass.async_block_till_done()
-        hass.data[influxdb.DOMAIN].block_till_done()
-        assert not mock_sleep.called
+    hass.states.async_set("entity.entity_id", "2")
+    await hass.async_block_till_done()
+    hass.data[influxdb.DOMAIN].block_till_done()
+    assert write_api.call_count == 2
+
+    # The failed event is written before the new one on shutdown
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
+    await hass.async_block_till_done()
     assert write_api.call_count == 3
+    assert write_api.call_args == get_mock_call(
+        [
+            {
+                "measurement": "entity.entity_id",
+                "tags": {"domain": "entity", "entity_id": "entity_id"},
+                "time": ANY,
+                "fields": {"value": value},
+            }
+            for value in (1, 2)
+        ]
+    )
 
 
 @pytest.mark.parametrize(
@@ -1389,26 +1497,44 @@ async def test_event_listener_scheduled_write(
     ],
     indirect=["mock_client", "get_mock_call"],
 )
-async def test_event_listener_backlog_full(
-    hass: HomeAssistant, mock_client, config_ext, get_write_api, get_mock_call
+async def test_event_listener_backlog_spill(
+    hass: HomeAssistant,
+    tmp_path,
+    mock_client,
+    config_ext,
+    get_write_api,
+    get_mock_call,
 ) -> None:
-    """Test the event listener drops old events when backlog gets full."""
-    await _setup(hass, mock_client, config_ext, get_write_api)
-
-    monotonic_time = 0
-
-    def fast_monotonic():
-        """Monotonic time that ticks fast enough to cause a timeout."""
-        nonlocal monotonic_time
-        monotonic_time += 60
-        return monotonic_time
+    """Test the backlog is spilled to disk and kept for the next start."""
+    hass.config.config_dir = str(tmp_path)
+    spill_file = tmp_path / STORAGE_DIR / QUEUE_SPILL_FILE
+    with patch(f"{INFLUX_PATH}.QUEUE_MEMORY_LIMIT", 1):
+        await _setup(hass, mock_client, config_ext, get_write_api)
+    write_api = get_write_api(mock_client)
+    write_api.side_effect = OSError("foo")
 
-    with patch("homeassistant.components.influxdb.time.monotonic", new=fast_monotonic):
-        hass.states.async_set("entity.id", 1)
+    for value in range(3):
+        hass.states.async_set("fake.entity_id", value)
         await hass.async_block_till_done()
         hass.data[influxdb.DOMAIN].block_till_done()
+    assert write_api.call_count == 1
+    assert spill_file.read_bytes().count(b"\n") == 3
 
-        assert get_write_api(mock_client).call_count == 0
+    # The backlog is not replayed while stopping
+    write_api.side_effect = None
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
+    await hass.async_block_till_done()
+    assert write_api.call_count == 1
+    assert spill_file.read_bytes().count(b"\n") == 3
+
+    # The next start replays the backlog in order
+    export_queue = ExportQueue(str(spill_file), 1, QUEUE_SPILL_LIMIT)
+    lines = export_queue.get_batch(BATCH_BUFFER_BYTES, 0)
+    assert [point["fields"] for point in _parse_lines(b"".join(lines))] == [
+        {"value": value} for value in range(3)
+    ]
+    export_queue.ack()
+    assert not spill_file.exists()
 
 
 @pytest.mark.parametrize(
@@ -12,7 +12,8 @@ from homeassistant.components import logbook, recorder
 from homeassistant.components.automation import ATTR_SOURCE, EVENT_AUTOMATION_TRIGGERED
 from homeassistant.components.logbook import websocket_api
 from homeassistant.components.recorder import Recorder
-from homeassistant.components.recorder.util import get_instance
+from homeassistant.components.recorder.db_schema import Events, States
+from homeassistant.components.recorder.util import get_instance, session_scope
 from homeassistant.components.script import EVENT_SCRIPT_STARTED
 from homeassistant.components.websocket_api.const import TYPE_RESULT
 from homeassistant.const import (
@@ -27,6 +28,7 @@ from homeassistant.const import (
     CONF_INCLUDE,
     EVENT_HOMEASSISTANT_FINAL_WRITE,
     EVENT_HOMEASSISTANT_START,
+    EVENT_LOGBOOK_ENTRY,
     STATE_OFF,
     STATE_ON,
 )
@@ -456,6 +458,140 @@ async def test_get_events_invalid_filters(
     assert response["error"]["code"] == "invalid_format"
 
 
+async def test_get_events_paginated(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test logbook get_events pages with a cursor."""
+    now = dt_util.utcnow()
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook")
+        ]
+    )
+    await async_recorder_block_till_done(hass)
+
+    hass.states.async_set("light.kitchen", STATE_OFF)
+    hass.states.async_set("light.living_room", STATE_OFF)
+    for brightness in range(5):
+        hass.states.async_set("light.kitchen", STATE_ON, {"brightness": brightness})
+        hass.states.async_set("light.kitchen", STATE_OFF)
+    # Two changes at the same time must not be split or repeated by the cursor
+    with freeze_time(dt_util.utcnow()):
+        hass.states.async_set("light.kitchen", STATE_ON)
+        hass.states.async_set("light.living_room", STATE_ON)
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "logbook/get_events",
+            "start_time": now.isoformat(),
+            "entity_ids": ["light.kitchen", "light.living_room"],
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    all_events = response["result"]
+    assert len(all_events) == 12
+
+    events = []
+    cursor = None
+    for msg_id in range(2, 10):
+        command = {
+            "id": msg_id,
+            "type": "logbook/get_events",
+            "start_time": now.isoformat(),
+            "entity_ids": ["light.kitchen", "light.living_room"],
+            "limit": 5 if msg_id == 2 else 1,
+        }
+        if cursor:
+            command["cursor"] = cursor
+        await client.send_json(command)
+        response = await client.receive_json()
+        assert response["success"]
+        events.extend(response["result"]["events"])
+        if not (cursor := response["result"]["next_cursor"]):
+            break
+    assert events == all_events
+
+    await client.send_json(
+        {
+            "id": 11,
+            "type": "logbook/get_events",
+            "start_time": now.isoformat(),
+            "cursor": "invalid",
+        }
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "invalid_cursor"
+
+
+async def test_get_events_paginated_event_and_state_tie(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test the cursor tells an event from a state with the same time and id."""
+    now = dt_util.utcnow()
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook")
+        ]
+    )
+    await async_recorder_block_till_done(hass)
+
+    hass.states.async_set("light.kitchen", STATE_OFF)
+    with freeze_time(dt_util.utcnow()):
+        hass.bus.async_fire(
+            EVENT_LOGBOOK_ENTRY, {ATTR_NAME: "Kitchen", "message": "cleaned"}
+        )
+        hass.states.async_set("light.kitchen", STATE_ON)
+    await async_wait_recording_done(hass)
+
+    def _give_event_and_state_same_id() -> None:
+        with session_scope(hass=hass) as session:
+            state = session.query(States).order_by(States.state_id.desc()).first()
+            event = (
+                session.query(Events)
+                .filter(Events.time_fired_ts == state.last_updated_ts)
+                .one()
+            )
+            event.event_id = state.state_id = 1000
+
+    await get_instance(hass).async_add_executor_job(_give_event_and_state_same_id)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {"id": 1, "type": "logbook/get_events", "start_time": now.isoformat()}
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    all_events = response["result"]
+    assert all_events[-2]["message"] == "cleaned"
+    assert all_events[-1]["state"] == STATE_ON
+
+    events = []
+    cursor = None
+    for msg_id in range(2, 2 + len(all_events) + 1):
+        command = {
+            "id": msg_id,
+            "type": "logbook/get_events",
+            "start_time": now.isoformat(),
+            "limit": 1,
+        }
+        if cursor:
+            command["cursor"] = cursor
+        await client.send_json(command)
+        response = await client.receive_json()
+        assert response["success"]
+        events.extend(response["result"]["events"])
+        if not (cursor := response["result"]["next_cursor"]):
+            break
+    assert events == all_events
+
+
 async def test_get_events_with_device_ids(
     recorder_mock: Recorder,
     hass: HomeAssistant,
@@ -1740,6 +1876,49 @@ async def test_subscribe_unsubscribe_logbook_stream_entities_past_only(
     ) == listeners_without_writes(init_listeners)
 
 
+@patch("homeassistant.components.logbook.websocket_api.STREAM_CHUNK_SIZE", 2)
+async def test_logbook_stream_sends_history_in_chunks(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test historical events are sent in chunks as they are fetched."""
+    now = dt_util.utcnow()
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook")
+        ]
+    )
+    await hass.async_block_till_done()
+    hass.states.async_set("light.small", STATE_OFF)
+    for _ in range(2):
+        hass.states.async_set("light.small", STATE_ON)
+        hass.states.async_set("light.small", STATE_OFF)
+    hass.states.async_set("light.small", STATE_ON)
+    await async_wait_recording_done(hass)
+
+    websocket_client = await hass_ws_client()
+    await websocket_client.send_json(
+        {
+            "id": 7,
+            "type": "logbook/event_stream",
+            "start_time": now.isoformat(),
+            "end_time": (dt_util.utcnow() - timedelta(microseconds=1)).isoformat(),
+            "entity_ids": ["light.small"],
+        }
+    )
+    msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+    assert msg["id"] == 7
+    assert msg["success"]
+
+    states = []
+    for partial in (True, True, False):
+        msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+        assert msg["id"] == 7
+        assert msg["event"].get("partial", False) is partial
+        states.extend(event["state"] for event in msg["event"]["events"])
+    assert states == ["on", "off", "on", "off", "on"]
+
+
 @patch("homeassistant.components.logbook.websocket_api.EVENT_COALESCE_TIME", 0)
 async def test_subscribe_unsubscribe_logbook_stream_big_query(
     recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
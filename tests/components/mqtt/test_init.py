@@ -8,12 +8,17 @@ import ssl
 from typing import Any, TypedDict
 from unittest.mock import ANY, MagicMock, call, mock_open, patch
 
+from paho.mqtt.client import MQTTMessage
 import pytest
 import voluptuous as vol
 
 from homeassistant.components import mqtt
 from homeassistant.components.mqtt import debug_info
-from homeassistant.components.mqtt.client import EnsureJobAfterCooldown
+from homeassistant.components.mqtt.client import (
+    EnsureJobAfterCooldown,
+    _matcher_for_topic,
+    _MatchingSubscriptionsCache,
+)
 from homeassistant.components.mqtt.mixins import MQTT_ENTITY_DEVICE_INFO_SCHEMA
 from homeassistant.components.mqtt.models import MessageCallbackType, ReceiveMessage
 from homeassistant.config_entries import ConfigEntryDisabler, ConfigEntryState
@@ -1277,6 +1282,134 @@ async def test_subscribe_topic_sys_root_and_wildcard_subtree_topic(
     assert calls[0].payload == "test-payload"
 
 
+async def test_subscribe_overlapping_wildcard_topics(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+) -> None:
+    """Test overlapping wildcard subscriptions are matched and removed."""
+    await mqtt_mock_entry()
+    calls: list[tuple[str, str]] = []
+
+    def _record(subscribed_topic: str) -> MessageCallbackType:
+        @callback
+        def _callback(msg: ReceiveMessage) -> None:
+            calls.append((subscribed_topic, msg.topic))
+
+        return _callback
+
+    unsubscribes = {
+        topic: await mqtt.async_subscribe(hass, topic, _record(topic))
+        for topic in ("home/+/state", "home/#", "home/kitchen/state", "+/+/+", "#")
+    }
+
+    async_fire_mqtt_message(hass, "home/kitchen/state", "on")
+    async_fire_mqtt_message(hass, "home", "on")
+    async_fire_mqtt_message(hass, "$SYS/home/state", "on")
+    await hass.async_block_till_done()
+    assert calls == [
+        ("home/kitchen/state", "home/kitchen/state"),
+        ("home/+/state", "home/kitchen/state"),
+        ("home/#", "home/kitchen/state"),
+        ("+/+/+", "home/kitchen/state"),
+        ("#", "home/kitchen/state"),
+        ("home/#", "home"),
+        ("#", "home"),
+    ]
+
+    calls.clear()
+    unsubscribes.pop("home/+/state")()
+    unsubscribes.pop("#")()
+    async_fire_mqtt_message(hass, "home/kitchen/state", "off")
+    await hass.async_block_till_done()
+    assert calls == [
+        ("home/kitchen/state", "home/kitchen/state"),
+        ("home/#", "home/kitchen/state"),
+        ("+/+/+", "home/kitchen/state"),
+    ]
+
+    calls.clear()
+    await mqtt.async_subscribe(hass, "home/kitchen/#", _record("home/kitchen/#"))
+    async_fire_mqtt_message(hass, "home/kitchen/state", "on")
+    await hass.async_block_till_done()
+    assert calls == [
+        ("home/kitchen/state", "home/kitchen/state"),
+        ("home/#", "home/kitchen/state"),
+        ("+/+/+", "home/kitchen/state"),
+        ("home/kitchen/#", "home/kitchen/state"),
+    ]
+
+
+def test_matching_subscriptions_cache_invalidate() -> None:
+    """Test invalidating drops exactly the cached topics a filter matches."""
+    topics = (
+        "home",
+        "home/kitchen",
+        "home/kitchen/state",
+        "home/hall/state",
+        "home//state",
+        "garden/state",
+        "$SYS/broker/load",
+        "$SYS",
+    )
+    topic_filters = (
+        "#",
+        "+",
+        "+/#",
+        "home/#",
+        "home/+/state",
+        "+/+/+",
+        "home/kitchen/#",
+        "$SYS/#",
+        "home/kitchen",
+        "other/#",
+    )
+    for topic_filter in topic_filters:
+        cache = _MatchingSubscriptionsCache()
+        for topic in topics:
+            cache.set(topic, [])
+        cache.invalidate(topic_filter)
+        matcher = _matcher_for_topic(topic_filter)
+        assert [topic for topic in topics if cache.get(topic) is None] == [
+            topic for topic in topics if matcher(topic)
+        ], topic_filter
+        assert len(cache) == len(topics) - sum(bool(matcher(topic)) for topic in topics)
+        cache.invalidate("#")
+        cache.invalidate("$SYS/#")
+        cache.invalidate("$SYS")
+        assert len(cache) == 0
+
+
+async def test_received_messages_are_drained_in_batches(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+    calls: list[ReceiveMessage],
+    record_calls: MessageCallbackType,
+) -> None:
+    """Test messages received together are handled in one loop callback."""
+    mqtt_mock = await mqtt_mock_entry()
+    # The fixture wraps the real client in a mock
+    mqtt_client = mqtt_mock._mock_wraps
+    await mqtt.async_subscribe(hass, "test-topic/#", record_calls)
+
+    for index in range(3):
+        msg = MQTTMessage(topic=f"test-topic/{index}".encode())
+        msg.payload = b"test-payload"
+        mqtt_client._mqtt_on_message(None, None, msg)
+    await hass.async_block_till_done()
+    msg = MQTTMessage(topic=b"test-topic/3")
+    msg.payload = b"test-payload"
+    mqtt_client._mqtt_on_message(None, None, msg)
+    await hass.async_block_till_done()
+
+    assert [call.topic for call in calls] == [
+        "test-topic/0",
+        "test-topic/1",
+        "test-topic/2",
+        "test-topic/3",
+    ]
+    assert mqtt_client.messages_per_drain == {3: 1, 1: 1}
+
+
 async def test_subscribe_special_characters(
     hass: HomeAssistant,
     mqtt_mock_entry: MqttMockHAClientGenerator,
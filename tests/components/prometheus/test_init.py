@@ -538,6 +538,40 @@ async def test_counter(client, counter_entities) -> None:
     )
 
 
+@pytest.mark.parametrize("namespace", [""])
+async def test_scrape_cache(hass: HomeAssistant, client, counter_entities) -> None:
+    """Test the entity metrics are only generated again after they changed."""
+    with mock.patch.object(
+        prometheus_client, "generate_latest", wraps=prometheus_client.generate_latest
+    ) as generate_latest:
+        body = await generate_latest_metrics(client)
+        assert "# HELP python_info Python platform information" in body
+        assert (
+            'counter_value{domain="counter",'
+            'entity="counter.counter",'
+            'friendly_name="None"} 2.0' in body
+        )
+        # Only the collectors of the process are generated again
+        body = await generate_latest_metrics(client)
+        assert generate_latest.call_count == 3
+        assert (
+            'counter_value{domain="counter",'
+            'entity="counter.counter",'
+            'friendly_name="None"} 2.0' in body
+        )
+
+        hass.states.async_set("counter.counter", 3)
+        await hass.async_block_till_done()
+        body = await generate_latest_metrics(client)
+        assert generate_latest.call_count == 5
+
+    assert (
+        'counter_value{domain="counter",'
+        'entity="counter.counter",'
+        'friendly_name="None"} 3.0' in body
+    )
+
+
 @pytest.mark.parametrize("namespace", [""])
 async def test_renaming_entity_name(
     hass: HomeAssistant,
@@ -0,0 +1,169 @@
+"""The tests for the recorder bulk writer."""
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant.components.recorder import CONF_BULK_WRITES, CONF_COMMIT_INTERVAL
+from homeassistant.components.recorder.db_schema import (
+    EventData,
+    Events,
+    EventTypes,
+    StateAttributes,
+    States,
+    StatesMeta,
+)
+from homeassistant.components.recorder.util import session_scope
+from homeassistant.core import Context, HomeAssistant
+
+from .common import async_wait_recording_done
+
+from tests.typing import RecorderInstanceGenerator
+
+
+async def _async_wait_committed(hass: HomeAssistant) -> None:
+    """Wait until the recorder processed and committed all events."""
+    await async_wait_recording_done(hass)
+    # The first commit may be triggered before the recorder
+    # processed the events when the commit interval is not zero
+    await async_wait_recording_done(hass)
+
+
+@pytest.mark.parametrize("commit_interval", [0, 1])
+@pytest.mark.parametrize("returning", [True, False])
+async def test_bulk_writes_states(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    hass: HomeAssistant,
+    commit_interval: int,
+    returning: bool,
+) -> None:
+    """Test states are written with their metadata, attributes and old state."""
+    instance = await async_setup_recorder_instance(
+        hass, {CONF_BULK_WRITES: True, CONF_COMMIT_INTERVAL: commit_interval}
+    )
+    context = Context(user_id="b36a6ab1e7f24e4e9a1fbe5bd1d0fa1b")
+
+    with patch.object(
+        instance.engine.dialect,
+        "insert_executemany_returning_sort_by_parameter_order",
+        returning,
+    ):
+        hass.states.async_set("test.one", "on", {"shared": True})
+        hass.states.async_set("test.two", "on", {"shared": True})
+        hass.states.async_set("test.one", "off", {"shared": True}, context=context)
+        hass.states.async_set("test.one", "on", {"unique": 1})
+        await _async_wait_committed(hass)
+        hass.states.async_set("test.one", "off", {"shared": True})
+        hass.states.async_remove("test.two")
+        await _async_wait_committed(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        metadata_ids = {
+            states_meta.entity_id: states_meta.metadata_id
+            for states_meta in session.query(StatesMeta)
+        }
+        assert set(metadata_ids) == {"test.one", "test.two"}
+        shared_attrs = {
+            attrs.shared_attrs: attrs.attributes_id
+            for attrs in session.query(StateAttributes)
+        }
+        assert set(shared_attrs) == {'{"shared":true}', '{"unique":1}', "{}"}
+
+        states = list(session.query(States).order_by(States.state_id))
+        assert [
+            (state.metadata_id, state.state, state.attributes_id, state.entity_id)
+            for state in states
+        ] == [
+            (metadata_ids["test.one"], "on", shared_attrs['{"shared":true}'], None),
+            (metadata_ids["test.two"], "on", shared_attrs['{"shared":true}'], None),
+            (metadata_ids["test.one"], "off", shared_attrs['{"shared":true}'], None),
+            (metadata_ids["test.one"], "on", shared_attrs['{"unique":1}'], None),
+            (metadata_ids["test.one"], "off", shared_attrs['{"shared":true}'], None),
+            (metadata_ids["test.two"], None, shared_attrs["{}"], None),
+        ]
+        assert [state.old_state_id for state in states] == [
+            None,
+            None,
+            states[0].state_id,
+            states[2].state_id,
+            states[3].state_id,
+            states[1].state_id,
+        ]
+        assert states[2].context_user_id_bin == bytes.fromhex(context.user_id)
+        assert states[0].last_updated_ts is not None
+
+
+async def test_bulk_writes_skips_removal_of_unknown_entity(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test removing an entity that was never recorded does not add metadata."""
+    await async_setup_recorder_instance(
+        hass, {CONF_BULK_WRITES: True, CONF_COMMIT_INTERVAL: 1}
+    )
+
+    hass.states.async_set("test.keep", "on")
+    await _async_wait_committed(hass)
+    hass.bus.async_fire(
+        "state_changed",
+        {"entity_id": "test.never", "old_state": None, "new_state": None},
+    )
+    hass.states.async_set("test.keep", "off")
+    await _async_wait_committed(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        assert [states_meta.entity_id for states_meta in session.query(StatesMeta)] == [
+            "test.keep"
+        ]
+        states = list(session.query(States).order_by(States.state_id))
+        assert [state.state for state in states] == ["on", "off"]
+        assert states[1].old_state_id == states[0].state_id
+
+
+@pytest.mark.parametrize("commit_interval", [0, 1])
+async def test_bulk_writes_events(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    hass: HomeAssistant,
+    commit_interval: int,
+) -> None:
+    """Test events are written with deduplicated event types and data."""
+    await async_setup_recorder_instance(
+        hass, {CONF_BULK_WRITES: True, CONF_COMMIT_INTERVAL: commit_interval}
+    )
+
+    for _ in range(3):
+        hass.bus.async_fire("bulk_event", {"de": "dupe"})
+    hass.bus.async_fire("bulk_event")
+    hass.bus.async_fire("other_bulk_event", {"de": "dupe"})
+    await _async_wait_committed(hass)
+    hass.bus.async_fire("bulk_event", {"de": "dupe"})
+    await _async_wait_committed(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        event_type_ids = {
+            event_types.event_type: event_types.event_type_id
+            for event_types in session.query(EventTypes).filter(
+                EventTypes.event_type.in_(("bulk_event", "other_bulk_event"))
+            )
+        }
+        data_ids = [
+            event_data.data_id
+            for event_data in session.query(EventData).filter(
+                EventData.shared_data == '{"de":"dupe"}'
+            )
+        ]
+        assert len(data_ids) == 1
+        events = list(
+            session.query(Events)
+            .filter(Events.event_type_id.in_(event_type_ids.values()))
+            .order_by(Events.event_id)
+        )
+        assert [(event.event_type_id, event.data_id) for event in events] == [
+            (event_type_ids["bulk_event"], data_ids[0]),
+            (event_type_ids["bulk_event"], data_ids[0]),
+            (event_type_ids["bulk_event"], data_ids[0]),
+            (event_type_ids["bulk_event"], None),
+            (event_type_ids["other_bulk_event"], data_ids[0]),
+            (event_type_ids["bulk_event"], data_ids[0]),
+        ]
+        assert all(event.time_fired_ts is not None for event in events)
@@ -735,6 +735,47 @@ async def test_get_significant_states_only_minimal_response(
     assert len(hist["sensor.test"]) == 3
 
 
+@pytest.mark.parametrize("start_offset", [0, 2])
+@pytest.mark.parametrize("significant_changes_only", [True, False])
+def test_get_significant_state_columns(
+    hass_recorder: Callable[..., HomeAssistant],
+    start_offset: int,
+    significant_changes_only: bool,
+) -> None:
+    """Test the columnar result matches the significant states."""
+    hass = hass_recorder()
+    zero, four, states = record_states(hass)
+    start = zero + timedelta(seconds=start_offset)
+    entity_ids = [*states, "sensor.never_recorded"]
+
+    with session_scope(hass=hass, read_only=True) as session:
+        hist = history.get_significant_states_with_session(
+            hass,
+            session,
+            start,
+            four,
+            entity_ids=entity_ids,
+            significant_changes_only=significant_changes_only,
+            no_attributes=True,
+        )
+        columns = history.get_significant_state_columns_with_session(
+            hass,
+            session,
+            start,
+            four,
+            entity_ids=entity_ids,
+            significant_changes_only=significant_changes_only,
+        )
+
+    assert set(columns) == set(entity_ids)
+    for entity_id in entity_ids:
+        expected = hist.get(entity_id, [])
+        assert columns[entity_id].states == [state.state for state in expected]
+        assert columns[entity_id].timestamps.tolist() == pytest.approx(
+            [state.last_updated.timestamp() for state in expected]
+        )
+
+
 def record_states(hass) -> tuple[datetime, datetime, dict[str, list[State]]]:
     """Record some test states.
 
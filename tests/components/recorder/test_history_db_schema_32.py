@@ -291,6 +291,32 @@ def test_get_significant_states(hass_recorder: Callable[..., HomeAssistant]) ->
         assert_dict_of_states_equal_without_context_and_last_changed(states, hist)
 
 
+def test_get_significant_state_columns(
+    hass_recorder: Callable[..., HomeAssistant]
+) -> None:
+    """Test the columnar result matches the significant states."""
+    hass = hass_recorder()
+    instance = recorder.get_instance(hass)
+    with patch.object(instance.states_meta_manager, "active", False):
+        zero, four, states = record_states(hass)
+        entity_ids = [*states, "sensor.never_recorded"]
+        with session_scope(hass=hass, read_only=True) as session:
+            hist = history.get_significant_states_with_session(
+                hass, session, zero, four, entity_ids=entity_ids, no_attributes=True
+            )
+            columns = history.get_significant_state_columns_with_session(
+                hass, session, zero, four, entity_ids=entity_ids
+            )
+
+    assert set(columns) == set(entity_ids)
+    for entity_id in entity_ids:
+        expected = hist.get(entity_id, [])
+        assert columns[entity_id].states == [state.state for state in expected]
+        assert columns[entity_id].timestamps.tolist() == pytest.approx(
+            [state.last_updated.timestamp() for state in expected]
+        )
+
+
 def test_get_significant_states_minimal_response(
     hass_recorder: Callable[..., HomeAssistant]
 ) -> None:
@@ -8,8 +8,12 @@ from sqlalchemy import select
 
 from homeassistant.components import recorder
 from homeassistant.components.recorder import Recorder, history, statistics
-from homeassistant.components.recorder.db_schema import StatisticsShortTerm
+from homeassistant.components.recorder.db_schema import (
+    StatisticsRollup,
+    StatisticsShortTerm,
+)
 from homeassistant.components.recorder.models import (
+    StatisticMetaData,
     datetime_to_timestamp_or_none,
     process_timestamp,
 )
@@ -29,6 +33,10 @@ from homeassistant.components.recorder.statistics import (
 from homeassistant.components.recorder.table_managers.statistics_meta import (
     _generate_get_metadata_stmt,
 )
+from homeassistant.components.recorder.tasks import (
+    RecorderTask,
+    StatisticsRollupBackfillTask,
+)
 from homeassistant.components.recorder.util import session_scope
 from homeassistant.components.sensor import UNIT_CONVERTERS
 from homeassistant.core import HomeAssistant, callback
@@ -38,6 +46,7 @@ import homeassistant.util.dt as dt_util
 
 from .common import (
     assert_dict_of_states_equal_without_context_and_last_changed,
+    async_recorder_block_till_done,
     async_wait_recording_done,
     do_adhoc_statistics,
     record_states,
@@ -46,7 +55,7 @@ from .common import (
 )
 
 from tests.common import mock_registry
-from tests.typing import WebSocketGenerator
+from tests.typing import RecorderInstanceGenerator, WebSocketGenerator
 
 ORIG_TZ = dt_util.DEFAULT_TIME_ZONE
 
@@ -1700,6 +1709,242 @@ def test_monthly_statistics_sum(
     dt_util.set_default_time_zone(dt_util.get_time_zone("UTC"))
 
 
+@pytest.mark.freeze_time("2021-08-01 00:00:00+00:00")
+def test_statistics_rollups(hass_recorder: Callable[..., HomeAssistant]) -> None:
+    """Test day, week and month statistics are read from the rollups."""
+    dt_util.set_default_time_zone(dt_util.get_time_zone("America/Regina"))
+
+    hass = hass_recorder()
+    instance = recorder.get_instance(hass)
+    wait_recording_done(hass)
+    assert instance.statistics_rollup_time_zone == "America/Regina"
+
+    start = dt_util.as_utc(dt_util.parse_datetime("2021-09-28 00:00:00"))
+    external_statistics = [
+        {
+            "start": start + timedelta(hours=hour),
+            "last_reset": None,
+            "mean": hour % 7,
+            "min": hour % 5 - 1,
+            "max": hour % 11,
+            "state": hour,
+            "sum": hour * 2,
+        }
+        for hour in range(24 * 10)
+    ]
+    external_metadata = {
+        "has_mean": True,
+        "has_sum": True,
+        "name": "Total imported energy",
+        "source": "test",
+        "statistic_id": "test:total_energy_import",
+        "unit_of_measurement": "kWh",
+    }
+    async_add_external_statistics(hass, external_metadata, external_statistics)
+    wait_recording_done(hass)
+
+    def _statistics_per_period() -> dict[str, dict[str, list[dict]]]:
+        return {
+            period: statistics_during_period(
+                hass,
+                start,
+                period=period,
+                statistic_ids={"test:total_energy_import"},
+                types={"change", "last_reset", "max", "mean", "min", "state", "sum"},
+            )
+            for period in ("day", "week", "month")
+        }
+
+    def _assert_rollups_match_hourly_statistics() -> None:
+        from_rollups = _statistics_per_period()
+        time_zone = instance.statistics_rollup_time_zone
+        instance.statistics_rollup_time_zone = None
+        assert _statistics_per_period() == from_rollups
+        instance.statistics_rollup_time_zone = time_zone
+
+    with session_scope(hass=hass, read_only=True) as session:
+        # 10 days in 2 weeks and 2 months
+        assert session.query(StatisticsRollup).count() == 14
+    stats = statistics_during_period(hass, start, period="month")
+    assert [
+        (row["start"], row["end"], row["sum"])
+        for row in stats["test:total_energy_import"]
+    ] == [
+        (
+            dt_util.as_utc(dt_util.parse_datetime("2021-09-01 00:00:00")).timestamp(),
+            dt_util.as_utc(dt_util.parse_datetime("2021-10-01 00:00:00")).timestamp(),
+            2 * (24 * 3 - 1),
+        ),
+        (
+            dt_util.as_utc(dt_util.parse_datetime("2021-10-01 00:00:00")).timestamp(),
+            dt_util.as_utc(dt_util.parse_datetime("2021-11-01 00:00:00")).timestamp(),
+            2 * (24 * 10 - 1),
+        ),
+    ]
+    _assert_rollups_match_hourly_statistics()
+
+    # Bounds within a period read the whole first and last periods
+    mid_day_start = start + timedelta(days=2, hours=7, minutes=30)
+    mid_day_end = start + timedelta(days=8, hours=15)
+    assert not statistics._is_statistics_rollup_boundary("day", mid_day_start)
+    for period in ("day", "week", "month"):
+        with patch.object(
+            statistics,
+            "_generate_statistics_rollup_during_period_stmt",
+            wraps=statistics._generate_statistics_rollup_during_period_stmt,
+        ) as rollup_stmt_mock:
+            from_rollups = statistics_during_period(
+                hass,
+                mid_day_start,
+                mid_day_end,
+                {"test:total_energy_import"},
+                period,
+                None,
+                {"change", "max", "mean", "min", "state", "sum"},
+            )
+        assert rollup_stmt_mock.call_count == 1
+        instance.statistics_rollup_time_zone = None
+        assert (
+            statistics_during_period(
+                hass,
+                mid_day_start,
+                mid_day_end,
+                {"test:total_energy_import"},
+                period,
+                None,
+                {"change", "max", "mean", "min", "state", "sum"},
+            )
+            == from_rollups
+        )
+        instance.statistics_rollup_time_zone = "America/Regina"
+        rows = from_rollups["test:total_energy_import"]
+        assert rows[0]["start"] <= mid_day_start.timestamp() < rows[0]["end"]
+        assert rows[-1]["start"] < mid_day_end.timestamp() <= rows[-1]["end"]
+
+    # Adjusting the sum updates the rollups
+    instance.async_adjust_statistics(
+        "test:total_energy_import", start + timedelta(days=4, hours=5), 100, "kWh"
+    )
+    wait_recording_done(hass)
+    _assert_rollups_match_hourly_statistics()
+
+    # The rollups are compiled again for a new time zone
+    dt_util.set_default_time_zone(dt_util.get_time_zone("Europe/Vienna"))
+    with patch.object(statistics, "STATISTICS_ROLLUP_BACKFILL_DAYS", 1), patch.object(
+        statistics,
+        "backfill_statistics_rollups",
+        wraps=statistics.backfill_statistics_rollups,
+    ) as backfill_mock:
+        instance.queue_task(StatisticsRollupBackfillTask())
+        for _ in range(20):
+            wait_recording_done(hass)
+            if instance.statistics_rollup_time_zone is not None:
+                break
+    assert instance.statistics_rollup_time_zone == "Europe/Vienna"
+    # The backfill is split in batches of a day
+    assert backfill_mock.call_count == 10
+    _assert_rollups_match_hourly_statistics()
+
+    dt_util.set_default_time_zone(dt_util.get_time_zone("UTC"))
+
+
+@pytest.mark.freeze_time("2021-08-01 00:00:00+00:00")
+async def test_statistics_rollups_fold_compiled_hours(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test compiled hours are folded into the rollups they are in."""
+    hass.config.set_time_zone("UTC")
+    instance = await async_setup_recorder_instance(hass)
+    await async_wait_recording_done(hass)
+    assert instance.statistics_rollup_time_zone == "UTC"
+
+    start = dt_util.as_utc(dt_util.parse_datetime("2021-09-30 20:00:00"))
+    metadata: StatisticMetaData = {
+        "has_mean": True,
+        "has_sum": True,
+        "name": None,
+        "source": "recorder",
+        "statistic_id": "sensor.total_energy_import",
+        "unit_of_measurement": "kWh",
+    }
+
+    def _add_short_term_statistics() -> None:
+        with session_scope(hass=hass) as session:
+            _, metadata_id = instance.statistics_meta_manager.update_or_add(
+                session, metadata, {}
+            )
+            session.add_all(
+                StatisticsShortTerm.from_stats(
+                    metadata_id,
+                    {
+                        "start": start + timedelta(minutes=minute),
+                        "last_reset": None,
+                        "mean": minute % 13,
+                        "min": minute % 7 - 3,
+                        "max": minute % 17,
+                        "state": minute,
+                        "sum": minute * 2,
+                    },
+                )
+                for minute in range(0, 8 * 60, 5)
+            )
+
+    def _compile_hourly_statistics() -> None:
+        for hour in range(8):
+            with session_scope(hass=hass) as session:
+                statistics._compile_hourly_statistics(
+                    session, start + timedelta(hours=hour)
+                )
+
+    def _count_rollups() -> int:
+        with session_scope(hass=hass, read_only=True) as session:
+            return session.query(StatisticsRollup).count()
+
+    def _statistics_per_period() -> dict[str, list[dict]]:
+        return {
+            period: statistics_during_period(
+                hass,
+                start,
+                period=period,
+                statistic_ids={"sensor.total_energy_import"},
+                types={"last_reset", "max", "mean", "min", "state", "sum"},
+            )["sensor.total_energy_import"]
+            for period in ("day", "week", "month")
+        }
+
+    class RunInRecorderThread(RecorderTask):
+        def __init__(self, target: Callable[[], None]) -> None:
+            self.target = target
+
+        def run(self, instance: Recorder) -> None:
+            self.target()
+
+    # The statistics metadata manager must only be written from the recorder thread
+    instance.queue_task(RunInRecorderThread(_add_short_term_statistics))
+    await async_recorder_block_till_done(hass)
+
+    # The rollups are not compiled from the hourly statistics again
+    with patch.object(
+        statistics, "_compile_statistics_rollups", side_effect=AssertionError
+    ):
+        instance.queue_task(RunInRecorderThread(_compile_hourly_statistics))
+        await async_recorder_block_till_done(hass)
+
+    # 8 hours in 2 days, 1 week and 2 months
+    assert await instance.async_add_executor_job(_count_rollups) == 5
+
+    from_rollups = await instance.async_add_executor_job(_statistics_per_period)
+    instance.statistics_rollup_time_zone = None
+    from_hourly_statistics = await instance.async_add_executor_job(
+        _statistics_per_period
+    )
+    instance.statistics_rollup_time_zone = "UTC"
+    assert from_rollups == {
+        period: [{**row, "mean": pytest.approx(row["mean"])} for row in rows]
+        for period, rows in from_hourly_statistics.items()
+    }
+
+
 def test_cache_key_for_generate_statistics_during_period_stmt() -> None:
     """Test cache key for _generate_statistics_during_period_stmt."""
     stmt = _generate_statistics_during_period_stmt(
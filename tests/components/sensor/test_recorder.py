@@ -32,7 +32,11 @@ from homeassistant.components.recorder.statistics import (
     list_statistic_ids,
 )
 from homeassistant.components.recorder.util import get_instance, session_scope
-from homeassistant.components.sensor import ATTR_OPTIONS, SensorDeviceClass
+from homeassistant.components.sensor import (
+    ATTR_OPTIONS,
+    SensorDeviceClass,
+    recorder as sensor_recorder,
+)
 from homeassistant.const import ATTR_FRIENDLY_NAME, STATE_UNAVAILABLE
 from homeassistant.core import HomeAssistant, State
 from homeassistant.setup import async_setup_component, setup_component
@@ -4006,6 +4010,98 @@ def test_compile_statistics_hourly_daily_monthly_summary(
     assert "Error while processing event StatisticsTask" not in caplog.text
 
 
+def test_compile_statistics_from_recent_states(
+    hass_recorder: Callable[..., HomeAssistant],
+) -> None:
+    """Test statistics compiled from the recorded state changes match the history."""
+    zero = dt_util.utcnow()
+    period_start = dt_util.as_utc(zero.replace(second=0, microsecond=0)) + timedelta(
+        minutes=5
+    )
+    period_end = period_start + timedelta(minutes=5)
+    hass = hass_recorder()
+    setup_component(hass, "sensor", {})
+    wait_recording_done(hass)  # Wait for the sensor recorder platform to be added
+    energy_attributes = {**ENERGY_SENSOR_ATTRIBUTES, "state_class": "total_increasing"}
+
+    with freeze_time(period_start - timedelta(minutes=2)) as freezer:
+        hass.states.set("sensor.energy", "10", energy_attributes)
+        hass.states.set("sensor.unchanged", "5", TEMPERATURE_SENSOR_ATTRIBUTES)
+        hass.states.set("sensor.temperature", "20", TEMPERATURE_SENSOR_ATTRIBUTES)
+        temperature_renamed = {
+            **TEMPERATURE_SENSOR_ATTRIBUTES,
+            "friendly_name": "Temperature",
+        }
+        for offset, temperature, temperature_attributes, energy in (
+            (timedelta(minutes=1), "21", TEMPERATURE_SENSOR_ATTRIBUTES, "12"),
+            (timedelta(minutes=3), "18", TEMPERATURE_SENSOR_ATTRIBUTES, "3"),
+            (timedelta(minutes=4), "25", TEMPERATURE_SENSOR_ATTRIBUTES, "7"),
+            # Attribute only changes are not significant for the mean
+            (timedelta(minutes=5), "25", temperature_renamed, "8"),
+            (timedelta(minutes=6, seconds=30), "19", temperature_renamed, "9"),
+            (timedelta(minutes=8), "30", temperature_renamed, "15"),
+        ):
+            freezer.move_to(period_start - timedelta(minutes=2) + offset)
+            hass.states.set("sensor.temperature", temperature, temperature_attributes)
+            hass.states.set("sensor.energy", energy, energy_attributes)
+    wait_recording_done(hass)
+
+    recent_states = hass.data[sensor_recorder.RECENT_STATES]
+    assert recent_states.covers(period_start)
+    assert not recent_states.covers(period_start - timedelta(minutes=5))
+    with patch.object(
+        history,
+        "get_full_significant_states_with_session",
+        wraps=history.get_full_significant_states_with_session,
+    ) as get_history, session_scope(hass=hass, read_only=True) as session:
+        from_recent_states = sensor_recorder._compile_statistics(
+            hass, session, period_start, period_end
+        )
+        assert get_history.call_count == 0
+        hass.data.pop(sensor_recorder.RECENT_STATES)
+        from_history = sensor_recorder._compile_statistics(
+            hass, session, period_start, period_end
+        )
+        assert get_history.call_count == 2
+
+    assert from_recent_states.platform_stats == from_history.platform_stats
+    assert {
+        result["meta"]["statistic_id"] for result in from_recent_states.platform_stats
+    } == {"sensor.energy", "sensor.temperature", "sensor.unchanged"}
+    # States before the start of the compiled period are forgotten, except
+    # the state at the start of the period which is kept in case of a retry
+    assert [state.state for state in recent_states.states["sensor.energy"]] == [
+        "12",
+        "3",
+        "7",
+        "8",
+        "9",
+        "15",
+    ]
+
+
+def test_recent_states_history_of_unfed_sensor() -> None:
+    """Test the history of a sensor the recorder did not feed yet is unknown."""
+    start = dt_util.utcnow()
+    recent_states = sensor_recorder.RecentStates(start)
+    period_start = start + timedelta(minutes=5)
+    period_end = period_start + timedelta(minutes=5)
+
+    state = State(
+        "sensor.test", "10", TEMPERATURE_SENSOR_ATTRIBUTES, last_updated=start
+    )
+    assert recent_states.history(state, period_start, period_end, True) == [state]
+
+    # The state changed after the period, but was not recorded yet
+    state = State(
+        "sensor.test",
+        "20",
+        TEMPERATURE_SENSOR_ATTRIBUTES,
+        last_updated=period_end + timedelta(seconds=1),
+    )
+    assert recent_states.history(state, period_start, period_end, True) is None
+
+
 def record_states(
     hass: HomeAssistant,
     freezer: FrozenDateTimeFactory,
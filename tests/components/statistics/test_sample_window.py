@@ -0,0 +1,133 @@
+"""Test the rolling sample window of the statistics sensor."""
+from datetime import datetime, timedelta
+import random
+import statistics
+
+import pytest
+
+from homeassistant.components.statistics.sample_window import (
+    SampleWindow,
+    _SortedValues,
+)
+from homeassistant.util import dt as dt_util
+
+
+def _assert_matches_samples(window: SampleWindow) -> None:
+    """Assert the maintained statistics match a recomputation."""
+    states = list(window.states)
+    ages = list(window.ages)
+    pairs = list(zip(zip(states, ages), zip(states[1:], ages[1:])))
+    assert window.sum == pytest.approx(sum(states))
+    assert window.mean == statistics.mean(states)
+    assert window.max == (max(states), ages[states.index(max(states))])
+    assert window.min == (min(states), ages[states.index(min(states))])
+    assert window.median == statistics.median(states)
+    assert window.area_step == pytest.approx(
+        sum(
+            value * (next_age - age).total_seconds()
+            for (value, age), (_, next_age) in pairs
+        )
+    )
+    assert window.area_linear == pytest.approx(
+        sum(
+            0.5 * (value + next_value) * (next_age - age).total_seconds()
+            for (value, age), (next_value, next_age) in pairs
+        )
+    )
+    assert window.sum_differences == pytest.approx(
+        sum(abs(next_value - value) for (value, _), (next_value, _) in pairs)
+    )
+    if len(states) >= 2:
+        assert window.variance == statistics.variance(states)
+        assert (
+            window.percentile(5)
+            == statistics.quantiles(states, n=100, method="exclusive")[4]
+        )
+        assert (
+            window.percentile(50)
+            == statistics.quantiles(states, n=100, method="exclusive")[49]
+        )
+
+
+def test_sample_window_rolling_statistics() -> None:
+    """Test statistics stay correct while samples are added and purged."""
+    rng = random.Random(42)
+    window = SampleWindow(25, track_extrema=True, track_order=True)
+    age: datetime = dt_util.utcnow()
+
+    for _ in range(200):
+        age += timedelta(seconds=rng.randint(1, 30))
+        window.append(rng.choice((round(rng.uniform(-50, 50), 1), 3.0)), age)
+        if rng.random() < 0.2:
+            window.popleft()
+        if window.states:
+            _assert_matches_samples(window)
+        assert len(window) <= 25
+
+
+def test_sorted_values_across_blocks() -> None:
+    """Test the sorted values stay ordered while blocks split and merge."""
+    rng = random.Random(7)
+    values = _SortedValues()
+    expected: list[float] = []
+
+    for step in range(6000):
+        # Grow the multiset first, then shrink it to exercise the merges
+        if expected and rng.random() < (0.3 if step < 3000 else 0.7):
+            value = rng.choice(expected)
+            values.remove(value)
+            expected.remove(value)
+        else:
+            value = float(rng.randint(-100, 100))
+            values.add(value)
+            expected.append(value)
+        if step % 97 == 0:
+            expected.sort()
+            assert len(values) == len(expected)
+            assert [values[index] for index in range(len(values))] == expected
+
+    with pytest.raises(IndexError):
+        values[len(expected)]
+
+
+def test_sample_window_binary_samples() -> None:
+    """Test binary samples are counted and integrated."""
+    window = SampleWindow(None)
+    age = dt_util.utcnow()
+
+    for offset, value in ((0, False), (10, True), (40, True), (50, False)):
+        window.append(value, age + timedelta(seconds=offset))
+
+    assert window.count_true == 2
+    assert window.area_step == 40
+
+    window.popleft()
+    window.popleft()
+    assert window.count_true == 1
+    assert window.area_step == 10
+
+    window.popleft()
+    window.popleft()
+    assert len(window) == 0
+    assert window.count_true == 0
+    assert window.area_step == 0
+
+
+@pytest.mark.parametrize(
+    ("value", "error"), ((float("nan"), ValueError), (float("inf"), OverflowError))
+)
+def test_sample_window_rejects_non_finite(value: float, error: type[Exception]) -> None:
+    """Test non-finite samples are rejected without changing the window."""
+    window = SampleWindow(2, track_extrema=True, track_order=True)
+    age = dt_util.utcnow()
+    window.append(1.0, age)
+    window.append(2.0, age + timedelta(seconds=1))
+
+    with pytest.raises(error):
+        window.append(value, age + timedelta(seconds=2))
+
+    assert list(window.states) == [1.0, 2.0]
+    _assert_matches_samples(window)
+    window.append(3.0, age + timedelta(seconds=3))
+    window.popleft()
+    assert list(window.states) == [3.0]
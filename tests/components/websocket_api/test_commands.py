@@ -16,10 +16,11 @@ from homeassistant.components.websocket_api.auth import (
     TYPE_AUTH_REQUIRED,
 )
 from homeassistant.components.websocket_api.const import FEATURE_COALESCE_MESSAGES, URL
-from homeassistant.const import SIGNAL_BOOTSTRAP_INTEGRATIONS
+from homeassistant.components.websocket_api.messages import construct_result_message
+from homeassistant.const import EVENT_STATE_CHANGED, SIGNAL_BOOTSTRAP_INTEGRATIONS
 from homeassistant.core import Context, HomeAssistant, State, callback
 from homeassistant.exceptions import HomeAssistantError
-from homeassistant.helpers import device_registry as dr, entity
+from homeassistant.helpers import device_registry as dr, entity, entity_platform
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.loader import async_get_integration
 from homeassistant.setup import DATA_SETUP_TIME, async_setup_component
@@ -540,6 +541,52 @@ async def test_get_states(hass: HomeAssistant, websocket_client) -> None:
     assert msg["result"] == states
 
 
+async def test_get_states_shares_snapshot(
+    hass: HomeAssistant, websocket_client
+) -> None:
+    """Test get_states reuses the serialized states while entities are subscribed."""
+    hass.states.async_set("greeting.hello", "world")
+    hass.states.async_set("greeting.bye", "universe")
+
+    await websocket_client.send_json({"id": 5, "type": "subscribe_entities"})
+    assert (await websocket_client.receive_json())["success"]
+    msg = await websocket_client.receive_json()
+    assert set(msg["event"]["a"]) == {"greeting.hello", "greeting.bye"}
+
+    payloads: list[str] = []
+
+    def _construct_result_message(iden: int, payload: str) -> str:
+        payloads.append(payload)
+        return construct_result_message(iden, payload)
+
+    async def _get_states(msg_id: int) -> list[dict]:
+        with patch(
+            "homeassistant.components.websocket_api.commands.construct_result_message",
+            _construct_result_message,
+        ):
+            await websocket_client.send_json({"id": msg_id, "type": "get_states"})
+            while (msg := await websocket_client.receive_json())["id"] != msg_id:
+                pass
+        assert msg["success"]
+        return msg["result"]
+
+    assert await _get_states(6) == [
+        state.as_dict() for state in hass.states.async_all()
+    ]
+    assert await _get_states(7) == [
+        state.as_dict() for state in hass.states.async_all()
+    ]
+    assert payloads[0] is payloads[1]
+
+    hass.states.async_set("greeting.hello", "there")
+    hass.states.async_remove("greeting.bye")
+    hass.states.async_set("greeting.new", "entity")
+    assert await _get_states(8) == [
+        state.as_dict() for state in hass.states.async_all()
+    ]
+    assert payloads[2] is not payloads[1]
+
+
 async def test_get_services(hass: HomeAssistant, websocket_client) -> None:
     """Test get_services command."""
     for id_ in (5, 6):
@@ -1093,6 +1140,59 @@ async def test_subscribe_unsubscribe_entities_specific_entities(
     }
 
 
+async def test_subscribe_entities_shares_one_listener(
+    hass: HomeAssistant, websocket_client
+) -> None:
+    """Test subscribe_entities subscriptions share one state_changed listener."""
+    hass.states.async_set("light.kitchen", "off")
+    hass.states.async_set("light.bedroom", "off")
+    init_count = hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0)
+
+    for msg_id, entity_ids in (
+        (5, None),
+        (6, ["light.kitchen"]),
+        (7, ["light.kitchen", "light.bedroom"]),
+    ):
+        command = {"id": msg_id, "type": "subscribe_entities"}
+        if entity_ids:
+            command["entity_ids"] = entity_ids
+        await websocket_client.send_json(command)
+        msg = await websocket_client.receive_json()
+        assert msg["id"] == msg_id
+        assert msg["success"]
+        msg = await websocket_client.receive_json()
+        assert msg["id"] == msg_id
+        assert set(msg["event"]["a"]) == set(
+            entity_ids or ["light.kitchen", "light.bedroom"]
+        )
+
+    assert hass.bus.async_listeners()[EVENT_STATE_CHANGED] == init_count + 1
+
+    hass.states.async_set("light.bedroom", "on")
+    hass.states.async_set("light.kitchen", "on")
+    received = []
+    for _ in range(5):
+        msg = await websocket_client.receive_json()
+        received.append((msg["id"], next(iter(msg["event"]["c"]))))
+    assert sorted(received) == [
+        (5, "light.bedroom"),
+        (5, "light.kitchen"),
+        (6, "light.kitchen"),
+        (7, "light.bedroom"),
+        (7, "light.kitchen"),
+    ]
+
+    for msg_id, subscription in ((8, 5), (9, 6), (10, 7)):
+        await websocket_client.send_json(
+            {"id": msg_id, "type": "unsubscribe_events", "subscription": subscription}
+        )
+        msg = await websocket_client.receive_json()
+        assert msg["id"] == msg_id
+        assert msg["success"]
+
+    assert hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0) == init_count
+
+
 async def test_render_template_renders_template(
     hass: HomeAssistant, websocket_client
 ) -> None:
@@ -1888,6 +1988,37 @@ async def test_integration_setup_info(
     ]
 
 
+async def test_integration_poll_info(
+    hass: HomeAssistant, websocket_client, hass_admin_user: MockUser
+) -> None:
+    """Test the polling statistics of the entity platforms."""
+    statistics = entity_platform.PollStatistics(overruns=1, skipped_polls=2)
+    statistics.record(0.5)
+    statistics.record(1.5)
+    with patch.object(
+        entity_platform,
+        "async_get_poll_statistics",
+        return_value={"sensor.command_line": statistics},
+    ):
+        await websocket_client.send_json({"id": 7, "type": "integration/poll_info"})
+        msg = await websocket_client.receive_json()
+
+    assert msg["id"] == 7
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+    assert msg["result"] == [
+        {
+            "platform": "sensor.command_line",
+            "polls": 2,
+            "overruns": 1,
+            "skipped_polls": 2,
+            "last_seconds": 1.5,
+            "max_seconds": 1.5,
+            "mean_seconds": 1.0,
+        }
+    ]
+
+
 @pytest.mark.parametrize(
     ("key", "config"),
     (
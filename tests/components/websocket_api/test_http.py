@@ -3,6 +3,7 @@ import asyncio
 from datetime import timedelta
 from typing import Any, cast
 from unittest.mock import patch
+import zlib
 
 from aiohttp import ServerDisconnectedError, WSMsgType, web
 import pytest
@@ -13,12 +14,21 @@ from homeassistant.components.websocket_api import (
     http,
     websocket_command,
 )
-from homeassistant.components.websocket_api.connection import ActiveConnection
+from homeassistant.components.websocket_api.connection import (
+    ActiveConnection,
+    TransferStatistics,
+)
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.setup import async_setup_component
 from homeassistant.util.dt import utcnow
+from homeassistant.util.json import json_loads
 
 from tests.common import async_fire_time_changed
-from tests.typing import MockHAClientWebSocket, WebSocketGenerator
+from tests.typing import (
+    ClientSessionGenerator,
+    MockHAClientWebSocket,
+    WebSocketGenerator,
+)
 
 
 @pytest.fixture
@@ -503,3 +513,153 @@ async def test_binary_message(
     assert "Received binary message for non-existing handler 0" in caplog.text
     assert "Received binary message for non-existing handler 3" in caplog.text
     assert "Received binary message for non-existing handler 10" in caplog.text
+
+
+def _register_large_message_command(
+    hass: HomeAssistant, statistics: list[TransferStatistics]
+) -> None:
+    """Register a command that sends a large and a small result."""
+
+    @callback
+    @websocket_command({"type": "large_message"})
+    def large_message(
+        hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+    ) -> None:
+        statistics.append(connection.transfer_statistics)
+        connection.send_result(msg["id"], {"data": "a" * 10000})
+        connection.send_result(msg["id"], {"data": "a"})
+
+    async_register_command(hass, large_message)
+
+
+async def test_permessage_deflate(
+    hass: HomeAssistant,
+    aiohttp_client: ClientSessionGenerator,
+    hass_access_token: str,
+    socket_enabled: None,
+) -> None:
+    """Test large messages are compressed when permessage-deflate is negotiated."""
+    statistics: list[TransferStatistics] = []
+    assert await async_setup_component(hass, "websocket_api", {})
+    _register_large_message_command(hass, statistics)
+    client = await aiohttp_client(hass.http.app)
+    websocket_client = await client.ws_connect(const.URL, compress=15)
+    assert (await websocket_client.receive_json())["type"] == "auth_required"
+    await websocket_client.send_json(
+        {"type": "auth", "access_token": hass_access_token}
+    )
+    assert (await websocket_client.receive_json())["type"] == "auth_ok"
+
+    await websocket_client.send_json({"id": 1, "type": "large_message"})
+    msg = await websocket_client.receive()
+    assert msg.type == WSMsgType.TEXT
+    assert msg.json()["result"] == {"data": "a" * 10000}
+    msg = await websocket_client.receive()
+    assert msg.type == WSMsgType.TEXT
+    assert msg.json()["result"] == {"data": "a"}
+
+    stats = statistics[0]
+    assert stats.messages == 4
+    assert stats.compressed_messages == 1
+    assert stats.payload_bytes > 10000
+    # The deflated frame is counted before compression
+    assert stats.bytes_sent == stats.payload_bytes
+    await websocket_client.close()
+
+
+async def test_binary_messages(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test large messages are sent compressed in binary frames when supported."""
+    statistics: list[TransferStatistics] = []
+    _register_large_message_command(hass, statistics)
+
+    await websocket_client.send_json({"id": 1, "type": "large_message"})
+    msg = await websocket_client.receive()
+    assert msg.type == WSMsgType.TEXT
+    assert msg.json()["result"] == {"data": "a" * 10000}
+    await websocket_client.receive_json()
+    assert statistics[0].compressed_messages == 0
+
+    await websocket_client.send_json(
+        {
+            "id": 2,
+            "type": "supported_features",
+            "features": {const.FEATURE_BINARY_MESSAGES: 1},
+        }
+    )
+    assert (await websocket_client.receive_json())["success"]
+
+    await websocket_client.send_json({"id": 3, "type": "large_message"})
+    msg = await websocket_client.receive()
+    assert msg.type == WSMsgType.BINARY
+    assert len(msg.data) < 1000
+    assert json_loads(zlib.decompress(msg.data))["result"] == {"data": "a" * 10000}
+    msg = await websocket_client.receive()
+    assert msg.type == WSMsgType.TEXT
+    assert msg.json()["result"] == {"data": "a"}
+    assert statistics[1].compressed_messages == 1
+    # The first large message was sent uncompressed, the second compressed
+    assert statistics[1].payload_bytes - statistics[1].bytes_sent > 9000
+
+
+async def test_frame_writer_supported(
+    hass: HomeAssistant,
+    aiohttp_client: ClientSessionGenerator,
+    socket_enabled: None,
+) -> None:
+    """Test the aiohttp frame writer still has the internals used for sending.
+
+    This fails when aiohttp changes them, so turning off the compression
+    of small messages can be updated.
+    """
+    frame_writers: list[Any] = []
+    get_frame_writer = http._async_get_frame_writer
+
+    def _get_frame_writer(wsock: web.WebSocketResponse) -> Any:
+        frame_writers.append(get_frame_writer(wsock))
+        return frame_writers[-1]
+
+    assert await async_setup_component(hass, "websocket_api", {})
+    client = await aiohttp_client(hass.http.app)
+    with patch.object(http, "_async_get_frame_writer", _get_frame_writer):
+        websocket_client = await client.ws_connect(const.URL)
+        assert (await websocket_client.receive_json())["type"] == "auth_required"
+
+    assert len(frame_writers) == 1
+    assert frame_writers[0] is not None
+    await websocket_client.close()
+
+
+async def test_frame_writer_not_supported(
+    hass: HomeAssistant,
+    aiohttp_client: ClientSessionGenerator,
+    hass_access_token: str,
+    socket_enabled: None,
+) -> None:
+    """Test messages are sent with the aiohttp defaults without the frame writer."""
+    statistics: list[TransferStatistics] = []
+    assert await async_setup_component(hass, "websocket_api", {})
+    _register_large_message_command(hass, statistics)
+    client = await aiohttp_client(hass.http.app)
+    with patch.object(http, "_async_get_frame_writer", return_value=None):
+        websocket_client = await client.ws_connect(const.URL, compress=15)
+        assert (await websocket_client.receive_json())["type"] == "auth_required"
+        await websocket_client.send_json(
+            {"type": "auth", "access_token": hass_access_token}
+        )
+        assert (await websocket_client.receive_json())["type"] == "auth_ok"
+
+        await websocket_client.send_json({"id": 1, "type": "large_message"})
+        msg = await websocket_client.receive()
+        assert msg.type == WSMsgType.TEXT
+        assert msg.json()["result"] == {"data": "a" * 10000}
+        msg = await websocket_client.receive()
+        assert msg.type == WSMsgType.TEXT
+        assert msg.json()["result"] == {"data": "a"}
+
+    stats = statistics[0]
+    assert stats.messages == 4
+    assert stats.compressed_messages == 1
+    assert stats.bytes_sent == stats.payload_bytes
+    await websocket_client.close()
@@ -205,6 +205,58 @@ async def test_active_zone_prefers_smaller_zone_if_same_distance_2(
     assert active.entity_id == "zone.smallest_zone"
 
 
+async def test_active_zone_follows_zone_changes(hass: HomeAssistant) -> None:
+    """Test the active zone is found after zones are moved and removed."""
+    assert await setup.async_setup_component(
+        hass,
+        zone.DOMAIN,
+        {
+            "zone": [
+                {
+                    "name": f"Zone {idx}",
+                    "latitude": 32 + idx / 10,
+                    "longitude": -117,
+                    "radius": 250,
+                }
+                for idx in range(50)
+            ]
+            + [
+                {
+                    "name": "Huge Zone",
+                    "latitude": 0,
+                    "longitude": 0,
+                    "radius": 20_000_000,
+                },
+            ]
+        },
+    )
+
+    assert zone.async_active_zone(hass, 33, -117).entity_id == "zone.zone_10"
+    assert zone.async_active_zone(hass, 33, -117.005, 500).entity_id == "zone.zone_10"
+    assert zone.async_active_zone(hass, 33.05, -117).entity_id == "zone.huge_zone"
+    assert zone.async_active_zone(hass, 10, -170).entity_id == "zone.huge_zone"
+
+    hass.states.async_set(
+        "zone.zone_10",
+        "0",
+        {"latitude": -33, "longitude": 179.999, "radius": 250},
+    )
+    assert zone.async_active_zone(hass, 33, -117).entity_id == "zone.huge_zone"
+    assert zone.async_active_zone(hass, -33, -179.999).entity_id == "zone.zone_10"
+
+    hass.states.async_set(
+        "zone.zone_10",
+        "0",
+        {"latitude": -33, "longitude": 179.999, "radius": 250, "passive": True},
+    )
+    assert zone.async_active_zone(hass, -33, -179.999).entity_id == "zone.huge_zone"
+
+    hass.states.async_remove("zone.huge_zone")
+    assert zone.async_active_zone(hass, -33, -179.999) is None
+    assert zone.async_active_zone(hass, 32.5, -117).entity_id == "zone.zone_5"
+    assert zone.async_active_zone(hass, 89.9, 0, 100_000) is None
+
+
 async def test_in_zone_works_for_passive_zones(hass: HomeAssistant) -> None:
     """Test working in passive zones."""
     latitude = 32.880600
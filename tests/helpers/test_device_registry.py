@@ -709,6 +709,57 @@ async def test_removing_area_id(
     assert entry_w_area != entry_wo_area
 
 
+async def test_entries_for_area_and_config_entry(
+    hass: HomeAssistant, device_registry: dr.DeviceRegistry
+) -> None:
+    """Test devices are looked up by area and config entry as they change."""
+    config_entry_1 = MockConfigEntry()
+    config_entry_1.add_to_hass(hass)
+    config_entry_2 = MockConfigEntry()
+    config_entry_2.add_to_hass(hass)
+
+    entry1 = device_registry.async_get_or_create(
+        config_entry_id=config_entry_1.entry_id,
+        identifiers={("bridgeid", "0123")},
+    )
+    entry2 = device_registry.async_get_or_create(
+        config_entry_id=config_entry_1.entry_id,
+        identifiers={("bridgeid", "4567")},
+    )
+    entry1 = device_registry.async_update_device(entry1.id, area_id="kitchen")
+    entry2 = device_registry.async_get_or_create(
+        config_entry_id=config_entry_2.entry_id,
+        identifiers={("bridgeid", "4567")},
+    )
+
+    assert dr.async_entries_for_area(device_registry, "kitchen") == [entry1]
+    assert dr.async_entries_for_config_entry(
+        device_registry, config_entry_1.entry_id
+    ) == [entry1, entry2]
+    assert dr.async_entries_for_config_entry(
+        device_registry, config_entry_2.entry_id
+    ) == [entry2]
+
+    entry2 = device_registry.async_update_device(
+        entry2.id, area_id="kitchen", remove_config_entry_id=config_entry_1.entry_id
+    )
+    assert dr.async_entries_for_area(device_registry, "kitchen") == [entry1, entry2]
+    assert dr.async_entries_for_config_entry(
+        device_registry, config_entry_1.entry_id
+    ) == [entry1]
+
+    device_registry.async_clear_area_id("kitchen")
+    device_registry.async_remove_device(entry1.id)
+    assert dr.async_entries_for_area(device_registry, "kitchen") == []
+    assert (
+        dr.async_entries_for_config_entry(device_registry, config_entry_1.entry_id)
+        == []
+    )
+    assert dr.async_entries_for_config_entry(
+        device_registry, config_entry_2.entry_id
+    ) == [device_registry.async_get(entry2.id)]
+
+
 async def test_specifying_via_device_create(
     hass: HomeAssistant, device_registry: dr.DeviceRegistry
 ) -> None:
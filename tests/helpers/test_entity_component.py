@@ -115,11 +115,10 @@ async def test_setup_does_discovery(
     assert ("platform_test", {}, {"msg": "discovery_info"}) == mock_setup.call_args[0]
 
 
-@patch("homeassistant.helpers.entity_platform.async_track_time_interval")
-async def test_set_scan_interval_via_config(
-    mock_track: Mock, hass: HomeAssistant
-) -> None:
+async def test_set_scan_interval_via_config(hass: HomeAssistant) -> None:
     """Test the setting of the scan interval via configuration."""
+    entity = MockEntity(should_poll=True)
+    entity.async_update = AsyncMock()
 
     def platform_setup(
         hass: HomeAssistant,
@@ -128,7 +127,7 @@ async def test_set_scan_interval_via_config(
         discovery_info: DiscoveryInfoType | None = None,
     ) -> None:
         """Test the platform setup."""
-        add_entities([MockEntity(should_poll=True)])
+        add_entities([entity])
 
     mock_entity_platform(hass, "test_domain.platform", MockPlatform(platform_setup))
 
@@ -139,8 +138,14 @@ async def test_set_scan_interval_via_config(
     )
 
     await hass.async_block_till_done()
-    assert mock_track.called
-    assert timedelta(seconds=30) == mock_track.call_args[0][2]
+    assert entity.platform.scan_interval == timedelta(seconds=30)
+    # The entity is polled once every interval
+    for polls in (1, 2):
+        async_fire_time_changed(
+            hass, dt_util.utcnow() + timedelta(seconds=30 * polls + 1)
+        )
+        await hass.async_block_till_done()
+        assert entity.async_update.call_count == polls
 
 
 async def test_set_entity_namespace_via_config(hass: HomeAssistant) -> None:
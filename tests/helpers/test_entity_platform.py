@@ -3,8 +3,10 @@ import asyncio
 from collections.abc import Iterable
 from datetime import timedelta
 import logging
+import threading
+import time
 from typing import Any
-from unittest.mock import ANY, Mock, patch
+from unittest.mock import ANY, AsyncMock, Mock, patch
 
 import pytest
 
@@ -36,6 +38,7 @@ from tests.common import (
     MockEntityPlatform,
     MockPlatform,
     async_fire_time_changed,
+    async_fire_time_changed_exact,
     mock_entity_platform,
     mock_registry,
 )
@@ -77,7 +80,7 @@ async def test_polling_disabled_by_config_entry(hass: HomeAssistant) -> None:
     poll_ent = MockEntity(should_poll=True)
 
     await entity_platform.async_add_entities([poll_ent])
-    assert entity_platform._async_unsub_polling is None
+    assert not entity_platform._poll_slots.running
 
 
 async def test_polling_updates_entities_with_exception(hass: HomeAssistant) -> None:
@@ -170,11 +173,10 @@ async def test_update_state_adds_entities_with_update_before_add_false(
     assert not ent.update.called
 
 
-@patch("homeassistant.helpers.entity_platform.async_track_time_interval")
-async def test_set_scan_interval_via_platform(
-    mock_track: Mock, hass: HomeAssistant
-) -> None:
+async def test_set_scan_interval_via_platform(hass: HomeAssistant) -> None:
     """Test the setting of the scan interval via platform."""
+    entity = MockEntity(should_poll=True)
+    entity.async_update = AsyncMock()
 
     def platform_setup(
         hass: HomeAssistant,
@@ -183,7 +185,7 @@ async def test_set_scan_interval_via_platform(
         discovery_info: DiscoveryInfoType | None = None,
     ) -> None:
         """Test the platform setup."""
-        add_entities([MockEntity(should_poll=True)])
+        add_entities([entity])
 
     platform = MockPlatform(platform_setup)
     platform.SCAN_INTERVAL = timedelta(seconds=30)
@@ -195,8 +197,14 @@ async def test_set_scan_interval_via_platform(
     component.setup({DOMAIN: {"platform": "platform"}})
 
     await hass.async_block_till_done()
-    assert mock_track.called
-    assert timedelta(seconds=30) == mock_track.call_args[0][2]
+    assert entity.platform.scan_interval == timedelta(seconds=30)
+    # The entity is polled once every interval
+    for polls in (1, 2):
+        async_fire_time_changed(
+            hass, dt_util.utcnow() + timedelta(seconds=30 * polls + 1)
+        )
+        await hass.async_block_till_done()
+        assert entity.async_update.call_count == polls
 
 
 async def test_adding_entities_with_generator_and_thread_callback(
@@ -462,7 +470,8 @@ async def test_parallel_updates_async_platform_updates_in_parallel(
 
     assert handle._update_in_sequence is False
 
-    await handle._update_entity_states(dt_util.utcnow())
+    async_fire_time_changed(hass, dt_util.utcnow() + handle.scan_interval)
+    await hass.async_block_till_done()
     assert peak_update_count > 1
 
 
@@ -512,10 +521,258 @@ async def test_parallel_updates_sync_platform_updates_in_sequence(
 
     assert handle._update_in_sequence is True
 
-    await handle._update_entity_states(dt_util.utcnow())
+    async_fire_time_changed(hass, dt_util.utcnow() + handle.scan_interval)
+    await hass.async_block_till_done()
     assert peak_update_count == 1
 
 
+async def test_polling_backs_off_slow_entities(hass: HomeAssistant) -> None:
+    """Test slow polling entities are skipped and polling statistics are kept."""
+    platform = MockPlatform()
+
+    mock_entity_platform(hass, "test_domain.async_platform", platform)
+
+    component = EntityComponent(_LOGGER, DOMAIN, hass)
+    component._platforms = {}
+
+    await component.async_setup({DOMAIN: {"platform": "async_platform"}})
+    await hass.async_block_till_done()
+
+    handle = list(component._platforms.values())[-1]
+    updates: dict[str, int] = {"fast": 0, "slow": 0}
+
+    class AsyncEntity(MockEntity):
+        """Mock entity that has async_update."""
+
+        slow = False
+
+        async def async_update(self):
+            updates[self.name] += 1
+            if self.slow:
+                await asyncio.sleep(0.02)
+
+        async def async_device_update(self, warning: bool = True) -> None:
+            await super().async_device_update(warning)
+            if self.slow:
+                # Took longer than the scan interval
+                self.update_duration = 20
+
+    fast = AsyncEntity(name="fast")
+    slow = AsyncEntity(name="slow")
+    slow.slow = True
+    await handle.async_add_entities([fast, slow])
+    now = dt_util.utcnow()
+
+    async def poll_all(times: int) -> None:
+        nonlocal now
+        for _ in range(times):
+            now += handle.scan_interval
+            async_fire_time_changed(hass, now)
+            await hass.async_block_till_done()
+
+    await poll_all(4)
+    # Polled, skipped once, polled and skipped twice after the second overrun
+    assert updates == {"fast": 4, "slow": 2}
+
+    slow.slow = False
+    await poll_all(3)
+    assert updates == {"fast": 7, "slow": 4}
+
+    poll_statistics = entity_platform.async_get_poll_statistics(hass)
+    assert poll_statistics == {"test_domain.async_platform": handle.poll_statistics}
+    assert handle.poll_statistics.polls == 7
+    assert handle.poll_statistics.skipped_polls == 3
+    assert handle.poll_statistics.overruns == 0
+    assert handle.poll_statistics.max_duration >= 0.02
+    assert (
+        0 < handle.poll_statistics.mean_duration < handle.poll_statistics.max_duration
+    )
+
+
+async def test_polling_caps_executor_updates(hass: HomeAssistant) -> None:
+    """Test polling entities with a sync update share a limited executor."""
+    platform = MockPlatform()
+    platform.PARALLEL_UPDATES = 0
+
+    mock_entity_platform(hass, "test_domain.platform", platform)
+
+    component = EntityComponent(_LOGGER, DOMAIN, hass)
+    component._platforms = {}
+
+    await component.async_setup({DOMAIN: {"platform": "platform"}})
+    await hass.async_block_till_done()
+
+    handle = list(component._platforms.values())[-1]
+    lock = threading.Lock()
+    updating = 0
+    peak_update_count = 0
+
+    class SyncEntity(MockEntity):
+        """Mock entity that has update."""
+
+        def update(self):
+            nonlocal updating, peak_update_count
+            with lock:
+                updating += 1
+                peak_update_count = max(updating, peak_update_count)
+            time.sleep(0.01)
+            with lock:
+                updating -= 1
+
+    entities = [SyncEntity() for _ in range(5)]
+    await handle.async_add_entities(entities)
+    assert handle._update_in_sequence is False
+
+    with patch.object(entity_platform, "MAX_PARALLEL_EXECUTOR_POLLS", 2):
+        async_fire_time_changed(hass, dt_util.utcnow() + handle.scan_interval)
+        await hass.async_block_till_done()
+    assert peak_update_count == 2
+    assert all(entity.update_duration >= 0.01 for entity in entities)
+    assert entity_platform.executor_update_limit.get() is None
+
+
+async def test_polling_spreads_entities(hass: HomeAssistant) -> None:
+    """Test polling entities are spread across the scan interval."""
+    platform = MockPlatform()
+
+    mock_entity_platform(hass, "test_domain.async_platform", platform)
+
+    component = EntityComponent(_LOGGER, DOMAIN, hass)
+    component._platforms = {}
+
+    await component.async_setup({DOMAIN: {"platform": "async_platform"}})
+    await hass.async_block_till_done()
+
+    handle = list(component._platforms.values())[-1]
+    polled: list[str] = []
+
+    class AsyncEntity(MockEntity):
+        """Mock entity that has async_update."""
+
+        async def async_update(self):
+            polled.append(self.entity_id)
+
+    entities = [AsyncEntity(name=f"entity {i}") for i in range(10)]
+    timers = len(hass.timer_wheel)
+    await handle.async_add_entities(entities)
+
+    # One coarse timer polls all entities of the platform
+    assert len(hass.timer_wheel) == timers + 1
+    slots = round(handle.scan_interval.total_seconds())
+    entity_slots = {
+        entity_platform._poll_slot(entity.entity_id, slots): entity
+        for entity in entities
+    }
+    assert len(handle._poll_slots) == 10
+    assert all(0 <= slot < slots for slot in entity_slots)
+    assert len(entity_slots) > 1
+    # The slots do not change between starts
+    assert entity_platform._poll_slot("light.kitchen", 30) == 19
+
+    # Polling the entities of the first slots does not poll the others,
+    # the coarse timer runs up to a second late
+    first_slot = min(entity_slots)
+    async_fire_time_changed_exact(
+        hass, dt_util.utcnow() + timedelta(seconds=first_slot + 2.5)
+    )
+    await hass.async_block_till_done()
+    assert polled == [
+        entity.entity_id
+        for entity in entities
+        if entity_platform._poll_slot(entity.entity_id, slots) <= first_slot + 1
+    ]
+    assert len(polled) < 10
+
+    await entities[0].async_remove()
+    assert entities[0] not in handle._poll_slots
+    assert len(handle._poll_slots) == 9
+
+    # Every entity is polled once per interval
+    polled.clear()
+    async_fire_time_changed_exact(
+        hass,
+        dt_util.utcnow() + handle.scan_interval + timedelta(seconds=first_slot + 2.5),
+    )
+    await hass.async_block_till_done()
+    assert sorted(polled) == sorted(entity.entity_id for entity in entities[1:])
+
+    handle.async_unsub_polling()
+    assert not handle._poll_slots
+    assert not handle._poll_slots.running
+    assert len(hass.timer_wheel) == timers
+
+
+async def test_polling_reads_should_poll_every_interval(hass: HomeAssistant) -> None:
+    """Test entities are polled while they should poll."""
+    component = EntityComponent(_LOGGER, DOMAIN, hass, timedelta(seconds=20))
+    await component.async_setup({})
+
+    push_ent = MockEntity(should_poll=False)
+    push_ent.async_update = AsyncMock()
+    poll_ent = MockEntity(should_poll=True)
+    poll_ent.async_update = AsyncMock()
+    await component.async_add_entities([push_ent, poll_ent])
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=21))
+    await hass.async_block_till_done()
+    assert push_ent.async_update.call_count == 0
+    assert poll_ent.async_update.call_count == 1
+
+    push_ent._values["should_poll"] = True
+    poll_ent._values["should_poll"] = False
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=41))
+    await hass.async_block_till_done()
+    assert push_ent.async_update.call_count == 1
+    assert poll_ent.async_update.call_count == 1
+
+
+async def test_polling_overrun_skips_only_the_slow_entity(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test an entity still updating is skipped while others are polled."""
+    platform = MockPlatform()
+
+    mock_entity_platform(hass, "test_domain.async_platform", platform)
+
+    component = EntityComponent(_LOGGER, DOMAIN, hass)
+    component._platforms = {}
+
+    await component.async_setup({DOMAIN: {"platform": "async_platform"}})
+    await hass.async_block_till_done()
+
+    handle = list(component._platforms.values())[-1]
+    updates: dict[str, int] = {"fast": 0, "slow": 0}
+    release = asyncio.Event()
+
+    class AsyncEntity(MockEntity):
+        """Mock entity that has async_update."""
+
+        async def async_update(self):
+            updates[self.name] += 1
+            if self.name == "slow":
+                await release.wait()
+
+    fast = AsyncEntity(name="fast")
+    slow = AsyncEntity(name="slow")
+    await handle.async_add_entities([fast, slow])
+
+    async_fire_time_changed(hass, dt_util.utcnow() + handle.scan_interval)
+    for _ in range(10):
+        await asyncio.sleep(0)
+    assert updates == {"fast": 1, "slow": 1}
+    async_fire_time_changed(hass, dt_util.utcnow() + handle.scan_interval * 2)
+    release.set()
+    await hass.async_block_till_done()
+
+    assert updates == {"fast": 2, "slow": 1}
+    assert handle.poll_statistics.overruns == 1
+    assert (
+        f"Updating {slow.entity_id} took longer than the scheduled update interval"
+        in caplog.text
+    )
+    assert f"Updating {fast.entity_id} took longer" not in caplog.text
+
+
 async def test_raise_error_on_update(hass: HomeAssistant) -> None:
     """Test the add entity if they raise an error on update."""
     updates = []
@@ -964,7 +1221,7 @@ async def test_stop_shutdown_cancels_retry_setup_and_interval_listener(
     await ent_platform.async_shutdown()
 
     assert len(mock_call_later.return_value.mock_calls) == 1
-    assert ent_platform._async_unsub_polling is None
+    assert not ent_platform._poll_slots.running
     assert ent_platform._async_cancel_retry_setup is None
 
 
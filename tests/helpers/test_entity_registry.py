@@ -1475,6 +1475,51 @@ def test_entity_registry_items() -> None:
     assert entities.get_entry(entry2.id) is None
 
 
+def test_entity_registry_items_secondary_indexes() -> None:
+    """Test the device, area and config entry indexes follow mutations."""
+    entities = er.EntityRegistryItems()
+    entry1 = er.RegistryEntry(
+        "test.entity1",
+        "1234",
+        "hue",
+        area_id="kitchen",
+        config_entry_id="config1",
+        device_id="device1",
+    )
+    entry2 = er.RegistryEntry(
+        "test.entity2",
+        "2345",
+        "hue",
+        config_entry_id="config1",
+        device_id="device1",
+        disabled_by=er.RegistryEntryDisabler.USER,
+    )
+    entities["test.entity1"] = entry1
+    entities["test.entity2"] = entry2
+
+    assert entities.get_entries_for_device_id("device1") == [entry1]
+    assert entities.get_entries_for_device_id("device1", True) == [entry1, entry2]
+    assert entities.get_entries_for_area_id("kitchen") == [entry1]
+    assert entities.get_entries_for_config_entry_id("config1") == [entry1, entry2]
+
+    # Updating an entry without changing the indexed values keeps the order
+    entry1 = entities["test.entity1"] = attr.evolve(entry1, name="Renamed")
+    assert entities.get_entries_for_config_entry_id("config1") == [entry1, entry2]
+
+    entry1 = entities["test.entity1"] = attr.evolve(
+        entry1, area_id="bedroom", device_id=None
+    )
+    assert entities.get_entries_for_area_id("kitchen") == []
+    assert entities.get_entries_for_area_id("bedroom") == [entry1]
+    assert entities.get_entries_for_device_id("device1", True) == [entry2]
+
+    del entities["test.entity2"]
+    assert entities.get_entries_for_device_id("device1", True) == []
+    assert entities.get_entries_for_config_entry_id("config1") == [entry1]
+    assert entities._device_id_index == {}
+    assert entities._area_id_index == {"bedroom": {"test.entity1": True}}
+
+
 async def test_disabled_by_str_not_allowed(hass: HomeAssistant) -> None:
     """Test we need to pass disabled by type."""
     reg = er.async_get(hass)
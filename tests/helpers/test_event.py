@@ -4,6 +4,7 @@ import asyncio
 from collections.abc import Callable
 import contextlib
 from datetime import date, datetime, timedelta
+from typing import Any
 from unittest.mock import patch
 
 from astral import LocationInfo
@@ -13,7 +14,7 @@ from freezegun.api import FrozenDateTimeFactory
 import jinja2
 import pytest
 
-from homeassistant.const import MATCH_ALL
+from homeassistant.const import EVENT_STATE_CHANGED, MATCH_ALL
 import homeassistant.core as ha
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import TemplateError
@@ -429,6 +430,106 @@ async def test_async_track_state_change_filtered(hass: HomeAssistant) -> None:
     track_throws.async_remove()
 
 
+async def test_async_track_state_change_filtered_shares_listener(
+    hass: HomeAssistant,
+) -> None:
+    """Test filtered trackers share one listener and are called once per change."""
+    calls: dict[int, list[str]] = {}
+    start_listeners = hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0)
+
+    def _track(index: int, track_states: TrackStates):
+        calls[index] = []
+
+        @ha.callback
+        def _callback(event: EventType[EventStateChangedData]) -> None:
+            calls[index].append(event.data["entity_id"])
+
+        return async_track_state_change_filtered(hass, track_states, _callback)
+
+    trackers = [
+        _track(0, TrackStates(False, {"light.bowl"}, None)),
+        _track(1, TrackStates(False, {"light.bowl"}, {"light"})),
+        _track(2, TrackStates(False, set(), {"switch"})),
+        _track(3, TrackStates(True, set(), set())),
+    ]
+    assert hass.bus.async_listeners()[EVENT_STATE_CHANGED] == start_listeners + 1
+
+    hass.states.async_set("light.bowl", "on")
+    hass.states.async_set("light.kitchen", "on")
+    hass.states.async_set("switch.kitchen", "on")
+    await hass.async_block_till_done()
+    assert calls == {
+        0: ["light.bowl"],
+        1: ["light.bowl", "light.kitchen"],
+        2: ["switch.kitchen"],
+        3: ["light.bowl", "light.kitchen", "switch.kitchen"],
+    }
+
+    trackers[1].async_update_listeners(TrackStates(False, {"switch.kitchen"}, None))
+    trackers[3].async_remove()
+    hass.states.async_set("light.kitchen", "off")
+    hass.states.async_set("switch.kitchen", "off")
+    await hass.async_block_till_done()
+    assert calls[1][2:] == ["switch.kitchen"]
+    assert calls[2][1:] == ["switch.kitchen"]
+    assert calls[3][3:] == []
+
+    for tracker in trackers:
+        tracker.async_remove()
+    assert hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0) == start_listeners
+
+
+async def test_async_track_state_change_filtered_trackers_at_fire_time(
+    hass: HomeAssistant,
+) -> None:
+    """Test state changes only reach the trackers set up when they fired."""
+    calls: list[str] = []
+    trackers: dict[str, Any] = {}
+
+    def _track(name: str, action: Callable[[EventType[EventStateChangedData]], None]):
+        trackers[name] = async_track_state_change_filtered(
+            hass, TrackStates(False, {"light.bowl"}, None), action
+        )
+
+    @ha.callback
+    def _remove_other(event: EventType[EventStateChangedData]) -> None:
+        calls.append("remove_other")
+        trackers["removed"].async_remove()
+
+    @ha.callback
+    def _removed(event: EventType[EventStateChangedData]) -> None:
+        calls.append("removed")
+
+    @ha.callback
+    def _late(event: EventType[EventStateChangedData]) -> None:
+        calls.append("late")
+
+    template_runs: list[str] = []
+    info = async_track_template_result(
+        hass,
+        [TrackTemplate(Template("{{ states('light.bowl') }}", hass), None)],
+        lambda event, updates: template_runs.append(updates[0].result),
+    )
+    _track("remove_other", _remove_other)
+    _track("removed", _removed)
+
+    hass.states.async_set("light.bowl", "on")
+    # Set up after the state change fired
+    _track("late", _late)
+    # Removed before the template tracker is dispatched
+    info.async_remove()
+    await hass.async_block_till_done()
+    assert calls == ["remove_other"]
+    assert template_runs == []
+
+    hass.states.async_set("light.bowl", "off")
+    await hass.async_block_till_done()
+    assert calls == ["remove_other", "remove_other", "late"]
+
+    trackers["remove_other"].async_remove()
+    trackers["late"].async_remove()
+
+
 async def test_async_track_state_change_event(hass: HomeAssistant) -> None:
     """Test async_track_state_change_event."""
     single_entity_id_tracker = []
@@ -2950,6 +3051,60 @@ async def test_specifically_referenced_entity_is_not_rate_limited(
     info.async_remove()
 
 
+async def test_track_template_result_coalesces_refreshes(
+    hass: HomeAssistant,
+) -> None:
+    """Test state changes of one iteration refresh a template once."""
+    hass.states.async_set("sensor.one", "none")
+
+    template_refresh = Template('{{ states | count }}_{{ states("sensor.one") }}', hass)
+
+    refresh_runs = []
+
+    @ha.callback
+    def refresh_listener(
+        event: EventType[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        refresh_runs.append((event and event.data["entity_id"], updates.pop().result))
+
+    info = async_track_template_result(
+        hass,
+        [TrackTemplate(template_refresh, None, timedelta(seconds=5))],
+        refresh_listener,
+    )
+    await hass.async_block_till_done()
+    info.async_refresh()
+    await hass.async_block_till_done()
+    assert refresh_runs == [(None, "1_none")]
+
+    # The rate limited sensor.two and sensor.three are coalesced with the
+    # specifically referenced sensor.one, which triggers the refresh
+    with patch.object(
+        info, "_refresh", wraps=info._refresh  # pylint: disable=protected-access
+    ) as refresh:
+        hass.states.async_set("sensor.one", "any")
+        hass.states.async_set("sensor.two", "any")
+        hass.states.async_set("sensor.three", "any")
+        await hass.async_block_till_done()
+    assert refresh.call_count == 1
+    assert refresh_runs == [(None, "1_none"), ("sensor.one", "3_any")]
+
+    # Only rate limited state changes, the last of them is replayed
+    hass.states.async_set("sensor.two", "none")
+    hass.states.async_set("sensor.four", "any")
+    await hass.async_block_till_done()
+    assert len(refresh_runs) == 2
+    next_time = dt_util.utcnow() + timedelta(seconds=5)
+    with patch(
+        "homeassistant.helpers.ratelimit.dt_util.utcnow", return_value=next_time
+    ):
+        async_fire_time_changed(hass, next_time)
+        await hass.async_block_till_done()
+    assert refresh_runs[2:] == [("sensor.four", "4_any")]
+    info.async_remove()
+
+
 async def test_track_two_templates_with_different_rate_limits(
     hass: HomeAssistant,
 ) -> None:
@@ -4408,6 +4563,33 @@ async def test_async_call_later_timedelta(hass: HomeAssistant) -> None:
     remove()
 
 
+async def test_async_call_later_coarse(hass: HomeAssistant) -> None:
+    """Test calling actions later from the timer wheel."""
+    calls: list[str] = []
+    schedule_utctime = dt_util.utcnow()
+
+    remove_soon = async_call_later(hass, 5, lambda _: calls.append("soon"), coarse=True)
+    remove_cancelled = async_call_later(
+        hass, 5, lambda _: calls.append("cancelled"), coarse=True
+    )
+    remove_later = async_call_later(
+        hass, 30, lambda _: calls.append("later"), coarse=True
+    )
+    assert len(hass.timer_wheel) == 3
+    remove_cancelled()
+
+    async_fire_time_changed(hass, schedule_utctime + timedelta(seconds=6))
+    await hass.async_block_till_done()
+    assert calls == ["soon"]
+    assert len(hass.timer_wheel) == 1
+
+    remove_soon()
+    remove_later()
+    assert len(hass.timer_wheel) == 0
+    await hass.async_block_till_done()
+    assert calls == ["soon"]
+
+
 async def test_async_call_later_cancel(hass: HomeAssistant) -> None:
     """Test canceling a call_later action."""
     future = asyncio.get_running_loop().create_future()
@@ -0,0 +1,48 @@
+"""Test the reverse index of the ids referenced by entities."""
+from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.reference_index import ReferenceIndex
+
+
+def _entity(entity_id: str, references: dict[str, set[str]]) -> Entity:
+    """Return an entity with references."""
+    entity = Entity()
+    entity.entity_id = entity_id
+    entity.references = references  # type: ignore[attr-defined]
+    return entity
+
+
+def test_reference_index() -> None:
+    """Test the index is built per kind and rebuilt once invalidated."""
+    entities = [
+        _entity("test.one", {"devices": {"a"}, "areas": {"kitchen"}}),
+        _entity("test.two", {"devices": {"a", "b"}, "areas": set()}),
+    ]
+    lookups: list[str] = []
+
+    def get_references(entity: Entity, kind: str) -> set[str]:
+        lookups.append(kind)
+        return entity.references[kind]  # type: ignore[attr-defined, no-any-return]
+
+    reference_index = ReferenceIndex(lambda: entities, get_references)
+    assert reference_index.async_referencing("devices", "a") == [
+        "test.one",
+        "test.two",
+    ]
+    assert reference_index.async_referencing("devices", "b") == ["test.two"]
+    assert reference_index.async_referencing("devices", "c") == []
+    assert lookups == ["devices", "devices"]
+    assert reference_index.async_referencing("areas", "kitchen") == ["test.one"]
+    assert lookups == ["devices", "devices", "areas", "areas"]
+
+    # The returned list can be changed by the caller
+    reference_index.async_referencing("devices", "b").append("test.three")
+    assert reference_index.async_referencing("devices", "b") == ["test.two"]
+
+    entities.pop(0)
+    assert reference_index.async_referencing("devices", "a") == [
+        "test.one",
+        "test.two",
+    ]
+    reference_index.async_invalidate()
+    assert reference_index.async_referencing("devices", "a") == ["test.two"]
+    assert reference_index.async_referencing("areas", "kitchen") == []
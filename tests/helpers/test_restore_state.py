@@ -16,7 +16,9 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.reload import async_get_platform_without_config_entry
 from homeassistant.helpers.restore_state import (
     DATA_RESTORE_STATE,
+    STORAGE_JOURNAL_KEY,
     STORAGE_KEY,
+    RestoredExtraData,
     RestoreEntity,
     RestoreStateData,
     StoredState,
@@ -307,7 +309,7 @@ async def test_dump_data(hass: HomeAssistant) -> None:
 
     assert mock_write_data.called
     args = mock_write_data.mock_calls[0][1]
-    written_states = args[0]
+    written_states = args[0].build()
 
     for state in states:
         hass.states.async_remove(state.entity_id)
@@ -338,7 +340,7 @@ async def test_dump_data(hass: HomeAssistant) -> None:
 
     assert mock_write_data.called
     args = mock_write_data.mock_calls[0][1]
-    written_states = args[0]
+    written_states = args[0].build()
     assert len(written_states) == 2
     assert written_states[0]["state"]["entity_id"] == "input_boolean.b3"
     assert written_states[0]["state"]["state"] == "off"
@@ -346,6 +348,108 @@ async def test_dump_data(hass: HomeAssistant) -> None:
     assert written_states[1]["state"]["state"] == "off"
 
 
+async def test_incremental_dump(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test changed states are appended to the journal and compacted."""
+    hass.data.pop(DATA_RESTORE_STATE)
+    await async_load(hass, incremental=True)
+    data = async_get(hass)
+
+    platform = MockEntityPlatform(hass, domain="input_boolean")
+    entities = []
+    for object_id in ("b1", "b2", "b3"):
+        entity = RestoreEntity()
+        entity.hass = hass
+        entity.entity_id = f"input_boolean.{object_id}"
+        entity._attr_should_poll = False
+        entity._attr_state = "on"
+        await platform.async_add_entities([entity])
+        entities.append(entity)
+    await data.async_dump_states()
+    await hass.async_block_till_done()
+
+    assert [
+        (item["state"]["entity_id"], item["state"]["state"])
+        for item in hass_storage[STORAGE_KEY]["data"]
+    ] == [
+        ("input_boolean.b1", "on"),
+        ("input_boolean.b2", "on"),
+        ("input_boolean.b3", "on"),
+    ]
+    assert not [key for key in hass_storage if key.startswith(STORAGE_JOURNAL_KEY)]
+
+    entities[0]._attr_state = "off"
+    entities[0].async_write_ha_state()
+    hass.states.async_set("input_boolean.not_restored", "off")
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(minutes=15))
+    await hass.async_block_till_done()
+
+    journal = hass_storage[f"{STORAGE_JOURNAL_KEY}.0"]["data"]
+    assert [
+        (item["state"]["entity_id"], item["state"]["state"]) for item in journal
+    ] == [("input_boolean.b1", "off")]
+    assert hass_storage[STORAGE_KEY]["data"][0]["state"]["state"] == "on"
+
+    # Nothing changed, the journal is not written again
+    with patch(
+        "homeassistant.helpers.restore_state.Store.async_save"
+    ) as mock_write_data:
+        await data.async_dump_journal()
+    assert not mock_write_data.called
+
+    # Extra data written without a state change is journaled in a new
+    # segment with only the delta
+    with patch.object(
+        RestoreEntity,
+        "extra_restore_state_data",
+        property(
+            lambda entity: RestoredExtraData({"count": 1})
+            if entity.entity_id == "input_boolean.b2"
+            else None
+        ),
+    ):
+        entities[1].async_write_ha_state()
+        await data.async_dump_journal()
+        await hass.async_block_till_done()
+        journal = hass_storage[f"{STORAGE_JOURNAL_KEY}.1"]["data"]
+        assert [
+            (item["state"]["entity_id"], item["extra_data"]) for item in journal
+        ] == [("input_boolean.b2", {"count": 1})]
+        journal = hass_storage[f"{STORAGE_JOURNAL_KEY}.0"]["data"]
+        assert journal[0]["state"]["entity_id"] == "input_boolean.b1"
+
+        with patch(
+            "homeassistant.helpers.restore_state.Store.async_save"
+        ) as mock_write_data:
+            await data.async_dump_journal()
+        assert not mock_write_data.called
+
+    # The journal segments are applied on top of the saved states
+    for entity_id in ("input_boolean.b1", "input_boolean.b2", "input_boolean.b3"):
+        hass.states.async_remove(entity_id)
+    hass.data.pop(DATA_RESTORE_STATE)
+    await async_load(hass, incremental=True)
+    data = async_get(hass)
+    assert data.last_states["input_boolean.b1"].state.state == "off"
+    assert data.last_states["input_boolean.b2"].extra_data.as_dict() == {"count": 1}
+    assert data.last_states["input_boolean.b3"].state.state == "on"
+
+    # Compacting removes the journal
+    await data.async_dump_states()
+    await hass.async_block_till_done()
+    assert [
+        (item["state"]["entity_id"], item["state"]["state"])
+        for item in hass_storage[STORAGE_KEY]["data"]
+    ] == [
+        ("input_boolean.b1", "off"),
+        ("input_boolean.b2", "on"),
+        ("input_boolean.b3", "on"),
+    ]
+    assert hass_storage[STORAGE_KEY]["data"][1]["extra_data"] == {"count": 1}
+    assert not [key for key in hass_storage if key.startswith(STORAGE_JOURNAL_KEY)]
+
+
 async def test_dump_error(hass: HomeAssistant) -> None:
     """Test that we cache data."""
     states = [
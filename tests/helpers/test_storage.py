@@ -558,6 +558,123 @@ async def test_saving_load_round_trip(tmpdir: py.path.local) -> None:
     await hass.async_stop(force=True)
 
 
+async def test_writes_are_batched(tmpdir: py.path.local) -> None:
+    """Test stores saved in the same loop iteration are written together."""
+    loop = asyncio.get_running_loop()
+    hass = await async_test_home_assistant(loop)
+
+    hass.config.config_dir = await hass.async_add_executor_job(
+        tmpdir.mkdir, "temp_storage"
+    )
+    stores = [
+        storage.Store(hass, MOCK_VERSION, "atomic-1", atomic_writes=True),
+        storage.Store(hass, MOCK_VERSION, "atomic-2", atomic_writes=True),
+        storage.Store(hass, MOCK_VERSION, "plain"),
+    ]
+
+    with patch(
+        "homeassistant.helpers.storage.write_utf8_files_atomic",
+        wraps=storage.write_utf8_files_atomic,
+    ) as mock_write_atomic, patch.object(
+        hass, "async_add_executor_job", wraps=hass.async_add_executor_job
+    ) as mock_executor_job:
+        await asyncio.gather(*(store.async_save(MOCK_DATA) for store in stores))
+
+    assert len(mock_executor_job.mock_calls) == 1
+    assert len(mock_write_atomic.mock_calls) == 1
+    assert [path for path, _, _ in mock_write_atomic.mock_calls[0][1][0]] == [
+        stores[0].path,
+        stores[1].path,
+    ]
+
+    statistics = storage.async_get_write_statistics(hass)
+    for store in stores:
+        assert await store.async_load() == MOCK_DATA
+        assert statistics[store.key].writes == 1
+        assert statistics[store.key].bytes_written == os.path.getsize(store.path)
+        assert statistics[store.key].mean_latency > 0
+
+    await hass.async_stop(force=True)
+
+
+async def test_batched_write_errors(
+    tmpdir: py.path.local, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test a failing store does not fail the other stores written with it."""
+    loop = asyncio.get_running_loop()
+    hass = await async_test_home_assistant(loop)
+
+    hass.config.config_dir = await hass.async_add_executor_job(
+        tmpdir.mkdir, "temp_storage"
+    )
+    stores = [
+        storage.Store(hass, MOCK_VERSION, "atomic", atomic_writes=True),
+        storage.Store(hass, MOCK_VERSION, "atomic", atomic_writes=True),
+        storage.Store(hass, MOCK_VERSION, "other", atomic_writes=True),
+        storage.Store(hass, MOCK_VERSION, "broken/plain"),
+        storage.Store(hass, MOCK_VERSION, "snapshot", atomic_writes=True),
+    ]
+    orig_makedirs = os.makedirs
+
+    def _build_snapshot() -> dict[str, Any]:
+        raise ValueError("Snapshot failed")
+
+    def _makedirs(name: str, *args: Any, **kwargs: Any) -> None:
+        if name.endswith("broken"):
+            raise OSError("Permission denied")
+        orig_makedirs(name, *args, **kwargs)
+
+    with patch("homeassistant.helpers.storage.os.makedirs", _makedirs):
+        await asyncio.gather(
+            *(
+                store.async_save({"index": index})
+                for index, store in enumerate(stores[:-1])
+            ),
+            stores[-1].async_save(storage.StoreSnapshot(_build_snapshot)),
+        )
+
+    assert "Error writing config for broken/plain" in caplog.text
+    assert "Unexpected error preparing the data of snapshot" in caplog.text
+    assert "Error writing config for snapshot: Snapshot failed" in caplog.text
+    statistics = storage.async_get_write_statistics(hass)
+    assert statistics["broken/plain"].writes == 0
+    assert statistics["snapshot"].writes == 0
+    assert statistics["other"].writes == 1
+    # The last write to a path wins, no temporary files are left behind
+    assert await stores[0].async_load() == {"index": 1}
+    assert await stores[2].async_load() == {"index": 2}
+    assert sorted(os.listdir(os.path.dirname(stores[0].path))) == ["atomic", "other"]
+
+    await hass.async_stop(force=True)
+
+
+async def test_batched_write_job_error(
+    tmpdir: py.path.local, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test a failing write job is handled as a failed write by each store."""
+    loop = asyncio.get_running_loop()
+    hass = await async_test_home_assistant(loop)
+
+    hass.config.config_dir = await hass.async_add_executor_job(
+        tmpdir.mkdir, "temp_storage"
+    )
+    stores = [
+        storage.Store(hass, MOCK_VERSION, "first"),
+        storage.Store(hass, MOCK_VERSION, "second"),
+    ]
+
+    def _write_queue(queue: list[Any]) -> list[Any]:
+        raise RuntimeError("Job failed")
+
+    with patch("homeassistant.helpers.storage._write_queue", _write_queue):
+        await asyncio.gather(*(store.async_save({}) for store in stores))
+
+    assert "Error writing config for first: Job failed" in caplog.text
+    assert "Error writing config for second: Job failed" in caplog.text
+
+    await hass.async_stop(force=True)
+
+
 async def test_loading_corrupt_core_file(
     tmpdir: py.path.local, caplog: pytest.LogCaptureFixture
 ) -> None:
@@ -4578,3 +4578,142 @@ async def test_lru_increases_with_many_entities(hass: HomeAssistant) -> None:
     assert template.CACHED_TEMPLATE_NO_COLLECT_LRU.get_size() == int(
         round(mock_entity_count * template.ENTITY_COUNT_GROWTH_FACTOR)
     )
+
+
+async def test_render_cache(
+    hass: HomeAssistant, area_registry: ar.AreaRegistry
+) -> None:
+    """Test identical templates share renders until their dependencies change."""
+    template_str = "{{ states('sensor.a') }} {{ states.light | count }} {{ x }}"
+    hass.states.async_set("sensor.a", "1")
+    hass.states.async_set("light.a", "on")
+
+    def _render(template_str: str, **kwargs: Any) -> template.RenderInfo:
+        return template.Template(template_str, hass).async_render_to_info(kwargs)
+
+    def _stats() -> dict[str, int]:
+        return template.async_get_render_cache_stats(hass)
+
+    start = _stats()
+    info = _render(template_str, x=1)
+    assert_result_info(info, "1 1 1", ["sensor.a"], [])
+    assert info.domains_lifecycle == {"light"}
+    assert _stats() == {"hits": start["hits"], "misses": start["misses"] + 1}
+
+    # An identical template is served from the cache, unused variables are ignored
+    tmp = template.Template(template_str, hass)
+    info = tmp.async_render_to_info({"x": 1, "unused": object()})
+    assert info.template is tmp
+    assert_result_info(info, "1 1 1", ["sensor.a"], [])
+    assert info.domains_lifecycle == {"light"}
+    assert info.rate_limit == template.DOMAIN_STATES_RATE_LIMIT
+    assert _stats() == {"hits": start["hits"] + 1, "misses": start["misses"] + 1}
+
+    # Different variables or changed dependencies render again
+    assert _render(template_str, x=2).result() == "1 1 2"
+    hass.states.async_set("sensor.a", "2")
+    assert _render(template_str, x=1).result() == "2 1 1"
+    hass.states.async_set("light.b", "on")
+    assert _render(template_str, x=1).result() == "2 2 1"
+    assert _stats() == {"hits": start["hits"] + 1, "misses": start["misses"] + 4}
+    assert _render(template_str, x=1).result() == "2 2 1"
+    assert _stats() == {"hits": start["hits"] + 2, "misses": start["misses"] + 4}
+
+    # Renders using the registries are not cached
+    assert _render("{{ areas() }}").result() == []
+    area_registry.async_get_or_create("kitchen")
+    assert _render("{{ areas() }}").result() == ["kitchen"]
+
+    # Renders with unhashable variables, all states, time, randomness or an
+    # error are not cached
+    hits = _stats()["hits"]
+    for template_str, kwargs in (
+        ("{{ x }}", {"x": [1]}),
+        ("{{ states | count }}", {}),
+        ("{{ now() is not none }}", {}),
+        ("{{ [1, 2] | random }}", {}),
+        ("{{ integration_entities('light') }}", {}),
+        ("{{ expand('sensor.a') | count }}", {}),
+        ("{{ 1 / 0 }}", {}),
+    ):
+        _render(template_str, **kwargs)
+        _render(template_str, **kwargs)
+    assert _stats()["hits"] == hits
+    info = _render("{{ 1 / 0 }}")
+    with pytest.raises(TemplateError):
+        info.result()
+    assert info.rate_limit == template.ALL_STATES_RATE_LIMIT
+
+
+async def test_render_cache_display_precision(
+    hass: HomeAssistant, entity_registry: er.EntityRegistry
+) -> None:
+    """Test rounded sensor renders follow display precision changes."""
+    entry = entity_registry.async_get_or_create(
+        "sensor", "test", "very_unique", suggested_object_id="test"
+    )
+    entity_registry.async_update_entity_options(
+        entry.entity_id, "sensor", {"display_precision": 2}
+    )
+    hass.states.async_set("sensor.test", "23.015", {ATTR_UNIT_OF_MEASUREMENT: "beers"})
+
+    for template_str, output_1, output_2 in (
+        ("{{ states('sensor.test', rounded=True) }}", 23.02, 23.0),
+        ("{{ states.sensor.test.state_with_unit }}", "23.02 beers", "23.0 beers"),
+    ):
+        entity_registry.async_update_entity_options(
+            entry.entity_id, "sensor", {"display_precision": 2}
+        )
+        info = template.Template(template_str, hass).async_render_to_info()
+        assert info.result() == output_1
+        # Changing the display precision does not write a new state
+        entity_registry.async_update_entity_options(
+            entry.entity_id, "sensor", {"display_precision": 1}
+        )
+        info = template.Template(template_str, hass).async_render_to_info()
+        assert info.result() == output_2
+
+
+async def test_render_cache_includes(hass: HomeAssistant) -> None:
+    """Test renders including other templates with their context are not shared."""
+    await template.async_load_custom_templates(hass)
+    template._get_hass_loader(hass).sources = {
+        "context.jinja": """
+            {% macro test_macro() -%}
+            {{ x }}
+            {%- endmacro %}
+            {{- x -}}
+            """
+    }
+
+    for template_str in (
+        "{% include 'context.jinja' %}",
+        "{% import 'context.jinja' as t with context %}{{ t.test_macro() }}",
+        "{% from 'context.jinja' import test_macro with context %}{{ test_macro() }}",
+    ):
+        for x in (1, 2):
+            info = template.Template(template_str, hass).async_render_to_info({"x": x})
+            assert info.result() == x
+
+
+async def test_render_cache_render_options(hass: HomeAssistant) -> None:
+    """Test cached renders are not shared between render options or mutated."""
+    hass.states.async_set("sensor.a", "1")
+    template_str = "{{ states('sensor.a') | int == 1 }}"
+
+    info = template.Template(template_str, hass).async_render_to_info()
+    assert info.result() is True
+    info = template.Template(template_str, hass).async_render_to_info(
+        parse_result=False
+    )
+    assert info.result() == "True"
+    assert info.result().lower() == "true"
+
+    info = template.Template("{{ [1, 2] }}", hass).async_render_to_info()
+    assert info.result() == [1, 2]
+    info.result().append(3)
+    info = template.Template("{{ [1, 2] }}", hass).async_render_to_info()
+    assert info.result() == [1, 2]
+    info.result().append(3)
+    info = template.Template("{{ [1, 2] }}", hass).async_render_to_info()
+    assert info.result() == [1, 2]
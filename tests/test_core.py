@@ -1940,6 +1940,71 @@ async def test_async_entity_ids_count(hass: HomeAssistant) -> None:
     assert hass.states.async_entity_ids_count("light") == 3
 
 
+async def test_statemachine_domain_index(hass: HomeAssistant) -> None:
+    """Test domain filtered lookups follow set and remove."""
+
+    hass.states.async_set("light.bowl", "on")
+    hass.states.async_set("switch.link", "on")
+    hass.states.async_set("light.frog", "on")
+
+    assert hass.states.async_entity_ids("LIGHT") == ["light.bowl", "light.frog"]
+    assert hass.states.async_entity_ids(["light"]) == ["light.bowl", "light.frog"]
+    assert hass.states.async_entity_ids(["switch", "light"]) == [
+        "light.bowl",
+        "switch.link",
+        "light.frog",
+    ]
+    assert hass.states.async_entity_ids(["light", "light"]) == [
+        "light.bowl",
+        "light.frog",
+    ]
+    assert [
+        state.entity_id for state in hass.states.async_all(["switch", "light"])
+    ] == [
+        "light.bowl",
+        "switch.link",
+        "light.frog",
+    ]
+    assert len(hass.states.async_all(["light", "light"])) == 2
+    assert hass.states.async_entity_ids_count(["switch", "light"]) == 3
+    assert hass.states.async_entity_ids_count(["light", "light"]) == 2
+    assert hass.states.async_entity_ids("vacuum") == []
+    assert hass.states.async_all("vacuum") == []
+    assert hass.states.async_entity_ids_count("vacuum") == 0
+
+    hass.states.async_set("light.bowl", "off")
+    assert [state.state for state in hass.states.async_all("light")] == ["off", "on"]
+    assert hass.states.async_all("light")[0] is hass.states.get("light.bowl")
+
+    assert hass.states.async_remove("light.bowl")
+    assert hass.states.async_entity_ids("light") == ["light.frog"]
+    assert hass.states.async_remove("light.frog")
+    assert hass.states.async_entity_ids("light") == []
+    assert hass.states.async_entity_ids_count("light") == 0
+
+    hass.states.async_reserve("light.reserved")
+    assert hass.states.async_entity_ids("light") == []
+    hass.states.async_set("light.reserved", "on")
+    assert hass.states.async_entity_ids("light") == ["light.reserved"]
+
+    # A removed and added again entity moves to the end like in _states
+    hass.states.async_set("switch.kitchen", "on")
+    hass.states.async_remove("switch.link")
+    hass.states.async_set("switch.link", "off")
+    assert (
+        hass.states.async_entity_ids(["light", "switch"])
+        == [
+            entity_id
+            for entity_id in hass.states.async_entity_ids()
+            if entity_id.startswith(("light.", "switch."))
+        ]
+        == ["light.reserved", "switch.kitchen", "switch.link"]
+    )
+    assert hass.states.async_entity_ids(["light", "switch", "vacuum"])[-1] == (
+        "switch.link"
+    )
+
+
 async def test_hassjob_forbid_coroutine() -> None:
     """Test hassjob forbids coroutines."""
 
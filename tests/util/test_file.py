@@ -6,7 +6,12 @@ from unittest.mock import patch
 import py
 import pytest
 
-from homeassistant.util.file import WriteError, write_utf8_file, write_utf8_file_atomic
+from homeassistant.util.file import (
+    WriteError,
+    write_utf8_file,
+    write_utf8_file_atomic,
+    write_utf8_files_atomic,
+)
 
 
 @pytest.mark.parametrize("func", [write_utf8_file, write_utf8_file_atomic])
@@ -82,3 +87,35 @@ def test_write_utf8_file_atomic_fails(tmpdir: py.path.local) -> None:
         write_utf8_file_atomic(test_file, '{"some":"data"}', False)
 
     assert not os.path.exists(test_file)
+
+
+def test_write_utf8_files_atomic(tmpdir: py.path.local) -> None:
+    """Test files are written with one directory sync and errors are returned."""
+    test_dir = tmpdir.mkdir("files")
+    public_file = str(test_dir / "public.json")
+    private_file = str(test_dir / "private.json")
+    missing_dir_file = str(test_dir / "missing" / "test.json")
+
+    with patch("homeassistant.util.file.os.sync") as mock_sync, patch(
+        "homeassistant.util.file.os.fsync", wraps=os.fsync
+    ) as mock_fsync:
+        errors = write_utf8_files_atomic(
+            [
+                (public_file, '{"some":"data"}', False),
+                (missing_dir_file, '{"some":"data"}', False),
+                (private_file, '{"other":"data"}', True),
+            ]
+        )
+
+    assert list(errors) == [missing_dir_file]
+    assert isinstance(errors[missing_dir_file], WriteError)
+    assert not mock_sync.mock_calls
+    # One fsync per written file and one for their directory
+    assert len(mock_fsync.mock_calls) == 3
+    with open(public_file) as fh:
+        assert fh.read() == '{"some":"data"}'
+    assert os.stat(public_file).st_mode & 0o777 == 0o644
+    with open(private_file) as fh:
+        assert fh.read() == '{"other":"data"}'
+    assert os.stat(private_file).st_mode & 0o777 == 0o600
+    assert sorted(os.listdir(test_dir)) == ["private.json", "public.json"]
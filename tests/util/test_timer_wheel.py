@@ -0,0 +1,75 @@
+"""Test the timer wheel."""
+import asyncio
+
+import pytest
+
+from homeassistant.util.timer_wheel import TimerWheel
+
+
+async def test_timer_wheel_runs_timers_in_order_of_ticks() -> None:
+    """Test timers run once their tick has passed and never early."""
+    loop = asyncio.get_running_loop()
+    wheel = TimerWheel(loop, 0.05)
+    runs: list[tuple[str, float]] = []
+    done = asyncio.Event()
+
+    def _run(name: str, when: float) -> None:
+        runs.append((name, loop.time() - when))
+        if name == "last":
+            done.set()
+
+    now = loop.time()
+    wheel.call_at(now + 0.12, _run, "later", now + 0.12)
+    wheel.call_at(now + 0.01, _run, "first", now + 0.01)
+    wheel.call_at(now + 0.02, _run, "second", now + 0.02)
+    wheel.call_later(0.2, _run, "last", now + 0.2)
+    assert len(wheel) == 4
+
+    await asyncio.wait_for(done.wait(), 1)
+    assert [name for name, _ in runs] == ["first", "second", "later", "last"]
+    assert all(late >= 0 for _, late in runs)
+    assert len(wheel) == 0
+
+
+async def test_timer_wheel_cancel() -> None:
+    """Test cancelled timers do not run and an empty wheel is not scheduled."""
+    loop = asyncio.get_running_loop()
+    wheel = TimerWheel(loop, 0.01)
+    runs: list[int] = []
+
+    handles = [wheel.call_later(0.02, runs.append, idx) for idx in range(5)]
+    handles[1].cancel()
+    handles[1].cancel()
+    assert handles[1].cancelled()
+    assert len(wheel) == 4
+
+    # Cancelling a timer from a timer due in the same tick
+    wheel.call_later(0.01, handles[3].cancel)
+    await asyncio.sleep(0.05)
+    assert runs == [0, 2, 4]
+
+    handle = wheel.call_later(10, runs.append, 5)
+    scheduled = [
+        timer for timer in loop._scheduled if not timer.cancelled()  # type: ignore[attr-defined]
+    ]
+    handle.cancel()
+    assert len(wheel) == 0
+    assert all(timer.cancelled() for timer in scheduled)
+
+
+async def test_timer_wheel_callback_exception(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test a failing timer does not stop the other timers of the tick."""
+    loop = asyncio.get_running_loop()
+    wheel = TimerWheel(loop, 0.01)
+    runs: list[int] = []
+
+    def _fail() -> None:
+        raise ValueError
+
+    wheel.call_later(0, _fail)
+    wheel.call_later(0, runs.append, 1)
+    await asyncio.sleep(0.03)
+    assert runs == [1]
+    assert "Error running timer" in caplog.text